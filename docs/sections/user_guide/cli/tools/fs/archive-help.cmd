@@ -0,0 +1 @@
+uw fs archive --help
@@ -0,0 +1,3 @@
+rm -rf dst/archive && mkdir -p dst/archive/forecast/restart
+for f in atmf000 atmf006 restart/core restart/tracer; do echo $f >dst/archive/forecast/$f; done
+uw fs archive --plan yaml --target-dir dst/archive --config-file archive.yaml
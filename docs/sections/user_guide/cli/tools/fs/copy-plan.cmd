@@ -0,0 +1,2 @@
+rm -rf dst/copy-plan
+uw fs copy --plan yaml --target-dir dst/copy-plan --config-file copy-report.yaml
@@ -0,0 +1,5 @@
+rm -rf dst/copy-shard && mkdir -p dst/copy-shard/reports
+for i in 0 1; do
+  uw fs copy --quiet --shard $i/2 --report --target-dir dst/copy-shard --config-file copy-shard.yaml >dst/copy-shard/reports/$i.json
+done
+uw fs merge dst/copy-shard/reports/*.json
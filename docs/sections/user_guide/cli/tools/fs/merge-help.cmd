@@ -0,0 +1 @@
+uw fs merge --help
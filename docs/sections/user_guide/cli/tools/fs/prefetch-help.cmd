@@ -0,0 +1 @@
+uw fs prefetch --help
@@ -0,0 +1,4 @@
+rm -rf dst/prefetch
+uw fs prefetch --config-file prefetch.yaml --cycles 2024-05-29T12 2024-05-29T18 --key-path fv3 --driver --limit local=2 --report
+echo
+tree dst/prefetch
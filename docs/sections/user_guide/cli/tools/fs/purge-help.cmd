@@ -0,0 +1 @@
+uw fs purge --help
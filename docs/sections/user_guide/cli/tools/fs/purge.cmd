@@ -0,0 +1,8 @@
+rm -rf dst/purge
+for cycle in 2024052900 2024053000 2024060100; do mkdir -p dst/purge/$cycle/sub && echo hello >dst/purge/$cycle/sub/a; done
+touch -d "5 days ago" dst/purge/2024052900 dst/purge/2024053000
+uw fs purge --plan yaml --target-dir dst/purge --config-file purge.yaml
+echo
+uw fs purge --report --target-dir dst/purge --config-file purge.yaml
+echo
+tree -F dst/purge
@@ -13,7 +13,7 @@ from uwtools.config.formats.fieldtable import FieldTableConfig
 from uwtools.config.formats.ini import INIConfig
 from uwtools.config.formats.nml import NMLConfig
 from uwtools.config.formats.sh import SHConfig
-from uwtools.config.formats.yaml import YAMLConfig
+from uwtools.config.formats.yaml import LazyYAMLConfig, YAMLConfig
 from uwtools.config.tools import compare as _compare
 from uwtools.config.tools import compose as _compose
 from uwtools.config.tools import realize as _realize
@@ -50,6 +50,7 @@ def compose(
     output_format: str | None = None,
     cycle: datetime | None = None,
     leadtime: timedelta | None = None,
+    threads: int = 1,
 ) -> Config:
     """
     NB: This docstring is dynamically replaced: See compose.__doc__ definition below.
@@ -62,6 +63,7 @@ def compose(
         output_format=output_format,
         cycle=cycle,
         leadtime=leadtime,
+        threads=threads,
     )
 
 
@@ -71,6 +73,7 @@ def compose_to_dict(
     input_format: str | None = None,
     cycle: datetime | None = None,
     leadtime: timedelta | None = None,
+    threads: int = 1,
 ) -> dict:
     """
     Compose config files to a ``dict``.
@@ -140,15 +143,21 @@ def get_sh_config(
 def get_yaml_config(
     config: dict | Path | str | None = None,
     stdin_ok: bool = False,
+    lazy: bool = False,
 ) -> YAMLConfig:
     """
     Get a ``YAMLConfig`` object.
 
+    A lazy config constructs sections only when they are accessed. Passed to a driver with a key
+    path, only the driver's block (and any values it references) is constructed and dereferenced.
+
     :param config: YAML file or ``dict`` (``None`` => read ``stdin``).
     :param stdin_ok: OK to read from ``stdin``?
+    :param lazy: Construct config sections only when accessed?
     :return: An initialized ``YAMLConfig`` object.
     """
-    return YAMLConfig(config=_ensure_data_source(_str2path(config), stdin_ok))
+    cls = LazyYAMLConfig if lazy else YAMLConfig
+    return cls(config=_ensure_data_source(_str2path(config), stdin_ok))
 
 
 def realize(
@@ -165,6 +174,9 @@ def realize(
     total: bool = False,
     dry_run: bool = False,
     stdin_ok: bool = False,
+    threads: int = 1,
+    snapshot_file: Path | str | None = None,
+    schema_file: Path | str | None = None,
 ) -> dict:
     """
     NB: This docstring is dynamically replaced: See realize.__doc__ definition below.
@@ -184,6 +196,9 @@ def realize(
         values_needed=values_needed,
         total=total,
         dry_run=dry_run,
+        threads=threads,
+        snapshot_file=_str2path(snapshot_file),
+        schema_file=_str2path(schema_file),
     )
 
 
@@ -197,6 +212,7 @@ def realize_to_dict(
     total: bool = False,
     dry_run: bool = False,
     stdin_ok: bool = False,
+    threads: int = 1,
 ) -> dict:
     """
     Realize a config to a ``dict``, based on a base input config and an optional update config.
@@ -271,6 +287,7 @@ Recognized file extensions are: {extensions}.
 :param output_format: Format of output config (choices: {choices}, default: ``{default}``)
 :param cycle: A datetime object to make available for use in configs.
 :param leadtime: A timedelta object to make available for use in configs.
+:param threads: Number of concurrent threads to use to parse configs.
 :return: The composed config.
 """.format(
     default=_FORMAT.yaml,
@@ -307,6 +324,14 @@ case the function will return.
 
 In ``dry_run`` mode, output is written to ``stderr``.
 
+If ``schema_file`` is specified, the realized config is validated against it before being written.
+
+If ``snapshot_file`` is specified, the realized config is additionally written to it as a binary
+snapshot, recording whether the config was fully realized and which schema, if any, it was validated
+against. Snapshots may be used in place of YAML config files: Drivers loading a fully realized
+snapshot skip dereferencing, and skip validation if the snapshot was validated against the schema
+they would use. Snapshots are Python pickles: Only use snapshots from trusted sources.
+
 Recognized file extensions are: {extensions}
 
 :param input_config: Input config file (``None`` => read ``stdin``).
@@ -322,6 +347,9 @@ Recognized file extensions are: {extensions}
 :param total: Require rendering of all Jinja2 variables/expressions.
 :param dry_run: Log output instead of writing to output.
 :param stdin_ok: OK to read from ``stdin``?
+:param threads: Number of concurrent threads to use to parse input and update configs.
+:param snapshot_file: Also write the realized config, as a binary snapshot, to this path.
+:param schema_file: Validate the realized config against this JSON Schema file.
 :return: The ``dict`` representation of the realized config.
 :raises: ``UWConfigRealizeError`` if ``total`` is ``True`` and any Jinja2 syntax was not rendered.
 """.format(extensions=", ".join([f"``{x}``" for x in _FORMAT.extensions()])).strip()  # noqa: E501
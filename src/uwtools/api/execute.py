@@ -17,6 +17,8 @@ from uwtools.drivers.support import tasks as _tasks
 from uwtools.logging import log
 from uwtools.strings import STR
 from uwtools.utils.api import ensure_data_source
+from uwtools.utils.statcache import caching
+from uwtools.utils.telemetry import recording
 
 if TYPE_CHECKING:
     from datetime import datetime, timedelta
@@ -91,7 +93,8 @@ def execute(
     kwargs.update({arg: args[arg] for arg in sorted([STR.batch, *required]) if arg in accepted})
     driverobj = class_(**kwargs)
     log.debug("Instantiated %s with: %s", classname, kwargs)
-    node: Node = getattr(driverobj, task)(dry_run=dry_run)
+    with caching(), recording():
+        node: Node = getattr(driverobj, task)(dry_run=dry_run)
     if graph_file:
         Path(graph_file).write_text(f"{node.graph}\n")
     return node
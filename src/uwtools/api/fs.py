@@ -4,19 +4,136 @@ API access to ``uwtools`` file and directory management tools.
 
 from __future__ import annotations
 
+import json
+import logging
+import os
+from concurrent.futures import ProcessPoolExecutor
+from contextlib import AbstractContextManager, nullcontext
+from multiprocessing import get_context
 from pathlib import Path
-from typing import TYPE_CHECKING, cast
+from typing import TYPE_CHECKING, Any, cast
 
-from uwtools.fs import Copier, Linker, MakeDirs
+from uwtools.config.formats.yaml import YAMLConfig as _YAMLConfig
+from uwtools.fs import Archiver, Copier, Linker, MakeDirs, Prefetcher, Purger
+from uwtools.fs import merge_reports as _merge_reports
+from uwtools.logging import log as _log
+from uwtools.logging import setup_logging as _setup_logging
 from uwtools.strings import STR
+from uwtools.utils import cache as _cache
+from uwtools.utils import hpss as _hpss
+from uwtools.utils import http as _http
+from uwtools.utils import local as _local
 from uwtools.utils.api import ensure_data_source as _ensure_data_source
+from uwtools.utils.cache import configure as _configure_staging_cache
+from uwtools.utils.checksum import read_manifest as _read_manifest
+from uwtools.utils.checksum import verifying as _verifying
+from uwtools.utils.checksum import write_manifest as _write_manifest
+from uwtools.utils.hpss import configure_cache as _configure_cache
+from uwtools.utils.statcache import caching as _caching
+from uwtools.utils.tasks import limits as _limits
+from uwtools.utils.telemetry import Transfer as _Transfer
+from uwtools.utils.telemetry import recording as _recording
+from uwtools.utils.telemetry import summary as _summary
+from uwtools.utils.telemetry import write as _write_telemetry
 
 if TYPE_CHECKING:
     import datetime as dt
+    from concurrent.futures import Future
 
     from uwtools.config.support import YAMLKey
 
 
+@_caching()
+def archive(
+    config: Path | dict | str | None = None,
+    target_dir: Path | str | None = None,
+    cycle: dt.datetime | None = None,
+    leadtime: dt.timedelta | None = None,
+    key_path: list[YAMLKey] | None = None,
+    dry_run: bool = False,
+    threads: int = 1,
+    stdin_ok: bool = False,
+    output: dict[str, Path] | dict[str, list[Path]] | None = None,
+    limits: dict[str, int] | None = None,
+) -> dict[str, Any]:
+    """
+    Archive files to HPSS in ``htar`` bundles.
+
+    The files listed under ``files``, which may include ``!glob`` patterns and directories, and the
+    files in a driver's ``output`` manifest, if given, are packed, in path order, into bundles of
+    about ``bundle_size`` bytes, named ``<dir>/<name>.000.tar``, ``<dir>/<name>.001.tar``, etc.
+    Bundles are created concurrently, each by a single ``htar`` command, and each is then verified
+    against its index. Bundles whose indexes already list all their members are not recreated.
+    Files below the target directory are archived with paths relative to it.
+
+    If ``limits`` are specified, the number of concurrent threads is raised, if necessary, to their
+    sum. Only the ``hpss`` limit applies.
+
+    :param config: YAML-file path, or ``dict`` (read ``stdin`` if missing or ``None``).
+    :param target_dir: Path to target directory.
+    :param cycle: A datetime object to make available for use in the config.
+    :param leadtime: A timedelta object to make available for use in the config.
+    :param key_path: Path of keys to config block to use.
+    :param dry_run: Do not create archives.
+    :param threads: Number of concurrent threads to use.
+    :param stdin_ok: OK to read from ``stdin``?
+    :param output: A driver's ``output`` manifest, whose files are also to be archived.
+    :param limits: Maximum concurrent transfers, keyed by kind: ``hpss``, ``http``, or ``local``.
+    :return: A report on archives created / not created.
+    """
+    stager = Archiver(
+        target_dir=Path(target_dir) if target_dir else None,
+        config=_ensure_data_source(config, stdin_ok),
+        cycle=cycle,
+        leadtime=leadtime,
+        key_path=key_path,
+        output=output,
+    )
+    with _limits(limits):
+        threads = _threads(threads, limits)
+        assets = cast(list, stager.go(dry_run=dry_run, threads=threads).asset)
+    ready = lambda state: [str(asset.ref) for asset in assets if asset.ready() is state]
+    return {STR.ready: ready(True), STR.notready: ready(False)}
+
+
+@_caching()
+def archive_plan(
+    config: Path | dict | str | None = None,
+    target_dir: Path | str | None = None,
+    cycle: dt.datetime | None = None,
+    leadtime: dt.timedelta | None = None,
+    key_path: list[YAMLKey] | None = None,
+    stdin_ok: bool = False,
+    output: dict[str, Path] | dict[str, list[Path]] | None = None,
+) -> dict[str, Any]:
+    """
+    Plan ``htar`` bundles, without archiving.
+
+    The plan lists, under ``bundles``, each ``archive`` that would be created, with its
+    ``members``, and their total size in ``bytes``. Under ``totals``, the numbers of bundles,
+    members, and bytes are given.
+
+    :param config: YAML-file path, or ``dict`` (read ``stdin`` if missing or ``None``).
+    :param target_dir: Path to target directory.
+    :param cycle: A datetime object to make available for use in the config.
+    :param leadtime: A timedelta object to make available for use in the config.
+    :param key_path: Path of keys to config block to use.
+    :param stdin_ok: OK to read from ``stdin``?
+    :param output: A driver's ``output`` manifest, whose files are also to be archived.
+    :return: The planned bundles, and their totals.
+    """
+    stager = Archiver(
+        target_dir=Path(target_dir) if target_dir else None,
+        config=_ensure_data_source(config, stdin_ok),
+        cycle=cycle,
+        leadtime=leadtime,
+        key_path=key_path,
+        output=output,
+    )
+    return stager.plan()
+
+
+@_caching()
 def copy(
     config: Path | dict | str | None = None,
     target_dir: Path | str | None = None,
@@ -26,10 +143,41 @@ def copy(
     dry_run: bool = False,
     threads: int = 1,
     stdin_ok: bool = False,
-) -> dict[str, list[str]]:
+    limits: dict[str, int] | None = None,
+    sync: str | None = None,
+    verify: Path | str | None = None,
+    manifest: Path | str | None = None,
+    telemetry: Path | str | bool = False,
+    shard: tuple[int, int] | None = None,
+) -> dict[str, Any]:
     """
     Copy files.
 
+    If ``limits`` are specified, the number of concurrent threads is raised, if necessary, to their
+    sum, so that each kind of transfer can reach its limit.
+
+    If ``sync`` is specified, existing destinations of local sources are recopied only if they are
+    not current: if their size and modification time (``mtime``), or size and content hash
+    (``hash``), differ from their sources'. The report then also lists the files ``copied`` (new),
+    ``updated`` (recopied), and ``skipped`` (already current).
+
+    If ``verify`` or ``manifest`` is specified, the sha256 digest of each file copied is computed as
+    it is copied. Files whose digests differ from those in the ``verify`` manifest are removed, and
+    reported as not ready. The digests of the files copied are written to the ``manifest`` file.
+    Manifests use the ``sha256sum`` format, with paths relative to the target directory, if any.
+
+    If ``telemetry`` is specified, the report also includes, under ``telemetry``, a summary of the
+    files copied: their number, total size, and aggregate throughput; the same, with median
+    (``p50``) and 95th-percentile (``p95``) seconds per file, for each kind of transfer; and the
+    slowest files. If ``telemetry`` is a path, the summary is also written to that file, as JSON.
+
+    If ``shard`` is specified, as ``(i, n)``, only the ``i``-th of ``n`` disjoint shards of the
+    files, numbered from 0, is copied, so that ``n`` independent processes, e.g. on different
+    nodes, can share the work of copying the same config. Files are assigned to shards
+    deterministically, balancing the sizes of local sources and the numbers of other sources, with
+    members of the same ``htar`` archive kept together. The per-shard reports can be combined with
+    ``merge_reports()``.
+
     :param config: YAML-file path, or ``dict`` (read ``stdin`` if missing or ``None``).
     :param target_dir: Path to target directory.
     :param cycle: A datetime object to make available for use in the config.
@@ -38,6 +186,12 @@ def copy(
     :param dry_run: Do not copy files.
     :param threads: Number of concurrent threads to use.
     :param stdin_ok: OK to read from ``stdin``?
+    :param limits: Maximum concurrent transfers, keyed by kind: ``hpss``, ``http``, or ``local``.
+    :param sync: Recopy only destinations that are not current (choices: ``mtime``, ``hash``).
+    :param verify: Path to a manifest of expected digests of files to copy.
+    :param manifest: Path to a manifest of digests of files copied, to write.
+    :param telemetry: Summarize transfers in the report, and in a JSON file, if a path is given?
+    :param shard: Copy only this shard of the files: its index, and the number of shards.
     :return: A report on files copied / not copied.
     """
     stager = Copier(
@@ -46,12 +200,87 @@ def copy(
         cycle=cycle,
         leadtime=leadtime,
         key_path=key_path,
+        sync=sync,
+        shard=shard,
     )
-    assets = cast(list, stager.go(dry_run=dry_run, threads=threads).asset)
+    root = Path(target_dir) if target_dir else None
+    expected = _read_manifest(verify, root) if verify else None
+    checksums: AbstractContextManager[dict[str, str]] = (
+        _verifying(expected) if verify or manifest else nullcontext({})
+    )
+    with _limits(limits), checksums as digests, _recording() as transfers:
+        threads = _threads(threads, limits)
+        assets = cast(list, stager.go(dry_run=dry_run, threads=threads).asset)
+    if manifest and not dry_run:
+        _write_manifest(manifest, digests, root)
     ready = lambda state: [str(asset.ref) for asset in assets if asset.ready() is state]
-    return {STR.ready: ready(True), STR.notready: ready(False)}
+    report: dict[str, Any] = {STR.ready: ready(True), STR.notready: ready(False)}
+    if sync:
+        report.update(stager.synced(report[STR.ready]))
+    if telemetry:
+        report[STR.telemetry] = _telemetry(transfers, telemetry)
+    return report
+
+
+@_caching()
+def copy_plan(
+    config: Path | dict | str | None = None,
+    target_dir: Path | str | None = None,
+    cycle: dt.datetime | None = None,
+    leadtime: dt.timedelta | None = None,
+    key_path: list[YAMLKey] | None = None,
+    stdin_ok: bool = False,
+    sync: str | None = None,
+    shard: tuple[int, int] | None = None,
+) -> dict[str, Any]:
+    """
+    Plan file copies, without copying.
 
+    The plan lists, under ``files``, each source, after glob expansion, with its destination
+    (``dst``), the ``kind`` of transfer that would copy it (``hsi``, ``htar``, ``http``, or
+    ``local``), the ``action`` planned (``copy``, ``update``, or ``skip``), and, for sources to copy
+    or update, its ``size`` in bytes, where cheaply known: via ``stat`` for local sources, via
+    ``HEAD`` request for HTTP sources, and via cached ``htar`` indexes for archive members. Sizes of
+    ``hsi`` sources are not known. Under ``totals``, the numbers of files to copy or update, of
+    bytes known, and of files whose sizes are not known (``unsized``) are given for each kind.
 
+    :param config: YAML-file path, or ``dict`` (read ``stdin`` if missing or ``None``).
+    :param target_dir: Path to target directory.
+    :param cycle: A datetime object to make available for use in the config.
+    :param leadtime: A timedelta object to make available for use in the config.
+    :param key_path: Path of keys to config block to use.
+    :param stdin_ok: OK to read from ``stdin``?
+    :param sync: Plan to recopy only destinations that are not current (choices: ``mtime``,
+        ``hash``).
+    :param shard: Plan only this shard of the files, as for ``copy()``.
+    :return: The planned copies, and their totals.
+    """
+    stager = Copier(
+        target_dir=Path(target_dir) if target_dir else None,
+        config=_ensure_data_source(config, stdin_ok),
+        cycle=cycle,
+        leadtime=leadtime,
+        key_path=key_path,
+        sync=sync,
+        shard=shard,
+    )
+    return stager.plan()
+
+
+def hpss_cache(cache_dir: Path | str | None = None, ttl: float = 3600) -> None:
+    """
+    Configure the cache of HPSS directory listings and ``htar`` archive indexes.
+
+    Listings are always cached in memory, so that each is made once per process. If ``cache_dir``
+    is specified, successful listings are also cached there, for reuse by later processes.
+
+    :param cache_dir: Directory in which to cache listings on disk.
+    :param ttl: Seconds after which cached listings expire.
+    """
+    _configure_cache(cache_dir=cache_dir, ttl=ttl)
+
+
+@_caching()
 def link(
     config: Path | dict | str | None = None,
     target_dir: Path | str | None = None,
@@ -63,7 +292,9 @@ def link(
     threads: int = 1,
     stdin_ok: bool = False,
     fallback: str | None = None,
-) -> dict[str, list[str]]:
+    limits: dict[str, int] | None = None,
+    telemetry: Path | str | bool = False,
+) -> dict[str, Any]:
     """
     Create links to filesystem items.
 
@@ -71,6 +302,12 @@ def link(
     directories; when ``True``, links may not be made across filesystems, or to directories.
     Alternative if hardlink fails (choices: ``copy``, ``symlink``).
 
+    If ``limits`` are specified, the number of concurrent threads is raised, if necessary, to their
+    sum. Only the ``local`` limit applies, to copies made when ``fallback`` is ``copy``.
+
+    If ``telemetry`` is specified, the report also includes a summary of the copies made when
+    ``fallback`` is ``copy``, as described for ``copy()``.
+
     :param config: YAML-file path, or ``dict`` (read ``stdin`` if missing or ``None``).
     :param target_dir: Path to target directory.
     :param cycle: A datetime object to make available for use in the config.
@@ -81,6 +318,8 @@ def link(
     :param threads: Number of concurrent threads to use.
     :param stdin_ok: OK to read from ``stdin``?
     :param fallback: Alternative if hardlink fails (choices: ``copy``, ``symlink``).
+    :param limits: Maximum concurrent transfers, keyed by kind: ``hpss``, ``http``, or ``local``.
+    :param telemetry: Summarize transfers in the report, and in a JSON file, if a path is given?
     :return: A report on files linked / not linked.
     """
     stager = Linker(
@@ -92,11 +331,36 @@ def link(
         key_path=key_path,
         fallback=fallback,
     )
-    assets = cast(list, stager.go(dry_run=dry_run, threads=threads).asset)
+    with _limits(limits), _recording() as transfers:
+        threads = _threads(threads, limits)
+        assets = cast(list, stager.go(dry_run=dry_run, threads=threads).asset)
     ready = lambda state: [str(asset.ref) for asset in assets if asset.ready() is state]
-    return {STR.ready: ready(True), STR.notready: ready(False)}
+    report: dict[str, Any] = {STR.ready: ready(True), STR.notready: ready(False)}
+    if telemetry:
+        report[STR.telemetry] = _telemetry(transfers, telemetry)
+    return report
+
+
+def merge_reports(reports: list[Path | dict | str]) -> dict[str, Any]:
+    """
+    Merge the reports of ``copy()`` calls that copied shards of the same config.
 
+    Each report may be given as a ``dict``, or as the path to a JSON file, e.g. as printed by
+    ``uw fs copy --report``. The lists of paths under each key are combined and sorted. Telemetry
+    summaries, if any, are listed under ``telemetry`` in the order of the reports.
+
+    :param reports: The per-shard reports, or paths to them.
+    :return: The merged report.
+    """
+    return _merge_reports(
+        [
+            report if isinstance(report, dict) else json.loads(Path(report).read_text())
+            for report in reports
+        ]
+    )
 
+
+@_caching()
 def makedirs(
     config: Path | dict | str | None = None,
     target_dir: Path | str | None = None,
@@ -132,4 +396,285 @@ def makedirs(
     return {STR.ready: ready(True), STR.notready: ready(False)}
 
 
-__all__ = ["Copier", "Linker", "MakeDirs", "copy", "link", "makedirs"]
+def prefetch(
+    cycles: list[dt.datetime],
+    config: Path | dict | str | None = None,
+    target_dir: Path | str | None = None,
+    leadtime: dt.timedelta | None = None,
+    key_path: list[YAMLKey] | None = None,
+    driver: bool = False,
+    dry_run: bool = False,
+    threads: int = 1,
+    stdin_ok: bool = False,
+    limits: dict[str, int] | None = None,
+    nice: int = 10,
+) -> Future[dict[str, dict[str, list[str]]]]:
+    """
+    Copy files for upcoming cycles, in a background process, at low priority.
+
+    The config is dereferenced separately for each cycle, so that e.g. ``cycle`` in Jinja2
+    expressions refers to that cycle. The block at ``key_path`` is a :ref:`file block <files_yaml>`,
+    as for ``copy()`` or, if ``driver`` is ``True``, a driver block, e.g. ``fv3``, whose
+    ``files_to_copy`` are copied into its ``rundir``, unless a ``target_dir`` is given. The
+    background process uses the same staging settings, e.g. those made via ``staging_cache()`` and
+    ``hpss_cache()``, as the calling process. Files for all cycles are copied
+    concurrently, using up to ``threads`` threads, and within any ``limits``, which apply across
+    cycles. If ``limits`` are specified, the number of threads is raised, if necessary, to their
+    sum. The background process runs at the given ``nice`` increment, yielding the CPU to e.g.
+    the jobs of the current cycle. When a driver later runs for a prefetched cycle, it finds the
+    files already copied, and does not copy them again.
+
+    :param cycles: The cycles to copy files for.
+    :param config: YAML-file path, or ``dict`` (read ``stdin`` if missing or ``None``).
+    :param target_dir: Path to target directory (default: a driver block's ``rundir``).
+    :param leadtime: A timedelta object to make available for use in the config.
+    :param key_path: Path of keys to config block to use.
+    :param driver: Is the block a driver block?
+    :param dry_run: Do not copy files.
+    :param threads: Number of concurrent threads to use.
+    :param stdin_ok: OK to read from ``stdin``?
+    :param limits: Maximum concurrent transfers, keyed by kind: ``hpss``, ``http``, or ``local``.
+    :param nice: Priority decrement, as for ``nice(1)``, of the background process.
+    :return: A future whose result is a report on files copied / not copied, per cycle.
+    """
+    if _ensure_data_source(config, stdin_ok) is None:
+        config = _YAMLConfig(config=None).data  # read stdin here: the background process cannot
+    quiet = all(getattr(h, "baseFilename", None) == os.devnull for h in _log.handlers)
+    verbose = _log.getEffectiveLevel() <= logging.DEBUG
+    executor = ProcessPoolExecutor(
+        max_workers=1,
+        mp_context=get_context("spawn"),
+        initializer=_prefetch_init,
+        initargs=(nice, quiet, verbose, _prefetch_settings()),
+    )
+    future = executor.submit(
+        _prefetch, cycles, config, target_dir, leadtime, key_path, driver, dry_run, threads, limits
+    )
+    executor.shutdown(wait=False)  # the process exits when done
+    return future
+
+
+@_caching()
+def purge(
+    config: Path | dict | str | None = None,
+    target_dir: Path | str | None = None,
+    cycle: dt.datetime | None = None,
+    leadtime: dt.timedelta | None = None,
+    key_path: list[YAMLKey] | None = None,
+    dry_run: bool = False,
+    threads: int = 1,
+    stdin_ok: bool = False,
+) -> dict[str, Any]:
+    """
+    Purge files and directories, e.g. old run directories.
+
+    The ``paths`` to purge may be literal paths, or ``!glob`` patterns, and may be templates using
+    ``cycle`` and ``leadtime``, e.g. to select the run directory of an earlier cycle. If
+    ``older_than`` is specified, only paths last modified more than that many hours ago are purged.
+    Directory trees are removed breadth first, listing directories and removing files concurrently.
+    The report also gives the number of bytes ``reclaimed``.
+
+    :param config: YAML-file path, or ``dict`` (read ``stdin`` if missing or ``None``).
+    :param target_dir: Path to target directory.
+    :param cycle: A datetime object to make available for use in the config.
+    :param leadtime: A timedelta object to make available for use in the config.
+    :param key_path: Path of keys to config block to use.
+    :param dry_run: Do not purge paths.
+    :param threads: Number of concurrent threads to use.
+    :param stdin_ok: OK to read from ``stdin``?
+    :return: A report on paths purged / not purged.
+    """
+    stager = Purger(
+        target_dir=Path(target_dir) if target_dir else None,
+        config=_ensure_data_source(config, stdin_ok),
+        cycle=cycle,
+        leadtime=leadtime,
+        key_path=key_path,
+    )
+    assets = cast(list, stager.go(dry_run=dry_run, threads=threads).asset)
+    ready = lambda state: [str(asset.ref) for asset in assets if asset.ready() is state]
+    return {STR.ready: ready(True), STR.notready: ready(False), STR.reclaimed: stager.reclaimed}
+
+
+@_caching()
+def purge_plan(
+    config: Path | dict | str | None = None,
+    target_dir: Path | str | None = None,
+    cycle: dt.datetime | None = None,
+    leadtime: dt.timedelta | None = None,
+    key_path: list[YAMLKey] | None = None,
+    stdin_ok: bool = False,
+) -> dict[str, Any]:
+    """
+    Plan purges, without purging.
+
+    The plan lists, under ``paths``, each path that would be purged, with the number of ``files``
+    (including symlinks) at and below it, and their total size in ``bytes``. Under ``totals``, the
+    numbers of paths, files, and bytes are given.
+
+    :param config: YAML-file path, or ``dict`` (read ``stdin`` if missing or ``None``).
+    :param target_dir: Path to target directory.
+    :param cycle: A datetime object to make available for use in the config.
+    :param leadtime: A timedelta object to make available for use in the config.
+    :param key_path: Path of keys to config block to use.
+    :param stdin_ok: OK to read from ``stdin``?
+    :return: The planned purges, and their totals.
+    """
+    stager = Purger(
+        target_dir=Path(target_dir) if target_dir else None,
+        config=_ensure_data_source(config, stdin_ok),
+        cycle=cycle,
+        leadtime=leadtime,
+        key_path=key_path,
+    )
+    return stager.plan()
+
+
+def staging_cache(
+    cache_dir: Path | str | None = None, max_size: int | None = None, link: bool = False
+) -> None:
+    """
+    Configure the shared cache of files copied from HTTP and HPSS sources.
+
+    When ``cache_dir`` is specified, remote sources are copied into it once, and copied from it to
+    their destinations. Concurrent processes may share a cache directory. When the cache exceeds
+    ``max_size``, the least recently used files are evicted.
+
+    If ``link`` is ``True``, cached files are instead hardlinked to their destinations where
+    possible, saving space. Cached files are read-only, so that they cannot be modified via their
+    destinations, and hardlinked destinations are therefore read-only, too.
+
+    :param cache_dir: Directory in which to cache files (``None`` => no caching).
+    :param max_size: Maximum total size of cached files, in bytes (``None`` => unlimited).
+    :param link: Hardlink cached files to destinations, where possible?
+    """
+    _configure_staging_cache(cache_dir=cache_dir, max_size=max_size, link=link)
+
+
+@_caching()
+def _prefetch(
+    cycles: list[dt.datetime],
+    config: Path | dict | str | None,
+    target_dir: Path | str | None,
+    leadtime: dt.timedelta | None,
+    key_path: list[YAMLKey] | None,
+    driver: bool,
+    dry_run: bool,
+    threads: int,
+    limits: dict[str, int] | None,
+) -> dict[str, dict[str, list[str]]]:
+    """
+    Copy files for upcoming cycles, in the background process.
+
+    :param cycles: The cycles to copy files for.
+    :param config: YAML-file path, or ``dict`` (already read from ``stdin``).
+    :param target_dir: Path to target directory.
+    :param leadtime: A timedelta object to make available for use in the config.
+    :param key_path: Path of keys to config block to use.
+    :param driver: Is the block a driver block?
+    :param dry_run: Do not copy files.
+    :param threads: Number of concurrent threads to use.
+    :param limits: Maximum concurrent transfers, keyed by kind.
+    """
+    prefetcher = Prefetcher(
+        cycles=cycles,
+        config=config,
+        target_dir=Path(target_dir) if target_dir else None,
+        leadtime=leadtime,
+        key_path=key_path,
+        driver=driver,
+    )
+    with _limits(limits):
+        threads = _threads(threads, limits)
+        prefetcher.go(dry_run=dry_run, threads=threads)
+    reports = {}
+    for cycle, node in prefetcher.nodes.items():
+        ready = lambda node, state: [
+            str(asset.ref) for asset in cast(list, node.asset) if asset.ready() is state
+        ]
+        reports[cycle] = {STR.ready: ready(node, True), STR.notready: ready(node, False)}
+    return reports
+
+
+def _prefetch_init(
+    nice: int, quiet: bool, verbose: bool, settings: dict[str, dict[str, Any]]
+) -> None:
+    """
+    Prepare the background process for prefetching.
+
+    :param nice: Priority decrement, as for ``nice(1)``.
+    :param quiet: Log nothing, as the parent process does?
+    :param verbose: Log all messages, as the parent process does?
+    :param settings: The parent process's staging settings, from ``_prefetch_settings()``.
+    """
+    os.nice(nice)
+    _setup_logging(quiet=quiet, verbose=verbose)
+    cache, hpss = settings["cache"], settings["hpss"]
+    _configure_staging_cache(cache_dir=cache["dir"], max_size=cache["max_size"], link=cache["link"])
+    _configure_cache(cache_dir=hpss["dir"], ttl=hpss["ttl"])
+    _http.configure(**settings["http"])
+    _local.configure(**settings["local"])
+
+
+def _prefetch_settings() -> dict[str, dict[str, Any]]:
+    """
+    The staging settings of this process, to apply in the background process.
+
+    A spawned process starts with fresh module state, so settings made via e.g. ``staging_cache()``
+    would otherwise be lost.
+    """
+    return {
+        "cache": vars(_cache.CONFIG).copy(),
+        "hpss": vars(_hpss.CACHE).copy(),
+        "http": vars(_http.CONFIG).copy(),
+        "local": vars(_local.CONFIG).copy(),
+    }
+
+
+def _telemetry(transfers: list[_Transfer], telemetry: Path | str | bool) -> dict[str, Any]:
+    """
+    Summarize transfers, writing the summary to a file if a path is given.
+
+    :param transfers: The recorded transfers.
+    :param telemetry: Path to the JSON summary to write, or True.
+    """
+    summary = _summary(transfers)
+    if not isinstance(telemetry, bool):
+        _write_telemetry(telemetry, summary)
+    return summary
+
+
+def _threads(threads: int, limits: dict[str, int] | None) -> int:
+    """
+    Return the number of concurrent threads to use, raised if necessary to the sum of the limits.
+
+    :param threads: Number of concurrent threads requested.
+    :param limits: Maximum concurrent transfers, keyed by kind.
+    """
+    total = sum((limits or {}).values())
+    if total > threads:
+        _log.warning("Using %s threads, the sum of transfer limits, instead of %s", total, threads)
+        return total
+    return threads
+
+
+__all__ = [
+    "Archiver",
+    "Copier",
+    "Linker",
+    "MakeDirs",
+    "Prefetcher",
+    "Purger",
+    "archive",
+    "archive_plan",
+    "copy",
+    "copy_plan",
+    "hpss_cache",
+    "link",
+    "makedirs",
+    "merge_reports",
+    "prefetch",
+    "purge",
+    "purge_plan",
+    "staging_cache",
+]
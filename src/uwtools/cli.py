@@ -28,6 +28,7 @@ import uwtools.api.rocoto
 import uwtools.api.template
 import uwtools.config.jinja2
 import uwtools.rocoto
+from uwtools.config.support import dict_to_yaml_str
 from uwtools.exceptions import (
     UWConfigKeyError,
     UWConfigRealizeError,
@@ -318,6 +319,7 @@ def _add_subparser_config_compose(subparsers: Subparsers) -> ActionChecks:
     _add_arg_output_format(optional, choices=FORMATS)
     _add_arg_cycle(optional)
     _add_arg_leadtime(optional)
+    _add_arg_threads(optional)
     checks = _add_args_verbosity(optional)
     parser.add_argument("configs", metavar="CONFIG", nargs="+", type=Path)
     return checks
@@ -343,6 +345,9 @@ def _add_subparser_config_realize(subparsers: Subparsers) -> ActionChecks:
     _add_arg_values_needed(optional, helpmsg="Report values needed to realize config, then exit")
     _add_arg_total(optional)
     _add_arg_dry_run(optional)
+    _add_arg_threads(optional)
+    _add_arg_snapshot_file(optional)
+    _add_arg_schema_file(optional)
     return [
         *_add_args_verbosity(optional),
         partial(_check_file_vs_format, STR.input_file, STR.input_format),
@@ -408,6 +413,7 @@ def _dispatch_config_compose(args: Args) -> bool:
         output_format=args[STR.output_format],
         cycle=args[STR.cycle],
         leadtime=args[STR.leadtime],
+        threads=args[STR.threads],
     )
     return True
 
@@ -433,6 +439,9 @@ def _dispatch_config_realize(args: Args) -> bool:
             total=args[STR.total],
             dry_run=args[STR.dry_run],
             stdin_ok=True,
+            threads=args[STR.threads],
+            snapshot_file=args[STR.snapshot_file],
+            schema_file=args[STR.schema_file],
         )
     except UWConfigRealizeError:
         msg = "Config could not be realized."
@@ -526,16 +535,20 @@ def _add_subparser_fs(subparsers: Subparsers) -> ModeChecks:
     _basic_setup(parser)
     subparsers = _add_subparsers(parser, STR.action, STR.action.upper())
     return {
+        STR.archive: _add_subparser_fs_archive(subparsers),
         STR.copy: _add_subparser_fs_copy(subparsers),
         STR.hardlink: _add_subparser_fs_hardlink(subparsers),
         STR.link: _add_subparser_fs_link(subparsers),
         STR.makedirs: _add_subparser_fs_makedirs(subparsers),
+        STR.merge: _add_subparser_fs_merge(subparsers),
+        STR.prefetch: _add_subparser_fs_prefetch(subparsers),
+        STR.purge: _add_subparser_fs_purge(subparsers),
     }
 
 
 def _add_subparser_fs_common(parser: Parser) -> tuple[ActionChecks, Group]:
     """
-    Perform common subparser setup for mode: fs {copy link makedirs}.
+    Perform common subparser setup for mode: fs {archive copy link makedirs purge}.
 
     :param parser: The parser to configure.
     """
@@ -551,6 +564,23 @@ def _add_subparser_fs_common(parser: Parser) -> tuple[ActionChecks, Group]:
     return _add_args_verbosity(optional), optional
 
 
+def _add_subparser_fs_archive(subparsers: Subparsers) -> ActionChecks:
+    """
+    Add subparser for mode: fs archive.
+
+    :param subparsers: Parent parser's subparsers, to add this subparser to.
+    """
+    parser = _add_subparser(subparsers, STR.archive, "Archive files to HPSS in htar bundles")
+    checks, optional = _add_subparser_fs_common(parser)
+    _add_arg_limit(optional)
+    _add_arg_output_manifest(optional)
+    _add_arg_plan(
+        optional,
+        helpmsg="Show plan of bundles, in json (default) or yaml format, without archiving",
+    )
+    return checks
+
+
 def _add_subparser_fs_copy(subparsers: Subparsers) -> ActionChecks:
     """
     Add subparser for mode: fs copy.
@@ -558,7 +588,14 @@ def _add_subparser_fs_copy(subparsers: Subparsers) -> ActionChecks:
     :param subparsers: Parent parser's subparsers, to add this subparser to.
     """
     parser = _add_subparser(subparsers, STR.copy, "Copy files")
-    checks, _ = _add_subparser_fs_common(parser)
+    checks, optional = _add_subparser_fs_common(parser)
+    _add_arg_limit(optional)
+    _add_arg_plan(optional)
+    _add_arg_shard(optional)
+    _add_arg_sync(optional)
+    _add_arg_verify(optional)
+    _add_arg_manifest(optional)
+    _add_arg_telemetry(optional)
     return checks
 
 
@@ -571,6 +608,8 @@ def _add_subparser_fs_hardlink(subparsers: Subparsers) -> ActionChecks:
     parser = _add_subparser(subparsers, STR.hardlink, "Create hardlinks")
     checks, optional = _add_subparser_fs_common(parser)
     _add_arg_fallback(optional)
+    _add_arg_limit(optional)
+    _add_arg_telemetry(optional)
     return checks
 
 
@@ -581,7 +620,9 @@ def _add_subparser_fs_link(subparsers: Subparsers) -> ActionChecks:
     :param subparsers: Parent parser's subparsers, to add this subparser to.
     """
     parser = _add_subparser(subparsers, STR.link, "Create symlinks")
-    checks, _ = _add_subparser_fs_common(parser)
+    checks, optional = _add_subparser_fs_common(parser)
+    _add_arg_limit(optional)
+    _add_arg_telemetry(optional)
     return checks
 
 
@@ -596,6 +637,57 @@ def _add_subparser_fs_makedirs(subparsers: Subparsers) -> ActionChecks:
     return checks
 
 
+def _add_subparser_fs_merge(subparsers: Subparsers) -> ActionChecks:
+    """
+    Add subparser for mode: fs merge.
+
+    :param subparsers: Parent parser's subparsers, to add this subparser to.
+    """
+    parser = _add_subparser(subparsers, STR.merge, "Merge JSON reports on shards of copies")
+    optional = _basic_setup(parser)
+    checks = _add_args_verbosity(optional)
+    parser.add_argument(STR.reports, metavar="REPORT", nargs="+", type=Path)
+    return checks
+
+
+def _add_subparser_fs_prefetch(subparsers: Subparsers) -> ActionChecks:
+    """
+    Add subparser for mode: fs prefetch.
+
+    :param subparsers: Parent parser's subparsers, to add this subparser to.
+    """
+    parser = _add_subparser(subparsers, STR.prefetch, "Copy files for upcoming cycles")
+    optional = _basic_setup(parser)
+    _add_arg_config_file(optional)
+    _add_arg_target_dir(
+        optional, helpmsg="Root directory for relative destination paths (default: driver rundir)"
+    )
+    _add_arg_cycles(optional)
+    _add_arg_leadtime(optional)
+    _add_arg_dry_run(optional)
+    _add_arg_threads(optional)
+    _add_arg_key_path(optional, helpmsg="Dot-separated path of keys to file or driver block")
+    _add_arg_driver(optional)
+    _add_arg_report(optional, helpmsg="Show JSON report on [non]ready assets, per cycle")
+    _add_arg_limit(optional)
+    _add_arg_nice(optional)
+    return _add_args_verbosity(optional)
+
+
+def _add_subparser_fs_purge(subparsers: Subparsers) -> ActionChecks:
+    """
+    Add subparser for mode: fs purge.
+
+    :param subparsers: Parent parser's subparsers, to add this subparser to.
+    """
+    parser = _add_subparser(subparsers, STR.purge, "Purge files and directories")
+    checks, optional = _add_subparser_fs_common(parser)
+    _add_arg_plan(
+        optional, helpmsg="Show plan of purges, in json (default) or yaml format, without purging"
+    )
+    return checks
+
+
 def _dispatch_fs(args: Args) -> bool:
     """
     Define dispatch logic for fs mode.
@@ -603,20 +695,71 @@ def _dispatch_fs(args: Args) -> bool:
     :param args: Parsed command-line args.
     """
     actions = {
+        STR.archive: _dispatch_fs_archive,
         STR.copy: _dispatch_fs_copy,
         STR.hardlink: _dispatch_fs_hardlink,
         STR.link: _dispatch_fs_link,
         STR.makedirs: _dispatch_fs_makedirs,
+        STR.merge: _dispatch_fs_merge,
+        STR.prefetch: _dispatch_fs_prefetch,
+        STR.purge: _dispatch_fs_purge,
     }
     return actions[args[STR.action]](args)
 
 
+def _dispatch_fs_archive(args: Args) -> bool:
+    """
+    Define dispatch logic for fs archive action.
+
+    :param args: Parsed command-line args.
+    """
+    if args[STR.plan]:
+        return _dispatch_fs_archive_plan(args)
+    report = uwtools.api.fs.archive(
+        target_dir=args[STR.target_dir],
+        config=args[STR.config_file],
+        cycle=args[STR.cycle],
+        leadtime=args[STR.leadtime],
+        key_path=args[STR.key_path],
+        dry_run=args[STR.dry_run],
+        threads=args[STR.threads],
+        stdin_ok=True,
+        output=args[STR.output_manifest],
+        limits=dict(args[STR.limit] or []),
+    )
+    return _dispatch_fs_report(report=report if args[STR.report] else None)
+
+
+def _dispatch_fs_archive_plan(args: Args) -> bool:
+    """
+    Define dispatch logic for fs archive action, when planning.
+
+    :param args: Parsed command-line args.
+    """
+    plan = uwtools.api.fs.archive_plan(
+        target_dir=args[STR.target_dir],
+        config=args[STR.config_file],
+        cycle=args[STR.cycle],
+        leadtime=args[STR.leadtime],
+        key_path=args[STR.key_path],
+        stdin_ok=True,
+        output=args[STR.output_manifest],
+    )
+    if args[STR.plan] == FORMAT.yaml:
+        print(dict_to_yaml_str(plan, sort=True))
+    else:
+        print(json.dumps(plan, indent=2, sort_keys=True))
+    return True
+
+
 def _dispatch_fs_copy(args: Args) -> bool:
     """
     Define dispatch logic for fs copy action.
 
     :param args: Parsed command-line args.
     """
+    if args[STR.plan]:
+        return _dispatch_fs_copy_plan(args)
     report = uwtools.api.fs.copy(
         target_dir=args[STR.target_dir],
         config=args[STR.config_file],
@@ -626,10 +769,39 @@ def _dispatch_fs_copy(args: Args) -> bool:
         dry_run=args[STR.dry_run],
         threads=args[STR.threads],
         stdin_ok=True,
+        limits=dict(args[STR.limit] or []),
+        sync=args[STR.sync],
+        verify=args[STR.verify],
+        manifest=args[STR.manifest],
+        telemetry=args[STR.telemetry] or False,
+        shard=args[STR.shard],
     )
     return _dispatch_fs_report(report=report if args[STR.report] else None)
 
 
+def _dispatch_fs_copy_plan(args: Args) -> bool:
+    """
+    Define dispatch logic for fs copy action, when planning.
+
+    :param args: Parsed command-line args.
+    """
+    plan = uwtools.api.fs.copy_plan(
+        target_dir=args[STR.target_dir],
+        config=args[STR.config_file],
+        cycle=args[STR.cycle],
+        leadtime=args[STR.leadtime],
+        key_path=args[STR.key_path],
+        stdin_ok=True,
+        sync=args[STR.sync],
+        shard=args[STR.shard],
+    )
+    if args[STR.plan] == FORMAT.yaml:
+        print(dict_to_yaml_str(plan, sort=True))
+    else:
+        print(json.dumps(plan, indent=2, sort_keys=True))
+    return True
+
+
 def _dispatch_fs_hardlink(args: Args) -> bool:
     """
     Define dispatch logic for fs hardlink action.
@@ -647,6 +819,8 @@ def _dispatch_fs_hardlink(args: Args) -> bool:
         threads=args[STR.threads],
         stdin_ok=True,
         fallback=args[STR.fallback],
+        limits=dict(args[STR.limit] or []),
+        telemetry=args[STR.telemetry] or False,
     )
     return _dispatch_fs_report(report=report if args[STR.report] else None)
 
@@ -666,6 +840,8 @@ def _dispatch_fs_link(args: Args) -> bool:
         dry_run=args[STR.dry_run],
         threads=args[STR.threads],
         stdin_ok=True,
+        limits=dict(args[STR.limit] or []),
+        telemetry=args[STR.telemetry] or False,
     )
     return _dispatch_fs_report(report=report if args[STR.report] else None)
 
@@ -689,7 +865,82 @@ def _dispatch_fs_makedirs(args: Args) -> bool:
     return _dispatch_fs_report(report=report if args[STR.report] else None)
 
 
-def _dispatch_fs_report(report: dict[str, list[str]] | None) -> bool:
+def _dispatch_fs_merge(args: Args) -> bool:
+    """
+    Define dispatch logic for fs merge action.
+
+    :param args: Parsed command-line args.
+    """
+    report = uwtools.api.fs.merge_reports(reports=args[STR.reports])
+    print(json.dumps(report, indent=2, sort_keys=True))
+    return True
+
+
+def _dispatch_fs_prefetch(args: Args) -> bool:
+    """
+    Define dispatch logic for fs prefetch action.
+
+    :param args: Parsed command-line args.
+    """
+    report = uwtools.api.fs.prefetch(
+        cycles=args[STR.cycles],
+        target_dir=args[STR.target_dir],
+        config=args[STR.config_file],
+        leadtime=args[STR.leadtime],
+        key_path=args[STR.key_path],
+        driver=args[STR.driver],
+        dry_run=args[STR.dry_run],
+        threads=args[STR.threads],
+        stdin_ok=True,
+        limits=dict(args[STR.limit] or []),
+        nice=args[STR.nice],
+    ).result()
+    return _dispatch_fs_report(report=report if args[STR.report] else None)
+
+
+def _dispatch_fs_purge(args: Args) -> bool:
+    """
+    Define dispatch logic for fs purge action.
+
+    :param args: Parsed command-line args.
+    """
+    if args[STR.plan]:
+        return _dispatch_fs_purge_plan(args)
+    report = uwtools.api.fs.purge(
+        target_dir=args[STR.target_dir],
+        config=args[STR.config_file],
+        cycle=args[STR.cycle],
+        leadtime=args[STR.leadtime],
+        key_path=args[STR.key_path],
+        dry_run=args[STR.dry_run],
+        threads=args[STR.threads],
+        stdin_ok=True,
+    )
+    return _dispatch_fs_report(report=report if args[STR.report] else None)
+
+
+def _dispatch_fs_purge_plan(args: Args) -> bool:
+    """
+    Define dispatch logic for fs purge action, when planning.
+
+    :param args: Parsed command-line args.
+    """
+    plan = uwtools.api.fs.purge_plan(
+        target_dir=args[STR.target_dir],
+        config=args[STR.config_file],
+        cycle=args[STR.cycle],
+        leadtime=args[STR.leadtime],
+        key_path=args[STR.key_path],
+        stdin_ok=True,
+    )
+    if args[STR.plan] == FORMAT.yaml:
+        print(dict_to_yaml_str(plan, sort=True))
+    else:
+        print(json.dumps(plan, indent=2, sort_keys=True))
+    return True
+
+
+def _dispatch_fs_report(report: dict[str, Any] | None) -> bool:
     """
     Handle reporting for fs operations.
 
@@ -966,6 +1217,17 @@ def _add_arg_cycle(group: Group, required: bool = False) -> None:
     )
 
 
+def _add_arg_cycles(group: Group) -> None:
+    group.add_argument(
+        _switch(STR.cycles),
+        help="The cycles in ISO8601 format (e.g. yyyy-mm-ddThh)",
+        metavar="CYCLE",
+        nargs="+",
+        required=True,
+        type=dt.datetime.fromisoformat,
+    )
+
+
 def _add_arg_database(group: Group) -> None:
     group.add_argument(
         _switch(STR.database),
@@ -976,6 +1238,14 @@ def _add_arg_database(group: Group) -> None:
     )
 
 
+def _add_arg_driver(group: Group) -> None:
+    group.add_argument(
+        _switch(STR.driver),
+        action="store_true",
+        help="Treat the config block as a driver block, staging its files_to_copy in its rundir",
+    )
+
+
 def _add_arg_dry_run(group: Group) -> None:
     group.add_argument(
         _switch(STR.dry_run),
@@ -1080,6 +1350,29 @@ def _add_arg_leadtime(group: Group, required: bool = False) -> None:
     )
 
 
+def _add_arg_limit(group: Group) -> None:
+    group.add_argument(
+        _switch(STR.limit),
+        action="append",
+        help=(
+            "Maximum concurrent transfers of a kind (hpss, http, local), e.g. hpss=2 "
+            "(repeatable; raises --threads to the sum of limits, if necessary)"
+        ),
+        metavar="KIND=NUM",
+        required=False,
+        type=_limit_from_str,
+    )
+
+
+def _add_arg_manifest(group: Group) -> None:
+    group.add_argument(
+        _switch(STR.manifest),
+        help="Path to sha256sum-format manifest of copied files to write",
+        metavar="PATH",
+        type=Path,
+    )
+
+
 def _add_arg_module(group: Group) -> None:
     group.add_argument(
         _switch(STR.module),
@@ -1089,6 +1382,18 @@ def _add_arg_module(group: Group) -> None:
     )
 
 
+def _add_arg_nice(group: Group) -> None:
+    default = 10
+    group.add_argument(
+        _switch(STR.nice),
+        default=default,
+        help="Priority decrement of the background process, as for nice (default: %s)" % default,
+        metavar="NUM",
+        required=False,
+        type=int,
+    )
+
+
 def _add_arg_output_file(group: Group, required: bool = False) -> None:
     group.add_argument(
         _switch(STR.output_file),
@@ -1110,6 +1415,16 @@ def _add_arg_output_format(group: Group, choices: list[str], required: bool = Fa
     )
 
 
+def _add_arg_output_manifest(group: Group) -> None:
+    group.add_argument(
+        _switch(STR.output_manifest),
+        help="Path to JSON output manifest, as shown by a driver's show_output task, to archive",
+        metavar="PATH",
+        required=False,
+        type=_output_manifest_from_path,
+    )
+
+
 def _add_arg_output_dir(group: Group, required: bool = False) -> None:
     """
     Add --output-dir argument.
@@ -1134,6 +1449,18 @@ def _add_arg_partial(group: Group) -> None:
     )
 
 
+def _add_arg_plan(group: Group, helpmsg: str | None = None) -> None:
+    group.add_argument(
+        _switch(STR.plan),
+        choices=[STR.json, FORMAT.yaml],
+        const=STR.json,
+        help=helpmsg or "Show plan of copies, in json (default) or yaml format, without copying",
+        metavar="FORMAT",
+        nargs="?",
+        type=str,
+    )
+
+
 def _add_arg_port(group: Group) -> None:
     group.add_argument(
         _switch(STR.port),
@@ -1236,6 +1563,37 @@ def _add_arg_show_schema(group: Group) -> None:
     )
 
 
+def _add_arg_snapshot_file(group: Group) -> None:
+    group.add_argument(
+        _switch(STR.snapshot_file),
+        help="Path to binary snapshot of realized config to also write",
+        metavar="PATH",
+        type=Path,
+    )
+
+
+def _add_arg_shard(group: Group) -> None:
+    group.add_argument(
+        _switch(STR.shard),
+        help="Copy only shard I of N disjoint shards of the files, numbered from 0",
+        metavar="I/N",
+        required=False,
+        type=_shard_from_str,
+    )
+
+
+def _add_arg_sync(group: Group) -> None:
+    group.add_argument(
+        _switch(STR.sync),
+        choices=[STR.mtime, STR.hash],
+        const=STR.mtime,
+        help="Recopy only destinations differing in size and mtime (default), or hash",
+        metavar="METHOD",
+        nargs="?",
+        type=str,
+    )
+
+
 def _add_arg_target_dir(group: Group, required: bool = False, helpmsg: str | None = None) -> None:
     group.add_argument(
         _switch(STR.target_dir),
@@ -1255,6 +1613,17 @@ def _add_arg_task(group: Group, required: bool = True) -> None:
     )
 
 
+def _add_arg_telemetry(group: Group) -> None:
+    group.add_argument(
+        _switch(STR.telemetry),
+        const=True,
+        help="Include transfer throughput and latency in report, and write them to PATH, if given",
+        metavar="PATH",
+        nargs="?",
+        type=Path,
+    )
+
+
 def _add_arg_threads(group: Group) -> None:
     default = 1
     group.add_argument(
@@ -1334,6 +1703,15 @@ def _add_arg_verbose(group: Group) -> None:
     )
 
 
+def _add_arg_verify(group: Group) -> None:
+    group.add_argument(
+        _switch(STR.verify),
+        help="Path to sha256sum-format manifest of expected digests of copied files",
+        metavar="PATH",
+        type=Path,
+    )
+
+
 def _add_arg_workflow(group: Group) -> None:
     group.add_argument(
         _switch(STR.workflow),
@@ -1667,6 +2045,43 @@ def _switch(arg: str) -> str:
     return "--%s" % arg.replace("_", "-")
 
 
+def _limit_from_str(s: str) -> tuple[str, int]:
+    """
+    Return a transfer kind and maximum parsed from a limit string.
+
+    :param s: The limit string to parse.
+    """
+    if matches := re.fullmatch(r"(\w+)=(\d+)", s):
+        return matches[1], int(matches[2])
+    _abort("Specify limit as KIND=NUM")
+
+
+def _output_manifest_from_path(s: str) -> dict[str, Path | list[Path]]:
+    """
+    Return a driver's output manifest read from a JSON file.
+
+    :param s: Path to the JSON file.
+    """
+    try:
+        manifest = json.loads(Path(s).read_text())
+        return {
+            k: [Path(x) for x in v] if isinstance(v, list) else Path(v) for k, v in manifest.items()
+        }
+    except (AttributeError, OSError, TypeError, ValueError) as e:
+        _abort("Cannot read output manifest %s: %s" % (s, e))
+
+
+def _shard_from_str(s: str) -> tuple[int, int]:
+    """
+    Return a shard index and number of shards parsed from a shard string.
+
+    :param s: The shard string to parse.
+    """
+    if matches := re.fullmatch(r"(\d+)/(\d+)", s):
+        return int(matches[1]), int(matches[2])
+    _abort("Specify shard as I/N")
+
+
 def _timedelta_from_str(tds: str) -> dt.timedelta:
     """
     Return a timedelta parsed from a leadtime string.
@@ -284,6 +284,19 @@ class Config(ABC, UserDict):
         :param path: Path to dump config to (default: stdout).
         """
 
+    @classmethod
+    def patch(cls, base_file: Path | str, values: dict) -> Config:
+        """
+        Return a config read from a base file, updated with the given values, and dereferenced.
+
+        :param base_file: Path to the base config file.
+        :param values: The values to update the base config with.
+        """
+        cfgobj = cls(Path(base_file))
+        cfgobj.update_from(values)
+        cfgobj.dereference()
+        return cfgobj
+
     def update_from(self, src: dict | UserDict) -> None:
         """
         Update a config.
@@ -1,19 +1,26 @@
 from __future__ import annotations
 
+import re
 from collections import OrderedDict
+from copy import deepcopy
+from dataclasses import dataclass, field
 from io import StringIO
-from typing import TYPE_CHECKING
+from pathlib import Path
+from typing import TYPE_CHECKING, Any
 
 import f90nml  # type: ignore[import-untyped]
 from f90nml import Namelist
 
 from uwtools.config.formats.base import Config
+from uwtools.config.support import INCLUDE_TAG
 from uwtools.config.tools import validate_depth
+from uwtools.logging import log
 from uwtools.strings import FORMAT
 from uwtools.utils.file import readable, writable
 
 if TYPE_CHECKING:
-    from pathlib import Path
+    from collections.abc import Callable, Iterator
+    from typing import IO
 
 
 class NMLConfig(Config):
@@ -29,6 +36,7 @@ class NMLConfig(Config):
         """
         super().__init__(config)
         self._parse_include()
+        self._patched: tuple[str, dict] | None = None
 
     # Private methods
 
@@ -62,16 +70,9 @@ class NMLConfig(Config):
 
         :param cfg: A dict object.
         """
-
-        def to_od(d: dict):
-            return OrderedDict(
-                {key: to_od(val) if isinstance(val, dict) else val for key, val in d.items()}
-            )
-
         validate_depth(cfg, FORMAT.nml)
-        nml: Namelist = Namelist(to_od(cfg)) if not isinstance(cfg, Namelist) else cfg
         with StringIO() as sio:
-            nml.write(sio, sort=False)
+            _write(cfg, sio)
             return sio.getvalue().strip()
 
     @staticmethod
@@ -100,9 +101,16 @@ class NMLConfig(Config):
         """
         Dump the config in Fortran namelist format.
 
+        If the config was created by patch() and has not since been modified, the patched text is
+        written verbatim.
+
         :param path: Path to dump config to (default: stdout).
         """
-        self.dump_dict(cfg=self.data, path=path)
+        if self._patched and self._patched[1] == self.data:
+            with writable(path) as f:
+                f.write(self._patched[0])
+        else:
+            self.dump_dict(cfg=self.data, path=path)
 
     @classmethod
     def dump_dict(cls, cfg: dict | Namelist, path: Path | None = None) -> None:
@@ -112,5 +120,382 @@ class NMLConfig(Config):
         :param cfg: The in-memory config object to dump.
         :param path: Path to dump config to (default: stdout).
         """
+        validate_depth(cfg, FORMAT.nml)
         with writable(path) as f:
-            print(cls._dict_to_str(cfg), file=f)
+            _write(cfg, f)
+
+    @classmethod
+    def patch(cls, base_file: Path | str, values: dict) -> NMLConfig:
+        """
+        Return a config read from a base file, updated with the given values, and dereferenced.
+
+        Only the assignments whose values changed are rewritten in the base file's text, and new
+        variables and groups are added, so that dump() reproduces all other content of the base
+        file, including comments and formatting, verbatim. Changes that cannot be made in place
+        (e.g. to array-element assignments, or removals) cause dump() to rewrite the file in full.
+
+        :param base_file: Path to the base namelist file.
+        :param values: The values to update the base config with.
+        """
+        base_file = Path(base_file)
+        cfgobj = cls(base_file)
+        base = deepcopy(cfgobj.data)
+        cfgobj.update_from(values)
+        cfgobj.dereference()
+        with readable(base_file) as f:
+            text = f.read()
+        changes = _changes(base, cfgobj.data)
+        patched = (
+            None
+            if changes is None or INCLUDE_TAG in text or not _patchable(changes)
+            else _patch(text, changes, cls._dict_to_str)
+        )
+        if patched is None:
+            log.debug("Cannot patch %s in place, rewriting", base_file)
+        else:
+            cfgobj._patched = (patched, deepcopy(cfgobj.data))
+            log.debug("Patched %s", base_file)
+        return cfgobj
+
+
+@dataclass
+class _Group:
+    """
+    A namelist group located in namelist text.
+
+    :param name: The group name.
+    :param end: Offset of the group terminator.
+    :param assignments: Map from variable paths to (LHS, value start, value end) tuples.
+    """
+
+    name: str
+    end: int = -1
+    assignments: dict[str, list[tuple[str, int, int]]] = field(default_factory=dict)
+
+
+def _changes(old: dict, new: dict) -> dict | None:
+    """
+    Return the entries in new that are missing from, or differ from those in, old.
+
+    :param old: The original data.
+    :param new: The updated data.
+    :return: The changed entries, or None if new lacks entries present in old.
+    """
+    if not set(old).issubset(new):
+        return None
+    changes = {}
+    for key, val in new.items():
+        if isinstance(val, dict) and isinstance(old.get(key), dict):
+            sub = _changes(old[key], val)
+            if sub is None:
+                return None
+            if sub:
+                changes[key] = sub
+        elif key not in old or old[key] != val:
+            changes[key] = val
+    return changes
+
+
+def _f90repr(val: Any) -> str:
+    """
+    Return the Fortran representation of a scalar value, as f90nml writes it by default.
+
+    :param val: A scalar value.
+    """
+    if isinstance(val, bool):
+        return ".true." if val else ".false."
+    if isinstance(val, (int, float)):
+        return str(val)
+    if isinstance(val, complex):
+        return "(%s, %s)" % (val.real, val.imag)
+    if isinstance(val, str):
+        return repr(str(val)).replace("\\'", "''").replace('\\"', '""').replace("\\\\", "\\")
+    return ""
+
+
+def _leaves(d: dict, path: tuple[str, ...] = ()) -> list[tuple[tuple[str, ...], Any]] | None:
+    """
+    Return (path, value) pairs for the leaf values in a group's data.
+
+    :param d: Group data, possibly with nested derived-type values.
+    :param path: Keys leading to the given data.
+    :return: The leaves, or None if the data contains arrays of derived types.
+    """
+    leaves = []
+    for key, val in d.items():
+        if isinstance(val, dict):
+            sub = _leaves(val, (*path, key))
+            if sub is None:
+                return None
+            leaves.extend(sub)
+        elif isinstance(val, list) and any(isinstance(x, dict) for x in val):
+            return None
+        else:
+            leaves.append(((*path, key), val))
+    return leaves
+
+
+def _lines(header: str, strs: list[str]) -> list[str]:
+    """
+    Return the lines assigning the given value representations, wrapped as f90nml wraps them.
+
+    :param header: The assignment's LHS, through the equals sign and following space.
+    :param strs: Fortran representations of the values.
+    """
+    width = len(header) + 1 if len(header) >= _WIDTH else _WIDTH
+    pad = " " * len(header)
+    last = len(strs) - 1
+    lines, line = [], header
+    for i, s in enumerate(strs):
+        line += s + (", " if i < last else "")
+        if len(line) >= width:
+            lines.append(line.rstrip())
+            line = pad
+    if line and not line.isspace():
+        lines.append(line.rstrip())
+    return lines
+
+
+def _patch(text: str, changes: dict, fmt: Callable[[dict], str]) -> str | None:
+    """
+    Return namelist text with changed values applied in place.
+
+    :param text: The base namelist text.
+    :param changes: The changed values, keyed by group name.
+    :param fmt: A function returning the namelist representation of a dict.
+    :return: The patched text, or None if the changes cannot be made in place.
+    """
+    groups = _scan(text)
+    if groups is None:
+        return None
+    edits: list[tuple[int, int, str]] = []
+    new = {}
+    for gname, gvals in changes.items():
+        matches = [g for g in groups if g.name == gname.lower()]
+        if not matches:
+            new[gname] = gvals
+            continue
+        group_edits = _patch_group(text, matches, gname, gvals, fmt)
+        if group_edits is None:
+            return None
+        edits.extend(group_edits)
+    for start, end, replacement in sorted(edits, reverse=True):
+        text = text[:start] + replacement + text[end:]
+    if new:
+        text = "%s\n%s\n" % (text if text.endswith("\n") else text + "\n", fmt(new))
+    return text
+
+
+def _patch_group(
+    text: str, matches: list[_Group], gname: str, gvals: Any, fmt: Callable[[dict], str]
+) -> list[tuple[int, int, str]] | None:
+    """
+    Return (start, end, replacement) edits applying changed values to a group.
+
+    :param text: The base namelist text.
+    :param matches: The groups in the text with the given name.
+    :param gname: The group name.
+    :param gvals: The group's changed values.
+    :param fmt: A function returning the namelist representation of a dict.
+    :return: The edits, or None if the changes cannot be made in place.
+    """
+    leaves = _leaves(gvals) if isinstance(gvals, dict) else None
+    if len(matches) > 1 or leaves is None:
+        return None
+    group, edits, lines = matches[0], [], []
+    for path, val in leaves:
+        key = "%".join(path).lower()
+        nested: Any = val
+        for k in reversed(path):
+            nested = {k: nested}
+        body = fmt({gname: nested}).split("\n")[1:-1]
+        if spans := group.assignments.get(key):
+            lhs, start, end = spans[0]
+            if len(spans) > 1 or lhs != key:
+                return None
+            edits.append((start, end, "\n".join(body).split("=", 1)[1].strip()))
+        elif any(k.startswith(key + "%") or key.startswith(k + "%") for k in group.assignments):
+            return None
+        else:
+            lines.extend(body)
+    if lines:
+        linestart = text.rfind("\n", 0, group.end) + 1
+        if text[linestart : group.end].strip():
+            edits.append((group.end, group.end, "\n%s\n" % "\n".join(lines)))
+        else:
+            edits.append((linestart, linestart, "".join("%s\n" % line for line in lines)))
+    return edits
+
+
+def _patchable(val: Any) -> bool:
+    """
+    Can the given value be written into a namelist?
+
+    :param val: A value.
+    """
+    if isinstance(val, dict):
+        return all(isinstance(k, str) and _patchable(v) for k, v in val.items())
+    if isinstance(val, list):
+        return all(_patchable(v) for v in val)
+    return val is None or isinstance(val, (bool, complex, float, int, str))
+
+
+def _scan(text: str) -> list[_Group] | None:
+    """
+    Locate the groups, and the assignments in them, in namelist text.
+
+    :param text: Namelist text.
+    :return: The groups, or None if the text could not be scanned.
+    """
+    groups: list[_Group] = []
+    group: _Group | None = None
+    assignment: list | None = None  # [key, lhs, value start, value end]
+
+    def finish() -> None:
+        if group is not None and assignment is not None:
+            key, lhs, start, end = assignment
+            group.assignments.setdefault(key, []).append((lhs, start, end))
+
+    i, n = 0, len(text)
+    while i < n:
+        c = text[i]
+        if c == "!":
+            i = n if (eol := text.find("\n", i)) == -1 else eol
+        elif group is None:
+            m = _NAME.match(text, i + 1) if c in "&$" else None
+            group, assignment = (_Group(name=m[0].lower()), None) if m else (None, None)
+            i = m.end() if m else i + 1
+        elif c == "/" or (c in "&$" and _END.match(text, i + 1)):
+            finish()
+            group.end = i
+            groups.append(group)
+            group = None
+            i += 1
+        elif c.isspace() or c == ",":
+            i += 1
+        elif (c.isalpha() or c == "_") and (m := _LHS.match(text, i)):
+            finish()
+            lhs = re.sub(r"\s", "", m[0][:-1]).lower()
+            assignment = [re.sub(r"\([^()]*\)", "", lhs), lhs, m.end(), m.end()]
+            i = m.end()
+        elif assignment is None or (j := _skip_value(text, i)) == -1:
+            return None
+        else:
+            if assignment[2] == assignment[3]:
+                assignment[2] = i
+            i = assignment[3] = j
+    return None if group else groups
+
+
+def _skip_value(text: str, i: int) -> int:
+    """
+    Return the offset just past the value token starting at the given offset.
+
+    :param text: Namelist text.
+    :param i: Offset of the start of the value token.
+    :return: The offset, or -1 for an unterminated string.
+    """
+    c = text[i]
+    if c in "'\"":
+        j = text.find(c, i + 1) + 1
+        while 0 < j < len(text) and text[j] == c:  # doubled quote: escaped, string continues
+            j = text.find(c, j + 1) + 1
+        return j or -1
+    m = _VALUE.match(text, i)
+    return m.end() if m else i + 1
+
+
+def _streamable(val: Any, nested: bool = False) -> bool:
+    """
+    Can the given value be written by the native namelist writer?
+
+    :param val: A value.
+    :param nested: Is the value an element of a multidimensional array?
+    """
+    if isinstance(val, Namelist):
+        return False
+    if isinstance(val, dict):
+        keys = {k.lower() for k in val if isinstance(k, str)}
+        return (
+            len(keys) == len(val)
+            and not any(_SPECIAL.match(k) for k in keys)
+            and all(_streamable(v) for v in val.values())
+        )
+    if isinstance(val, list):
+        items = [v for v in val if v is not None]
+        if any(isinstance(v, list) for v in items):
+            return all(isinstance(v, list) and _streamable(v, nested=True) for v in items)
+        if any(isinstance(v, dict) for v in items):
+            return not nested and all(isinstance(v, dict) and _streamable(v) for v in items)
+        return all(isinstance(v, _SCALARS) for v in items)
+    return val is None or isinstance(val, _SCALARS)
+
+
+def _var_lines(name: str, val: Any, idx: tuple[int, ...] = (), sort: bool = False) -> Iterator[str]:
+    """
+    Yield the lines assigning a value to a namelist variable, as f90nml writes them by default.
+
+    :param name: The variable name.
+    :param val: The variable's value.
+    :param idx: Outer indices of a multidimensional array's element.
+    :param sort: Order derived-type components by name? (f90nml does, in arrays of derived types.)
+    """
+    if isinstance(val, list) and any(isinstance(v, list) for v in val):
+        for i, v in enumerate(val, start=1):
+            yield from _var_lines(name, v, (*idx, i))
+    elif isinstance(val, dict):
+        for key, v in sorted(val.items()) if sort else val.items():
+            yield from _var_lines("%s%%%s" % (name, key.lower()), v, sort=sort)
+    elif isinstance(val, list) and any(isinstance(v, dict) for v in val):
+        for i, v in enumerate(val, start=1):
+            if v is not None:
+                yield from _var_lines("%s(%s)" % (name, i), v, sort=True)
+    else:
+        values = val if isinstance(val, list) else [val]
+        # Numeric arrays, e.g. per-level coefficients, are formatted in bulk:
+        fmt = str if {type(v) for v in values} <= {float, int} else _f90repr
+        idxstr = "(:,%s)" % ",".join(map(str, reversed(idx))) if idx else ""
+        lines = _lines("%s%s%s = " % (_INDENT, name, idxstr), list(map(fmt, values)))
+        if lines and (not values or values[-1] is None):
+            lines[-1] += " ,"
+        yield from lines
+
+
+def _write(cfg: dict, f: IO) -> None:
+    """
+    Write a config to a file handle in Fortran namelist format.
+
+    Configs of plain values of the types uwtools configs can contain are written directly by a
+    native writer, whose output is identical to that of f90nml with its default formatting. Others,
+    e.g. Namelist objects, which carry their own formatting properties, are written by f90nml.
+
+    :param cfg: A dict or Namelist object.
+    :param f: The handle to write to.
+    """
+    if not (_streamable(cfg) and all(isinstance(group, dict) for group in cfg.values())):
+
+        def to_od(d: dict):
+            return OrderedDict(
+                {key: to_od(val) if isinstance(val, dict) else val for key, val in d.items()}
+            )
+
+        nml: Namelist = Namelist(to_od(cfg)) if not isinstance(cfg, Namelist) else cfg
+        nml.write(f, sort=False)
+        return
+    for i, (name, group) in enumerate(cfg.items()):
+        f.write("%s&%s\n" % ("\n" if i else "", name.lower()))
+        for key, val in group.items():
+            f.writelines("%s\n" % line for line in _var_lines(key.lower(), val))
+        f.write("/\n")
+
+
+_END = re.compile(r"end(?![\w])", re.IGNORECASE)
+_LHS = re.compile(
+    r"[a-z_]\w*(\s*\([^()]*\))?(\s*%\s*[a-z_]\w*(\s*\([^()]*\))?)*\s*=", re.IGNORECASE
+)
+_INDENT = " " * 4
+_NAME = re.compile(r"[a-z_]\w*", re.IGNORECASE)
+_SCALARS = (bool, complex, float, int, str)
+_SPECIAL = re.compile(r"_(complex|grp_.*|start_index)$")
+_VALUE = re.compile(r"[^\s,!/'\"&$]+")
+_WIDTH = 72
@@ -1,14 +1,18 @@
 from __future__ import annotations
 
+from collections.abc import Hashable, Mapping
+from copy import copy, deepcopy
 from types import SimpleNamespace as ns
-from typing import TYPE_CHECKING, NoReturn
+from typing import TYPE_CHECKING, Any, NoReturn
 
 import yaml
 from yaml.constructor import ConstructorError
 
 from uwtools.config.formats.base import Config
+from uwtools.config.snapshot import is_snapshot, load_snapshot
 from uwtools.config.support import (
     INCLUDE_TAG,
+    depth,
     dict_to_yaml_str,
     log_and_error,
     uw_yaml_loader,
@@ -18,8 +22,14 @@ from uwtools.strings import FORMAT
 from uwtools.utils.file import readable, writable
 
 if TYPE_CHECKING:
+    from collections import UserDict
+    from collections.abc import Iterator
     from pathlib import Path
 
+    from uwtools.config.snapshot import Snapshot
+
+_MAPTAG = "tag:yaml.org,2002:map"
+
 _MSGS = ns(
     unhashable="""
 ERROR:
@@ -52,6 +62,8 @@ class YAMLConfig(Config):
     Work with YAML configs.
     """
 
+    _snapshot: Snapshot | None = None
+
     # Private methods
 
     @staticmethod
@@ -89,6 +101,11 @@ class YAMLConfig(Config):
 
         :param config_file: Path to config file to load.
         """
+        if config_file and is_snapshot(config_file):
+            snapshot = load_snapshot(config_file)
+            if config_file == self._config_file:
+                self._snapshot = snapshot
+            return snapshot.data
         with readable(config_file) as f:
             s = f.read()
         try:
@@ -133,12 +150,22 @@ class YAMLConfig(Config):
         """
         A loader with all UW constructors added.
         """
-        loader = uw_yaml_loader()
+        # Use a loader class private to this config, so that !include tags resolve relative paths
+        # against this config's file, regardless of other YAMLConfig objects loaded concurrently or
+        # in the meantime.
+        loader: type[yaml.SafeLoader] = type("_Loader", (uw_yaml_loader(),), {})
         loader.add_constructor(INCLUDE_TAG, self._yaml_include)
         return loader
 
     # Public methods
 
+    @property
+    def snapshot(self) -> Snapshot | None:
+        """
+        The snapshot this config was loaded from, if any.
+        """
+        return self._snapshot
+
     def dump(self, path: Path | None = None) -> None:
         """
         Dump the config in YAML format.
@@ -159,6 +186,177 @@ class YAMLConfig(Config):
             print(cls._dict_to_str(cfg), file=f)
 
 
+class LazyYAMLConfig(YAMLConfig):
+    """
+    Work with YAML configs, constructing sections only when they are accessed.
+
+    The document is composed into a node graph once, but Python objects are constructed from nodes
+    only on demand, so that e.g. ``!include`` tags are processed only for sections actually used.
+    Operations needing the whole config, like dumping or dereferencing, construct all of it.
+    """
+
+    _loader: yaml.SafeLoader
+
+    # Private methods
+
+    def _construct(self, node: yaml.Node) -> Any:
+        """
+        Construct the Python object represented by a node.
+
+        :param node: A YAML node.
+        """
+        try:
+            return self._loader.construct_object(node, deep=True)
+        except ConstructorError as e:
+            self._load_handle_constructor_error(self._config_file, e)
+
+    @property
+    def _depth(self) -> int:
+        """
+        The depth of this config's hierarchy (1, for as-yet unconstructed configs).
+        """
+        return 1 if isinstance(self.data, LazyYAMLMapping) else depth(self.data)
+
+    @classmethod
+    def _dict_to_str(cls, cfg: dict) -> str:
+        """
+        Return the YAML representation of the given dict.
+
+        :param cfg: The in-memory config object.
+        """
+        return dict_to_yaml_str(materialize(cfg))
+
+    def _load(self, config_file: Path | None) -> dict:
+        """
+        Read this config's YAML file and compose its node graph.
+
+        See docs for Config._load().
+
+        :param config_file: Path to config file to load.
+        """
+        if config_file != self._config_file or (config_file and is_snapshot(config_file)):
+            # Included files and snapshots are loaded eagerly.
+            return super()._load(config_file)
+        with readable(config_file) as f:
+            s = f.read()
+        # The loader is kept, so that !include tags constructed later use this config's constructor.
+        self._loader = self._yaml_loader(s)
+        node = self._loader.get_single_node()
+        if not isinstance(node, yaml.MappingNode) or node.tag != _MAPTAG:
+            config = None if node is None else self._construct(node)
+            self._load_handle_non_dict_value(type(config).__name__, config_file)
+        return LazyYAMLMapping(node, self)  # type: ignore[return-value]
+
+    def _yaml_include(self, loader: yaml.Loader, node: yaml.SequenceNode) -> dict:
+        """
+        Return a dictionary with include tags processed.
+
+        Includes are processed only when the sections containing them are accessed, so report any
+        that cannot be read as config errors.
+
+        :param loader: The YAML loader.
+        :param node: A YAML node.
+        :raises: UWConfigError if an included file cannot be read.
+        """
+        try:
+            return super()._yaml_include(loader, node)
+        except OSError as e:
+            raise log_and_error("Cannot include %s: %s" % (e.filename, e.strerror)) from e
+
+    # Public methods
+
+    def dereference(self, context: dict | None = None) -> LazyYAMLConfig:
+        """
+        Render as much Jinja2 syntax as possible, constructing the whole config first.
+        """
+        self.data = materialize(self.data)
+        super().dereference(context)
+        return self
+
+    def update_from(self, src: dict | UserDict) -> None:
+        """
+        Update a config, constructing the whole config first.
+
+        :param src: The dictionary with new data to use.
+        """
+        self.data = materialize(self.data)
+        super().update_from(src)
+
+
+class LazyYAMLMapping(Mapping):
+    """
+    A read-only mapping constructing its values from YAML nodes on first access.
+
+    Nested plain mappings are themselves represented as lazy mappings. Deep copies share the same
+    (read-only) view: Use materialize() to obtain plain, independent data.
+    """
+
+    def __init__(self, node: yaml.MappingNode, config: LazyYAMLConfig) -> None:
+        """
+        :param node: The YAML node representing the mapping.
+        :param config: The config whose loader constructs values.
+        """
+        config._loader.flatten_mapping(node)  # noqa: SLF001
+        self._config = config
+        self._nodes: dict[Any, yaml.Node] = {}
+        self._values: dict[Any, Any] = {}
+        for key_node, value_node in node.value:
+            key = config._construct(key_node)  # noqa: SLF001
+            if not isinstance(key, Hashable):
+                config._load_handle_constructor_error(  # noqa: SLF001
+                    config.config_file,
+                    ConstructorError(
+                        "while constructing a mapping",
+                        node.start_mark,
+                        "found unhashable key",
+                        key_node.start_mark,
+                    ),
+                )
+            self._nodes[key] = value_node
+
+    def __deepcopy__(self, _memo: dict) -> LazyYAMLMapping:
+        return self
+
+    def __getitem__(self, key: Any) -> Any:
+        if key not in self._values:
+            node = self._nodes[key]
+            if isinstance(node, yaml.MappingNode) and node.tag == _MAPTAG:
+                self._values[key] = LazyYAMLMapping(node, self._config)
+            else:
+                self._values[key] = self._config._construct(node)  # noqa: SLF001
+        return self._values[key]
+
+    def __iter__(self) -> Iterator:
+        return iter(self._nodes)
+
+    def __len__(self) -> int:
+        return len(self._nodes)
+
+    def replace(self, key: Any, val: Any) -> LazyYAMLMapping:
+        """
+        Return a copy of this mapping, with the value at the given (existing) key replaced.
+
+        :param key: The key whose value to replace.
+        :param val: The replacement value.
+        """
+        new = copy(self)
+        new._values = {**self._values, key: val}  # noqa: SLF001
+        return new
+
+
+def materialize(val: Any) -> Any:
+    """
+    Return a deep copy of the given value, with lazy mappings constructed as plain dicts.
+
+    :param val: A value, possibly a lazy mapping or containing lazy mappings.
+    """
+    if isinstance(val, (dict, LazyYAMLMapping)):
+        return {k: materialize(v) for k, v in val.items()}
+    if isinstance(val, list):
+        return [materialize(v) for v in val]
+    return deepcopy(val)
+
+
 def _write_plain_open_ended(self: yaml.emitter.Emitter, *args, **kwargs) -> None:
     """
     Write YAML without the "..." end-of-stream marker.
@@ -13,7 +13,7 @@ from typing import Any, NoReturn
 
 import yaml
 from jinja2 import Environment, FileSystemLoader, StrictUndefined, Undefined, meta
-from jinja2.exceptions import UndefinedError
+from jinja2.exceptions import TemplateSyntaxError, UndefinedError
 
 from uwtools.config.support import (
     UWYAMLConvert,
@@ -259,6 +259,26 @@ def unrendered(s: str) -> bool:
     return False
 
 
+def variables(val: _ConfigVal) -> set[str]:
+    """
+    Return the names of top-level variables referenced by Jinja2 expressions in the given value.
+
+    :param val: A value possibly containing Jinja2 syntax.
+    """
+    if isinstance(val, dict):
+        return set().union(*[variables(x) for kv in val.items() for x in kv])
+    if isinstance(val, list):
+        return set().union(*[variables(x) for x in val])
+    if isinstance(val, (UWYAMLConvert, UWYAMLGlob)):
+        val = val.value
+    if isinstance(val, str):
+        try:
+            return meta.find_undeclared_variables(Environment().parse(val))
+        except TemplateSyntaxError:
+            pass
+    return set()
+
+
 # Private functions
 
 
@@ -0,0 +1,130 @@
+"""
+Support for binary snapshots of realized configs.
+"""
+
+from __future__ import annotations
+
+import json
+import pickle
+from dataclasses import dataclass
+from hashlib import sha256
+from pathlib import Path
+
+from uwtools.exceptions import UWConfigError
+from uwtools.logging import log
+from uwtools.utils.file import atomic, resource_path
+
+# A snapshot file consists of the MAGIC bytes, the hex SHA-256 digest of the payload and a newline,
+# and the payload itself: a pickled dict (protocol 5) containing the config data and metadata
+# describing the state of that data when the snapshot was made. Snapshots are meant to be written
+# and read by uwtools itself: As with any pickle, only load snapshots from trusted sources.
+
+MAGIC = b"UWSNAPSHOT\n"
+PROTOCOL = 5
+
+
+@dataclass(frozen=True)
+class Snapshot:
+    """
+    A config snapshot.
+
+    :param data: The config data.
+    :param realized: Was the data fully realized when the snapshot was made?
+    :param schema: Digest of the schema file the data was validated against, if any.
+    :param version: The uwtools version that made the snapshot.
+    """
+
+    data: dict
+    realized: bool
+    schema: str | None
+    version: str
+
+    @property
+    def current(self) -> bool:
+        """
+        Was this snapshot made by the running version of uwtools?
+        """
+        return self.version == _version()
+
+    def validated(self, schema_file: Path) -> bool:
+        """
+        Was the snapshot data validated against the given schema by this version of uwtools?
+
+        :param schema_file: Path to a JSON Schema file.
+        """
+        return self.current and self.schema is not None and self.schema == digest(schema_file)
+
+
+def digest(path: Path) -> str:
+    """
+    Return the hex SHA-256 digest of a file's content.
+
+    :param path: Path to the file.
+    """
+    return sha256(path.read_bytes()).hexdigest()
+
+
+def dump_snapshot(
+    data: dict, path: Path, realized: bool, schema_file: Path | None = None
+) -> Snapshot:
+    """
+    Write a config snapshot to a file.
+
+    :param data: The config data.
+    :param path: Path to write the snapshot to.
+    :param realized: Is the data fully realized?
+    :param schema_file: Path to the JSON Schema file the data was validated against, if any.
+    :return: The snapshot written.
+    """
+    snapshot = Snapshot(
+        data=data,
+        realized=realized,
+        schema=digest(schema_file) if schema_file else None,
+        version=_version(),
+    )
+    payload = pickle.dumps(snapshot.__dict__, protocol=PROTOCOL)
+    with atomic(path) as tmp:
+        tmp.write_bytes(MAGIC + sha256(payload).hexdigest().encode() + b"\n" + payload)
+    log.debug("Wrote config snapshot to %s", path)
+    return snapshot
+
+
+def is_snapshot(path: Path | str) -> bool:
+    """
+    Does the given file contain a config snapshot?
+
+    :param path: Path to the file.
+    """
+    try:
+        with Path(path).open("rb") as f:
+            return f.read(len(MAGIC)) == MAGIC
+    except OSError:
+        return False
+
+
+def load_snapshot(path: Path | str) -> Snapshot:
+    """
+    Read a config snapshot from a file.
+
+    :param path: Path to the snapshot file.
+    :return: The snapshot.
+    :raises: UWConfigError if the file is not a valid snapshot.
+    """
+    content = Path(path).read_bytes()
+    header, _, payload = content[len(MAGIC) :].partition(b"\n")
+    if not content.startswith(MAGIC) or sha256(payload).hexdigest().encode() != header:
+        msg = "Invalid or corrupt config snapshot: %s" % path
+        raise UWConfigError(msg)
+    snapshot = Snapshot(**pickle.loads(payload))  # noqa: S301
+    log.debug("Read config snapshot from %s", path)
+    if not snapshot.current:
+        log.debug("Snapshot %s was made by uwtools %s", path, snapshot.version)
+    return snapshot
+
+
+def _version() -> str:
+    """
+    Return the uwtools version.
+    """
+    info = json.loads(resource_path("info.json").read_text())
+    return str(info["version"])
@@ -5,12 +5,14 @@ Tools for working with configs.
 from __future__ import annotations
 
 import os
-from functools import reduce
+from collections.abc import Mapping
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial, reduce
 from operator import getitem
 from pathlib import Path
 from tempfile import mkstemp
 from textwrap import indent
-from typing import TYPE_CHECKING, cast
+from typing import TYPE_CHECKING, Any, TypeVar, cast
 from uuid import uuid4
 
 from yaml.composer import ComposerError
@@ -18,15 +20,26 @@ from yaml.composer import ComposerError
 from uwtools.config.formats.base import Config
 from uwtools.config.formats.yaml import YAMLConfig
 from uwtools.config.jinja2 import unrendered
-from uwtools.config.support import YAMLKey, depth, format_to_config, log_and_error
+from uwtools.config.snapshot import dump_snapshot
+from uwtools.config.support import (
+    YAMLKey,
+    depth,
+    dict_to_yaml_str,
+    format_to_config,
+    log_and_error,
+)
+from uwtools.config.validator import validate_external
 from uwtools.exceptions import UWConfigError, UWConfigKeyError, UWConfigRealizeError, UWError
 from uwtools.logging import log
 from uwtools.strings import FORMAT
 from uwtools.utils.file import get_config_format
 
 if TYPE_CHECKING:
+    from collections.abc import Callable, Iterable
     from datetime import datetime, timedelta
 
+T = TypeVar("T")
+
 # Public functions
 
 
@@ -56,6 +69,7 @@ def compose(
     output_format: str | None = None,
     cycle: datetime | None = None,
     leadtime: timedelta | None = None,
+    threads: int = 1,
 ) -> Config:
     """
     NB: This docstring is dynamically replaced: See compose.__doc__ definition below.
@@ -107,21 +121,26 @@ def compose(
                 del cfgobj[key]
             return cfgobj
 
-    def cfgobj_update(config: Config, path: Path) -> Config:
+    def cfgobj_update(config: Config, path_and_cfgobj: tuple[Path, Config]) -> Config:
         """
-        Update the given Config object with config data from the given file.
+        Update the given Config object with config data parsed from the given file.
 
         :param config: The Config objet to update.
-        :param path: Path to the file containing config data to update with.
+        :param path_and_cfgobj: Path to the file containing config data, and its parsed Config.
         :return: And updated Config object.
         """
+        path, cfgobj = path_and_cfgobj
         log.debug("Composing '%s' config from %s", input_format, path)
-        config.update_from(cfgobj_get(path))
+        config.update_from(cfgobj)
         return config
 
+    # Configs are parsed concurrently, when requested, but are merged strictly in the given order,
+    # so that the composed result does not depend on the number of threads used.
+
     input_format = input_format or get_config_format(configs[0], "input")
     input_class: type[Config] = format_to_config(input_format)
-    config = reduce(cfgobj_update, configs[1:], cfgobj_get(configs[0]))
+    cfgobjs = _map_concurrently(cfgobj_get, configs, threads)
+    config = reduce(cfgobj_update, zip(configs[1:], cfgobjs[1:], strict=True), cfgobjs[0])
     output_format = output_format or get_config_format(output_file, "output")
     output_class = format_to_config(output_format)
     output_config: Config = output_class(config)
@@ -144,12 +163,20 @@ def realize(
     values_needed: bool = False,
     total: bool = False,
     dry_run: bool = False,
+    threads: int = 1,
+    snapshot_file: Path | None = None,
+    schema_file: Path | None = None,
 ) -> dict:
     """
     NB: This docstring is dynamically replaced: See realize.__doc__ definition below.
     """
-    input_obj = _realize_input_setup(input_config, input_format)
-    input_obj = _realize_update(input_obj, update_config, update_format)
+    loaders: list[Callable[[], Config | Path | dict | None]] = [
+        partial(_realize_input_setup, input_config, input_format),
+        partial(_realize_update_load, update_config, update_format),
+    ]
+    input_obj, update_obj = _map_concurrently(lambda f: f(), loaders, threads)
+    assert isinstance(input_obj, Config)
+    input_obj = _realize_update(input_obj, update_obj, update_format)
     _realize_cfgobj(input_obj, cycle, leadtime)
     output_data, output_format = _realize_output_setup(
         input_obj, output_file, output_format, key_path
@@ -161,12 +188,21 @@ def realize(
         raise UWConfigRealizeError(msg)
     if values_needed:
         return incomplete
+    if schema_file:
+        validate_external(schema_file=schema_file, desc="realized config", config_data=output_data)
     if dry_run:
         for line in str(input_obj).strip().split("\n"):
             log.info(line)
         return {}
     output_class = cast(Config, format_to_config(output_format))
     output_class.dump_dict(cfg=output_data, path=output_file)
+    if snapshot_file:
+        dump_snapshot(
+            data=output_data,
+            path=snapshot_file,
+            realized=not unrendered(dict_to_yaml_str(output_data)),
+            schema_file=schema_file,
+        )
     return input_obj.data
 
 
@@ -201,10 +237,10 @@ def walk_key_path(config: dict, key_path: list[YAMLKey]) -> tuple[dict, str]:
         except KeyError as e:
             msg = f"Bad config path: {pathstr}"
             raise log_and_error(msg) from e
-        if not isinstance(subconfig, dict):
+        if not isinstance(subconfig, Mapping):
             msg = f"Value at {pathstr} must be a dictionary"
             raise log_and_error(msg)
-        config = subconfig
+        config = cast(dict, subconfig)
     return config, pathstr
 
 
@@ -231,6 +267,21 @@ def _ensure_format(
     return get_config_format(config, desc)
 
 
+def _map_concurrently(f: Callable[[Any], T], xs: Iterable[Any], threads: int) -> list[T]:
+    """
+    Map a function over a collection, using a pool of threads if more than one is requested.
+
+    :param f: The function to map.
+    :param xs: The values to map the function over.
+    :param threads: Number of concurrent threads to use.
+    :return: The results, in the order of the given values.
+    """
+    if threads > 1:
+        with ThreadPoolExecutor(max_workers=threads) as executor:
+            return list(executor.map(f, xs))
+    return list(map(f, xs))
+
+
 def _realize_cfgobj(config: Config, cycle: datetime | None, leadtime: timedelta | None) -> None:
     """
     Realize the given Config object.
@@ -329,6 +380,25 @@ def _realize_update(
     return input_obj
 
 
+def _realize_update_load(
+    update_config: Config | Path | dict | None = None,
+    update_format: str | None = None,
+) -> Config | Path | dict | None:
+    """
+    Load a config-realize update config from a file, so that it can be parsed concurrently with the
+    input config.
+
+    :param update_config: Update config source (None => read from stdin).
+    :param update_format: Format of the update config.
+    :return: The loaded Config object, or the update config source itself if it was not a file.
+    """
+    if isinstance(update_config, Path):
+        update_format = _ensure_format("update", update_format, update_config)
+        update_obj: Config = format_to_config(update_format)(config=update_config)
+        return update_obj
+    return update_config
+
+
 def _realize_values_needed(config: Config) -> dict[str, list[list]]:
     """
     Report key paths of keys and values with incompletely rendered content.
@@ -403,6 +473,7 @@ Recognized file extensions are: {extensions}
 :param output_format: Format of output config (choices: {choices}, default: {default}).
 :param cycle: A datetime object to make available for use in configs.
 :param leadtime: A timedelta object to make available for use in configs.
+:param threads: Number of concurrent threads to use to parse configs.
 :return: The composed config.
 """.format(
     default=FORMAT.yaml,
@@ -425,6 +496,9 @@ Recognized file extensions are: {extensions}
 :param values_needed: Report complete, missing, and template values.
 :param total: Require rendering of all Jinja2 variables/expressions.
 :param dry_run: Log output instead of writing to output.
+:param threads: Number of concurrent threads to use to parse input and update configs.
+:param snapshot_file: Also write the realized config, as a binary snapshot, to this path.
+:param schema_file: Validate the realized config against this JSON Schema file.
 :raises: UWConfigRealizeError if total is True and config cannot be totally realized.
 :return: The realized config (or an empty-dict for no-op modes).
 """.format(extensions=", ".join(FORMAT.extensions())).strip()
@@ -2,6 +2,7 @@
 A driver for the CDEPS data models.
 """
 
+from functools import partial
 from pathlib import Path
 
 from iotaa import Asset, collection, task
@@ -11,6 +12,7 @@ from uwtools.config.formats.nml import NMLConfig
 from uwtools.drivers.driver import AssetsCycleBased
 from uwtools.drivers.support import set_driver_docstring
 from uwtools.strings import STR
+from uwtools.utils.statcache import is_file
 from uwtools.utils.tasks import file
 
 
@@ -40,7 +42,7 @@ class CDEPS(AssetsCycleBased):
         fn = "datm_in"
         yield self.taskname(f"namelist file {fn}")
         path = self.rundir / fn
-        yield Asset(path, path.is_file)
+        yield Asset(path, partial(is_file, path))
         yield None
         self._model_namelist_file("atm_in", path)
 
@@ -52,7 +54,7 @@ class CDEPS(AssetsCycleBased):
         fn = "datm.streams"
         yield self.taskname(f"stream file {fn}")
         path = self.rundir / fn
-        yield Asset(path, path.is_file)
+        yield Asset(path, partial(is_file, path))
         template_file = self.config["atm_streams"]["template_file"]
         yield file(path=Path(template_file))
         self._model_stream_file("atm_streams", path, template_file)
@@ -76,7 +78,7 @@ class CDEPS(AssetsCycleBased):
         fn = "docn_in"
         yield self.taskname(f"namelist file {fn}")
         path = self.rundir / fn
-        yield Asset(path, path.is_file)
+        yield Asset(path, partial(is_file, path))
         yield None
         self._model_namelist_file("ocn_in", path)
 
@@ -88,7 +90,7 @@ class CDEPS(AssetsCycleBased):
         fn = "docn.streams"
         yield self.taskname(f"stream file {fn}")
         path = self.rundir / fn
-        yield Asset(path, path.is_file)
+        yield Asset(path, partial(is_file, path))
         template_file = self.config["ocn_streams"]["template_file"]
         yield file(path=Path(template_file))
         self._model_stream_file("ocn_streams", path, template_file)
@@ -2,6 +2,7 @@
 A driver for chgres_cube.
 """
 
+from functools import partial
 from pathlib import Path
 from typing import Any
 
@@ -11,6 +12,7 @@ from uwtools.config.formats.nml import NMLConfig
 from uwtools.drivers.driver import DriverCycleLeadtimeBased
 from uwtools.drivers.support import set_driver_docstring
 from uwtools.strings import STR
+from uwtools.utils.statcache import is_file
 from uwtools.utils.tasks import file
 
 
@@ -40,7 +42,7 @@ class ChgresCube(DriverCycleLeadtimeBased):
         fn = "fort.41"
         yield self.taskname(f"namelist file {fn}")
         path = self.rundir / fn
-        yield Asset(path, path.is_file)
+        yield Asset(path, partial(is_file, path))
         input_files = []
         namelist = self.config[STR.namelist]
         if base_file := namelist.get(STR.base_file):
@@ -95,7 +97,7 @@ class ChgresCube(DriverCycleLeadtimeBased):
         """
         path = self._runscript_path
         yield self.taskname(path.name)
-        yield Asset(path, path.is_file)
+        yield Asset(path, partial(is_file, path))
         yield None
         envvars = {
             "KMP_AFFINITY": "scatter",
@@ -12,11 +12,17 @@ from copy import deepcopy
 from functools import partial
 from pathlib import Path
 from textwrap import dedent
-from typing import TYPE_CHECKING, Any
+from typing import TYPE_CHECKING, Any, cast
 
 from iotaa import Asset, collection, external, task
 
-from uwtools.config.formats.yaml import YAMLConfig
+from uwtools.config.formats.yaml import (
+    LazyYAMLConfig,
+    LazyYAMLMapping,
+    YAMLConfig,
+    materialize,
+)
+from uwtools.config.jinja2 import variables
 from uwtools.config.tools import walk_key_path
 from uwtools.config.validator import (
     bundle,
@@ -31,8 +37,10 @@ from uwtools.scheduler import JobScheduler
 from uwtools.strings import STR
 from uwtools.utils.file import writable
 from uwtools.utils.processing import run_shell_cmd
+from uwtools.utils.statcache import is_file
 
 if TYPE_CHECKING:
+    from collections.abc import Mapping
     from datetime import datetime, timedelta
 
     from uwtools.config.formats.base import Config
@@ -55,16 +63,26 @@ class Assets(ABC):
         schema_file: Path | None = None,
         controller: list[YAMLKey] | None = None,
     ) -> None:
-        config_copy = YAMLConfig(config)
-        config_copy.dereference(
-            context={
-                **({STR.cycle: cycle} if cycle else {}),
-                **({STR.leadtime: leadtime} if leadtime is not None else {}),
-                **config_copy.data,
-            }
-        )
-        self._config_full: dict = config_copy.data
-        self._config_intermediate, _ = walk_key_path(self._config_full, key_path or [])
+        context = {
+            **({STR.cycle: cycle} if cycle else {}),
+            **({STR.leadtime: leadtime} if leadtime is not None else {}),
+        }
+        snapshot = None
+        if isinstance(config, LazyYAMLConfig) and isinstance(config.data, LazyYAMLMapping):
+            # Construct and dereference only the block at the key path, and the parts of the rest of
+            # the config needed to render it.
+            self._config_full: dict | LazyYAMLMapping = _dereference_lazy(
+                config.data, key_path or [], context
+            )
+        else:
+            config_copy = YAMLConfig(config)
+            snapshot = config_copy.snapshot
+            if snapshot and snapshot.realized:
+                log.debug("Using realized config snapshot %s", config_copy.config_file)
+            else:
+                config_copy.dereference(context={**context, **config_copy.data})
+            self._config_full = config_copy.data
+        self._config_intermediate, _ = walk_key_path(cast(dict, self._config_full), key_path or [])
         try:
             self._config: dict = self._config_intermediate[self.driver_name()]
         except KeyError as e:
@@ -72,6 +90,16 @@ class Assets(ABC):
             raise UWConfigError(msg) from e
         self._delegate(controller, STR.rundir)
         self.schema_file = schema_file
+        # A snapshot validated against this driver's schema need not be validated again, unless a
+        # key path or controller means that the config to validate differs from the snapshot's.
+        self._prevalidated = bool(
+            snapshot
+            and not key_path
+            and not controller
+            and snapshot.validated(
+                self.schema_file or internal_schema_file(schema_name=self._schema_name())
+            )
+        )
         self._validate()
 
     def __repr__(self) -> str:
@@ -98,7 +126,8 @@ class Assets(ABC):
         """
         A copy of the original input config, dereferenced.
         """
-        return deepcopy(self._config_full)
+        config: dict = materialize(self._config_full)
+        return config
 
     @staticmethod
     def create_user_updated_config(
@@ -114,9 +143,7 @@ class Assets(ABC):
         """
         user_values = config_values.get(STR.update_values, {})
         if base_file := config_values.get(STR.base_file):
-            cfgobj = config_class(base_file)
-            cfgobj.update_from(user_values)
-            cfgobj.dereference()
+            cfgobj = config_class.patch(base_file, user_values)
             config = cfgobj.data
             dump = partial(cfgobj.dump, path)
         else:
@@ -232,6 +259,9 @@ class Assets(ABC):
 
         :raises: UWConfigError if config fails validation.
         """
+        if self._prevalidated:
+            log.debug("Skipping validation of %s config validated in snapshot", self.driver_name())
+            return
         kwargs: dict = {
             "config_data": self._config_intermediate,
             "desc": "%s config" % self.driver_name(),
@@ -382,7 +412,7 @@ class Driver(Assets):
         """
         path = self._runscript_path
         yield self.taskname(path.name)
-        yield Asset(path, path.is_file)
+        yield Asset(path, partial(is_file, path))
         yield None
         self._write_runscript(path)
 
@@ -411,7 +441,7 @@ class Driver(Assets):
         yield self.taskname("run via batch submission")
         suffix = ".submit"
         path = Path("%s%s" % (self._runscript_path, suffix))
-        yield Asset(path, path.is_file)
+        yield Asset(path, partial(is_file, path))
         yield self.provisioned_rundir()
         success = self._scheduler.submit_job(runscript=self._runscript_path, submit_file=path)
         if not success:
@@ -424,7 +454,7 @@ class Driver(Assets):
         """
         yield self.taskname("run via local execution")
         path = self.rundir / self._runscript_done_file
-        yield Asset(path, path.is_file)
+        yield Asset(path, partial(is_file, path))
         yield self.provisioned_rundir()
         cmd = "./{x} >{x}.out 2>&1".format(x=self._runscript_path.name)
         run_shell_cmd(cmd=cmd, cwd=self.rundir, log_output=True)
@@ -667,6 +697,43 @@ class DriverTimeInvariant(Driver):
 DriverT = type[Assets] | type[Driver]
 
 
+def _dereference_lazy(
+    config: LazyYAMLMapping, key_path: list[YAMLKey], context: dict
+) -> dict | LazyYAMLMapping:
+    """
+    Return a config with only the block at the given key path constructed and dereferenced.
+
+    The result is a lazy mapping, unless the key path is empty.
+
+    :param config: A lazily constructed config.
+    :param key_path: Keys leading to the block to dereference.
+    :param context: Additional values to use when dereferencing.
+    """
+    block, _ = walk_key_path(cast(dict, config), key_path)
+    data = materialize(block)
+    for key in reversed(key_path):
+        data = {key: data}
+    # Provide as context only the top-level config values referenced by the block's Jinja2
+    # expressions, and dereference again if values taken from them reference yet more values.
+    names: set[str] = set()
+    while True:
+        names |= variables(data)
+        values = {name: config[name] for name in sorted(names) if name in config}
+        data = YAMLConfig(data).dereference(context={**context, **values}).data
+        if variables(data) <= names:
+            break
+    rendered, _ = walk_key_path(data, key_path)
+
+    def graft(m: Mapping, keys: list[YAMLKey]) -> Any:
+        if not keys:
+            return rendered
+        val = graft(m[keys[0]], keys[1:])
+        return m.replace(keys[0], val) if isinstance(m, LazyYAMLMapping) else {**m, keys[0]: val}
+
+    full: dict | LazyYAMLMapping = graft(config, key_path)
+    return full
+
+
 def _add_docstring(class_: type, omit: list[str] | None = None) -> None:
     """
     Dynamically add docstring to a driver class.
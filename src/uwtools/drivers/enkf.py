@@ -4,6 +4,7 @@ A driver for the EnKF component.
 
 from __future__ import annotations
 
+from functools import partial
 from pathlib import Path
 
 from iotaa import Asset, collection, task
@@ -15,6 +16,7 @@ from uwtools.drivers.stager import FileStager
 from uwtools.drivers.support import set_driver_docstring
 from uwtools.fs import Linker
 from uwtools.strings import STR
+from uwtools.utils.statcache import is_file
 from uwtools.utils.tasks import file
 
 
@@ -58,7 +60,7 @@ class EnKF(DriverCycleBased, FileStager):
         """
         path = self._input_config_path
         yield self.taskname(path.name)
-        yield Asset(path, path.is_file)
+        yield Asset(path, partial(is_file, path))
         base_file = self.config[STR.namelist].get(STR.base_file)
         yield file(Path(base_file)) if base_file else None
         self.create_user_updated_config(
@@ -91,7 +93,7 @@ class EnKF(DriverCycleBased, FileStager):
         """
         path = self._runscript_path
         yield self.taskname(path.name)
-        yield Asset(path, path.is_file)
+        yield Asset(path, partial(is_file, path))
         yield None
         envvars = {
             "OMP_NUM_THREADS": self.config.get(STR.execution, {}).get(STR.threads, 1),
@@ -2,6 +2,7 @@
 A driver for esg_grid.
 """
 
+from functools import partial
 from pathlib import Path
 
 from iotaa import Asset, collection, task
@@ -10,6 +11,7 @@ from uwtools.config.formats.nml import NMLConfig
 from uwtools.drivers.driver import DriverTimeInvariant
 from uwtools.drivers.support import set_driver_docstring
 from uwtools.strings import STR
+from uwtools.utils.statcache import is_file
 from uwtools.utils.tasks import file
 
 
@@ -28,7 +30,7 @@ class ESGGrid(DriverTimeInvariant):
         fn = "regional_grid.nml"
         yield self.taskname(fn)
         path = self.rundir / fn
-        yield Asset(path, path.is_file)
+        yield Asset(path, partial(is_file, path))
         base_file = self.config[STR.namelist].get(STR.base_file)
         yield file(Path(base_file)) if base_file else None
         self.create_user_updated_config(
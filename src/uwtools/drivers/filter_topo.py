@@ -2,6 +2,7 @@
 A driver for filter_topo.
 """
 
+from functools import partial
 from pathlib import Path
 
 from iotaa import Asset, collection, task
@@ -10,6 +11,7 @@ from uwtools.config.formats.nml import NMLConfig
 from uwtools.drivers.driver import DriverTimeInvariant
 from uwtools.drivers.support import set_driver_docstring
 from uwtools.strings import STR
+from uwtools.utils.statcache import is_file
 from uwtools.utils.tasks import filecopy, symlink
 
 
@@ -28,7 +30,7 @@ class FilterTopo(DriverTimeInvariant):
         src = Path(self.config["config"]["input_grid_file"])
         dst = Path(self.config[STR.rundir], src.name)
         yield self.taskname(f"Input grid {src!s}")
-        yield Asset(dst, dst.is_file)
+        yield Asset(dst, partial(is_file, dst))
         yield symlink(target=src, linkname=dst)
 
     @task
@@ -39,7 +41,7 @@ class FilterTopo(DriverTimeInvariant):
         src = Path(self.config["config"]["input_raw_orog"])
         dst = self.output["path"]
         yield self.taskname(f"Raw orog input {dst!s}")
-        yield Asset(dst, dst.is_file)
+        yield Asset(dst, partial(is_file, dst))
         yield filecopy(src=src, dst=dst)
 
     @task
@@ -50,7 +52,7 @@ class FilterTopo(DriverTimeInvariant):
         fn = "input.nml"
         path = self.rundir / fn
         yield self.taskname(f"namelist file {fn}")
-        yield Asset(path, path.is_file)
+        yield Asset(path, partial(is_file, path))
         yield None
         self.create_user_updated_config(
             config_class=NMLConfig,
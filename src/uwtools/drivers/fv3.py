@@ -2,6 +2,7 @@
 A driver for the FV3 model.
 """
 
+from functools import partial
 from pathlib import Path
 
 from iotaa import Asset, collection, task
@@ -13,7 +14,8 @@ from uwtools.drivers.driver import DriverCycleBased
 from uwtools.drivers.stager import FileStager
 from uwtools.drivers.support import set_driver_docstring
 from uwtools.strings import STR
-from uwtools.utils.tasks import file, filecopy, symlink
+from uwtools.utils.statcache import is_dir, is_file
+from uwtools.utils.tasks import file, filecopy, link_batch
 
 
 class FV3(DriverCycleBased, FileStager):
@@ -41,7 +43,7 @@ class FV3(DriverCycleBased, FileStager):
                     self.rundir / "INPUT" / f"gfs_bndy.tile{n}.{(boundary_hour - offset):03d}.nc"
                 )
                 symlinks[target] = linkname
-        yield [symlink(target=tgt, linkname=lnk) for tgt, lnk in symlinks.items()]
+        yield [link_batch(pairs=list(symlinks.items()))]
 
     @task
     def diag_table(self):
@@ -51,7 +53,7 @@ class FV3(DriverCycleBased, FileStager):
         fn = "diag_table"
         yield self.taskname(fn)
         path = self.rundir / fn
-        yield Asset(path, path.is_file)
+        yield Asset(path, partial(is_file, path))
         template_file = Path(self.config[fn]["template_file"])
         yield file(template_file)
         render(
@@ -71,7 +73,7 @@ class FV3(DriverCycleBased, FileStager):
         fn = "field_table"
         yield self.taskname(fn)
         path = self.rundir / fn
-        yield Asset(path, path.is_file)
+        yield Asset(path, partial(is_file, path))
         yield filecopy(src=Path(self.config["field_table"][STR.base_file]), dst=path)
 
     @task
@@ -82,7 +84,7 @@ class FV3(DriverCycleBased, FileStager):
         fn = "model_configure"
         yield self.taskname(fn)
         path = self.rundir / fn
-        yield Asset(path, path.is_file)
+        yield Asset(path, partial(is_file, path))
         base_file = self.config["model_configure"].get(STR.base_file)
         yield file(Path(base_file)) if base_file else None
         self.create_user_updated_config(
@@ -99,7 +101,7 @@ class FV3(DriverCycleBased, FileStager):
         fn = "input.nml"
         yield self.taskname(fn)
         path = self.rundir / fn
-        yield Asset(path, path.is_file)
+        yield Asset(path, partial(is_file, path))
         base_file = self.config[STR.namelist].get(STR.base_file)
         yield file(Path(base_file)) if base_file else None
         self.create_user_updated_config(
@@ -137,7 +139,7 @@ class FV3(DriverCycleBased, FileStager):
         """
         yield self.taskname("RESTART directory")
         path = self.rundir / "RESTART"
-        yield Asset(path, path.is_dir)
+        yield Asset(path, partial(is_dir, path))
         yield None
         path.mkdir(parents=True)
 
@@ -148,7 +150,7 @@ class FV3(DriverCycleBased, FileStager):
         """
         path = self._runscript_path
         yield self.taskname(path.name)
-        yield Asset(path, path.is_file)
+        yield Asset(path, partial(is_file, path))
         yield None
         envvars = {
             "ESMF_RUNTIME_COMPLIANCECHECK": "OFF:depth=4",
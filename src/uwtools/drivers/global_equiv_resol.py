@@ -2,6 +2,7 @@
 A driver for the global_equiv_resol component.
 """
 
+from functools import partial
 from pathlib import Path
 
 from iotaa import Asset, collection, external
@@ -9,6 +10,7 @@ from iotaa import Asset, collection, external
 from uwtools.drivers.driver import DriverTimeInvariant
 from uwtools.drivers.support import set_driver_docstring
 from uwtools.strings import STR
+from uwtools.utils.statcache import is_file
 
 
 class GlobalEquivResol(DriverTimeInvariant):
@@ -25,7 +27,7 @@ class GlobalEquivResol(DriverTimeInvariant):
         """
         path = Path(self.config["input_grid_file"])
         yield self.taskname(path.name)
-        yield Asset(path, path.is_file)
+        yield Asset(path, partial(is_file, path))
 
     @collection
     def provisioned_rundir(self):
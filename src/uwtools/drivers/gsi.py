@@ -4,6 +4,7 @@ A driver for the GSI component.
 
 from __future__ import annotations
 
+from functools import partial
 from pathlib import Path
 
 from iotaa import Asset, collection, task
@@ -14,6 +15,7 @@ from uwtools.drivers.driver import DriverCycleBased
 from uwtools.drivers.stager import FileStager
 from uwtools.drivers.support import set_driver_docstring
 from uwtools.strings import STR
+from uwtools.utils.statcache import is_file
 from uwtools.utils.tasks import file
 
 
@@ -32,7 +34,7 @@ class GSI(DriverCycleBased, FileStager):
         fn = "coupler.res"
         yield self.taskname(fn)
         path = self.rundir / fn
-        yield Asset(path, path.is_file)
+        yield Asset(path, partial(is_file, path))
         template_file = Path(self.config[fn]["template_file"])
         yield file(template_file)
         render(
@@ -50,7 +52,7 @@ class GSI(DriverCycleBased, FileStager):
         """
         path = self.rundir / "filelist03"
         yield self.taskname(path.name)
-        yield Asset(path, path.is_file)
+        yield Asset(path, partial(is_file, path))
         yield None
         files = self.config["filelist"]
         path.write_text("\n".join(sorted(files)))
@@ -62,7 +64,7 @@ class GSI(DriverCycleBased, FileStager):
         """
         path = self._input_config_path
         yield self.taskname(path.name)
-        yield Asset(path, path.is_file)
+        yield Asset(path, partial(is_file, path))
         base_file = self.config[STR.namelist].get(STR.base_file)
         yield file(Path(base_file)) if base_file else None
         self.create_user_updated_config(
@@ -101,7 +103,7 @@ class GSI(DriverCycleBased, FileStager):
         """
         path = self._runscript_path
         yield self.taskname(path.name)
-        yield Asset(path, path.is_file)
+        yield Asset(path, partial(is_file, path))
         yield None
         envvars = {
             "OMP_NUM_THREADS": self.config.get(STR.execution, {}).get(STR.threads, 1),
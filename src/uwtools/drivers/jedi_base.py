@@ -3,6 +3,7 @@ A base class for JEDI-based drivers.
 """
 
 from abc import abstractmethod
+from functools import partial
 from pathlib import Path
 
 from iotaa import Asset, collection, task
@@ -11,6 +12,7 @@ from uwtools.config.formats.yaml import YAMLConfig
 from uwtools.drivers.driver import DriverCycleBased
 from uwtools.drivers.stager import FileStager
 from uwtools.strings import STR
+from uwtools.utils.statcache import is_file
 from uwtools.utils.tasks import file
 
 
@@ -29,7 +31,7 @@ class JEDIBase(DriverCycleBased, FileStager):
         fn = self._config_fn
         yield self.taskname(fn)
         path = self.rundir / fn
-        yield Asset(path, path.is_file)
+        yield Asset(path, partial(is_file, path))
         base_file = self.config["configuration_file"].get(STR.base_file)
         yield file(Path(base_file)) if base_file else None
         self.create_user_updated_config(
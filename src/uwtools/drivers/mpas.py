@@ -3,6 +3,7 @@ A driver for the MPAS Atmosphere component.
 """
 
 from datetime import datetime, timedelta, timezone
+from functools import partial
 from pathlib import Path
 
 from iotaa import Asset, collection, task
@@ -11,7 +12,8 @@ from uwtools.config.formats.nml import NMLConfig
 from uwtools.drivers.mpas_base import MPASBase
 from uwtools.drivers.support import set_driver_docstring
 from uwtools.strings import STR
-from uwtools.utils.tasks import file, symlink
+from uwtools.utils.statcache import is_file
+from uwtools.utils.tasks import file, link_batch
 
 
 class MPAS(MPASBase):
@@ -37,7 +39,7 @@ class MPAS(MPASBase):
             target = Path(lbcs["path"], fn)
             linkname = self.rundir / fn
             symlinks[target] = linkname
-        yield [symlink(target=tgt, linkname=lnk) for tgt, lnk in symlinks.items()]
+        yield [link_batch(pairs=list(symlinks.items()))]
 
     @task
     def namelist_file(self):
@@ -46,7 +48,7 @@ class MPAS(MPASBase):
         """
         path = self.rundir / "namelist.atmosphere"
         yield self.taskname(str(path))
-        yield Asset(path, path.is_file)
+        yield Asset(path, partial(is_file, path))
         base_file = self.config[STR.namelist].get(STR.base_file)
         yield file(Path(base_file)) if base_file else None
         duration = timedelta(hours=self.config["length"])
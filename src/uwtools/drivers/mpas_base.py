@@ -7,7 +7,7 @@ from __future__ import annotations
 import re
 from abc import abstractmethod
 from datetime import datetime, timezone
-from functools import reduce
+from functools import partial, reduce
 from itertools import islice
 from typing import TYPE_CHECKING, cast
 
@@ -18,6 +18,7 @@ from lxml.etree import Element, SubElement
 
 from uwtools.drivers.driver import DriverCycleBased
 from uwtools.drivers.stager import FileStager
+from uwtools.utils.statcache import is_file
 
 if TYPE_CHECKING:
     from pathlib import Path
@@ -58,7 +59,7 @@ class MPASBase(DriverCycleBased, FileStager):
         fn = self._streams_fn
         yield self.taskname(fn)
         path = self.rundir / fn
-        yield Asset(path, path.is_file)
+        yield Asset(path, partial(is_file, path))
         yield None
         streams = Element("streams")
         for k, v in self.config["streams"].items():
@@ -3,6 +3,7 @@ A driver for the MPAS Init component.
 """
 
 from datetime import datetime, timedelta, timezone
+from functools import partial
 from pathlib import Path
 
 from iotaa import Asset, collection, task
@@ -11,7 +12,8 @@ from uwtools.config.formats.nml import NMLConfig
 from uwtools.drivers.mpas_base import MPASBase
 from uwtools.drivers.support import set_driver_docstring
 from uwtools.strings import STR
-from uwtools.utils.tasks import file, symlink
+from uwtools.utils.statcache import is_file
+from uwtools.utils.tasks import file, link_batch
 
 
 class MPASInit(MPASBase):
@@ -39,7 +41,7 @@ class MPASInit(MPASBase):
             target = Path(boundary_filepath, fn)
             linkname = self.rundir / fn
             symlinks[target] = linkname
-        yield [symlink(target=tgt, linkname=lnk) for tgt, lnk in symlinks.items()]
+        yield [link_batch(pairs=list(symlinks.items()))]
 
     @task
     def namelist_file(self):
@@ -49,7 +51,7 @@ class MPASInit(MPASBase):
         fn = "namelist.init_atmosphere"
         yield self.taskname(fn)
         path = self.rundir / fn
-        yield Asset(path, path.is_file)
+        yield Asset(path, partial(is_file, path))
         base_file = self.config[STR.namelist].get(STR.base_file)
         yield file(Path(base_file)) if base_file else None
         initial_ts, final_ts = self._initial_and_final_ts
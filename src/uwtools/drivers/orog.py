@@ -2,6 +2,7 @@
 A driver for UFS_UTILS's orog.
 """
 
+from functools import partial
 from pathlib import Path
 
 from iotaa import Asset, collection, external, task
@@ -11,6 +12,7 @@ from uwtools.drivers.stager import FileStager
 from uwtools.drivers.support import set_driver_docstring
 from uwtools.strings import STR
 from uwtools.utils.file import writable
+from uwtools.utils.statcache import is_file
 
 
 class Orog(DriverTimeInvariant, FileStager):
@@ -27,7 +29,7 @@ class Orog(DriverTimeInvariant, FileStager):
         """
         grid_file = Path(self.config["grid_file"])
         yield self.taskname(f"Input grid file {grid_file}")
-        yield Asset(grid_file, grid_file.is_file) if str(grid_file) != "none" else None
+        yield Asset(grid_file, partial(is_file, grid_file)) if str(grid_file) != "none" else None
 
     @task
     def input_config_file(self):
@@ -36,7 +38,7 @@ class Orog(DriverTimeInvariant, FileStager):
         """
         path = self._input_config_path
         yield self.taskname(str(path))
-        yield Asset(path, path.is_file)
+        yield Asset(path, partial(is_file, path))
         yield self.grid_file()
         if inputs := self.config.get("old_line1_items"):
             ordered_entries = [
@@ -81,7 +83,7 @@ class Orog(DriverTimeInvariant, FileStager):
         """
         path = self._runscript_path
         yield self.taskname(path.name)
-        yield Asset(path, path.is_file)
+        yield Asset(path, partial(is_file, path))
         yield None
         envvars = {
             "KMP_AFFINITY": "disabled",
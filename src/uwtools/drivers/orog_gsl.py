@@ -2,6 +2,7 @@
 A driver for orog_gsl.
 """
 
+from functools import partial
 from pathlib import Path
 
 from iotaa import Asset, collection, task
@@ -10,6 +11,7 @@ from uwtools.drivers.driver import DriverTimeInvariant
 from uwtools.drivers.support import set_driver_docstring
 from uwtools.strings import STR
 from uwtools.utils.file import writable
+from uwtools.utils.statcache import is_file
 from uwtools.utils.tasks import symlink
 
 
@@ -27,7 +29,7 @@ class OrogGSL(DriverTimeInvariant):
         """
         path = self._input_config_path
         yield self.taskname(str(path))
-        yield Asset(path, path.is_file)
+        yield Asset(path, partial(is_file, path))
         yield None
         inputs = [str(self.config["config"][k]) for k in ("tile", "resolution", "halo")]
         with writable(path) as f:
@@ -44,7 +46,7 @@ class OrogGSL(DriverTimeInvariant):
         src = Path(self.config["config"]["input_grid_file"])
         dst = self.rundir / fn
         yield self.taskname("Input grid")
-        yield Asset(dst, dst.is_file)
+        yield Asset(dst, partial(is_file, dst))
         yield symlink(target=src, linkname=dst)
 
     @collection
@@ -70,7 +72,7 @@ class OrogGSL(DriverTimeInvariant):
         src = Path(self.config["config"]["topo_data_2p5m"])
         dst = self.rundir / fn
         yield self.taskname("Topo data 2.5-min")
-        yield Asset(dst, dst.is_file)
+        yield Asset(dst, partial(is_file, dst))
         yield symlink(target=src, linkname=dst)
 
     @task
@@ -82,7 +84,7 @@ class OrogGSL(DriverTimeInvariant):
         src = Path(self.config["config"]["topo_data_30s"])
         dst = self.rundir / fn
         yield self.taskname("Topo data 30-sec")
-        yield Asset(dst, dst.is_file)
+        yield Asset(dst, partial(is_file, dst))
         yield symlink(target=src, linkname=dst)
 
     # Public helper methods
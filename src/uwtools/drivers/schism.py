@@ -2,6 +2,7 @@
 An assets driver for SCHISM.
 """
 
+from functools import partial
 from pathlib import Path
 
 from iotaa import Asset, collection, task
@@ -10,6 +11,7 @@ from uwtools.api.template import render
 from uwtools.drivers.driver import AssetsCycleBased
 from uwtools.drivers.support import set_driver_docstring
 from uwtools.strings import STR
+from uwtools.utils.statcache import is_file
 from uwtools.utils.tasks import file
 
 
@@ -28,7 +30,7 @@ class SCHISM(AssetsCycleBased):
         fn = "param.nml"
         yield self.taskname(fn)
         path = self.rundir / fn
-        yield Asset(path, path.is_file)
+        yield Asset(path, partial(is_file, path))
         template_file = Path(self.config[STR.namelist]["template_file"])
         yield file(path=template_file)
         render(
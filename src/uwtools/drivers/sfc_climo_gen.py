@@ -3,6 +3,7 @@ A driver for sfc_climo_gen.
 """
 
 import re
+from functools import partial
 from pathlib import Path
 
 from iotaa import Asset, collection, task
@@ -11,6 +12,7 @@ from uwtools.config.formats.nml import NMLConfig
 from uwtools.drivers.driver import DriverTimeInvariant
 from uwtools.drivers.support import set_driver_docstring
 from uwtools.strings import STR
+from uwtools.utils.statcache import is_file
 from uwtools.utils.tasks import file
 
 
@@ -29,7 +31,7 @@ class SfcClimoGen(DriverTimeInvariant):
         fn = "fort.41"
         yield self.taskname(f"namelist file {fn}")
         path = self.rundir / fn
-        yield Asset(path, path.is_file)
+        yield Asset(path, partial(is_file, path))
         vals = self.config[STR.namelist][STR.update_values]["config"]
         input_paths = [Path(v) for k, v in vals.items() if k.startswith("input_")]
         input_paths += [Path(vals["mosaic_file_mdl"])]
@@ -2,6 +2,7 @@
 A driver for shave.
 """
 
+from functools import partial
 from pathlib import Path
 
 from iotaa import Asset, collection, task
@@ -10,6 +11,7 @@ from uwtools.drivers.driver import DriverTimeInvariant
 from uwtools.drivers.support import set_driver_docstring
 from uwtools.strings import STR
 from uwtools.utils.file import writable
+from uwtools.utils.statcache import is_file
 from uwtools.utils.tasks import file
 
 
@@ -27,7 +29,7 @@ class Shave(DriverTimeInvariant):
         """
         path = self._input_config_path
         yield self.taskname(str(path))
-        yield Asset(path, path.is_file)
+        yield Asset(path, partial(is_file, path))
         config = self.config["config"]
         input_file = Path(config["input_grid_file"])
         yield file(path=input_file)
@@ -5,7 +5,7 @@ A driver for the ungrib component.
 from __future__ import annotations
 
 from datetime import timedelta
-from functools import cached_property
+from functools import cached_property, partial
 from pathlib import Path
 
 from iotaa import Asset, collection, task
@@ -16,7 +16,8 @@ from uwtools.drivers.support import set_driver_docstring
 from uwtools.exceptions import UWConfigError
 from uwtools.strings import STR
 from uwtools.utils.processing import run_shell_cmd
-from uwtools.utils.tasks import file
+from uwtools.utils.statcache import is_file, is_symlink
+from uwtools.utils.tasks import file, link_batch
 from uwtools.utils.time import to_datetime, to_iso8601, to_timedelta
 
 
@@ -36,9 +37,8 @@ class Ungrib(DriverCycleBased):
         """
         yield self.taskname("GRIB files")
         files = [Path(p) for p in self.config["gribfiles"]]
-        yield [
-            self._gribfile(src, self.rundir / f"GRIBFILE.{_ext(i)}") for i, src in enumerate(files)
-        ]
+        pairs = [(src, self.rundir / f"GRIBFILE.{_ext(i)}") for i, src in enumerate(files)]
+        yield [link_batch(pairs=pairs)]
 
     @task
     def namelist_file(self):
@@ -63,7 +63,7 @@ class Ungrib(DriverCycleBased):
         }
         path = self.rundir / "namelist.wps"
         yield self.taskname(str(path))
-        yield Asset(path, path.is_file)
+        yield Asset(path, partial(is_file, path))
         yield None
         self.create_user_updated_config(
             config_class=NMLConfig,
@@ -91,7 +91,7 @@ class Ungrib(DriverCycleBased):
         """
         path = self.rundir / "Vtable"
         yield self.taskname(str(path))
-        yield Asset(path, path.is_symlink)
+        yield Asset(path, partial(is_symlink, path))
         infile = Path(self.config["vtable"])
         yield file(path=infile)
         path.parent.mkdir(parents=True, exist_ok=True)
@@ -103,7 +103,7 @@ class Ungrib(DriverCycleBased):
         A run executed directly on the local system.
         """
         yield self.taskname("run via local execution")
-        yield [Asset(path, path.is_file) for path in self.output["paths"]]
+        yield [Asset(path, partial(is_file, path)) for path in self.output["paths"]]
         yield self.provisioned_rundir()
         cmd = "{x} >{x}.out 2>&1".format(x=self._runscript_path)
         run_shell_cmd(cmd=cmd, cwd=self.rundir, log_output=True)
@@ -137,20 +137,6 @@ class Ungrib(DriverCycleBased):
 
     # Private helper methods
 
-    @task
-    def _gribfile(self, infile: Path, link: Path):
-        """
-        A symlink to an input GRIB file.
-
-        :param link: Link name.
-        :param infile: File to link.
-        """
-        yield self.taskname(str(link))
-        yield Asset(link, link.is_symlink)
-        yield file(path=infile)
-        link.parent.mkdir(parents=True, exist_ok=True)
-        link.symlink_to(infile)
-
     @cached_property
     def _step(self) -> timedelta:
         td = to_timedelta(self.config["step"])
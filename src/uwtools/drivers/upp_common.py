@@ -4,6 +4,7 @@ Common UPP logic.
 
 from __future__ import annotations
 
+from functools import partial
 from pathlib import Path
 from typing import TYPE_CHECKING
 
@@ -13,6 +14,7 @@ from uwtools.config.formats.nml import NMLConfig
 from uwtools.drivers.upp_assets import UPPAssets
 from uwtools.exceptions import UWConfigError
 from uwtools.strings import STR
+from uwtools.utils.statcache import is_file
 from uwtools.utils.tasks import file, filecopy
 
 if TYPE_CHECKING:
@@ -35,7 +37,7 @@ def control_file(obj: UPP | UPPAssets):
 def namelist_file(obj: UPP | UPPAssets):
     path = namelist_path(obj)
     yield obj.taskname(str(path))
-    yield Asset(path, path.is_file)
+    yield Asset(path, partial(is_file, path))
     base_file = obj.config[STR.namelist].get(STR.base_file)
     yield file(Path(base_file)) if base_file else None
     obj.create_user_updated_config(
@@ -5,16 +5,18 @@ File and directory staging.
 from __future__ import annotations
 
 import glob
-import re
 from abc import ABC, abstractmethod
 from fnmatch import fnmatch
+from hashlib import sha256
+from heapq import heappop, heappush
 from itertools import dropwhile, zip_longest
 from operator import eq
 from pathlib import Path
-from typing import TYPE_CHECKING
-from urllib.parse import urlparse
+from time import time
+from typing import TYPE_CHECKING, Any
+from urllib.parse import unquote, urlparse
 
-from iotaa import collection
+from iotaa import Node, collection
 
 from uwtools.config.formats.yaml import YAMLConfig
 from uwtools.config.support import UWYAMLGlob, YAMLKey
@@ -23,13 +25,31 @@ from uwtools.config.validator import validate_internal
 from uwtools.exceptions import UWConfigError
 from uwtools.logging import log
 from uwtools.strings import STR
+from uwtools.utils import http, remove
 from uwtools.utils.api import str2path
-from uwtools.utils.processing import run_shell_cmd
-from uwtools.utils.tasks import directory, filecopy, hardlink, symlink
+from uwtools.utils.hpss import HTAR_MEMBER, hsi_ls, htar_index, htar_sizes
+from uwtools.utils.listing import Listings, walk
+from uwtools.utils.tasks import (
+    SCHEMES,
+    SYNC,
+    current,
+    directory,
+    filecopy,
+    filecopy_hsi_batch,
+    filecopy_htar_batch,
+    filecopy_symlink,
+    htar_bundle,
+    link_batch,
+    purged,
+)
 
 if TYPE_CHECKING:
     import datetime as dt
 
+HPSS_BATCH_SIZE = 500
+HTAR_BUNDLE_MEMBERS = 1000000  # htar's limit on members per archive
+HTAR_BUNDLE_SIZE = 64 * 1024**3  # default target bytes per bundle
+
 
 class Stager(ABC):
     """
@@ -53,15 +73,7 @@ class Stager(ABC):
         :raises: UWConfigError if config fails validation.
         """
         self._target_dir = str2path(target_dir)
-        yaml_config = YAMLConfig(config=str2path(config))
-        yaml_config.dereference(
-            context={
-                **({"cycle": cycle} if cycle else {}),
-                **({"leadtime": leadtime} if leadtime is not None else {}),
-                **yaml_config.data,
-            }
-        )
-        self._config, _ = walk_key_path(yaml_config.data, key_path or [])
+        self._config = _block(config, cycle, leadtime, key_path)
         self._validate()
         self._check_target_dir()
         self._check_destination_paths()
@@ -146,7 +158,9 @@ class FileStager(Stager):
         return list(self._config.keys())
 
     def _expand_glob(self) -> list[tuple[str, str, bool]]:
+        # Local directories are listed once, however many glob patterns are expanded over them.
         srcs: list[tuple[str, str, bool]] = []
+        listings = Listings()
         for dst, src in self._config.items():
             if isinstance(src, str):
                 srcs.append((dst, src, True))
@@ -158,7 +172,7 @@ class FileStager(Stager):
                 if parts.scheme == STR.url_scheme_htar:
                     srcs.extend(self._expand_glob_htar(parts.path, parts.query, dst))
                 elif parts.scheme in ["", STR.url_scheme_file]:
-                    srcs.extend(self._expand_glob_local(parts.path, dst))
+                    srcs.extend(self._expand_glob_local(parts.path, dst, listings))
                 else:
                     msg = "URL scheme '%s' incompatible with tag %s in: %s"
                     log.error(msg, parts.scheme, src.tag, src)
@@ -167,7 +181,7 @@ class FileStager(Stager):
     def _expand_glob_hsi(self, glob_pattern: str, dst: str) -> list[tuple[str, str, bool]]:
         srcs: list[tuple[str, str, bool]] = []
         hsi_errmsg_prefix = "***"
-        success, output = run_shell_cmd(f"{STR.hsi} -q ls -1 '{glob_pattern!s}'")
+        success, output = hsi_ls(glob_pattern)
         if success:
             lines = output.strip().split("\n")
             if matches := [line for line in lines if not line.startswith(hsi_errmsg_prefix)][1:]:
@@ -182,24 +196,31 @@ class FileStager(Stager):
         srcs: list[tuple[str, str, bool]] = []
         archive_files = self._expand_glob_hsi(path, "<unused>")
         for archive_file in [url.removeprefix(f"{STR.hsi}://") for _, url, _ in archive_files]:
-            success, output = run_shell_cmd(f"{STR.htar} -qtf '{archive_file}'")
+            success, output = htar_index(archive_file)
             if not success:
                 return []  # any failure => no results
             for line in output.strip().split("\n"):
-                regex = r"^HTAR:\s+[^ ]{10}\s+[^ ]+\s+\d+\s+[^ ]{10}\s+[^ ]{5}\s+(.*)$"
-                # e.g.: HTAR: -rw-r--r--  Paul.Madden/rtruc         64 2025-04-04 04:37  a1.c
-                if m := re.match(regex, line):
-                    archive_member = m[1]
+                if m := HTAR_MEMBER.match(line):
+                    archive_member = m["path"]
                     if fnmatch(archive_member, query):
-                        d, s, nonglob = self._expand_glob_resolve(query, m[1], dst)
+                        d, s, nonglob = self._expand_glob_resolve(query, archive_member, dst)
                         srcs.append((d, f"{STR.htar}://{archive_file}?{s}", nonglob))
         return srcs
 
-    def _expand_glob_local(self, glob_pattern: str, dst: str) -> list[tuple[str, str, bool]]:
+    def _expand_glob_local(
+        self, glob_pattern: str, dst: str, listings: Listings | None = None
+    ) -> list[tuple[str, str, bool]]:
         srcs: list[tuple[str, str, bool]] = []
-        for path in glob.iglob(glob_pattern, recursive=True):
-            if Path(path).is_dir() and not isinstance(self, Linker):
-                log.warning("Ignoring directory %s", path)
+        trees: set[Path] = set()  # directories already expanded
+        for path, isdir in (listings or Listings()).glob(glob_pattern):
+            # A recursive pattern also matches the paths below a matched directory, which are
+            # yielded after it, and which its expansion already includes.
+            if trees.intersection(Path(path).parents):
+                continue
+            if isdir and isinstance(self, Copier):
+                d, s, _ = self._expand_glob_resolve(glob_pattern, path, dst)
+                srcs.extend(self._expand_tree(s, d))
+                trees.add(Path(path))
             else:
                 srcs.append(self._expand_glob_resolve(glob_pattern, path, dst))
         return srcs
@@ -224,11 +245,197 @@ class FileStager(Stager):
         return "files-to-stage"
 
 
+class Archiver(Stager):
+    """
+    Archive local files to HPSS in htar bundles.
+    """
+
+    def __init__(
+        self,
+        config: dict | str | Path | None = None,
+        target_dir: str | Path | None = None,
+        cycle: dt.datetime | None = None,
+        leadtime: dt.timedelta | None = None,
+        key_path: list[YAMLKey] | None = None,
+        output: dict[str, Path] | dict[str, list[Path]] | None = None,
+    ) -> None:
+        """
+        :param config: YAML-file path, or dict (read stdin if missing or None).
+        :param target_dir: Path to target directory.
+        :param cycle: A datetime object to make available for use in the config.
+        :param leadtime: A timedelta object to make available for use in the config.
+        :param key_path: Path of keys to config block to use.
+        :param output: A driver's output manifest, whose files are also to be archived.
+        :raises: UWConfigError if config fails validation, or no files are specified.
+        """
+        super().__init__(config, target_dir, cycle, leadtime, key_path)
+        self._output = [
+            Path(path)
+            for val in (output or {}).values()
+            for path in (val if isinstance(val, list) else [val])
+        ]
+        if not self._config[STR.archive].get(STR.files) and not self._output:
+            msg = "No files to archive: Specify files in config, or a driver output manifest"
+            raise UWConfigError(msg)
+
+    @collection
+    def go(self):
+        """
+        Archive files.
+        """
+        yield "Archives"
+        root = self._root
+        yield [
+            htar_bundle(archive, [member for member, _ in members], cwd=root)
+            for archive, members in self._bundles().items()
+        ]
+
+    def plan(self) -> dict[str, Any]:
+        """
+        Plan the bundles go() would create, without creating them.
+
+        :return: The planned bundles, with their members and sizes, and their totals.
+        """
+        bundles: list[dict[str, Any]] = [
+            {
+                "archive": archive,
+                "bytes": sum(size for _, size in members),
+                "members": [member for member, _ in members],
+            }
+            for archive, members in self._bundles().items()
+        ]
+        totals = {
+            "bundles": len(bundles),
+            "bytes": sum(b["bytes"] for b in bundles),
+            "members": sum(len(b["members"]) for b in bundles),
+        }
+        return {"bundles": bundles, "totals": totals}
+
+    def _bundles(self) -> dict[str, list[tuple[str, int]]]:
+        """
+        The files to archive, packed, in member-path order, into bundles of about the target size.
+
+        Members are added to a bundle until the next would take it beyond the target size, so that
+        a bundle exceeds the target only if it holds a single, larger file. Related files, e.g.
+        those in the same directory, tend to share a bundle, so that they can be retrieved
+        together.
+        """
+        block = self._config[STR.archive]
+        target = block.get(STR.bundle_size, HTAR_BUNDLE_SIZE)
+        prefix = "%s/%s" % (urlparse(block[STR.dir]).path.rstrip("/"), block[STR.name])
+        bundles: list[list[tuple[str, int]]] = []
+        size = 0
+        for member, nbytes in self._members():
+            current = bundles[-1] if bundles else None
+            if current is None or len(current) >= HTAR_BUNDLE_MEMBERS or size + nbytes > target:
+                bundles.append([])
+                size = 0
+            bundles[-1].append((member, nbytes))
+            size += nbytes
+        log.info("Packed %s files into %s bundles", sum(map(len, bundles)), len(bundles))
+        return {"%s.%03d.tar" % (prefix, i): bundle for i, bundle in enumerate(bundles)}
+
+    @property
+    def _dst_paths(self) -> list[str]:
+        """
+        The paths to files to archive.
+        """
+        return [
+            path.value if isinstance(path, UWYAMLGlob) else path
+            for path in self._config[STR.archive].get(STR.files, [])
+        ]
+
+    def _members(self) -> list[tuple[str, int]]:
+        """
+        The files to archive, after glob expansion, as member paths, with their sizes.
+
+        Directories are archived as the files and symlinks below them. Files below the target
+        directory are archived with paths relative to it, others with absolute paths.
+        """
+        root = self._root
+        listings = Listings()
+        paths: list[str] = [str(path) for path in self._output]
+        for item in self._config[STR.archive].get(STR.files, []):
+            if isinstance(item, UWYAMLGlob):
+                pattern = urlparse(item.value).path
+                pattern = str(Path(glob.escape(str(root)), pattern)) if root else pattern
+                paths.extend(match for match, _ in listings.glob(pattern))
+            else:
+                path = urlparse(item).path
+                paths.append(str(Path(root, path)) if root else path)
+        members: dict[str, int] = {}
+        for path in paths:
+            if Path(path).is_dir() and not Path(path).is_symlink():
+                paths_below = [p for p, _ in walk(path)]
+                log.info("Found %s files below directory %s", len(paths_below), path)
+            else:
+                paths_below = [path]
+            for p in paths_below:
+                try:
+                    nbytes = Path(p).lstat().st_size
+                except FileNotFoundError:
+                    log.warning("File %s does not exist", p)
+                    continue
+                if root and Path(p).is_relative_to(root):
+                    members[str(Path(p).relative_to(root))] = nbytes
+                else:
+                    members[str(Path(p))] = nbytes
+        return sorted(members.items())
+
+    @property
+    def _root(self) -> Path | None:
+        """
+        The target directory, as a simple filesystem path.
+        """
+        return Path(urlparse(str(self._target_dir)).path) if self._target_dir else None
+
+    @property
+    def _schema(self) -> str:
+        """
+        The name of the schema to use for config validation.
+        """
+        return "archive"
+
+
 class Copier(FileStager):
     """
     Stage files by copying.
     """
 
+    def __init__(
+        self,
+        config: dict | str | Path | None = None,
+        target_dir: str | Path | None = None,
+        cycle: dt.datetime | None = None,
+        leadtime: dt.timedelta | None = None,
+        key_path: list[YAMLKey] | None = None,
+        sync: str | None = None,
+        shard: tuple[int, int] | None = None,
+    ) -> None:
+        """
+        :param config: YAML-file path, or dict (read stdin if missing or None).
+        :param target_dir: Path to target directory.
+        :param cycle: A datetime object to make available for use in the config.
+        :param leadtime: A timedelta object to make available for use in the config.
+        :param key_path: Path of keys to config block to use.
+        :param sync: Recopy local sources to destinations that are not current (choices: 'mtime',
+            'hash').
+        :param shard: Copy only shard i of n, given as (i, n), where 0 <= i < n.
+        :raises: UWConfigError if config fails validation, on an unknown sync method, or on a bad
+            shard.
+        """
+        super().__init__(config, target_dir, cycle, leadtime, key_path)
+        if sync and sync not in SYNC:
+            msg = "Unknown sync method '%s' (choices: %s)" % (sync, ", ".join(SYNC))
+            raise UWConfigError(msg)
+        if shard and not 0 <= shard[0] < shard[1]:
+            msg = "Bad shard %s/%s: Specify shard i/n, where 0 <= i < n" % shard
+            raise UWConfigError(msg)
+        self.sync = sync
+        self.shard = shard
+        self._states: dict[str, str] = {}
+        self._symlinks: set[str] = set()
+
     @collection
     def go(self, name: str = ""):
         """
@@ -242,11 +449,95 @@ class Copier(FileStager):
         # a source path is a full explicit path, its existence should be checked before any attempt
         # is made to copy it.
 
+        # When syncing, the state of each destination -- to be copied, updated, or skipped -- is
+        # recorded before any copying, for reporting by synced().
+
+        # Files in HPSS are copied in batches, avoiding the overhead of an HPSS session per file:
+        # Full files via one hsi session per batch, in which the existence of each source is checked
+        # by its get command; and archive members via one htar extraction per batch of members of
+        # the same archive.
+
+        # Directories matched by glob patterns are copied as trees: Each regular file below them is
+        # copied to the same relative path below the destination, and each symlink is recreated
+        # there, with the same target.
+
         yield "File copies%s" % (f" {name}" if name else "")
-        yield [
-            filecopy(src=src, dst=self._simple(self._target_dir) / self._simple(dst), check=nonglob)
-            for dst, src, nonglob in self._expand_glob()
-        ]
+        reqs: list[Node] = []
+        hsi, check = [], set()
+        htar: dict[str, list[tuple[str, Path]]] = {}
+        for dst, src, nonglob in self._sources():
+            path = self._simple(self._target_dir) / self._simple(dst)
+            parts = urlparse(str(src))
+            if self.sync:
+                self._states[str(path)] = self._state(src, path)
+            if parts.scheme in SCHEMES.hsi:
+                hsi.append((parts.path, path))
+            elif parts.scheme in SCHEMES.htar:
+                htar.setdefault(parts.path, []).append((unquote(parts.query), path))
+                if nonglob:
+                    check.add(parts.path)
+            elif src in self._symlinks:
+                reqs.append(filecopy_symlink(src=Path(src), dst=path))
+            else:
+                reqs.append(filecopy(src=src, dst=path, check=nonglob, sync=self.sync))
+        reqs.extend(filecopy_hsi_batch(batch) for batch in _batches(hsi))
+        reqs.extend(
+            filecopy_htar_batch(archive, batch, check=archive in check)
+            for archive, pairs in htar.items()
+            for batch in _batches(pairs)
+        )
+        yield reqs
+
+    def plan(self) -> dict[str, Any]:
+        """
+        Plan the copies go() would make, without making them.
+
+        Each source is listed after glob expansion, with its destination, the kind of transfer that
+        would copy it, and the action planned: to copy it, to update (recopy) it when syncing, or
+        to skip it, if its destination exists. Sizes of sources to copy or update are included where
+        cheaply known: via stat for local sources, via HEAD request for HTTP sources, and via cached
+        htar indexes for archive members. The hsi listings used to expand globs do not include
+        sizes. Totals of the files to copy or update, and of their known sizes, are given per kind.
+
+        :return: The planned copies, and their totals.
+        """
+        actions = {STR.copied: STR.copy, STR.skipped: STR.skip, STR.updated: STR.update}
+        files: list[dict[str, Any]] = []
+        totals: dict[str, dict[str, int]] = {}
+        for dst, src, _ in self._sources():
+            path = self._simple(self._target_dir) / self._simple(dst)
+            action = actions[self._state(src, path)]
+            kind = _kind(src)
+            size = None if action == STR.skip else _size(src, kind)
+            files.append(
+                {"action": action, "dst": str(path), "kind": kind, "size": size, "src": str(src)}
+            )
+            if action != STR.skip:
+                total = totals.setdefault(kind, {"bytes": 0, "files": 0, "unsized": 0})
+                total["bytes"] += size or 0
+                total["files"] += 1
+                total["unsized"] += size is None
+        return {"files": files, "totals": dict(sorted(totals.items()))}
+
+    def synced(self, ready: list[str]) -> dict[str, list[str]]:
+        """
+        Report on the files synced by go().
+
+        Only local sources are compared with their existing destinations: Existing destinations of
+        other sources are always skipped. Files to be copied or updated are reported only if they
+        are now ready.
+
+        :param ready: Paths to the destination files that are ready.
+        :return: Paths to the destination files copied, skipped, and updated.
+        """
+        ok = {*ready, *[path for path, s in self._states.items() if s == STR.skipped]}
+        report = {
+            state: [path for path, s in self._states.items() if s == state and path in ok]
+            for state in (STR.copied, STR.skipped, STR.updated)
+        }
+        counts = [len(report[state]) for state in (STR.copied, STR.updated, STR.skipped)]
+        log.info("Synced files: %s copied, %s updated, %s skipped", *counts)
+        return report
 
     @staticmethod
     def _simple(path: Path | str) -> Path:
@@ -257,6 +548,71 @@ class Copier(FileStager):
         """
         return Path(urlparse(str(path)).path)
 
+    def _expand_tree(self, src: str, dst: str) -> list[tuple[str, str, bool]]:
+        """
+        The regular files and symlinks below a source directory, with their destinations.
+
+        :param src: Path to the source directory.
+        :param dst: Path to the destination directory.
+        """
+        srcs: list[tuple[str, str, bool]] = []
+        for path, islink in walk(src):
+            if islink:
+                self._symlinks.add(path)
+            srcs.append((str(Path(dst) / Path(path).relative_to(src)), path, False))
+        log.info("Found %s files below directory %s", len(srcs), src)
+        return srcs
+
+    def _sources(self) -> list[tuple[str, str, bool]]:
+        """
+        The sources to copy, after glob expansion: all of them, or those in this copier's shard.
+
+        Sources are assigned to shards deterministically, so that copiers given the same config
+        and different shards of the same number copy disjoint sets of files, together copying all
+        of them, with no coordination. Members of the same htar archive are kept together, so that
+        each archive is read by only one shard. Local sources, whose sizes are known via stat, are
+        assigned, largest first, to the shard with the fewest bytes assigned. Other sources, in the
+        order of a hash of their destinations, are assigned to the shard with the fewest of them.
+        """
+        srcs = self._expand_glob()
+        if not self.shard:
+            return srcs
+        index, count = self.shard
+        units = [_unit(str(dst), str(src)) for dst, src, _ in srcs]
+        sizes: dict[str, int | None] = {}  # of the units to assign, if known
+        for unit, (_, src, _) in zip(units, srcs, strict=True):
+            local = _kind(str(src)) == STR.local and unit not in sizes
+            sizes[unit] = _size(str(src), STR.local) if local else None
+        sized = sorted((-size, unit) for unit, size in sizes.items() if size is not None)
+        unsized = sorted(
+            (sha256(unit.encode()).hexdigest(), unit)
+            for unit, size in sizes.items()
+            if size is None
+        )
+        shards = {
+            **_shards([(unit, -negsize) for negsize, unit in sized], count),
+            **_shards([(unit, 1) for _, unit in unsized], count),
+        }
+        subset = [src for unit, src in zip(units, srcs, strict=True) if shards[unit] == index]
+        log.info("Shard %s/%s: %s of %s files", index, count, len(subset), len(srcs))
+        return subset
+
+    def _state(self, src: str, dst: Path) -> str:
+        """
+        The sync state of a destination file: to be copied, skipped, or updated.
+
+        :param src: The source path or URL.
+        :param dst: Path to the destination file.
+        """
+        if src in self._symlinks:  # symlinks are recreated only if missing
+            return STR.skipped if dst.is_symlink() else STR.copied
+        if not dst.is_file():
+            return STR.copied
+        local = urlparse(src).scheme in SCHEMES.local
+        if local and self.sync and not current(self._simple(src), dst, self.sync):
+            return STR.updated
+        return STR.skipped
+
 
 class Linker(FileStager):
     """
@@ -302,22 +658,18 @@ class Linker(FileStager):
 
         # See comment in Copier.go() in re: "check" argument.
 
+        # Links are created in batches, avoiding the overhead of a task per link: one batch of links
+        # whose targets are checked for existence, and one of links whose targets are not.
+
         linkname = lambda k: Path(self._target_dir / k if self._target_dir else k)
         yield "File %s%s" % ("hardlinks" if self.hardlink else "links", f" {name}" if name else "")
+        pairs: dict[bool, list[tuple[Path, Path]]] = {True: [], False: []}
+        for k, v, nonglob in self._expand_glob():
+            pairs[nonglob].append((Path(v), linkname(k)))
         yield [
-            hardlink(
-                target=Path(v),
-                linkname=linkname(k),
-                check=nonglob,
-                fallback=self.fallback,
-            )
-            if self.hardlink
-            else symlink(
-                target=Path(v),
-                linkname=linkname(k),
-                check=nonglob,
-            )
-            for k, v, nonglob in self._expand_glob()
+            link_batch(pairs=batch, check=check, hard=bool(self.hardlink), fallback=self.fallback)
+            for check, batch in pairs.items()
+            if batch
         ]
 
 
@@ -351,3 +703,285 @@ class MakeDirs(Stager):
         The name of the schema to use for config validation.
         """
         return "makedirs"
+
+
+class Prefetcher:
+    """
+    Stage files for upcoming cycles.
+    """
+
+    def __init__(
+        self,
+        cycles: list[dt.datetime],
+        config: dict | str | Path | None = None,
+        target_dir: str | Path | None = None,
+        leadtime: dt.timedelta | None = None,
+        key_path: list[YAMLKey] | None = None,
+        driver: bool = False,
+    ) -> None:
+        """
+        :param cycles: The cycles to stage files for.
+        :param config: YAML-file path, or dict (read stdin if missing or None).
+        :param target_dir: Path to target directory (default: a driver block's rundir).
+        :param leadtime: A timedelta object to make available for use in the config.
+        :param key_path: Path of keys to config block to use: a file block, or a driver block.
+        :param driver: Is the block a driver block, whose files_to_copy are to be staged?
+        :raises: UWConfigError if a cycle's config fails validation.
+        """
+        # The config is read once, e.g. from stdin, and dereferenced separately for each cycle.
+        data = YAMLConfig(config=str2path(config)).data
+        self._copiers: dict[str, Copier] = {}
+        for cycle in cycles:
+            block = _block(data, cycle, leadtime, key_path)
+            files, rundir = block, target_dir
+            if driver:
+                files, rundir = block.get("files_to_copy", {}), target_dir or block.get(STR.rundir)
+                if not rundir:
+                    msg = "Driver block has no rundir, and no target directory was specified"
+                    raise UWConfigError(msg)
+            if files:
+                self._copiers[cycle.isoformat()] = Copier(config=files, target_dir=rundir)
+            else:
+                log.warning("No files to prefetch for cycle %s", cycle.isoformat())
+        self.nodes: dict[str, Node] = {}
+
+    @collection
+    def go(self):
+        """
+        Stage files for upcoming cycles.
+        """
+        yield "Prefetch for %s cycles" % len(self._copiers)
+        self.nodes = {
+            cycle: copier.go("for cycle %s" % cycle) for cycle, copier in self._copiers.items()
+        }
+        yield list(self.nodes.values())
+
+
+class Purger(Stager):
+    """
+    Purge files and directories.
+    """
+
+    def __init__(
+        self,
+        config: dict | str | Path | None = None,
+        target_dir: str | Path | None = None,
+        cycle: dt.datetime | None = None,
+        leadtime: dt.timedelta | None = None,
+        key_path: list[YAMLKey] | None = None,
+    ) -> None:
+        """
+        :param config: YAML-file path, or dict (read stdin if missing or None).
+        :param target_dir: Path to target directory.
+        :param cycle: A datetime object to make available for use in the config.
+        :param leadtime: A timedelta object to make available for use in the config.
+        :param key_path: Path of keys to config block to use.
+        :raises: UWConfigError if config fails validation.
+        """
+        super().__init__(config, target_dir, cycle, leadtime, key_path)
+        self._reclaimed: dict[str, int] = {}
+
+    @collection
+    def go(self):
+        """
+        Purge files and directories.
+        """
+        yield "Purged paths"
+        yield [purged(path=Path(path), reclaimed=self._reclaimed) for path in self._paths()]
+
+    def plan(self) -> dict[str, Any]:
+        """
+        Plan the purges go() would make, without making them.
+
+        Each path to purge is listed, after glob expansion and age selection, with the number of
+        files and symlinks at and below it, and their total size in bytes. Totals are also given.
+
+        :return: The planned purges, and their totals.
+        """
+        paths: list[dict[str, Any]] = []
+        for path in self._paths():
+            files, nbytes = remove.usage(Path(path))
+            paths.append({"bytes": nbytes, "files": files, "path": path})
+        totals = {
+            "bytes": sum(p["bytes"] for p in paths),
+            "files": sum(p["files"] for p in paths),
+            "paths": len(paths),
+        }
+        return {STR.paths: paths, "totals": totals}
+
+    @property
+    def reclaimed(self) -> int:
+        """
+        The number of bytes reclaimed by go().
+        """
+        return sum(self._reclaimed.values())
+
+    @property
+    def _dst_paths(self) -> list[str]:
+        """
+        The paths to files and directories to purge.
+        """
+        return [
+            path.value if isinstance(path, UWYAMLGlob) else path
+            for path in self._config[STR.purge][STR.paths]
+        ]
+
+    def _paths(self) -> list[str]:
+        """
+        The existing paths to purge, after glob expansion, old enough to purge.
+
+        A path's age is that of its own modification time: For a directory, that is when entries
+        were last added to or removed from it, not when files below it were last modified.
+        """
+        older_than = self._config[STR.purge].get(STR.older_than)
+        cutoff = time() - older_than * 3600 if older_than is not None else None
+        root = urlparse(str(self._target_dir)).path if self._target_dir else None
+        listings = Listings()
+        paths: list[str] = []
+        for item in self._config[STR.purge][STR.paths]:
+            if isinstance(item, UWYAMLGlob):
+                pattern = urlparse(item.value).path
+                pattern = str(Path(glob.escape(root), pattern)) if root else pattern
+                paths.extend(match for match, _ in listings.glob(pattern))
+            else:
+                path = urlparse(item).path
+                paths.append(str(Path(root, path)) if root else path)
+        selected = []
+        for path in dict.fromkeys(paths):
+            try:
+                info = Path(path).lstat()
+            except FileNotFoundError:
+                continue
+            if Path(path).parent == Path(path):
+                log.warning("Refusing to purge %s", path)
+            elif cutoff is None or info.st_mtime < cutoff:
+                selected.append(path)
+        log.info("Selected %s of %s paths to purge", len(selected), len(paths))
+        return selected
+
+    @property
+    def _schema(self) -> str:
+        """
+        The name of the schema to use for config validation.
+        """
+        return "purge"
+
+
+def merge_reports(reports: list[dict[str, Any]]) -> dict[str, Any]:
+    """
+    Merge the reports of copiers that copied shards of the same config.
+
+    The lists of paths under each key (e.g. "ready", "notready") are concatenated and sorted.
+    Telemetry summaries, which cannot be combined exactly, are listed in shard order.
+
+    :param reports: The per-shard reports.
+    :return: The merged report.
+    """
+    merged: dict[str, list] = {}
+    for report in reports:
+        for key, val in report.items():
+            if key == STR.telemetry:
+                merged.setdefault(key, []).append(val)
+            else:
+                merged.setdefault(key, []).extend(val)
+    return {key: val if key == STR.telemetry else sorted(val) for key, val in merged.items()}
+
+
+def _batches(items: list) -> list[list]:
+    """
+    Split items into HPSS batches.
+
+    :param items: The items to split.
+    """
+    return [items[i : i + HPSS_BATCH_SIZE] for i in range(0, len(items), HPSS_BATCH_SIZE)]
+
+
+def _block(
+    config: dict | str | Path | None,
+    cycle: dt.datetime | None,
+    leadtime: dt.timedelta | None,
+    key_path: list[YAMLKey] | None,
+) -> Any:
+    """
+    Return a config block, dereferenced for a cycle and leadtime.
+
+    :param config: YAML-file path, or dict (read stdin if missing or None).
+    :param cycle: A datetime object to make available for use in the config.
+    :param leadtime: A timedelta object to make available for use in the config.
+    :param key_path: Path of keys to the config block.
+    """
+    yaml_config = YAMLConfig(config=str2path(config))
+    yaml_config.dereference(
+        context={
+            **({"cycle": cycle} if cycle else {}),
+            **({"leadtime": leadtime} if leadtime is not None else {}),
+            **yaml_config.data,
+        }
+    )
+    block, _ = walk_key_path(yaml_config.data, key_path or [])
+    return block
+
+
+def _kind(src: str) -> str:
+    """
+    Return the kind of transfer that would copy a source: 'hsi', 'htar', 'http', or 'local'.
+
+    :param src: The source path or URL.
+    """
+    scheme = urlparse(src).scheme
+    kinds = [STR.hsi, STR.htar, STR.http, STR.local]
+    return next((kind for kind in kinds if scheme in getattr(SCHEMES, kind)), scheme)
+
+
+def _size(src: str, kind: str) -> int | None:
+    """
+    Return the size of a source, if cheaply known.
+
+    :param src: The source path or URL.
+    :param kind: The kind of transfer that would copy the source.
+    """
+    parts = urlparse(src)
+    try:
+        if kind == STR.local:
+            return Path(parts.path).stat().st_size
+        if kind == STR.http:
+            return http.size(src)
+    except OSError:  # including requests.RequestException
+        return None
+    if kind == STR.htar:
+        return htar_sizes(parts.path).get(unquote(parts.query))
+    return None
+
+
+def _shards(items: list[tuple[str, int]], count: int) -> dict[str, int]:
+    """
+    Assign weighted items, in order, each to the shard with the least total weight so far.
+
+    Ties between shards are broken by the number of items assigned, then by shard number, so that
+    e.g. empty files are spread evenly, and the assignment is deterministic.
+
+    :param items: Pairs of (item, weight).
+    :param count: The number of shards.
+    :return: The shard number of each item.
+    """
+    loads = [(0, 0, i) for i in range(count)]
+    shards = {}
+    for item, weight in items:
+        load, n, shard = heappop(loads)
+        shards[item] = shard
+        heappush(loads, (load + weight, n + 1, shard))
+    return shards
+
+
+def _unit(dst: str, src: str) -> str:
+    """
+    Return the unit in which a source is assigned to a shard.
+
+    Members of an htar archive are assigned together, as their archive. Other sources are assigned
+    individually, as their destinations.
+
+    :param dst: The destination path.
+    :param src: The source path or URL.
+    """
+    parts = urlparse(src)
+    return "%s://%s" % (STR.htar, parts.path) if parts.scheme in SCHEMES.htar else dst
@@ -138,10 +138,12 @@ class _STR(_ValsMatchKeys):
     ECF_TRYNO: str = _
     account: str = _
     action: str = _
+    archive: str = _
     base_file: str = _
     batch: str = _
     batchargs: str = _
     body: str = _
+    bundle_size: str = _
     cdeps: str = _
     chgres_cube: str = _
     classname: str = _
@@ -150,14 +152,18 @@ class _STR(_ValsMatchKeys):
     config: str = _
     config_file: str = _
     configs: str = _
+    copied: str = _
     copy: str = _
     cycle: str = _
+    cycles: str = _
     database: str = _
     date: str = _
     datelist: str = _
     datetime: str = _
     day: str = _
     defstatus: str = _
+    dir: str = _
+    driver: str = _
     dry_run: str = _
     ecflow: str = _
     end: str = _
@@ -177,6 +183,7 @@ class _STR(_ValsMatchKeys):
     fallback: str = _
     families: str = _
     family: str = _
+    files: str = _
     filter_topo: str = _
     format1: str = _
     format2: str = _
@@ -186,9 +193,12 @@ class _STR(_ValsMatchKeys):
     graph_file: str = _
     gsi: str = _
     hardlink: str = _
+    hash: str = _
     help: str = _
+    hpss: str = _
     hsi: str = _
     htar: str = _
+    http: str = _
     includes: str = _
     inlimits: str = _
     input_file: str = _
@@ -198,18 +208,23 @@ class _STR(_ValsMatchKeys):
     ioda: str = _
     iterate: str = _
     jedi: str = _
+    json: str = _
     key_eq_val_pairs: str = _
     key_path: str = _
     labels: str = _
     late: str = _
     leadtime: str = _
+    limit: str = _
     limits: str = _
     link: str = _
     list: str = _
+    local: str = _
     make_hgrid: str = _
     make_solo_mosaic: str = _
     makedirs: str = _
+    manifest: str = _
     manual: str = _
+    merge: str = _
     meters: str = _
     mode: str = _
     module: str = _
@@ -218,29 +233,40 @@ class _STR(_ValsMatchKeys):
     mpassit: str = _
     mpiargs: str = _
     mpicmd: str = _
+    mtime: str = _
+    name: str = _
     namelist: str = _
+    nice: str = _
     node: str = _
     notready: str = _
+    older_than: str = _
     orog: str = _
     orog_gsl: str = _
     output_dir: str = _
     output_file: str = _
     output_format: str = _
+    output_manifest: str = _
     parent: str = _
     partial: str = _
     path1: str = _
     path2: str = _
+    paths: str = _
+    plan: str = _
     platform: str = _
     port: str = _
+    prefetch: str = _
     properties: str = _
+    purge: str = _
     quiet: str = _
     rate: str = _
     ready: str = _
     realize: str = _
+    reclaimed: str = _
     refs: str = _
     render: str = _
     repeat: str = _
     report: str = _
+    reports: str = _
     rocoto: str = _
     run: str = _
     rundir: str = _
@@ -252,8 +278,12 @@ class _STR(_ValsMatchKeys):
     search_path: str = _
     server: str = _
     sfc_climo_gen: str = _
+    shard: str = _
     shave: str = _
     show_schema: str = _
+    skip: str = _
+    skipped: str = _
+    snapshot_file: str = _
     stacksize: str = _
     start: str = _
     stdin_ok: str = _
@@ -264,18 +294,22 @@ class _STR(_ValsMatchKeys):
     suitedef: str = _
     suites: str = _
     symlink: str = _
+    sync: str = _
     target_dir: str = _
     task: str = _
     tasks: str = _
+    telemetry: str = _
     template: str = _
     threads: str = _
     total: str = _
     translate: str = _
     trigger: str = _
     ungrib: str = _
+    update: str = _
     update_file: str = _
     update_format: str = _
     update_values: str = _
+    updated: str = _
     upp: str = _
     upp_assets: str = _
     url_scheme_file: str = "file"
@@ -291,6 +325,7 @@ class _STR(_ValsMatchKeys):
     variable: str = _
     vars: str = _
     verbose: str = _
+    verify: str = _
     version: str = _
     workflow: str = _
     ww3: str = _
@@ -7,7 +7,7 @@ import yaml
 from pytest import mark, raises
 
 from uwtools.api import config
-from uwtools.config.formats.yaml import YAMLConfig
+from uwtools.config.formats.yaml import LazyYAMLConfig, YAMLConfig
 from uwtools.exceptions import UWConfigError, UWError
 from uwtools.utils.file import FORMAT
 
@@ -45,6 +45,7 @@ def test_api_config_compose(cycle, input_format, leadtime, output_file, output_f
         "output_file": output_file,
         "output_format": output_format,
         "realize": False,
+        "threads": 4,
     }
     with patch.object(config, "_compose") as _compose:
         config.compose(**kwargs)
@@ -56,6 +57,7 @@ def test_api_config_compose(cycle, input_format, leadtime, output_file, output_f
         output_file=None if output_file is None else Path(output_file),
         output_format=output_format,
         realize=False,
+        threads=4,
     )
 
 
@@ -66,6 +68,7 @@ def test_api_config_compose_to_dict():
         "input_format": "yaml",
         "cycle": None,
         "leadtime": None,
+        "threads": 1,
     }
     with patch.object(config, "compose") as compose:
         compose.return_value = YAMLConfig(config={"foo": "bar"})
@@ -93,6 +96,13 @@ def test_api_config__get_config(classname, f):
     constructor.assert_called_once_with(**kwargs)
 
 
+def test_api_config_get_yaml_config__lazy(tmp_path):
+    path = tmp_path / "config.yaml"
+    path.write_text("a:\n  b: 1\n")
+    assert isinstance(config.get_yaml_config(config=path, lazy=True), LazyYAMLConfig)
+    assert not isinstance(config.get_yaml_config(config=path), LazyYAMLConfig)
+
+
 @mark.parametrize("cycle", [None, datetime(2025, 11, 12, 6, tzinfo=timezone.utc)])
 @mark.parametrize("leadtime", [None, timedelta(hours=6)])
 def test_api_config_realize(cycle, leadtime):
@@ -109,6 +119,9 @@ def test_api_config_realize(cycle, leadtime):
         "values_needed": True,
         "total": True,
         "dry_run": False,
+        "threads": 2,
+        "snapshot_file": "path4",
+        "schema_file": "path5",
     }
     with patch.object(config, "_realize") as _realize:
         config.realize(**kwargs)
@@ -118,6 +131,8 @@ def test_api_config_realize(cycle, leadtime):
             "input_config": Path(kwargs["input_config"]),
             "update_config": Path(kwargs["update_config"]),
             "output_file": Path(kwargs["output_file"]),
+            "snapshot_file": Path(kwargs["snapshot_file"]),
+            "schema_file": Path(kwargs["schema_file"]),
         }
     )
 
@@ -146,6 +161,9 @@ def test_api_config_realize__update_config_none():
         values_needed=False,
         total=False,
         dry_run=False,
+        threads=1,
+        snapshot_file=None,
+        schema_file=None,
     )
 
 
@@ -160,6 +178,7 @@ def test_api_config_realize_to_dict():
         "total": False,
         "dry_run": False,
         "stdin_ok": False,
+        "threads": 1,
     }
     with patch.object(config, "realize") as realize:
         config.realize_to_dict(**kwargs)
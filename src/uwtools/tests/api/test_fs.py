@@ -1,7 +1,9 @@
 import datetime as dt
+import json
 from pathlib import Path
+from unittest.mock import patch
 
-from pytest import fixture
+from pytest import fixture, mark
 
 from uwtools.api import fs
 from uwtools.strings import STR
@@ -30,6 +32,45 @@ def kwargs(tmp_path, utc):
 # Tests
 
 
+def test_fs_archive(tmp_path):
+    (tmp_path / "a").write_text("a")
+    config = {"archive": {"dir": "/hpss", "name": "run", "files": ["a"]}}
+    created: list[str] = []
+    index = "HTAR: -rw-r--r--  u/g  1 2025-04-04 04:37  a\n"
+
+    def htar(cmd, **_):
+        created.append(cmd)
+        return True, ""
+
+    with (
+        patch("uwtools.utils.tasks.run_shell_cmd", side_effect=htar),
+        patch(
+            "uwtools.utils.hpss.run_shell_cmd", side_effect=lambda *_, **__: (bool(created), index)
+        ),
+        patch.object(fs, "_limits", wraps=fs._limits) as _limits,
+    ):
+        assert fs.archive(config=config, target_dir=tmp_path, dry_run=True) == {
+            STR.notready: ["/hpss/run.000.tar"],
+            STR.ready: [],
+        }
+        assert fs.archive(config=config, target_dir=tmp_path, limits={STR.hpss: 2}) == {
+            STR.notready: [],
+            STR.ready: ["/hpss/run.000.tar"],
+        }
+    assert len(created) == 1
+    _limits.assert_called_with({STR.hpss: 2})
+
+
+def test_fs_archive_plan(tmp_path):
+    (tmp_path / "a").write_text("a")
+    output = {"a": tmp_path / "a"}
+    plan = fs.archive_plan(config={"archive": {"dir": "/hpss", "name": "run"}}, output=output)
+    assert plan == {
+        "bundles": [{"archive": "/hpss/run.000.tar", "bytes": 1, "members": [str(output["a"])]}],
+        "totals": {"bundles": 1, "bytes": 1, "members": 1},
+    }
+
+
 def test_fs_copy_fail(kwargs):
     paths = kwargs["config"]["a"]["b"]
     for p in paths:
@@ -55,6 +96,127 @@ def test_fs_copy_pass(kwargs):
     assert set(report[STR.notready]) == set()
 
 
+def test_fs_copy_manifest(kwargs, tmp_path):
+    paths = kwargs["config"]["a"]["b"]
+    manifest = tmp_path / "manifest"
+    fs.copy(**{**kwargs, "dry_run": True}, manifest=manifest)
+    assert not manifest.exists()
+    fs.copy(**kwargs, manifest=manifest)
+    lines = manifest.read_text().strip().split("\n")
+    assert [line.split("  ")[1] for line in lines] == sorted(paths.keys())
+    empty = "e3b0c44298fc1c149afbf4c8996fb92427ae41e4649b934ca495991b7852b855"
+    assert all(line.startswith(empty) for line in lines)
+
+
+def test_fs_copy_verify(kwargs, tmp_path):
+    paths = kwargs["config"]["a"]["b"]
+    bad, good = list(paths.keys())
+    Path(paths[bad]).write_text("foo")
+    manifest = tmp_path / "manifest"
+    empty = "e3b0c44298fc1c149afbf4c8996fb92427ae41e4649b934ca495991b7852b855"
+    manifest.write_text(f"{empty}  {bad}\n{empty}  {good}\n")
+    report = fs.copy(**kwargs, verify=manifest)
+    assert report[STR.ready] == [good]
+    assert report[STR.notready] == [bad]
+    assert not Path(bad).exists()
+
+
+def test_fs_copy_sync(kwargs):
+    paths = kwargs["config"]["a"]["b"]
+    fs.copy(**kwargs, sync="mtime")
+    dst = list(paths.keys())[0]
+    Path(dst).unlink()
+    report = fs.copy(**kwargs, sync="mtime")
+    assert report[STR.copied] == [dst]
+    assert report[STR.skipped] == [list(paths.keys())[1]]
+    assert report[STR.updated] == []
+    assert report[STR.ready] == [dst]
+
+
+def test_fs_copy_tree(tmp_path):
+    src, dst = tmp_path / "src", tmp_path / "dst"
+    (src / "sub").mkdir(parents=True)
+    (src / "a").write_text("a")
+    (src / "sub" / "b").write_text("b")
+    (src / "link").symlink_to("sub/b")
+    config = f"{dst}/<d>: !glob {src}"
+    cfgfile = tmp_path / "config.yaml"
+    cfgfile.write_text(config)
+    expected = [str(dst / "src" / x) for x in ("a", "link", "sub/b")]
+    report = fs.copy(config=cfgfile, sync="mtime", limits={STR.local: 2})
+    assert sorted(report[STR.copied]) == expected
+    (src / "sub" / "b").write_text("bb")
+    report = fs.copy(config=cfgfile, sync="mtime", limits={STR.local: 2})
+    assert report[STR.updated] == [str(dst / "src" / "sub" / "b")]
+    assert sorted(report[STR.skipped]) == expected[:2]
+    assert (dst / "src" / "link").read_text() == "bb"
+
+
+def test_fs_copy_telemetry(kwargs, tmp_path):
+    paths = kwargs["config"]["a"]["b"]
+    path = tmp_path / "telemetry.json"
+    report = fs.copy(**kwargs, telemetry=path)
+    assert report[STR.telemetry]["files"] == 2
+    assert report[STR.telemetry]["kinds"][STR.local]["files"] == 2
+    assert {x["path"] for x in report[STR.telemetry]["slowest"]} == set(paths.keys())
+    assert json.loads(path.read_text()) == report[STR.telemetry]
+    assert STR.telemetry not in fs.copy(**kwargs)
+    assert fs.link(**kwargs, telemetry=True)[STR.telemetry]["files"] == 0
+
+
+def test_fs_copy_shard(kwargs):
+    paths = kwargs["config"]["a"]["b"]
+    reports = [fs.copy(**kwargs, shard=(i, 2)) for i in range(2)]
+    assert [len(report[STR.ready]) for report in reports] == [1, 1]
+    assert fs.merge_reports([*reports]) == {STR.notready: [], STR.ready: sorted(paths.keys())}
+    for p in paths:
+        assert Path(p).is_file()
+
+
+def test_fs_copy_plan(kwargs):
+    paths = kwargs["config"]["a"]["b"]
+    del kwargs["dry_run"]
+    plan = fs.copy_plan(**kwargs)
+    assert [x["dst"] for x in plan["files"]] == list(paths.keys())
+    assert all(x["action"] == STR.copy for x in plan["files"])
+    assert plan["totals"] == {STR.local: {"bytes": 0, "files": 2, "unsized": 0}}
+    for p in paths:
+        assert not Path(p).exists()
+
+
+@mark.parametrize("func", [fs.copy, fs.link])
+def test_fs_copy_link__limits(func, kwargs):
+    with (
+        patch.object(fs, "_limits", wraps=fs._limits) as _limits,
+        patch.object(fs.Copier if func is fs.copy else fs.Linker, "go") as go,
+    ):
+        func(**kwargs, threads=2, limits={STR.hpss: 2, STR.local: 4})
+    _limits.assert_called_once_with({STR.hpss: 2, STR.local: 4})
+    go.assert_called_once_with(dry_run=False, threads=6)
+
+
+def test_fs_hpss_cache(tmp_path):
+    with patch.object(fs, "_configure_cache") as _configure_cache:
+        fs.hpss_cache(cache_dir=tmp_path, ttl=60)
+    _configure_cache.assert_called_once_with(cache_dir=tmp_path, ttl=60)
+
+
+def test_fs_merge_reports(tmp_path):
+    path = tmp_path / "report.json"
+    path.write_text(json.dumps({STR.notready: ["/c"], STR.ready: ["/b"]}))
+    reports = [path, str(path), {STR.notready: [], STR.ready: ["/a"]}]
+    assert fs.merge_reports(reports) == {
+        STR.notready: ["/c", "/c"],
+        STR.ready: ["/a", "/b", "/b"],
+    }
+
+
+def test_fs_staging_cache(tmp_path):
+    with patch.object(fs, "_configure_staging_cache") as _configure_staging_cache:
+        fs.staging_cache(cache_dir=tmp_path, max_size=1024, link=True)
+    _configure_staging_cache.assert_called_once_with(cache_dir=tmp_path, max_size=1024, link=True)
+
+
 def test_fs_link_fail(kwargs):
     paths = kwargs["config"]["a"]["b"]
     assert not any(Path(p).exists() for p in paths)
@@ -97,3 +259,138 @@ def test_fs_makedirs_fail(tmp_path):
     assert set(report[STR.ready]) == set()
     assert set(report[STR.notready]) == set(map(str, paths))
     tmp_path.chmod(0o755)  # make tmp_path writable
+
+
+def test_fs_prefetch(tmp_path, utc):
+    (tmp_path / "a").write_text("a")
+    config = {"a": {"{{ cycle.strftime('%H') }}/a": str(tmp_path / "a")}}
+    future = fs.prefetch(
+        cycles=[utc(2025, 1, 1, 0)], config=config, target_dir=tmp_path, key_path=["a"], nice=5
+    )
+    assert future.result(timeout=60) == {
+        "2025-01-01T00:00:00": {STR.notready: [], STR.ready: [str(tmp_path / "00" / "a")]}
+    }
+
+
+def test_fs_prefetch__stdin(utc):
+    with (
+        patch.object(fs, "_YAMLConfig") as yamlconfig,
+        patch.object(fs, "ProcessPoolExecutor") as ppe,
+    ):
+        fs.prefetch(cycles=[utc()], stdin_ok=True)
+    yamlconfig.assert_called_once_with(config=None)
+    assert ppe.call_args.kwargs["initargs"][3] == fs._prefetch_settings()
+    executor = ppe()
+    assert executor.submit.call_args.args[2] == yamlconfig().data
+    executor.shutdown.assert_called_once_with(wait=False)
+
+
+def test_fs__prefetch(tmp_path, utc):
+    (tmp_path / "a").write_text("a")
+    config = {"a": {"{{ cycle.strftime('%H') }}/a": str(tmp_path / "{{ cycle.strftime('%H') }}")}}
+    cycles = [utc(2025, 1, 1, 0), utc(2025, 1, 1, 6)]
+    (tmp_path / "00").write_text("00")
+    with patch.object(fs, "_limits", wraps=fs._limits) as _limits:
+        report = fs._prefetch(
+            cycles=cycles,
+            config=config,
+            target_dir=tmp_path / "dst",
+            leadtime=None,
+            key_path=["a"],
+            driver=False,
+            dry_run=False,
+            threads=1,
+            limits={STR.local: 2},
+        )
+    _limits.assert_called_once_with({STR.local: 2})
+    assert report == {
+        "2025-01-01T00:00:00": {STR.notready: [], STR.ready: [str(tmp_path / "dst/00/a")]},
+        "2025-01-01T06:00:00": {STR.notready: [str(tmp_path / "dst/06/a")], STR.ready: []},
+    }
+
+
+def test_fs__prefetch__driver(tmp_path, utc):
+    (tmp_path / "a").write_text("a")
+    config = {"fv3": {"files_to_copy": {"a": str(tmp_path / "a")}, "rundir": str(tmp_path / "run")}}
+    report = fs._prefetch(
+        cycles=[utc(2025, 1, 1, 0)],
+        config=config,
+        target_dir=None,
+        leadtime=None,
+        key_path=["fv3"],
+        driver=True,
+        dry_run=False,
+        threads=1,
+        limits=None,
+    )
+    assert report == {
+        "2025-01-01T00:00:00": {STR.notready: [], STR.ready: [str(tmp_path / "run/a")]}
+    }
+
+
+def test_fs__prefetch_init(tmp_path):
+    settings = {
+        "cache": {"dir": tmp_path / "cache", "link": True, "max_size": 1024},
+        "hpss": {"dir": tmp_path / "hpss", "ttl": 60.0},
+        "http": {"segments": 4},
+        "local": {"buffer_size": 1024},
+    }
+    with (
+        patch.object(fs.os, "nice") as nice,
+        patch.object(fs, "_setup_logging") as setup_logging,
+        patch.object(fs, "_configure_staging_cache") as _configure_staging_cache,
+        patch.object(fs, "_configure_cache") as _configure_cache,
+        patch.object(fs._http, "configure") as http_configure,
+        patch.object(fs._local, "configure") as local_configure,
+    ):
+        fs._prefetch_init(nice=10, quiet=False, verbose=True, settings=settings)
+    nice.assert_called_once_with(10)
+    setup_logging.assert_called_once_with(quiet=False, verbose=True)
+    _configure_staging_cache.assert_called_once_with(
+        cache_dir=tmp_path / "cache", max_size=1024, link=True
+    )
+    _configure_cache.assert_called_once_with(cache_dir=tmp_path / "hpss", ttl=60.0)
+    http_configure.assert_called_once_with(segments=4)
+    local_configure.assert_called_once_with(buffer_size=1024)
+
+
+def test_fs__prefetch_settings(tmp_path):
+    fs.staging_cache(cache_dir=tmp_path, max_size=1024, link=True)
+    settings = fs._prefetch_settings()
+    assert settings["cache"] == {"dir": tmp_path, "link": True, "max_size": 1024}
+    assert settings["hpss"] == {"dir": None, "ttl": 3600.0}
+    assert settings["http"] == vars(fs._http.CONFIG)
+    assert settings["local"] == vars(fs._local.CONFIG)
+    assert settings["http"] is not vars(fs._http.CONFIG)
+
+
+def test_fs_purge(tmp_path):
+    paths = [tmp_path / x for x in ("foo", "bar")]
+    for path in paths:
+        (path / "sub").mkdir(parents=True)
+        (path / "sub" / "a").write_text("foo")
+    config = {"purge": {"paths": [str(path) for path in paths]}}
+    report = fs.purge(config=config, dry_run=True)
+    assert report == {STR.notready: list(map(str, paths)), STR.ready: [], STR.reclaimed: 0}
+    report = fs.purge(config=config, threads=2)
+    assert report == {STR.notready: [], STR.ready: list(map(str, paths)), STR.reclaimed: 6}
+    assert not any(path.exists() for path in paths)
+
+
+def test_fs_purge_plan(tmp_path):
+    path = tmp_path / "foo"
+    path.write_text("foo")
+    plan = fs.purge_plan(config={"purge": {"paths": ["foo", "bar"]}}, target_dir=tmp_path)
+    assert plan == {
+        "paths": [{"bytes": 3, "files": 1, "path": str(path)}],
+        "totals": {"bytes": 3, "files": 1, "paths": 1},
+    }
+    assert path.is_file()
+
+
+def test_fs__threads(logged):
+    assert fs._threads(4, None) == 4
+    assert fs._threads(4, {STR.hpss: 1, STR.local: 2}) == 4
+    assert not logged("Using")
+    assert fs._threads(1, {STR.hpss: 1, STR.local: 2}) == 3
+    assert logged("Using 3 threads, the sum of transfer limits, instead of 1")
@@ -3,12 +3,19 @@ Tests for uwtools.config.formats.nml module.
 """
 
 import filecmp
+from collections import OrderedDict
+from copy import deepcopy
+from io import StringIO
+from random import Random
 from textwrap import dedent
 
 import f90nml  # type: ignore[import-untyped]
-from pytest import fixture, mark
+import yaml
+from pytest import fixture, mark, raises
 
+from uwtools.config.formats import nml
 from uwtools.config.formats.nml import NMLConfig
+from uwtools.config.support import uw_yaml_loader
 from uwtools.tests.support import fixture_path
 from uwtools.utils.file import FORMAT
 
@@ -155,3 +162,195 @@ def test_nml_dump_dict(dumpkit):
     d, expected, path = dumpkit
     NMLConfig.dump_dict(d, path=path)
     assert path.read_text().strip() == expected
+
+
+@fixture
+def patchkit(tmp_path):
+    base = """
+    ! Comments and formatting are preserved.
+    &a
+      x = 3*1.0  ! repeat count
+      s = 'it''s / not ! the end',  t = T
+    /
+    &b t%u = 1, v = (1.0, 2.0) /
+    """
+    path = tmp_path / "base.nml"
+    path.write_text(dedent(base).lstrip())
+    return path
+
+
+def test_nml_patch(patchkit, tmp_path):
+    values = {"a": {"x": [1, 2], "n": "{{ b.t.u }}"}, "b": {"t": {"u": 2}}, "c": {"z": True}}
+    cfgobj = NMLConfig.patch(patchkit, values)
+    expected = NMLConfig(patchkit)
+    expected.update_from(values)
+    expected.dereference()
+    assert cfgobj.data == expected.data
+    path = tmp_path / "patched.nml"
+    cfgobj.dump(path)
+    patched = """
+    ! Comments and formatting are preserved.
+    &a
+      x = 1, 2  ! repeat count
+      s = 'it''s / not ! the end',  t = T
+        n = '2'
+    /
+    &b t%u = 2, v = (1.0, 2.0) /
+
+    &c
+        z = .true.
+    /
+    """
+    assert path.read_text() == dedent(patched).lstrip()
+    assert NMLConfig(path).data == cfgobj.data
+
+
+def test_nml_patch_no_changes(patchkit, tmp_path):
+    path = tmp_path / "patched.nml"
+    NMLConfig.patch(str(patchkit), {}).dump(path)
+    assert path.read_text() == patchkit.read_text()
+
+
+def test_nml_patch_modified(patchkit, tmp_path):
+    cfgobj = NMLConfig.patch(patchkit, {"a": {"x": 1}})
+    cfgobj["a"]["x"] = 2
+    path = tmp_path / "patched.nml"
+    cfgobj.dump(path)
+    assert path.read_text().strip() == cfgobj._dict_to_str(cfgobj.data)
+
+
+@mark.parametrize(
+    ("base", "values"),
+    [
+        ("&a x(1) = 1 x(2) = 2 /", {"a": {"x": [3, 4]}}),
+        ("&a x = 1 x = 2 /", {"a": {"x": 3}}),
+        ("&a t%u = 1 /", {"a": {"t": 2}}),
+        ("&a x = 1 / &a x = 2 /", {"a": {"y": 3}}),
+        ("&a x = 1 /", {"a": {"t": [{"u": 1}]}}),
+        ("&a x = 1 /", {"a": {"t": {"u": [{"v": 1}]}}}),
+        ("&a x = 1 /", yaml.load("a:\n  x: !remove", Loader=uw_yaml_loader())),
+        ("&a x = 'unterminated /", {"a": {"x": 2}}),
+        ("&a 1 /", {"a": {"x": 2}}),
+        ("&a x = 1", {"a": {"x": 2}}),
+    ],
+)
+def test_nml_patch_rewrite(base, logged, tmp_path, values):
+    path = tmp_path / "base.nml"
+    path.write_text(base)
+    try:
+        expected = NMLConfig(path)
+    except Exception:  # noqa: BLE001
+        expected = None  # f90nml cannot parse the base, so neither can patch()
+    if expected:
+        expected.update_from(values)
+        expected.dereference()
+        cfgobj = NMLConfig.patch(path, values)
+        assert cfgobj.data == expected.data
+        assert cfgobj._patched is None
+        assert logged(f"Cannot patch {path} in place, rewriting")
+    if nml._patchable(values):
+        assert nml._patch(base, values, NMLConfig._dict_to_str) is None
+
+
+def test_nml__changes():
+    assert nml._changes({"a": {"x": 1, "y": 2}}, {"a": {"x": 1, "y": 3}, "b": {"z": 4}}) == {
+        "a": {"y": 3},
+        "b": {"z": 4},
+    }
+    assert nml._changes({"a": {"x": 1}}, {"a": {}}) is None
+    assert nml._changes({"a": {"x": {"y": 1}}}, {"a": {"x": {}}}) is None
+
+
+def test_nml__patchable():
+    assert nml._patchable({"a": {"b": [1, 1.0, None, True, "s", 1j]}})
+    assert not nml._patchable({"a": {"b": object()}})
+    assert not nml._patchable({"a": {1: 2}})
+
+
+def f90nml_str(cfg):
+    def to_od(d):
+        return OrderedDict({k: to_od(v) if isinstance(v, dict) else v for k, v in d.items()})
+
+    with StringIO() as sio:
+        f90nml.Namelist(to_od(deepcopy(cfg))).write(sio, sort=False)
+        return sio.getvalue()
+
+
+def nml_str(cfg):
+    with StringIO() as sio:
+        nml._write(cfg, sio)
+        return sio.getvalue()
+
+
+@mark.parametrize(
+    "group",
+    [
+        {"i": 1, "f": 3.14, "e": 1e-20, "b": True, "c": 1 + 2j, "s": "hello", "n": None},
+        {"s": "it's", "d": 'say "hi"', "bs": "a\\b", "u": "é", "t": "\t"},
+        {"UPPER": 1, "MiXeD": [1, 2]},
+        {"empty": [], "nulls": [None, None], "trailing": [1, None], "leading": [None, 1]},
+        {"ints": list(range(100)), "floats": [i / 7 for i in range(60)]},
+        {"mixed": [1, 2.5, True, "s", 1j, None] * 10},
+        {"long": ["x" * 80, "y" * 10]},
+        {"x" * 70: [1, 2, 3], "y" * 80: list(range(30))},
+        {"dt": {"a": 1, "B": {"c": [1, 2], "d": "s"}}},
+        {"dts": [{"z": 1, "a": 2}, None, {"m": {"y": 1, "b": [{"q": 1, "p": 2}]}}]},
+        {"md": [[1, 2], [3, 4], None, [[5], [6, 7]]]},
+        {"md": [[i * 0.5 for i in range(40)]] * 3},
+    ],
+)
+def test_nml__write__parity(group):
+    cfg = {"nl": group, "NL2": {"a": 1}, "nl3": {}}
+    assert nml._streamable(cfg)
+    assert nml_str(cfg) == f90nml_str(cfg)
+
+
+def test_nml__write__parity_random():
+    rng = Random(42)  # noqa: S311
+    scalars = [
+        lambda: rng.randint(-(10**12), 10**12),
+        lambda: rng.uniform(-1e6, 1e6),
+        lambda: rng.choice([True, False]),
+        lambda: "".join(rng.choice("ab'\" \\x") for _ in range(rng.randint(0, 30))),
+        lambda: complex(rng.random(), rng.random()),
+        lambda: None,
+    ]
+
+    def value(depth):
+        kind = rng.randrange(5 if depth < 3 else 2)
+        if kind == 0:
+            return rng.choice(scalars)()
+        if kind == 1:
+            return [rng.choice(scalars)() for _ in range(rng.randint(0, 50))]
+        if kind == 2:
+            return [[rng.choice(scalars)() for _ in range(rng.randint(1, 20))] for _ in range(3)]
+        if kind == 3:
+            return {"v%s" % i: value(depth + 1) for i in rng.sample(range(20), 3)}
+        return [{"v%s" % i: value(depth + 1) for i in rng.sample(range(20), 3)}, None]
+
+    for _ in range(200):
+        cfg = {"g%s" % i: {"v%s" % j: value(0) for j in range(5)} for i in range(3)}
+        assert nml._streamable(cfg)
+        assert nml_str(cfg) == f90nml_str(cfg)
+
+
+def test_nml__write__fallback():
+    cfg = f90nml.Namelist({"nl": {"a": [1, 2]}})
+    cfg.start_index = {}
+    cfg["nl"].start_index = {"a": [0]}
+    assert nml_str(cfg) == "&nl\n    a(0:1) = 1, 2\n/\n"
+    cfg = {"nl": {"a": [1, [2]]}}
+    with raises(ValueError, match="cannot be converted"):
+        nml_str(cfg)
+
+
+def test_nml__streamable():
+    assert nml._streamable({"nl": {"a": [[1], None, [[2]]], "b": [{"c": 1}, None]}})
+    assert not nml._streamable(f90nml.Namelist({"nl": {"a": 1}}))
+    assert not nml._streamable({"nl": {"a": 1, "A": 2}})
+    assert not nml._streamable({"nl": {1: 2}})
+    assert not nml._streamable({"nl": {"_start_index": {"a": [0]}}})
+    assert not nml._streamable({"nl": {"a": [1, [2]]}})
+    assert not nml._streamable({"nl": {"a": [{"b": 1}, 2]}})
+    assert not nml._streamable({"nl": {"a": [[{"b": 1}]]}})
+    assert not nml._streamable({"nl": {"a": object()}})
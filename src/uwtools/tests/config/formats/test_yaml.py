@@ -4,6 +4,7 @@ Tests for uwtools.config.formats.yaml module.
 
 import filecmp
 import sys
+from copy import deepcopy
 from datetime import datetime, timedelta
 from io import StringIO
 from textwrap import dedent
@@ -14,7 +15,8 @@ from pytest import fixture, mark, raises
 
 from uwtools import exceptions
 from uwtools.config import support
-from uwtools.config.formats.yaml import YAMLConfig
+from uwtools.config.formats.yaml import LazyYAMLConfig, LazyYAMLMapping, YAMLConfig, materialize
+from uwtools.config.snapshot import dump_snapshot
 from uwtools.exceptions import UWConfigError
 from uwtools.tests.support import fixture_path
 from uwtools.utils.file import FORMAT, _stdinproxy
@@ -99,6 +101,31 @@ def test_yaml_include_files():
     assert cfgobj["reverse_files"]["vegetable"] == "eggplant"
 
 
+def test_yaml_snapshot(tmp_path):
+    path = tmp_path / "config.snapshot"
+    written = dump_snapshot(data={"a": {"b": 1}}, path=path, realized=True)
+    cfgobj = YAMLConfig(path)
+    assert cfgobj.data == {"a": {"b": 1}}
+    assert cfgobj.snapshot == written
+
+
+def test_yaml_snapshot_none(tmp_path):
+    path = tmp_path / "config.yaml"
+    path.write_text("a: 1\n")
+    assert YAMLConfig(path).snapshot is None
+    assert YAMLConfig({"a": 1}).snapshot is None
+
+
+def test_yaml_snapshot_include(tmp_path):
+    snap = tmp_path / "included.snapshot"
+    dump_snapshot(data={"b": 2}, path=snap, realized=True)
+    path = tmp_path / "config.yaml"
+    path.write_text("a: !include [%s]\n" % snap)
+    cfgobj = YAMLConfig(path)
+    assert cfgobj.data == {"a": {"b": 2}}
+    assert cfgobj.snapshot is None
+
+
 def test_yaml_simple(tmp_path):
     """
     Test that YAML load, update, and dump work with a basic YAML file.
@@ -227,3 +254,102 @@ def test_yaml_dump_dict(dumpkit):
     d, expected, path = dumpkit
     YAMLConfig.dump_dict(d, path=path)
     assert path.read_text().strip() == expected
+
+
+def test_yaml_lazy(tmp_path):
+    (tmp_path / "inc.yaml").write_text("x: 1\n")
+    s = """
+    base: &base
+      p: 1
+    a:
+      <<: *base
+      i: !include [inc.yaml]
+      n: !int '{{ 2 }}'
+    b: !include [missing.yaml]
+    """
+    path = tmp_path / "config.yaml"
+    path.write_text(dedent(s).strip())
+    cfgobj = LazyYAMLConfig(path)
+    assert isinstance(cfgobj.data, LazyYAMLMapping)
+    assert list(cfgobj) == ["base", "a", "b"]
+    assert isinstance(cfgobj["a"], LazyYAMLMapping)
+    assert cfgobj["a"]["i"] == {"x": 1}
+    a = materialize(cfgobj["a"])
+    assert isinstance(a, dict)
+    assert a["p"] == 1
+    assert a["n"].tagged_string == "!int '{{ 2 }}'"
+    with raises(UWConfigError) as e:
+        assert cfgobj["b"]
+    assert str(e.value) == "Cannot include %s: No such file or directory" % (
+        tmp_path / "missing.yaml"
+    )
+
+
+def test_yaml_lazy_constructor_error(tmp_path):
+    path = tmp_path / "config.yaml"
+    path.write_text("a: 1\nb: !not_a_constructor bar\n")
+    cfgobj = LazyYAMLConfig(path)
+    assert cfgobj["a"] == 1
+    with raises(UWConfigError) as e:
+        assert cfgobj["b"]
+    assert "constructor: '!not_a_constructor'" in str(e.value)
+
+
+@mark.parametrize("key", ["{{ b }}", "[1, 2]"])
+def test_yaml_lazy_constructor_error_no_quotes(key, tmp_path):
+    path = tmp_path / "config.yaml"
+    path.write_text("a:\n  %s: 1\n" % key)
+    cfgobj = LazyYAMLConfig(path)
+    with raises(UWConfigError) as e:
+        assert cfgobj["a"]
+    assert "value is enclosed in quotes" in str(e.value)
+
+
+def test_yaml_lazy_deepcopy(tmp_path):
+    path = tmp_path / "config.yaml"
+    path.write_text("a:\n  b: 1\n")
+    lazy = LazyYAMLConfig(path).data
+    assert deepcopy(lazy) is lazy
+
+
+def test_yaml_lazy_dereference_dump(tmp_path):
+    path = tmp_path / "config.yaml"
+    path.write_text("a:\n  b: '{{ c }}'\nc: 1\n")
+    cfgobj = LazyYAMLConfig(path)
+    cfgobj.dereference()
+    assert cfgobj.data == {"a": {"b": "1"}, "c": 1}
+    assert repr(LazyYAMLConfig(path)) == "a:\n  b: '{{ c }}'\nc: 1"
+
+
+def test_yaml_lazy_not_dict(tmp_path):
+    path = tmp_path / "config.yaml"
+    path.write_text("hello")
+    with raises(UWConfigError) as e:
+        LazyYAMLConfig(path)
+    assert f"Parsed a str value from {path}, expected a dict" in str(e.value)
+
+
+def test_yaml_lazy_replace(tmp_path):
+    path = tmp_path / "config.yaml"
+    path.write_text("a: 1\nb: 2\n")
+    lazy = LazyYAMLConfig(path).data
+    assert isinstance(lazy, LazyYAMLMapping)
+    new = lazy.replace("a", 3)
+    assert dict(new) == {"a": 3, "b": 2}
+    assert dict(lazy) == {"a": 1, "b": 2}
+
+
+def test_yaml_lazy_snapshot(tmp_path):
+    path = tmp_path / "config.snapshot"
+    dump_snapshot(data={"a": 1}, path=path, realized=True)
+    cfgobj = LazyYAMLConfig(path)
+    assert cfgobj.data == {"a": 1}
+    assert cfgobj.snapshot
+
+
+def test_yaml_lazy_update_from(tmp_path):
+    path = tmp_path / "config.yaml"
+    path.write_text("a:\n  b: 1\n")
+    cfgobj = LazyYAMLConfig(path)
+    cfgobj.update_from({"a": {"c": 2}})
+    assert cfgobj.data == {"a": {"b": 1, "c": 2}}
@@ -358,6 +358,18 @@ def test_config_jinja2_unrendered(s, status):
     assert jinja2.unrendered(s) is status
 
 
+def test_config_jinja2_variables():
+    loader = uw_yaml_loader()("")
+    config = {
+        "a": "{{ b.c }}-{{ d }}",
+        "{{ e }}": [1, "{{ f | int }}", "{% for x in g %}{{ x }}{% endfor %}"],
+        "h": UWYAMLConvert(loader, yaml.ScalarNode(tag="!int", value="{{ i }}")),
+        "j": "{{ bad",
+        "k": 42,
+    }
+    assert jinja2.variables(config) == {"b", "d", "e", "f", "g", "i"}
+
+
 @mark.parametrize(
     ("converted", "tag", "value"),
     [
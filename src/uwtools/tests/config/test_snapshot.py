@@ -0,0 +1,101 @@
+"""
+Tests for uwtools.config.snapshot module.
+"""
+
+import json
+from unittest.mock import patch
+
+from pytest import fixture, raises
+
+from uwtools.config import snapshot
+from uwtools.exceptions import UWConfigError
+
+# Fixtures
+
+
+@fixture
+def schema_file(tmp_path):
+    path = tmp_path / "schema.jsonschema"
+    path.write_text(json.dumps({"type": "object"}))
+    return path
+
+
+# Tests
+
+
+def test_config_snapshot_Snapshot_current():
+    assert snapshot.Snapshot(
+        data={}, realized=True, schema=None, version=snapshot._version()
+    ).current
+    assert not snapshot.Snapshot(data={}, realized=True, schema=None, version="0.0.0").current
+
+
+def test_config_snapshot_Snapshot_validated(schema_file, tmp_path):
+    digest = snapshot.digest(schema_file)
+    version = snapshot._version()
+    s = lambda schema, version: snapshot.Snapshot(
+        data={}, realized=True, schema=schema, version=version
+    )
+    assert s(digest, version).validated(schema_file)
+    assert not s(None, version).validated(schema_file)
+    assert not s(digest, "0.0.0").validated(schema_file)
+    other = tmp_path / "other.jsonschema"
+    other.write_text(json.dumps({"type": "array"}))
+    assert not s(digest, version).validated(other)
+
+
+def test_config_snapshot_digest(tmp_path):
+    path = tmp_path / "a"
+    path.write_text("foo")
+    assert snapshot.digest(path) == (
+        "2c26b46b68ffc68ff99b453c1d30413413422d706483bfa0f98a5e886266e7ae"
+    )
+
+
+def test_config_snapshot_dump_snapshot_load_snapshot(schema_file, tmp_path, utc):
+    data = {"a": {"b": [1, 2.0, "3"]}, "t": utc(2025, 1, 2, 3)}
+    path = tmp_path / "subdir" / "config.snapshot"
+    written = snapshot.dump_snapshot(data=data, path=path, realized=True, schema_file=schema_file)
+    assert path.read_bytes().startswith(snapshot.MAGIC)
+    assert not path.with_name("config.snapshot.tmp").exists()
+    loaded = snapshot.load_snapshot(path)
+    assert loaded == written
+    assert loaded.data == data
+    assert loaded.realized is True
+    assert loaded.schema == snapshot.digest(schema_file)
+    assert loaded.version == snapshot._version()
+
+
+def test_config_snapshot_dump_snapshot_no_schema(tmp_path):
+    path = tmp_path / "config.snapshot"
+    snapshot.dump_snapshot(data={"a": 1}, path=path, realized=False)
+    loaded = snapshot.load_snapshot(path)
+    assert loaded.realized is False
+    assert loaded.schema is None
+
+
+def test_config_snapshot_is_snapshot(tmp_path):
+    path = tmp_path / "config.snapshot"
+    snapshot.dump_snapshot(data={}, path=path, realized=True)
+    assert snapshot.is_snapshot(path)
+    yaml = tmp_path / "config.yaml"
+    yaml.write_text("a: 1\n")
+    assert not snapshot.is_snapshot(yaml)
+    assert not snapshot.is_snapshot(tmp_path / "missing")
+
+
+def test_config_snapshot_load_snapshot_corrupt(tmp_path):
+    path = tmp_path / "config.snapshot"
+    snapshot.dump_snapshot(data={"a": 1}, path=path, realized=True)
+    path.write_bytes(path.read_bytes()[:-1])
+    with raises(UWConfigError) as e:
+        snapshot.load_snapshot(path)
+    assert str(e.value) == "Invalid or corrupt config snapshot: %s" % path
+
+
+def test_config_snapshot_load_snapshot_old_version(logged, tmp_path):
+    path = tmp_path / "config.snapshot"
+    with patch.object(snapshot, "_version", return_value="0.0.0"):
+        snapshot.dump_snapshot(data={"a": 1}, path=path, realized=True)
+    assert not snapshot.load_snapshot(path).current
+    assert logged("Snapshot %s was made by uwtools 0.0.0" % path)
@@ -20,6 +20,7 @@ from uwtools.config.formats.ini import INIConfig
 from uwtools.config.formats.nml import NMLConfig
 from uwtools.config.formats.sh import SHConfig
 from uwtools.config.formats.yaml import YAMLConfig
+from uwtools.config.snapshot import load_snapshot
 from uwtools.exceptions import UWConfigError, UWError
 from uwtools.strings import FORMAT
 from uwtools.tests.support import compare_files, fixture_path
@@ -430,6 +431,38 @@ def test_config_tools_compose__realize(realize, tmp_path, utc):
         assert config["validtime"].tagged_string == "!datetime '{{ cycle + leadtime }}'"
 
 
+@mark.parametrize("threads", [1, 4])
+def test_config_tools_compose__threads(threads, tmp_path):
+    paths = []
+    for i in range(8):
+        path = tmp_path / f"{i}.yaml"
+        path.write_text(yaml.dump({"n": i, f"k{i}": i}))
+        paths.append(path)
+    config = tools.compose(
+        configs=paths, realize=False, output_file=tmp_path / "out.yaml", threads=threads
+    )
+    assert config["n"] == 7
+    assert all(config[f"k{i}"] == i for i in range(8))
+
+
+@mark.parametrize("threads", [1, 16])
+def test_config_tools_compose__threads_include(threads, tmp_path):
+    # Each config includes its own inc.yaml, via a path relative to the config's directory:
+    paths = []
+    for i in range(16):
+        (tmp_path / str(i)).mkdir()
+        (tmp_path / str(i) / "inc.yaml").write_text(yaml.dump({"v": i}))
+        path = tmp_path / str(i) / "config.yaml"
+        # Precede the include with enough content that configs are parsed concurrently:
+        filler = {f"x{j}": j for j in range(1000)}
+        path.write_text(yaml.dump(filler) + f"k{i}: !include [inc.yaml]")
+        paths.append(path)
+    config = tools.compose(
+        configs=paths, realize=False, output_file=tmp_path / "out.yaml", threads=threads
+    )
+    assert all(config[f"k{i}"] == {"v": i} for i in range(16))
+
+
 def test_config_tools_compose__split_anchor_alias(compose_anchor_alias_assets):
     path_a, path_b, path_c, path_d = compose_anchor_alias_assets
     outpath = path_a.parent / "out.yaml"
@@ -466,6 +499,74 @@ def test_config_tools_config_tools_format_to_config__fail():
         tools.format_to_config("no-such-config-type")
 
 
+@mark.parametrize("threads", [1, 2])
+def test_config_tools_realize__threads(threads, tmp_path):
+    input_config = tmp_path / "input.yaml"
+    input_config.write_text(yaml.dump({"a": 1, "b": 2}))
+    update_config = tmp_path / "update.yaml"
+    update_config.write_text(yaml.dump({"b": 3}))
+    assert tools.realize(
+        input_config=input_config,
+        update_config=update_config,
+        output_file=tmp_path / "output.yaml",
+        threads=threads,
+    ) == {"a": 1, "b": 3}
+
+
+@mark.parametrize("threads", [1, 2])
+def test_config_tools_realize__threads_include(threads, tmp_path):
+    for name, val in [("input", 1), ("update", 2)]:
+        (tmp_path / name).mkdir()
+        (tmp_path / name / "inc.yaml").write_text(yaml.dump({name: val}))
+        filler = {f"x{j}": j for j in range(1000)}  # see test_config_tools_compose__threads_include
+        (tmp_path / name / "config.yaml").write_text(yaml.dump(filler) + "a: !include [inc.yaml]")
+    assert tools.realize(
+        input_config=tmp_path / "input" / "config.yaml",
+        update_config=tmp_path / "update" / "config.yaml",
+        output_file=tmp_path / "output.yaml",
+        threads=threads,
+    )["a"] == {"input": 1, "update": 2}
+
+
+def test_config_tools_realize__snapshot(tmp_path):
+    schema_file = tmp_path / "schema.jsonschema"
+    schema_file.write_text('{"properties": {"b": {"type": "integer"}}}')
+    snapshot_file = tmp_path / "config.snapshot"
+    tools.realize(
+        input_config={"a": "{{ b + 1 }}", "b": 1},
+        output_file=tmp_path / "config.yaml",
+        snapshot_file=snapshot_file,
+        schema_file=schema_file,
+    )
+    snapshot = load_snapshot(snapshot_file)
+    assert snapshot.data == {"a": "2", "b": 1}
+    assert snapshot.realized is True
+    assert snapshot.validated(schema_file)
+
+
+def test_config_tools_realize__snapshot_key_path_unrealized(tmp_path):
+    snapshot_file = tmp_path / "config.snapshot"
+    tools.realize(
+        input_config={"x": {"a": "{{ c }}"}},
+        output_file=tmp_path / "config.yaml",
+        key_path=["x"],
+        snapshot_file=snapshot_file,
+    )
+    snapshot = load_snapshot(snapshot_file)
+    assert snapshot.data == {"a": "{{ c }}"}
+    assert snapshot.realized is False
+    assert snapshot.schema is None
+
+
+def test_config_tools_realize__schema_file_invalid(tmp_path):
+    schema_file = tmp_path / "schema.jsonschema"
+    schema_file.write_text('{"properties": {"b": {"type": "string"}}}')
+    output_file = tmp_path / "config.yaml"
+    with raises(UWConfigError):
+        tools.realize(input_config={"b": 1}, output_file=output_file, schema_file=schema_file)
+    assert not output_file.exists()
+
+
 def test_config_tools_realize__conversion_cfg_to_yaml(tmp_path):
     """
     Test that a .cfg file can be used to create a YAML object.
@@ -1124,6 +1225,11 @@ def test_config_tools__ensure_format__explicitly_specified_with_path():
     )
 
 
+@mark.parametrize("threads", [1, 4])
+def test_config_tools__map_concurrently(threads):
+    assert tools._map_concurrently(lambda x: x * 2, range(10), threads) == list(range(0, 20, 2))
+
+
 def test_config_tools__realize_input_setup__ini_cfgobj():
     data = {"section": {"foo": "bar"}}
     cfgobj = INIConfig(config=data)
@@ -1296,6 +1402,19 @@ def test_config_tools__realize_update__file(realize_testobj, tmp_path):
     assert o[1][2][3] == 43
 
 
+def test_config_tools__realize_update_load__file(tmp_path):
+    update_config = tmp_path / "config.yaml"
+    update_config.write_text(yaml.dump({1: {2: {3: 43}}}))
+    o = tools._realize_update_load(update_config=update_config)
+    assert isinstance(o, YAMLConfig)
+    assert o[1][2][3] == 43
+
+
+@mark.parametrize("update_config", [None, {1: 2}, YAMLConfig({1: 2})])
+def test_config_tools__realize_update_load__passthrough(update_config):
+    assert tools._realize_update_load(update_config=update_config) is update_config
+
+
 def test_config_tools__realize_values_needed(uwcaplog):
     d = {"{{ x }}": 42, "b": "{{ y }}", "c": ["d", "{% for n in range(3) %}hi{% endfor %}"]}
     c = YAMLConfig(config=d)
@@ -7,6 +7,18 @@ from iotaa import Asset, Node, external
 from pytest import fixture
 
 from uwtools.logging import log
+from uwtools.utils import cache, hpss
+
+
+@fixture(autouse=True)
+def _hpss_cache():
+    hpss.clear_cache()
+
+
+@fixture(autouse=True)
+def _staging_cache():
+    yield
+    cache.configure()
 
 
 @fixture
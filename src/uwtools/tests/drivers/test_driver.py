@@ -15,7 +15,8 @@ import iotaa
 import yaml
 from pytest import fixture, mark, raises
 
-from uwtools.config.formats.yaml import YAMLConfig
+from uwtools.config.formats.yaml import LazyYAMLConfig, YAMLConfig
+from uwtools.config.snapshot import dump_snapshot
 from uwtools.drivers import driver
 from uwtools.exceptions import UWConfigError, UWNotImplementedError
 from uwtools.scheduler import Slurm
@@ -247,6 +248,51 @@ def test_Assets_key_path(config, tmp_path):
     assert assetsobj.config == config[assetsobj.driver_name()]
 
 
+def test_Assets_lazy(config, tmp_path, utc):
+    config["concrete"]["execution"]["mpicmd"] = "{{ tools.mpicmd }}"
+    config["concrete"]["execution"]["batchargs"]["stdout"] = "{{ foo.bar.concrete.rundir }}/out"
+    config["concrete"]["rundir"] = "{{ tools.root }}/{{ cycle.strftime('%Y%m%d%H') }}"
+    config_file = tmp_path / "config.yaml"
+    config_file.write_text(
+        yaml.dump(
+            {
+                "bin": "/usr/bin",
+                "foo": {"bar": config},
+                "tools": {"mpicmd": "{{ bin }}/srun", "root": "/run"},
+            }
+        )
+        + "unused: !include [missing.yaml]\n"
+    )
+    assetsobj = ConcreteAssetsCycleBased(
+        config=LazyYAMLConfig(config_file), cycle=utc(2024, 7, 2, 12), key_path=["foo", "bar"]
+    )
+    assert assetsobj.config["execution"]["mpicmd"] == "/usr/bin/srun"
+    assert assetsobj.config["rundir"] == "/run/2024070212"
+    assert assetsobj.config["execution"]["batchargs"]["stdout"] == "/run/2024070212/out"
+    with raises(UWConfigError) as e:
+        assert assetsobj.config_full
+    assert str(e.value) == "Cannot include %s: No such file or directory" % (
+        tmp_path / "missing.yaml"
+    )
+
+
+def test_Assets_lazy_no_key_path(config, tmp_path):
+    config_file = tmp_path / "config.yaml"
+    config_file.write_text(yaml.dump(config))
+    lazy = ConcreteAssetsTimeInvariant(config=LazyYAMLConfig(config_file))
+    eager = ConcreteAssetsTimeInvariant(config=config_file)
+    assert lazy.config_full == eager.config_full
+    assert isinstance(lazy.config_full["platform"], dict)
+
+
+def test_Assets_lazy_bad_key_path(config, tmp_path):
+    config_file = tmp_path / "config.yaml"
+    config_file.write_text(yaml.dump({"foo": config}))
+    with raises(UWConfigError) as e:
+        ConcreteAssetsTimeInvariant(config=LazyYAMLConfig(config_file), key_path=["foo", "bar"])
+    assert str(e.value) == "Bad config path: foo.bar"
+
+
 def test_Assets_leadtime(config, utc):
     cycle = utc(2024, 7, 2, 12)
     leadtime = dt.timedelta(hours=6)
@@ -288,6 +334,49 @@ def test_Assets_validate_schema_file(logged, should_pass, t, tmp_path):
             assert logged("1 is not of type 'string'")
 
 
+def test_Assets_snapshot_realized_and_validated(config, controller_schema, logged, tmp_path):
+    path = tmp_path / "config.snapshot"
+    dump_snapshot(data=config, path=path, realized=True, schema_file=controller_schema)
+    with (
+        patch.object(ConcreteAssetsTimeInvariant, "_validate", driver.Assets._validate),
+        patch.object(driver.YAMLConfig, "dereference") as dereference,
+        patch.object(driver, "validate_external") as validate_external,
+    ):
+        assetsobj = ConcreteAssetsTimeInvariant(config=path, schema_file=controller_schema)
+    dereference.assert_not_called()
+    validate_external.assert_not_called()
+    assert assetsobj.config_full == config
+    assert logged("Skipping validation of concrete config validated in snapshot")
+
+
+@mark.parametrize(
+    ("data", "kwargs"),
+    [({"a": "config"}, {"key_path": ["a"]}), ("config", {"controller": ["concrete"]})],
+)
+def test_Assets_snapshot_validated_other_config(config, controller_schema, data, kwargs, tmp_path):
+    path = tmp_path / "config.snapshot"
+    data = {"a": config} if isinstance(data, dict) else config
+    dump_snapshot(data=data, path=path, realized=True, schema_file=controller_schema)
+    with (
+        patch.object(ConcreteAssetsTimeInvariant, "_validate", driver.Assets._validate),
+        patch.object(driver, "validate_external") as validate_external,
+    ):
+        ConcreteAssetsTimeInvariant(config=path, schema_file=controller_schema, **kwargs)
+    validate_external.assert_called_once()
+
+
+def test_Assets_snapshot_unrealized_unvalidated(config, controller_schema, tmp_path):
+    path = tmp_path / "config.snapshot"
+    dump_snapshot(data=config, path=path, realized=False)
+    with (
+        patch.object(ConcreteAssetsTimeInvariant, "_validate", driver.Assets._validate),
+        patch.object(driver, "validate_external") as validate_external,
+    ):
+        assetsobj = ConcreteAssetsTimeInvariant(config=path, schema_file=controller_schema)
+    validate_external.assert_called_once()
+    assert assetsobj.config["execution"]["batchargs"]["stdout"] == "%s/out" % tmp_path
+
+
 def test_Assets__delegate(driverobj):
     assert "roses" not in driverobj.config
     driverobj._config_intermediate["plants"] = {"flowers": {"roses": "red"}}
@@ -130,15 +130,6 @@ def test_Ungrib_vtable(driverobj):
     assert dst.is_symlink()
 
 
-def test_Ungrib__gribfile(driverobj):
-    src = driverobj.rundir / "GRIBFILE.AAA.in"
-    src.touch()
-    dst = driverobj.rundir / "GRIBFILE.AAA"
-    assert not dst.is_symlink()
-    driverobj._gribfile(src, dst)
-    assert dst.is_symlink()
-
-
 def test_Ungrib__run_via_local_execution(driverobj, node):
     def make_output(*_args, **_kwargs):
         for path in driverobj.output["paths"]:
@@ -1,3 +1,4 @@
+import json
 import re
 import sys
 from argparse import ArgumentParser as Parser
@@ -47,6 +48,9 @@ def args_config_realize(utc):
         STR.values_needed: False,
         STR.total: False,
         STR.dry_run: False,
+        STR.threads: 1,
+        STR.snapshot_file: None,
+        STR.schema_file: None,
     }
 
 
@@ -60,8 +64,16 @@ def args_dispatch_fs(utc):
         "key_path": ["a", "b"],
         "dry_run": False,
         "threads": 3,
+        "limit": [("hpss", 2)],
+        "sync": "mtime",
+        "verify": Path("/verify"),
+        "manifest": Path("/manifest"),
+        "output_manifest": {"a": Path("/a")},
+        "plan": None,
         "report": True,
+        "shard": (0, 2),
         "stdin_ok": True,
+        "telemetry": Path("/telemetry"),
     }
 
 
@@ -82,6 +94,15 @@ def test_cli__abort(capsys):
     assert msg in capsys.readouterr().err
 
 
+def test_cli__add_arg_limit():
+    parser = Parser()
+    group = parser.add_argument_group()
+    cli._add_arg_limit(group)
+    assert parser.parse_args([]).limit is None
+    args = parser.parse_args(["--limit", "hpss=2", "--limit", "http=8"])
+    assert args.limit == [("hpss", 2), ("http", 8)]
+
+
 def test_cli__add_arg_partial():
     parser = Parser()
     group = parser.add_argument_group()
@@ -93,6 +114,15 @@ def test_cli__add_arg_partial():
     assert args.partial is True
 
 
+def test_cli__add_arg_sync():
+    parser = Parser()
+    group = parser.add_argument_group()
+    cli._add_arg_sync(group)
+    assert parser.parse_args([]).sync is None
+    assert parser.parse_args(["--sync"]).sync == STR.mtime
+    assert parser.parse_args(["--sync", "hash"]).sync == STR.hash
+
+
 def test_cli__add_subparser_config(subparsers):
     cli._add_subparser_config(subparsers)
     assert actions(subparsers.choices[STR.config]) == [
@@ -145,7 +175,21 @@ def test_cli__add_subparser_ecflow_validate(subparsers):
 
 def test_cli__add_subparser_file(subparsers):
     cli._add_subparser_fs(subparsers)
-    assert actions(subparsers.choices[STR.fs]) == [STR.copy, STR.hardlink, STR.link, STR.makedirs]
+    assert actions(subparsers.choices[STR.fs]) == [
+        STR.archive,
+        STR.copy,
+        STR.hardlink,
+        STR.link,
+        STR.makedirs,
+        STR.merge,
+        STR.prefetch,
+        STR.purge,
+    ]
+
+
+def test_cli__add_subparser_file_archive(subparsers):
+    cli._add_subparser_fs_archive(subparsers)
+    assert subparsers.choices[STR.archive]
 
 
 def test_cli__add_subparser_file_copy(subparsers):
@@ -158,6 +202,16 @@ def test_cli__add_subparser_file_link(subparsers):
     assert subparsers.choices[STR.link]
 
 
+def test_cli__add_subparser_file_prefetch(subparsers):
+    cli._add_subparser_fs_prefetch(subparsers)
+    assert subparsers.choices[STR.prefetch]
+
+
+def test_cli__add_subparser_file_purge(subparsers):
+    cli._add_subparser_fs_purge(subparsers)
+    assert subparsers.choices[STR.purge]
+
+
 def test_cli__add_subparser_for_driver(subparsers):
     name = "adriver"
     adriver = Mock()
@@ -420,6 +474,7 @@ def test_cli__dispatch_config_compose(utc):
         STR.output_format: FORMAT.yaml,
         STR.cycle: cycle,
         STR.leadtime: leadtime,
+        STR.threads: 4,
     }
     with patch.object(cli.uwtools.api.config, "compose") as compose:
         cli._dispatch_config_compose(args)
@@ -431,6 +486,7 @@ def test_cli__dispatch_config_compose(utc):
         output_format=FORMAT.yaml,
         cycle=cycle,
         leadtime=leadtime,
+        threads=4,
     )
 
 
@@ -451,6 +507,9 @@ def test_cli__dispatch_config_realize(args_config_realize, utc):
         total=False,
         dry_run=False,
         stdin_ok=True,
+        threads=1,
+        snapshot_file=None,
+        schema_file=None,
     )
 
 
@@ -510,10 +569,14 @@ def test_cli__dispatch_config_validate_config_obj():
 @mark.parametrize(
     ("action", "funcname"),
     [
+        (STR.archive, "_dispatch_fs_archive"),
         (STR.copy, "_dispatch_fs_copy"),
         (STR.hardlink, "_dispatch_fs_hardlink"),
         (STR.link, "_dispatch_fs_link"),
         (STR.makedirs, "_dispatch_fs_makedirs"),
+        (STR.merge, "_dispatch_fs_merge"),
+        (STR.prefetch, "_dispatch_fs_prefetch"),
+        (STR.purge, "_dispatch_fs_purge"),
     ],
 )
 def test_cli__dispatch_fs(action, funcname):
@@ -523,7 +586,7 @@ def test_cli__dispatch_fs(action, funcname):
     func.assert_called_once_with(args)
 
 
-@mark.parametrize("action", ["copy", "hardlink", "link", "makedirs"])
+@mark.parametrize("action", ["archive", "copy", "hardlink", "link", "makedirs", "purge"])
 def test_cli__dispatch_fs_action(action, args_dispatch_fs):
     api_fn = action
     args_actual = args_dispatch_fs
@@ -537,6 +600,17 @@ def test_cli__dispatch_fs_action(action, args_dispatch_fs):
         "threads": args_actual["threads"],
         "stdin_ok": args_actual["stdin_ok"],
     }
+    if action not in ("makedirs", "purge"):
+        args_expected["limits"] = {"hpss": 2}
+    if action == "archive":
+        args_expected["output"] = {"a": Path("/a")}
+    if action not in ("archive", "makedirs", "purge"):
+        args_expected["telemetry"] = Path("/telemetry")
+    if action == "copy":
+        args_expected["sync"] = "mtime"
+        args_expected["verify"] = Path("/verify")
+        args_expected["manifest"] = Path("/manifest")
+        args_expected["shard"] = (0, 2)
     if action == "hardlink":
         api_fn = "link"
         extra = {"hardlink": True, "fallback": None}
@@ -554,6 +628,129 @@ def test_cli__dispatch_fs_action(action, args_dispatch_fs):
     )
 
 
+@mark.parametrize(
+    ("fmt", "expected"),
+    [
+        ("json", '{\n  "bundles": [],\n  "totals": {}\n}'),
+        ("yaml", "bundles: []\ntotals: {}"),
+    ],
+)
+def test_cli__dispatch_fs_archive_plan(args_dispatch_fs, capsys, expected, fmt):
+    args = {**args_dispatch_fs, "plan": fmt}
+    with (
+        patch.object(cli.uwtools.api.fs, "archive_plan") as archive_plan,
+        patch.object(cli.uwtools.api.fs, "archive") as archive,
+    ):
+        archive_plan.return_value = {"bundles": [], "totals": {}}
+        assert cli._dispatch_fs_archive(args)
+    archive.assert_not_called()
+    archive_plan.assert_called_once_with(
+        target_dir=args["target_dir"],
+        config=args["config_file"],
+        cycle=args["cycle"],
+        leadtime=args["leadtime"],
+        key_path=args["key_path"],
+        stdin_ok=True,
+        output={"a": Path("/a")},
+    )
+    assert capsys.readouterr().out.strip() == expected
+
+
+@mark.parametrize(
+    ("fmt", "expected"),
+    [
+        ("json", '{\n  "files": [],\n  "totals": {}\n}'),
+        ("yaml", "files: []\ntotals: {}"),
+    ],
+)
+def test_cli__dispatch_fs_copy_plan(args_dispatch_fs, capsys, expected, fmt):
+    args = {**args_dispatch_fs, "plan": fmt}
+    with (
+        patch.object(cli.uwtools.api.fs, "copy_plan") as copy_plan,
+        patch.object(cli.uwtools.api.fs, "copy") as copy,
+    ):
+        copy_plan.return_value = {"files": [], "totals": {}}
+        assert cli._dispatch_fs_copy(args)
+    copy.assert_not_called()
+    copy_plan.assert_called_once_with(
+        target_dir=args["target_dir"],
+        config=args["config_file"],
+        cycle=args["cycle"],
+        leadtime=args["leadtime"],
+        key_path=args["key_path"],
+        stdin_ok=True,
+        sync=args["sync"],
+        shard=args["shard"],
+    )
+    assert capsys.readouterr().out.strip() == expected
+
+
+def test_cli__dispatch_fs_merge(capsys):
+    args = {STR.reports: [Path("/r1.json"), Path("/r2.json")]}
+    with patch.object(cli.uwtools.api.fs, "merge_reports") as merge_reports:
+        merge_reports.return_value = {STR.notready: [], STR.ready: ["/a"]}
+        assert cli._dispatch_fs_merge(args)
+    merge_reports.assert_called_once_with(reports=args[STR.reports])
+    assert json.loads(capsys.readouterr().out) == {STR.notready: [], STR.ready: ["/a"]}
+
+
+def test_cli__dispatch_fs_prefetch(args_dispatch_fs, utc):
+    args = {
+        **args_dispatch_fs,
+        "cycles": [utc(2025, 1, 1), utc(2025, 1, 2)],
+        "driver": True,
+        "nice": 10,
+    }
+    report = {"2025-01-01T00:00:00": {STR.notready: [], STR.ready: ["/a"]}}
+    with (
+        patch.object(cli.uwtools.api.fs, "prefetch") as prefetch,
+        patch.object(cli, "_dispatch_fs_report") as _dispatch_fs_report,
+    ):
+        prefetch().result.return_value = report
+        cli._dispatch_fs_prefetch(args)
+    prefetch.assert_called_with(
+        cycles=args["cycles"],
+        target_dir=args["target_dir"],
+        config=args["config_file"],
+        leadtime=args["leadtime"],
+        key_path=args["key_path"],
+        driver=True,
+        dry_run=args["dry_run"],
+        threads=args["threads"],
+        stdin_ok=True,
+        limits={"hpss": 2},
+        nice=10,
+    )
+    _dispatch_fs_report.assert_called_once_with(report=report)
+
+
+@mark.parametrize(
+    ("fmt", "expected"),
+    [
+        ("json", '{\n  "paths": [],\n  "totals": {}\n}'),
+        ("yaml", "paths: []\ntotals: {}"),
+    ],
+)
+def test_cli__dispatch_fs_purge_plan(args_dispatch_fs, capsys, expected, fmt):
+    args = {**args_dispatch_fs, "plan": fmt}
+    with (
+        patch.object(cli.uwtools.api.fs, "purge_plan") as purge_plan,
+        patch.object(cli.uwtools.api.fs, "purge") as purge,
+    ):
+        purge_plan.return_value = {"paths": [], "totals": {}}
+        assert cli._dispatch_fs_purge(args)
+    purge.assert_not_called()
+    purge_plan.assert_called_once_with(
+        target_dir=args["target_dir"],
+        config=args["config_file"],
+        cycle=args["cycle"],
+        leadtime=args["leadtime"],
+        key_path=args["key_path"],
+        stdin_ok=True,
+    )
+    assert capsys.readouterr().out.strip() == expected
+
+
 def test_cli__dispatch_fs_report_no(capsys):
     report = None
     cli._dispatch_fs_report(report=report)
@@ -1038,6 +1235,33 @@ def test_cli__parse_args():
         parser.parse_args.assert_called_with(raw_args)
 
 
+def test_cli__limit_from_str(capsys):
+    assert cli._limit_from_str("hpss=2") == ("hpss", 2)
+    with raises(SystemExit):
+        cli._limit_from_str("hpss")
+    assert "Specify limit as KIND=NUM" in capsys.readouterr().err
+
+
+def test_cli__output_manifest_from_path(capsys, tmp_path):
+    path = tmp_path / "output.json"
+    path.write_text('{"a": "/a", "b": ["/b1", "/b2"]}')
+    assert cli._output_manifest_from_path(str(path)) == {
+        "a": Path("/a"),
+        "b": [Path("/b1"), Path("/b2")],
+    }
+    path.write_text("[]")
+    with raises(SystemExit):
+        cli._output_manifest_from_path(str(path))
+    assert f"Cannot read output manifest {path}" in capsys.readouterr().err
+
+
+def test_cli__shard_from_str(capsys):
+    assert cli._shard_from_str("1/4") == (1, 4)
+    with raises(SystemExit):
+        cli._shard_from_str("1")
+    assert "Specify shard as I/N" in capsys.readouterr().err
+
+
 def test_cli__switch():
     assert cli._switch("foo_bar") == "--foo-bar"
 
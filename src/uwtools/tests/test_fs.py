@@ -1,14 +1,19 @@
+import datetime as dt
+import os
 from pathlib import Path
 from textwrap import dedent
-from unittest.mock import Mock, patch
+from unittest.mock import ANY, Mock, call, patch
 
 import iotaa
+import requests
 import yaml
 from pytest import fixture, mark, raises
 
 from uwtools import fs
 from uwtools.config.support import uw_yaml_loader
 from uwtools.exceptions import UWConfigError
+from uwtools.strings import STR
+from uwtools.utils import hpss, listing
 
 # Fixtures
 
@@ -42,6 +47,43 @@ def _expand_glob_assets(tmp_path):
     return dst, f, d, config
 
 
+@fixture
+def archive_assets(tmp_path):
+    root = tmp_path / "run"
+    for name, text in [("a", "aa"), ("b", "bb"), ("sub/c", "c" * 9), ("sub/d", "d")]:
+        path = root / name
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text(text)
+    (tmp_path / "e").write_text("e")
+    config = """
+    archive:
+      bundle_size: 5
+      dir: /hpss
+      name: run
+      files:
+        - a
+        - !glob b*
+        - sub
+    """
+    output = {"x": [root / "a"], "y": tmp_path / "e"}
+    return root, yaml.load(dedent(config), Loader=uw_yaml_loader()), output
+
+
+@fixture
+def rundirs(tmp_path):
+    # Run directories for two cycles, the older of which was last modified two days ago.
+    runs = tmp_path / "runs"
+    old, new = [runs / x for x in ("2025010100", "2025010200")]
+    for rundir in (old, new):
+        (rundir / "sub").mkdir(parents=True)
+        (rundir / "a").write_text("aaaa")
+        (rundir / "sub" / "b").write_text("bb")
+        (rundir / "sub" / "c").symlink_to(rundir / "a")
+    stale = old.stat().st_mtime - 48 * 3600
+    os.utime(old, (stale, stale))
+    return runs, old, new
+
+
 # Helpers
 
 
@@ -58,19 +100,107 @@ class ConcreteStager(fs.Stager):
 # Tests
 
 
+def test_fs_Archiver(archive_assets, ready_task):
+    root, config, output = archive_assets
+    archiver = fs.Archiver(config=config, target_dir=root, output=output)
+    with patch.object(fs, "htar_bundle", wraps=ready_task) as htar_bundle:
+        archiver.go()
+    assert htar_bundle.call_args_list == [
+        call("/hpss/run.000.tar", [str(root.parent / "e"), "a", "b"], cwd=root),
+        call("/hpss/run.001.tar", ["sub/c"], cwd=root),
+        call("/hpss/run.002.tar", ["sub/d"], cwd=root),
+    ]
+
+
+def test_fs_Archiver__bundle_members(archive_assets):
+    root, config, _ = archive_assets
+    with patch.object(fs, "HTAR_BUNDLE_MEMBERS", 1):
+        bundles = fs.Archiver(config=config, target_dir=root)._bundles()
+    assert list(bundles.values()) == [[("a", 2)], [("b", 2)], [("sub/c", 9)], [("sub/d", 1)]]
+
+
+def test_fs_Archiver__members(archive_assets, logged):
+    root, config, _ = archive_assets
+    config["archive"]["files"].append("missing")
+    archiver = fs.Archiver(config=config, target_dir=f"file://{root}")
+    assert archiver._members() == [("a", 2), ("b", 2), ("sub/c", 9), ("sub/d", 1)]
+    assert logged(f"Found 2 files below directory {root / 'sub'}")
+    assert logged(f"File {root / 'missing'} does not exist")
+
+
+def test_fs_Archiver__members__absolute(archive_assets):
+    root, _, _ = archive_assets
+    config = {"archive": {"dir": "hsi:///hpss/", "name": "run", "files": [str(root / "a")]}}
+    archiver = fs.Archiver(config=config)
+    assert archiver._members() == [(str(root / "a"), 2)]
+    assert list(archiver._bundles()) == ["/hpss/run.000.tar"]
+
+
+def test_fs_Archiver__no_files():
+    with raises(UWConfigError, match="No files to archive"):
+        fs.Archiver(config={"archive": {"dir": "/hpss", "name": "run"}})
+
+
+def test_fs_Archiver_plan(archive_assets):
+    root, config, _ = archive_assets
+    config["archive"]["bundle_size"] = 9
+    assert fs.Archiver(config=config, target_dir=root).plan() == {
+        "bundles": [
+            {"archive": "/hpss/run.000.tar", "bytes": 4, "members": ["a", "b"]},
+            {"archive": "/hpss/run.001.tar", "bytes": 9, "members": ["sub/c"]},
+            {"archive": "/hpss/run.002.tar", "bytes": 1, "members": ["sub/d"]},
+        ],
+        "totals": {"bundles": 3, "bytes": 14, "members": 4},
+    }
+
+
 @mark.parametrize("src_func", [str, Path])
 @mark.parametrize("dst_func", [str, Path])
 @mark.parametrize("tgt_func", [str, Path])
 def test_fs_Copier_go(src_func, dst_func, tgt_func):
     src, dst, tgt = src_func("/src/file"), dst_func("file"), tgt_func("/dst")
-    obj = Mock(_simple=fs.Copier._simple, _target_dir=tgt)
-    obj._expand_glob.return_value = [(dst, src, False)]
+    obj = Mock(_simple=fs.Copier._simple, _target_dir=tgt, sync=None, _symlinks=set())
+    obj._sources.return_value = [(dst, src, False)]
     with patch.object(fs, "filecopy") as filecopy:
         filecopy.return_value = iotaa.iotaa.NodeExternal(
             taskname="test", root=True, threads=0, asset=None
         )
         fs.Copier.go(obj)
-    filecopy.assert_called_once_with(src=src, dst=Path("/dst/file"), check=False)
+    filecopy.assert_called_once_with(src=src, dst=Path("/dst/file"), check=False, sync=None)
+
+
+def test_fs_Copier_go__hsi(ready_task):
+    srcs = [(f"dst/{n}", f"hsi:///src/{n}", True) for n in range(5)]
+    obj = Mock(_simple=fs.Copier._simple, _target_dir=Path("/tgt"), sync=None, _symlinks=set())
+    obj._sources.return_value = [*srcs, ("dst/x", "/src/x", True)]
+    with (
+        patch.object(fs, "HPSS_BATCH_SIZE", 2),
+        patch.object(fs, "filecopy", wraps=ready_task) as filecopy,
+        patch.object(fs, "filecopy_hsi_batch", wraps=ready_task) as filecopy_hsi_batch,
+    ):
+        fs.Copier.go(obj)
+    filecopy.assert_called_once_with(src="/src/x", dst=Path("/tgt/dst/x"), check=True, sync=None)
+    pairs = [(f"/src/{n}", Path(f"/tgt/dst/{n}")) for n in range(5)]
+    assert [c.args[0] for c in filecopy_hsi_batch.call_args_list] == [
+        pairs[:2],
+        pairs[2:4],
+        pairs[4:],
+    ]
+
+
+def test_fs_Copier_go__htar(ready_task):
+    obj = Mock(_simple=fs.Copier._simple, _target_dir=Path("/tgt"), sync=None, _symlinks=set())
+    obj._sources.return_value = [
+        ("a", "htar:///x.tar?a", False),
+        ("b", "htar:///y.tar?b%3F", True),
+        ("c", "htar:///x.tar?c", False),
+    ]
+    with patch.object(fs, "filecopy_htar_batch", wraps=ready_task) as filecopy_htar_batch:
+        fs.Copier.go(obj)
+    assert [(c.args, c.kwargs) for c in filecopy_htar_batch.call_args_list] == [
+        (("/x.tar", [("a", Path("/tgt/a")), ("c", Path("/tgt/c"))]), {"check": False}),
+        (("/y.tar", [("b?", Path("/tgt/b"))]), {"check": True}),
+    ]
 
 
 @mark.parametrize("source", ["dict", "file"])
@@ -102,6 +232,146 @@ def test_fs_Copier_go__live_no_targetdir_abspath_pass(assets):
     assert all(path.is_file() for path in [dstdir / "foo", dstdir / "bar"])
 
 
+@mark.parametrize("sync", ["hash", "mtime"])
+def test_fs_Copier_go__sync(assets, logged, sync, tmp_path):
+    dstdir, cfgdict, _ = assets
+    new = tmp_path / "src" / "new"
+    new.write_text("new")
+    cfgdict["a"]["b"]["new"] = str(new)
+    Path(cfgdict["a"]["b"]["subdir/bar"]).write_text("bar")
+    copier = fs.Copier(target_dir=dstdir, config=cfgdict, key_path=["a", "b"], sync=sync)
+    copier.go()
+    (dstdir / "new").unlink()
+    (dstdir / "subdir" / "bar").write_text("old")
+    os.utime(dstdir / "subdir" / "bar", (1000, 1000))
+    copier.go()
+    for path, text in [("foo", ""), ("subdir/bar", "bar"), ("new", "new")]:
+        assert (dstdir / path).read_text() == text
+    ready = [str(dstdir / path) for path in ("subdir/bar", "new")]
+    assert copier.synced(ready) == {
+        "copied": [str(dstdir / "new")],
+        "skipped": [str(dstdir / "foo")],
+        "updated": [str(dstdir / "subdir" / "bar")],
+    }
+    assert logged("Synced files: 1 copied, 1 updated, 1 skipped")
+    assert copier.synced([])[STR.skipped] == [str(dstdir / "foo")]
+
+
+def test_fs_Copier_plan(assets):
+    dstdir, cfgdict, _ = assets
+    srcdir = Path(cfgdict["a"]["b"]["foo"]).parent
+    (srcdir / "subdir" / "bar").write_text("bar")
+    cfgdict["a"]["b"].update(
+        {
+            "baz": str(srcdir / "baz"),
+            "hsi": "hsi:///a/hsi",
+            "htar": "htar:///a/x.tar?m%3F",
+            "http": "https://foo.com/x",
+        }
+    )
+    dstdir.mkdir()
+    (dstdir / "foo").touch()
+    copier = fs.Copier(target_dir=dstdir, config=cfgdict, key_path=["a", "b"])
+    with (
+        patch.object(fs.http, "size", return_value=42),
+        patch.object(fs, "htar_sizes", return_value={"m?": 8}) as htar_sizes,
+    ):
+        plan = copier.plan()
+    htar_sizes.assert_called_once_with("/a/x.tar")
+    plan_ = lambda action, dst, kind, size, src: dict(
+        action=action, dst=str(dstdir / dst), kind=kind, size=size, src=src
+    )
+    assert plan == {
+        "files": [
+            plan_("skip", "foo", "local", None, str(srcdir / "foo")),
+            plan_("copy", "subdir/bar", "local", 3, str(srcdir / "subdir" / "bar")),
+            plan_("copy", "baz", "local", None, str(srcdir / "baz")),
+            plan_("copy", "hsi", "hsi", None, "hsi:///a/hsi"),
+            plan_("copy", "htar", "htar", 8, "htar:///a/x.tar?m%3F"),
+            plan_("copy", "http", "http", 42, "https://foo.com/x"),
+        ],
+        "totals": {
+            "hsi": {"bytes": 0, "files": 1, "unsized": 1},
+            "htar": {"bytes": 8, "files": 1, "unsized": 0},
+            "http": {"bytes": 42, "files": 1, "unsized": 0},
+            "local": {"bytes": 3, "files": 2, "unsized": 1},
+        },
+    }
+
+
+def test_fs_Copier_shard(logged, tmp_path):
+    srcdir = tmp_path / "src"
+    srcdir.mkdir()
+    config = {}
+    for i, size in enumerate([8, 4, 2, 2]):
+        (srcdir / f"f{i}").write_bytes(b"x" * size)
+        config[f"f{i}"] = str(srcdir / f"f{i}")
+    config.update({"m1": "htar:///a.tar?m1", "m2": "htar:///a.tar?m2", "h": "hsi:///h"})
+    shards = []
+    for index in range(2):
+        copier = fs.Copier(target_dir=tmp_path / "dst", config=config, shard=(index, 2))
+        shards.append({dst: src for dst, src, _ in copier._sources()})
+    assert logged("Shard 0/2: ")
+    assert logged("Shard 1/2: ")
+    assert not shards[0].keys() & shards[1].keys()  # disjoint
+    assert shards[0].keys() | shards[1].keys() == config.keys()  # complete
+    assert {"m1", "m2"} <= shards[0].keys() or {"m1", "m2"} <= shards[1].keys()  # together
+    assert ("f0" in shards[0]) != ("f0" in shards[1])
+    sizes = [
+        sum(Path(src).stat().st_size for src in shard.values() if src.startswith("/"))
+        for shard in shards
+    ]
+    assert sorted(sizes) == [8, 8]
+
+
+def test_fs_Copier_shard__none(assets):
+    dstdir, cfgdict, _ = assets
+    copier = fs.Copier(target_dir=dstdir, config=cfgdict, key_path=["a", "b"])
+    assert copier._sources() == copier._expand_glob()
+
+
+@mark.parametrize("shard", [(2, 2), (-1, 2), (0, 0)])
+def test_fs_Copier__bad_shard(assets, shard):
+    _, cfgdict, _ = assets
+    with raises(UWConfigError, match=r"Bad shard .*: Specify shard i/n, where 0 <= i < n"):
+        fs.Copier(target_dir="/tgt", config=cfgdict, key_path=["a", "b"], shard=shard)
+
+
+def test_fs_Copier__bad_sync(assets):
+    _, cfgdict, _ = assets
+    with raises(UWConfigError, match=r"Unknown sync method 'foo' \(choices: hash, mtime\)"):
+        fs.Copier(target_dir="/tgt", config=cfgdict, key_path=["a", "b"], sync="foo")
+
+
+@mark.parametrize(
+    ("src", "exists", "current", "expected"),
+    [
+        ("/src/f", False, None, "copied"),
+        ("/src/f", True, True, "skipped"),
+        ("file:///src/f", True, False, "updated"),
+        ("hsi:///src/f", False, None, "copied"),
+        ("hsi:///src/f", True, None, "skipped"),
+    ],
+)
+def test_fs_Copier__state(current, exists, expected, src, tmp_path):
+    dst = tmp_path / "f"
+    if exists:
+        dst.touch()
+    obj = Mock(_simple=fs.Copier._simple, sync="mtime", _symlinks=set())
+    with patch.object(fs, "current", return_value=current) as current_:
+        assert fs.Copier._state(obj, src, dst) == expected
+    if current is not None:
+        current_.assert_called_once_with(Path("/src/f"), dst, "mtime")
+
+
+def test_fs_Copier__state__symlink(tmp_path):
+    dst = tmp_path / "f"
+    obj = Mock(sync="mtime", _symlinks={"/src/f"})
+    assert fs.Copier._state(obj, "/src/f", dst) == "copied"
+    dst.symlink_to("nowhere")
+    assert fs.Copier._state(obj, "/src/f", dst) == "skipped"
+
+
 def test_Copier_go__no_targetdir_relpath_fail(assets):
     _, cfgdict, _ = assets
     with raises(UWConfigError) as e:
@@ -111,10 +381,39 @@ def test_Copier_go__no_targetdir_relpath_fail(assets):
 
 
 def test_Copier__expand_glob(_expand_glob_assets):
-    dst, f, _, config = _expand_glob_assets
+    dst, f, d, config = _expand_glob_assets
+    (d / "sub").mkdir()
+    (d / "sub" / "a").write_text("a")
+    (d / "sub" / "a").chmod(0o750)
+    (d / "link").symlink_to("sub/a")
+    (d / "dangling").symlink_to("nowhere")
     fs.Copier(config=yaml.load(dedent(config), Loader=uw_yaml_loader())).go()
-    # Only file is copied, not directory:
-    assert list(dst.glob("*")) == [dst / f.name]
+    # File is copied, and directory is copied as a tree:
+    assert sorted(dst.rglob("*")) == [
+        dst / d.name,
+        dst / d.name / "dangling",
+        dst / d.name / "link",
+        dst / d.name / "sub",
+        dst / d.name / "sub" / "a",
+        dst / f.name,
+    ]
+    assert (dst / d.name / "sub" / "a").read_text() == "a"
+    assert (dst / d.name / "sub" / "a").stat().st_mode & 0o777 == 0o750
+    assert (dst / d.name / "link").readlink() == Path("sub/a")
+    assert (dst / d.name / "dangling").readlink() == Path("nowhere")
+
+
+def test_Copier__expand_tree(logged, tmp_path):
+    (tmp_path / "d" / "e").mkdir(parents=True)
+    (tmp_path / "d" / "e" / "f").touch()
+    (tmp_path / "d" / "g").symlink_to("e/f")
+    copier = fs.Copier(config={"/x": "/y"})
+    assert copier._expand_tree(str(tmp_path / "d"), "/dst/d") == [
+        ("/dst/d/e/f", str(tmp_path / "d" / "e" / "f"), False),
+        ("/dst/d/g", str(tmp_path / "d" / "g"), False),
+    ]
+    assert copier._symlinks == {str(tmp_path / "d" / "g")}
+    assert logged(f"Found 2 files below directory {tmp_path / 'd'}")
 
 
 def test_fs_Copier__simple():
@@ -177,7 +476,7 @@ def test_fs_FileStager__expand_glob__file_scheme(prefix):
     obj = Mock(_config=yaml.load(dedent(config), Loader=uw_yaml_loader()))
     obj._expand_glob_local.return_value = []
     fs.FileStager._expand_glob(obj)
-    obj._expand_glob_local.assert_called_once_with("/src/a*", "/dst/<a>")
+    obj._expand_glob_local.assert_called_once_with("/src/a*", "/dst/<a>", ANY)
 
 
 def test_fs_FileStager__expand_glob__hsi_scheme():
@@ -215,7 +514,7 @@ def test_fs_FileStager__expand_glob_hsi(logged, matches, success):
         *** Warning: No matching names located for '/BMC/rtrr/5year/uwtools/*.foo'
         """,
     }[matches]
-    with patch.object(fs, "run_shell_cmd") as run_shell_cmd:
+    with patch.object(hpss, "run_shell_cmd") as run_shell_cmd:
         run_shell_cmd.return_value = (success, dedent(output).strip())
         result = fs.FileStager._expand_glob_hsi(obj, glob_pattern, "/dst/<a>")
         if success:
@@ -239,7 +538,7 @@ def test_fs_FileStager__expand_glob_hsi(logged, matches, success):
                 )
         else:
             assert not result
-    run_shell_cmd.assert_called_once_with(f"hsi -q ls -1 '{glob_pattern}'")
+    run_shell_cmd.assert_called_once_with(f"hsi -q ls -1 '{glob_pattern}'", taskname=None)
 
 
 @mark.parametrize("success", [True, False])
@@ -266,7 +565,7 @@ def test_fs_FileStager__expand_glob_htar(success):
     _expand_glob_hsi = Mock(return_value=[(None, f"hsi:///a{n}.tar", None) for n in (1, 2)])
     with (
         patch.object(obj, "_expand_glob_hsi", _expand_glob_hsi),
-        patch.object(fs, "run_shell_cmd") as run_shell_cmd,
+        patch.object(hpss, "run_shell_cmd") as run_shell_cmd,
     ):
         run_shell_cmd.side_effect = [(success, dedent(output).strip()) for output in outputs]
         result = fs.FileStager._expand_glob_htar(obj, "/src/a*", "a1.*", "/dst/<a>")
@@ -285,12 +584,44 @@ def test_fs_FileStager__expand_glob_htar(success):
 
 def test_fs_FileStager__expand_glob_local():
     obj = Mock(wraps=fs.FileStager)
-    with patch.object(fs.glob, "iglob", return_value=["/src/a1", "/src/a2"]) as iglob:
+    paths = [("/src/a1", False), ("/src/a2", False)]
+    with patch.object(fs.Listings, "glob", return_value=iter(paths)) as glob:
         assert fs.FileStager._expand_glob_local(obj, "/src/a*", "/dst/<a>") == [
             ("/dst/a1", "/src/a1", False),
             ("/dst/a2", "/src/a2", False),
         ]
-    iglob.assert_called_once_with("/src/a*", recursive=True)
+    glob.assert_called_once_with("/src/a*")
+
+
+def test_fs_FileStager__expand_glob_local__recursive(tmp_path):
+    src, out = tmp_path / "src", tmp_path / "out"
+    (src / "a" / "b").mkdir(parents=True)
+    for path in ("top", "a/f1", "a/b/f2"):
+        (src / path).write_text(path)
+    config = f"{out}/<x>: !glob {src}/**"
+    copier = fs.Copier(config=yaml.load(config, Loader=uw_yaml_loader()))
+    # Each file is expanded once, via the walk of the root directory:
+    assert copier._expand_glob_local(f"{src}/**", str(out / "<x>")) == [
+        (str(out / "a" / "b" / "f2"), str(src / "a" / "b" / "f2"), False),
+        (str(out / "a" / "f1"), str(src / "a" / "f1"), False),
+        (str(out / "top"), str(src / "top"), False),
+    ]
+
+
+def test_fs_FileStager__expand_glob_local__listings(tmp_path):
+    for x in ("a1", "a2", "b1"):
+        (tmp_path / x).touch()
+    config = f"""
+    /dst/<a>: !glob {tmp_path}/a*
+    /dst/<b>: !glob {tmp_path}/b*
+    """
+    obj = Mock(_config=yaml.load(dedent(config), Loader=uw_yaml_loader()))
+    obj._expand_glob_local = lambda *args: fs.FileStager._expand_glob_local(obj, *args)
+    obj._expand_glob_resolve = fs.FileStager._expand_glob_resolve
+    with patch.object(listing.os, "scandir", wraps=os.scandir) as scandir:
+        srcs = fs.FileStager._expand_glob(obj)
+    assert sorted(src for _, src, _ in srcs) == [str(tmp_path / x) for x in ("a1", "a2", "b1")]
+    scandir.assert_called_once_with(str(tmp_path))
 
 
 @mark.parametrize(
@@ -331,6 +662,137 @@ def test_Linker__expand_glob(_expand_glob_assets):
     assert set(dst.glob("*")) == {dst / f.name, dst / d.name}
 
 
+def test_fs_Prefetcher(tmp_path, utc):
+    src = tmp_path / "src"
+    src.mkdir()
+    for hh in ("00", "06"):
+        (src / f"a{hh}").write_text(hh)
+    hh = "{{ cycle.strftime('%H') }}"
+    config = {"a": {"b": {f"{hh}/a": f"{src}/a{hh}"}}}
+    cycles = [utc(2025, 1, 1, h) for h in (0, 6, 12)]
+    prefetcher = fs.Prefetcher(
+        cycles=cycles, config=config, target_dir=tmp_path, key_path=["a", "b"]
+    )
+    prefetcher.go()
+    assert list(prefetcher.nodes) == [cycle.isoformat() for cycle in cycles]
+    assert [node.ready for node in prefetcher.nodes.values()] == [True, True, False]
+    assert (tmp_path / "06" / "a").read_text() == "06"
+
+
+def test_fs_Prefetcher__driver(tmp_path, utc):
+    (tmp_path / "a").write_text("a")
+    config = f"""
+    fv3:
+      files_to_copy:
+        a: {tmp_path}/a
+      rundir: {tmp_path}/run/{{{{ cycle.strftime('%Y%m%d%H') }}}}
+    """
+    cycles = [utc(2025, 1, 1, h) for h in (0, 6)]
+    prefetcher = fs.Prefetcher(
+        cycles=cycles, config=yaml.safe_load(dedent(config)), key_path=["fv3"], driver=True
+    )
+    prefetcher.go()
+    for rundir in ("2025010100", "2025010106"):
+        assert (tmp_path / "run" / rundir / "a").read_text() == "a"
+
+
+def test_fs_Prefetcher__driver_target_dir(tmp_path, utc):
+    (tmp_path / "a").write_text("a")
+    config = {"fv3": {"files_to_copy": {"a": str(tmp_path / "a")}, "rundir": "/unused"}}
+    fs.Prefetcher(
+        cycles=[utc()], config=config, target_dir=tmp_path / "dst", key_path=["fv3"], driver=True
+    ).go()
+    assert (tmp_path / "dst" / "a").is_file()
+
+
+def test_fs_Prefetcher__driver_no_rundir(utc):
+    config = {"fv3": {"files_to_copy": {"a": "/a"}}}
+    with raises(UWConfigError, match="Driver block has no rundir"):
+        fs.Prefetcher(cycles=[utc()], config=config, key_path=["fv3"], driver=True)
+
+
+def test_fs_Prefetcher__file_block_rundir(tmp_path, utc):
+    # A file block whose destinations include one named "rundir" is not a driver block:
+    (tmp_path / "a").write_text("a")
+    config = {"a": {"rundir": str(tmp_path / "a")}}
+    fs.Prefetcher(cycles=[utc()], config=config, target_dir=tmp_path / "dst", key_path=["a"]).go()
+    assert (tmp_path / "dst" / "rundir").read_text() == "a"
+
+
+def test_fs_Prefetcher__no_files(logged, tmp_path, utc):
+    config = {"fv3": {"rundir": str(tmp_path)}}
+    prefetcher = fs.Prefetcher(
+        cycles=[utc(2025, 1, 1)], config=config, key_path=["fv3"], driver=True
+    )
+    prefetcher.go()
+    assert prefetcher.nodes == {}
+    assert logged("No files to prefetch for cycle 2025-01-01T00:00:00")
+
+
+def test_fs_Purger(logged, rundirs):
+    runs, old, new = rundirs
+    config = f"""
+    purge:
+      older_than: 24
+      paths:
+        - !glob {runs}/*
+    """
+    purger = fs.Purger(config=yaml.load(dedent(config), Loader=uw_yaml_loader()))
+    purger.go()
+    assert not old.exists()
+    assert new.is_dir()
+    assert purger.reclaimed == 6 + len(str(old / "a"))
+    assert logged(f"Purged {old}: 3 files")
+
+
+def test_fs_Purger__cycle(rundirs, utc):
+    runs, old, new = rundirs
+    config = {"purge": {"paths": ["{{ cycle.strftime('%Y%m%d%H') }}"]}}
+    fs.Purger(config=config, target_dir=runs, cycle=utc(2025, 1, 2)).go()
+    assert old.is_dir()
+    assert not new.exists()
+
+
+def test_fs_Purger__dry_run(rundirs):
+    runs, old, _ = rundirs
+    config = {"purge": {"paths": [str(runs / "2025010100")]}}
+    purger = fs.Purger(config=config)
+    purger.go(dry_run=True)
+    assert old.is_dir()
+    assert purger.reclaimed == 0
+
+
+def test_fs_Purger__paths(logged, rundirs):
+    runs, old, new = rundirs
+    config = """
+    purge:
+      paths:
+        - !glob 2025*
+        - "2025010100"
+        - missing
+        - /
+    """
+    with patch.object(fs.Purger, "_check_destination_paths"):
+        purger = fs.Purger(
+            config=yaml.load(dedent(config), Loader=uw_yaml_loader()), target_dir=f"file://{runs}"
+        )
+    assert purger._paths() == [str(old), str(new)]
+    assert logged("Refusing to purge /")
+    assert logged("Selected 2 of 5 paths to purge")
+
+
+def test_fs_Purger_plan(rundirs):
+    _, old, new = rundirs
+    config = {"purge": {"older_than": 24, "paths": [str(old), str(new)]}}
+    purger = fs.Purger(config=config)
+    nbytes = 6 + len(str(old / "a"))
+    assert purger.plan() == {
+        "paths": [{"bytes": nbytes, "files": 3, "path": str(old)}],
+        "totals": {"bytes": nbytes, "files": 3, "paths": 1},
+    }
+    assert old.is_dir()
+
+
 @mark.parametrize(
     ("path", "target_dir", "msg", "fail_expected"),
     [
@@ -398,3 +860,67 @@ def test_fs_Stager__config_block__fail_bad_type(assets, val):
     with raises(UWConfigError) as e:
         ConcreteStager(target_dir=dstdir, config=cfgdict, key_path=["a", "b"])
     assert str(e.value) == "Value at a.b must be a dictionary"
+
+
+def test_fs__block(utc):
+    config = {"a": {"b": "{{ cycle.strftime('%H') }}{{ leadtime.seconds // 3600 }}{{ c }}"}, "c": 1}
+    block = fs._block(config, utc(2025, 1, 1, 6), dt.timedelta(hours=3), ["a"])
+    assert block == {"b": "0631"}
+
+
+@mark.parametrize(
+    ("src", "kind"),
+    [
+        ("/a", "local"),
+        ("file:///a", "local"),
+        ("ftp://foo.com/a", "ftp"),
+        ("hsi:///a", "hsi"),
+        ("htar:///a.tar?b", "htar"),
+        ("http://foo.com/a", "http"),
+        ("https://foo.com/a", "http"),
+    ],
+)
+def test_fs__kind(kind, src):
+    assert fs._kind(src) == kind
+
+
+def test_fs_merge_reports():
+    reports = [
+        {"notready": ["/d"], "ready": ["/c", "/a"], "telemetry": {"files": 2}},
+        {"notready": [], "ready": ["/b"], "telemetry": {"files": 1}},
+    ]
+    assert fs.merge_reports(reports) == {
+        "notready": ["/d"],
+        "ready": ["/a", "/b", "/c"],
+        "telemetry": [{"files": 2}, {"files": 1}],
+    }
+    assert fs.merge_reports([]) == {}
+
+
+def test_fs__shards():
+    items = [("a", 5), ("b", 4), ("c", 3), ("d", 2), ("e", 1)]
+    assert fs._shards(items, 2) == {"a": 0, "b": 1, "c": 1, "d": 0, "e": 0}
+    assert fs._shards(items, 1) == dict.fromkeys("abcde", 0)
+    assert fs._shards([(x, 0) for x in "abcde"], 2) == {"a": 0, "b": 1, "c": 0, "d": 1, "e": 0}
+
+
+def test_fs__size(tmp_path):
+    path = tmp_path / "a"
+    path.write_text("foo")
+    assert fs._size(str(path), "local") == 3
+    assert fs._size(str(tmp_path / "b"), "local") is None
+    with patch.object(fs.http, "size", side_effect=requests.ConnectionError):
+        assert fs._size("http://foo.com/a", "http") is None
+    assert fs._size("ftp://foo.com/a", "ftp") is None
+
+
+@mark.parametrize(
+    ("src", "unit"),
+    [
+        ("/a/b", "dst"),
+        ("hsi:///a/b", "dst"),
+        ("htar:///a.tar?b", "htar:///a.tar"),
+    ],
+)
+def test_fs__unit(src, unit):
+    assert fs._unit("dst", src) == unit
@@ -398,6 +398,34 @@ def non_empty_list(errors: list[str]) -> bool:
     return any(msg in errors for msg in ["[] is too short", "[] should be non-empty"])
 
 
+# archive
+
+
+def test_schema_archive():
+    config = {"archive": {"bundle_size": 1024, "dir": "/hpss", "files": ["/a", "/b"], "name": "x"}}
+    errors = schema_validator("archive")
+    # Basic correctness:
+    assert not errors(config)
+    # The archive block is required:
+    assert "'archive' is a required property" in errors({})
+    # dir and name are required, but bundle_size and files are optional:
+    for key in ("dir", "name"):
+        assert f"'{key}' is a required property" in errors(with_del(config, "archive", key))
+    for key in ("bundle_size", "files"):
+        assert not errors(with_del(config, "archive", key))
+    # An empty array of files is not allowed:
+    assert non_empty_list(errors(with_set(config, [], "archive", "files")))
+    # Non-string files are not allowed:
+    assert "True is not of type 'fs_src'\n" in errors(with_set(config, [True], "archive", "files"))
+    # Bundle sizes must be positive integers:
+    assert "0 is less than the minimum of 1" in errors(
+        with_set(config, 0, "archive", "bundle_size")
+    )
+    assert "1.5 is not of type 'integer'" in errors(with_set(config, 1.5, "archive", "bundle_size"))
+    # Additional keys are not allowed:
+    assert "Additional properties are not allowed" in errors(with_set(config, 1, "archive", "foo"))
+
+
 # batchargs
 
 
@@ -2555,6 +2583,31 @@ def test_schema_platform():
     assert "'scheduler' is a dependency of 'account'" in errors(with_del(config, "scheduler"))
 
 
+# purge
+
+
+def test_schema_purge():
+    config = {"purge": {"older_than": 72, "paths": ["/path/to/dir1", "/path/to/dir2"]}}
+    errors = schema_validator("purge")
+    # Basic correctness:
+    assert not errors(config)
+    # The purge block is required:
+    assert "'purge' is a required property" in errors({})
+    # Paths are required, but older_than is optional:
+    assert "'paths' is a required property" in errors(with_del(config, "purge", "paths"))
+    assert not errors(with_del(config, "purge", "older_than"))
+    # An empty array of paths is not allowed:
+    assert non_empty_list(errors(with_set(config, [], "purge", "paths")))
+    # Non-string paths are not allowed:
+    assert "True is not of type 'fs_src'\n" in errors(with_set(config, [True], "purge", "paths"))
+    # Ages must be non-negative numbers:
+    assert not errors(with_set(config, 1.5, "purge", "older_than"))
+    assert "-1 is less than the minimum of 0" in errors(with_set(config, -1, "purge", "older_than"))
+    assert "'1' is not of type 'number'" in errors(with_set(config, "1", "purge", "older_than"))
+    # Additional keys are not allowed:
+    assert "Additional properties are not allowed" in errors(with_set(config, 1, "purge", "foo"))
+
+
 # rocoto
 
 
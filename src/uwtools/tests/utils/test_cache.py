@@ -0,0 +1,241 @@
+import os
+from concurrent.futures import ThreadPoolExecutor
+from threading import Barrier
+from time import sleep
+from unittest.mock import Mock, patch
+
+from pytest import fixture
+
+from uwtools.utils import cache
+
+# Fixtures
+
+
+@fixture(autouse=True)
+def cachedir(tmp_path):
+    path = tmp_path / "cache"
+    cache.configure(cache_dir=path)
+    return path
+
+
+def fetcher(data: bytes = b"foo", ok: bool = True) -> Mock:
+    def fetch(path):
+        path.write_bytes(data)
+        return ok
+
+    return Mock(side_effect=fetch)
+
+
+# Tests
+
+
+def test_utils_cache_configure(tmp_path):
+    cache.configure()
+    assert not cache.enabled()
+    cache.configure(cache_dir=str(tmp_path), max_size=42, link=True)
+    assert cache.enabled()
+    assert cache.CONFIG.dir == tmp_path
+    assert cache.CONFIG.max_size == 42
+    assert cache.CONFIG.link
+    cache.configure()
+    assert not cache.enabled()
+
+
+def test_utils_cache_evict(cachedir):
+    cache.configure(cache_dir=cachedir, max_size=10)
+    entries = [cache._entry(src, "") for src in ("a", "b", "c")]
+    for i, entry in enumerate(entries):
+        entry.write_bytes(b"xxxx")
+        os.utime(entry, (i, i))
+    cache.evict()
+    assert [entry.exists() for entry in entries] == [False, True, True]
+    assert not cache._lockfile(entries[0]).exists()
+
+
+def test_utils_cache_evict__locked(cachedir):
+    cache.configure(cache_dir=cachedir, max_size=4)
+    entries = [cache._entry(src, "") for src in ("a", "b")]
+    for i, entry in enumerate(entries):
+        entry.write_bytes(b"xxxx")
+        os.utime(entry, (i, i))
+    with cache._lock(cache._lockfile(entries[0])):
+        cache.evict()
+    assert [entry.exists() for entry in entries] == [True, False]
+
+
+def test_utils_cache_evict__unlimited():
+    entry = cache._entry("a", "")
+    entry.write_bytes(b"xxxx")
+    cache.evict()
+    assert entry.exists()
+
+
+def test_utils_cache_evict__stale():
+    tmp = cache.temp_path()
+    old, new = tmp.with_name("old"), tmp.with_name("new")
+    (old / "sub").mkdir(parents=True)
+    new.touch()
+    os.utime(old, (0, 0))
+    cache.evict()
+    assert not old.exists()
+    assert new.exists()
+
+
+def test_utils_cache_get(cachedir, logged, tmp_path):
+    cache.configure(cache_dir=cachedir, link=True)
+    dst1, dst2 = tmp_path / "dst1", tmp_path / "dst2"
+    fetch = fetcher()
+    assert cache.get("http://foo/a", dst1, fetch, validator="v1")
+    assert cache.get("http://foo/a", dst2, fetch, validator="v1")
+    fetch.assert_called_once()
+    entry = cache._entry("http://foo/a", "v1")
+    assert entry.read_bytes() == b"foo"
+    assert entry.stat().st_mode & 0o777 == 0o444
+    assert dst1.samefile(entry)
+    assert dst2.samefile(entry)
+    assert logged("Cached http://foo/a")
+    assert logged(f"Using cached http://foo/a for {dst2}")
+    assert not list((cachedir / "tmp").iterdir())
+
+
+def test_utils_cache_get__concurrent(tmp_path):
+    fetch = fetcher()
+    barrier = Barrier(4)
+
+    def get(n):
+        barrier.wait(timeout=5)
+        return cache.get("http://foo/a", tmp_path / str(n), fetch)
+
+    with ThreadPoolExecutor(max_workers=4) as executor:
+        assert all(executor.map(get, range(4)))
+    fetch.assert_called_once()
+
+
+def test_utils_cache_get__copy(tmp_path):
+    dst = tmp_path / "dst"
+    assert cache.get("http://foo/a", dst, fetcher())
+    assert dst.read_bytes() == b"foo"
+    assert not dst.samefile(cache._entry("http://foo/a", ""))
+    assert dst.stat().st_mode & 0o777 == 0o644
+
+
+def test_utils_cache_get__copy_fallback(cachedir, tmp_path):
+    cache.configure(cache_dir=cachedir, link=True)
+    dst = tmp_path / "dst"
+    with patch.object(cache.os, "link", side_effect=OSError("cross-device link")):
+        assert cache.get("http://foo/a", dst, fetcher())
+    assert not dst.samefile(cache._entry("http://foo/a", ""))
+    assert dst.stat().st_mode & 0o777 == 0o644
+
+
+def test_utils_cache_get__fail(cachedir, tmp_path):
+    dst = tmp_path / "dst"
+    assert not cache.get("http://foo/a", dst, fetcher(ok=False))
+    assert not dst.exists()
+    assert not cache._entry("http://foo/a", "").exists()
+    assert not list((cachedir / "tmp").iterdir())
+
+
+def test_utils_cache_get__validator(tmp_path):
+    fetch = fetcher()
+    cache.get("http://foo/a", tmp_path / "dst1", fetch, validator="v1")
+    cache.get("http://foo/a", tmp_path / "dst2", fetch, validator="v2")
+    assert fetch.call_count == 2
+
+
+def test_utils_cache_lookup(tmp_path):
+    dst = tmp_path / "dst"
+    assert not cache.lookup("hsi:///a", dst)
+    assert not dst.exists()
+    cache.get("hsi:///a", tmp_path / "other", fetcher())
+    assert cache.lookup("hsi:///a", dst)
+    assert dst.read_bytes() == b"foo"
+
+
+def test_utils_cache_lookup__miss(cachedir, tmp_path):
+    assert not cache.lookup("hsi:///a", tmp_path / "dst")
+    assert not list(cachedir.glob("??/*.lock"))  # no lock file left behind
+
+
+def test_utils_cache_locked(tmp_path):
+    fetch = fetcher()
+    order = []
+
+    def batch():
+        with cache.locked(["hsi:///a", "hsi:///b"]):
+            order.append("batch")
+            assert not cache.lookup("hsi:///a", tmp_path / "a")  # uses the held lock
+            sleep(0.2)
+            path = cache.temp_path()
+            path.write_bytes(b"foo")
+            cache.store("hsi:///a", path, [tmp_path / "a"])
+
+    def get():
+        sleep(0.1)
+        cache.get("hsi:///a", tmp_path / "other", fetch)
+        order.append("get")
+
+    with ThreadPoolExecutor(max_workers=2) as executor:
+        for future in [executor.submit(batch), executor.submit(get)]:
+            future.result()
+    assert order == ["batch", "get"]
+    fetch.assert_not_called()  # the getter waited for the batch, and found the source cached
+    assert (tmp_path / "other").read_bytes() == b"foo"
+    assert not cache._lockfile(cache._entry("hsi:///b", "")).exists()
+
+
+def test_utils_cache_locked__disabled():
+    cache.configure()
+    with cache.locked(["hsi:///a"]):
+        pass
+    assert not cache.enabled()
+
+
+def test_utils_cache_lookup__not_owner(tmp_path):
+    cache.get("hsi:///a", tmp_path / "dst1", fetcher())
+    with patch.object(cache.os, "utime", side_effect=PermissionError):
+        assert cache.lookup("hsi:///a", tmp_path / "dst2")
+
+
+def test_utils_cache_store(cachedir, tmp_path):
+    cache.configure(cache_dir=cachedir, link=True)
+    path = cache.temp_path()
+    path.write_bytes(b"foo")
+    dsts = [tmp_path / "dst1", tmp_path / "dst2"]
+    cache.store("hsi:///a", path, dsts)
+    assert not path.exists()
+    assert all(dst.samefile(cache._entry("hsi:///a", "")) for dst in dsts)
+
+
+def test_utils_cache__lock__replaced():
+    path = cache._root() / "x.lock"
+    path.touch()
+    calls = []
+    same = cache._same
+
+    def replaced(fd, path):
+        calls.append(fd)
+        return len(calls) > 1 and same(fd, path)
+
+    with patch.object(cache, "_same", side_effect=replaced), cache._lock(path) as locked:
+        assert locked
+    assert len(calls) == 2  # the first lock was on a removed lock file, so was retried
+
+
+def test_utils_cache__same():
+    path = cache._root() / "x.lock"
+    path.touch()
+    with path.open() as f:
+        assert cache._same(f.fileno(), path)
+        path.unlink()
+        assert not cache._same(f.fileno(), path)
+        path.touch()
+        assert not cache._same(f.fileno(), path)
+
+
+def test_utils_cache_temp_path(cachedir):
+    path1, path2 = cache.temp_path(), cache.temp_path(cachedir / "ab" / "foo")
+    assert path1.parent == path2.parent == cachedir / "tmp"
+    assert path1.name.startswith("fetch.")
+    assert path2.name.startswith("foo.")
+    assert path1 != cache.temp_path()
@@ -0,0 +1,104 @@
+from hashlib import sha256
+from pathlib import Path
+
+from pytest import fixture, raises
+
+from uwtools.exceptions import UWConfigError
+from uwtools.utils import checksum, statcache
+
+FOO = sha256(b"foo").hexdigest()
+BAR = sha256(b"bar").hexdigest()
+
+# Fixtures
+
+
+@fixture
+def foo(tmp_path):
+    path = tmp_path / "foo"
+    path.write_bytes(b"foo")
+    return path
+
+
+# Tests
+
+
+def test_utils_checksum_active():
+    assert not checksum.active()
+    with checksum.verifying():
+        assert checksum.active()
+    assert not checksum.active()
+
+
+def test_utils_checksum_check(foo):
+    assert checksum.check(foo, FOO)  # not recording
+    with checksum.verifying() as digests:
+        assert checksum.check(foo, FOO)
+    assert digests == {str(foo): FOO}
+
+
+def test_utils_checksum_check__expected(foo):
+    with checksum.verifying(expected={str(foo): FOO}) as digests:
+        assert checksum.check(foo, FOO)
+    assert digests == {str(foo): FOO}
+    assert foo.is_file()
+
+
+def test_utils_checksum_check__mismatch(foo, logged):
+    with checksum.verifying(expected={str(foo): BAR}) as digests:
+        assert not checksum.check(foo, FOO)
+    assert digests == {str(foo): FOO}
+    assert not foo.exists()
+    assert logged(f"Checksum mismatch for {foo}: Expected {BAR}, got {FOO}")
+
+
+def test_utils_checksum_check__mismatch_cached(foo):
+    with statcache.caching(), checksum.verifying(expected={str(foo): BAR}):
+        assert statcache.is_file(foo)
+        assert not checksum.check(foo, FOO)
+        assert not statcache.is_file(foo)
+
+
+def test_utils_checksum_hexdigest(foo):
+    assert checksum.hexdigest(foo) == FOO
+    h = sha256(b"bar")
+    assert checksum.hexdigest(foo, h) == sha256(b"barfoo").hexdigest()
+
+
+def test_utils_checksum_read_manifest(tmp_path):
+    manifest = tmp_path / "manifest"
+    manifest.write_text(f"# digests\n{FOO}  foo\n\n{BAR.upper()} */abs/bar\n")
+    expected = {str(tmp_path / "foo"): FOO, "/abs/bar": BAR}
+    assert checksum.read_manifest(manifest) == expected
+    assert checksum.read_manifest(str(manifest), root=Path("/root")) == {
+        "/root/foo": FOO,
+        "/abs/bar": BAR,
+    }
+
+
+def test_utils_checksum_read_manifest__malformed(tmp_path):
+    manifest = tmp_path / "manifest"
+    manifest.write_text(f"{FOO}  foo\nbad\n")
+    with raises(UWConfigError, match=f"Malformed line 2 in manifest {manifest}: bad"):
+        checksum.read_manifest(manifest)
+
+
+def test_utils_checksum_verifying():
+    with checksum.verifying(expected={"/a": FOO}) as outer:
+        checksum.check(Path("/b"), BAR)
+        with checksum.verifying() as inner:
+            assert checksum._STATE.expected is None
+        assert checksum._STATE.expected == {"/a": FOO}
+    assert outer == {"/b": BAR}
+    assert inner == {}
+    assert checksum._STATE.recorded is None
+
+
+def test_utils_checksum_write_manifest(logged, tmp_path):
+    manifest = tmp_path / "sub" / "manifest"
+    digests = {str(tmp_path / "foo"): FOO, "/abs/bar": BAR}
+    checksum.write_manifest(manifest, digests, root=tmp_path)
+    assert manifest.read_text() == f"{BAR}  /abs/bar\n{FOO}  foo\n"
+    assert logged(f"Wrote manifest of 2 staged files to {manifest}")
+    checksum.write_manifest(manifest, digests)
+    assert manifest.read_text() == f"{BAR}  /abs/bar\n{FOO}  {tmp_path / 'foo'}\n"
+    assert checksum.read_manifest(manifest) == digests
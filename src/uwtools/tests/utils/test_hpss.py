@@ -0,0 +1,114 @@
+from textwrap import dedent
+from unittest.mock import patch
+
+from pytest import fixture
+
+from uwtools.utils import hpss
+
+# Fixtures
+
+
+@fixture(autouse=True)
+def cache():
+    with patch.object(hpss, "CACHE", hpss.ns(dir=None, ttl=3600.0)) as cache:
+        yield cache
+
+
+# Tests
+
+
+def test_utils_hpss_configure_cache(cache, tmp_path):
+    hpss.configure_cache(cache_dir=str(tmp_path), ttl=60)
+    assert cache.dir == tmp_path
+    assert cache.ttl == 60
+    hpss.configure_cache()
+    assert cache.dir is None
+    assert cache.ttl == 3600
+
+
+def test_utils_hpss_hsi_ls(logged):
+    with patch.object(hpss, "run_shell_cmd", return_value=(True, "out")) as run_shell_cmd:
+        assert hpss.hsi_ls("/a/*", taskname="t") == (True, "out")
+        assert hpss.hsi_ls("/a/*") == (True, "out")
+    run_shell_cmd.assert_called_once_with("hsi -q ls -1 '/a/*'", taskname="t")
+    assert logged("Using cached listing: hsi -q ls -1 '/a/*'")
+
+
+def test_utils_hpss_hsi_ls__expired(cache):
+    cache.ttl = 0
+    with patch.object(hpss, "run_shell_cmd", return_value=(True, "out")) as run_shell_cmd:
+        hpss.hsi_ls("/a")
+        hpss.hsi_ls("/a")
+    assert run_shell_cmd.call_count == 2
+
+
+def test_utils_hpss_htar_index():
+    with patch.object(hpss, "run_shell_cmd", return_value=(True, "out")) as run_shell_cmd:
+        assert hpss.htar_index("/a.tar") == (True, "out")
+        assert hpss.htar_index("/a.tar") == (True, "out")
+    run_shell_cmd.assert_called_once_with("htar -qtf '/a.tar'", taskname=None)
+
+
+def test_utils_hpss_htar_index__refresh(cache, tmp_path):
+    cache.dir = tmp_path
+    with patch.object(hpss, "run_shell_cmd", side_effect=[(False, "err"), (True, "out")]) as run:
+        assert hpss.htar_index("/new.tar") == (False, "err")
+        assert hpss.htar_index("/new.tar", refresh=True) == (True, "out")
+        assert hpss.htar_index("/new.tar") == (True, "out")
+    assert run.call_count == 2
+    with patch.object(hpss, "run_shell_cmd", return_value=(True, "new")) as run:
+        hpss.clear_cache()
+        assert hpss.htar_index("/new.tar", refresh=True) == (True, "new")  # not from disk
+    run.assert_called_once()
+
+
+def test_utils_hpss_htar_sizes(cache):
+    index = """
+    HTAR: -rw-r--r--  Paul.Madden/rtruc         64 2025-04-04 04:37  a1.c
+    HTAR: -rw-r--r--  Paul.Madden/rtruc       1024 2025-04-04 04:37  dir/b 2.c
+    HTAR: HTAR SUCCESSFUL
+    """
+    assert hpss.htar_sizes("/a.tar") == {}  # not cached
+    with patch.object(hpss, "run_shell_cmd", return_value=(True, dedent(index))):
+        hpss.htar_index("/a.tar")
+    with patch.object(hpss, "run_shell_cmd", return_value=(False, dedent(index))):
+        hpss.htar_index("/b.tar")
+    assert hpss.htar_sizes("/a.tar") == {"a1.c": 64, "dir/b 2.c": 1024}
+    assert hpss.htar_sizes("/b.tar") == {}  # listing failed
+    cache.ttl = 0
+    assert hpss.htar_sizes("/a.tar") == {}  # listing expired
+
+
+def test_utils_hpss_listed(cache):
+    listings = {"/a/*": (True, "/a:\n/a/b\n*** x\n"), "/c/*": (False, "/c:\n/c/d\n")}
+    run = lambda cmd, **_: listings[cmd.split("'")[1]]
+    with patch.object(hpss, "run_shell_cmd", side_effect=run):
+        for path in listings:
+            hpss.hsi_ls(path)
+    assert hpss.listed("/a/b")
+    assert not hpss.listed("/a")
+    assert not hpss.listed("*** x")
+    assert not hpss.listed("/c/d")  # listing failed
+    cache.ttl = 0
+    assert not hpss.listed("/a/b")  # listing expired
+
+
+def test_utils_hpss__listing__disk(cache, logged, tmp_path):
+    cache.dir = tmp_path / "cache"
+    with patch.object(hpss, "run_shell_cmd", return_value=(True, "out")) as run_shell_cmd:
+        hpss.hsi_ls("/a")
+        hpss.clear_cache()  # as if in a new process
+        assert hpss.hsi_ls("/a") == (True, "out")
+    run_shell_cmd.assert_called_once()
+    assert len(list(cache.dir.glob("*.json"))) == 1
+    assert logged("Using listing cached in %s" % cache.dir)
+
+
+def test_utils_hpss__listing__disk_failure(cache, tmp_path):
+    cache.dir = tmp_path
+    with patch.object(hpss, "run_shell_cmd", return_value=(False, "err")) as run_shell_cmd:
+        hpss.hsi_ls("/a")
+        hpss.clear_cache()
+        hpss.hsi_ls("/a")
+    assert run_shell_cmd.call_count == 2
+    assert not list(tmp_path.glob("*.json"))
@@ -0,0 +1,237 @@
+import re
+from hashlib import sha256
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from threading import Thread
+from unittest.mock import patch
+
+import requests
+from pytest import fixture, raises
+from requests.structures import CaseInsensitiveDict
+
+from uwtools.utils import http
+
+DATA = bytes(range(256)) * 1000
+
+# Fixtures
+
+
+@fixture(autouse=True)
+def config():
+    defaults = dict(http.CONFIG.__dict__)
+    yield http.CONFIG
+    http.configure(**defaults)
+
+
+@fixture
+def server():
+    requests_seen: list[tuple[str, str | None]] = []
+
+    class Handler(BaseHTTPRequestHandler):
+        def do_GET(self):
+            self._respond(body=True)
+
+        def do_HEAD(self):
+            self._respond(body=False)
+
+        def log_message(self, *_args):
+            pass
+
+        def _respond(self, body):
+            requests_seen.append((self.command, self.headers.get("Range")))
+            if self.path != "/data":
+                self.send_response(404)
+                self.end_headers()
+                return
+            data, code = DATA, 200
+            if m := re.match(r"bytes=(\d+)-(\d*)", self.headers.get("Range", "")):
+                start = int(m[1])
+                end = int(m[2]) if m[2] else len(DATA) - 1
+                if start >= len(DATA):
+                    self.send_response(416)
+                    self.end_headers()
+                    return
+                data, code = DATA[start : end + 1], 206
+            self.send_response(code)
+            self.send_header("Accept-Ranges", "bytes")
+            self.send_header("Content-Length", str(len(data)))
+            self.end_headers()
+            if body:
+                self.wfile.write(data)
+
+    httpd = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+    Thread(target=httpd.serve_forever, daemon=True).start()
+    yield "http://127.0.0.1:%s" % httpd.server_address[1], requests_seen
+    httpd.shutdown()
+    httpd.server_close()
+
+
+# Tests
+
+
+def test_utils_http_configure(config):
+    s = http.session("http://foo.com/a")
+    http.configure(pool_size=2, timeout=5)
+    assert config.pool_size == 2
+    assert config.timeout == 5
+    assert http.session("http://foo.com/a") is not s
+
+
+def test_utils_http_configure__bad():
+    with raises(TypeError, match="Unknown HTTP setting: foo"):
+        http.configure(foo=1)
+
+
+def test_utils_http_download(server, tmp_path):
+    base, seen = server
+    dst = tmp_path / "dst"
+    assert http.download(f"{base}/data", dst)
+    assert dst.read_bytes() == DATA
+    assert not (tmp_path / "dst.part").exists()
+    assert seen == [("GET", None)]
+
+
+def test_utils_http_download__hasher(server, tmp_path):
+    base, _ = server
+    h = sha256()
+    assert http.download(f"{base}/data", tmp_path / "dst", h)
+    assert h.hexdigest() == sha256(DATA).hexdigest()
+
+
+def test_utils_http_download__error(logged, server, tmp_path):
+    base, _ = server
+    dst = tmp_path / "dst"
+    assert not http.download(f"{base}/foo", dst)
+    assert not dst.exists()
+    assert logged(f"Could not get '{base}/foo', HTTP status was: 404")
+
+
+def test_utils_http_download__exception(logged, tmp_path):
+    with patch.object(http, "_get", side_effect=requests.ConnectionError("oops")):
+        assert not http.download("http://foo.com/a", tmp_path / "dst")
+    assert logged("Could not get 'http://foo.com/a': oops")
+
+
+def test_utils_http_download__resume(logged, server, tmp_path):
+    base, seen = server
+    dst = tmp_path / "dst"
+    (tmp_path / "dst.part").write_bytes(DATA[:1000])
+    assert http.download(f"{base}/data", dst)
+    assert dst.read_bytes() == DATA
+    assert seen == [("GET", "bytes=1000-")]
+    assert logged(f"Resuming download of {base}/data at byte 1000")
+
+
+def test_utils_http_download__resume_hasher(server, tmp_path):
+    base, _ = server
+    (tmp_path / "dst.part").write_bytes(DATA[:1000])
+    h = sha256()
+    assert http.download(f"{base}/data", tmp_path / "dst", h)
+    assert h.hexdigest() == sha256(DATA).hexdigest()
+
+
+def test_utils_http_download__resume_restart(logged, server, tmp_path):
+    base, seen = server
+    dst = tmp_path / "dst"
+    (tmp_path / "dst.part").write_bytes(DATA + b"stale")
+    assert http.download(f"{base}/data", dst)
+    assert dst.read_bytes() == DATA
+    assert seen == [("GET", f"bytes={len(DATA) + 5}-"), ("GET", None)]
+    assert logged(f"Restarting download of {base}/data")
+
+
+def test_utils_http_download__segments(config, logged, server, tmp_path):
+    base, seen = server
+    http.configure(segments=3, segment_min=1000)
+    dst = tmp_path / "dst"
+    assert http.exists(f"{base}/data")
+    assert http.download(f"{base}/data", dst)
+    assert dst.read_bytes() == DATA
+    n = len(DATA)
+    assert seen[0] == ("HEAD", None)
+    assert set(seen[1:]) == {
+        ("GET", f"bytes=0-{n // 3 - 1}"),
+        ("GET", f"bytes={n // 3}-{2 * n // 3 - 1}"),
+        ("GET", f"bytes={2 * n // 3}-{n - 1}"),
+    }
+    assert logged(f"Downloading {base}/data in 3 segments")
+    assert config.segments == 3
+
+
+def test_utils_http_download__segments_hasher(server, tmp_path):
+    base, _ = server
+    http.configure(segments=3, segment_min=1000)
+    h = sha256()
+    assert http.exists(f"{base}/data")
+    assert http.download(f"{base}/data", tmp_path / "dst", h)
+    assert h.hexdigest() == sha256(DATA).hexdigest()
+
+
+def test_utils_http_download__segments_error(server, tmp_path):
+    base, _ = server
+    http.configure(segments=2, segment_min=1000)
+    dst = tmp_path / "dst"
+    assert http.exists(f"{base}/data")
+    with patch.object(http, "_get_segment", side_effect=[True, False]):
+        assert not http.download(f"{base}/data", dst)
+    assert not dst.exists()
+    assert not (tmp_path / "dst.part").exists()
+
+
+def test_utils_http_download__segments_exception(logged, server, tmp_path):
+    base, _ = server
+    http.configure(segments=2, segment_min=1000)
+    dst = tmp_path / "dst"
+    assert http.exists(f"{base}/data")
+    with patch.object(http, "_get_segment", side_effect=requests.ConnectionError("oops")):
+        assert not http.download(f"{base}/data", dst)
+    assert not (tmp_path / "dst.part").exists()
+    assert logged(f"Could not get '{base}/data': oops")
+
+
+def test_utils_http_exists(server):
+    base, seen = server
+    assert http.exists(f"{base}/data")
+    assert not http.exists(f"{base}/foo")
+    assert seen == [("HEAD", None), ("HEAD", None)]
+
+
+def test_utils_http_session():
+    s = http.session("http://foo.com/a")
+    assert http.session("http://foo.com/b") is s
+    assert http.session("https://foo.com/a") is not s
+    assert http.session("http://bar.com/a") is not s
+
+
+def test_utils_http_size(server):
+    base, seen = server
+    assert http.size(f"{base}/data") == len(DATA)
+    assert http.size(f"{base}/data") == len(DATA)  # via kept headers
+    assert http.size(f"{base}/foo") is None
+    assert seen == [("HEAD", None), ("HEAD", None)]
+    url = "http://foo.com/a"
+    with patch.dict(http._HEADERS, {url: CaseInsensitiveDict({})}):
+        assert http.size(url) is None
+
+
+def test_utils_http_validator(server):
+    base, seen = server
+    assert http.validator(f"{base}/data") is None  # no ETag or Last-Modified
+    assert http.validator(f"{base}/foo") is None
+    assert seen == [("HEAD", None), ("HEAD", None)]
+
+
+def test_utils_http_validator__headers():
+    url = "http://foo.com/a"
+    headers = {"Content-Length": "42", "Last-Modified": "Mon, 19 Oct 2026 00:00:00 GMT"}
+    with patch.dict(http._HEADERS, {url: CaseInsensitiveDict(headers)}):
+        assert http.validator(url) == "42 Mon, 19 Oct 2026 00:00:00 GMT"
+        http._HEADERS[url]["etag"] = '"abc"'
+        assert http.validator(url) == '"abc"'
+
+
+def test_utils_http__get_segment__error(logged, server, tmp_path):
+    base, _ = server
+    part = tmp_path / "dst.part"
+    part.touch()
+    assert not http._get_segment(f"{base}/foo", part, 0, 9)
+    assert logged(f"Could not get '{base}/foo' bytes 0-9, HTTP status was: 404")
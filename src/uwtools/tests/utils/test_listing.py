@@ -0,0 +1,146 @@
+import glob
+import os
+from pathlib import Path
+from unittest.mock import patch
+
+from pytest import fixture, mark
+
+from uwtools.utils import listing
+
+PATTERNS = [
+    "",
+    "*",
+    "*/*/",
+    "*/b/*.txt",
+    "*/x.txt",
+    ".*",
+    "**",
+    "**/",
+    "**/*.txt",
+    "a/*",
+    "a/*/",
+    "a/*/../x.txt",
+    "a/**",
+    "a/**/",
+    "a/**/*.txt",
+    "a/**/c/*",
+    "a/.*",
+    "a/?.txt",
+    "a/[bx]*",
+    "a/b",
+    "a/b/",
+    "a/b/../x.txt",
+    "a/nope",
+    "a/nope/",
+    "a/x.txt/",
+    "e/*",
+    "e/dangling",
+    "e/link/**/*.txt",
+]
+
+# Fixtures
+
+
+@fixture
+def tree(monkeypatch, tmp_path):
+    for d in ("a/b/c", "a/.hidden", "e/f"):
+        (tmp_path / d).mkdir(parents=True)
+    for f in (
+        "a/x.txt",
+        "a/b/y.txt",
+        "a/b/c/z.txt",
+        "a/.hidden/h.txt",
+        "a/.dot.txt",
+        "e/f/r",
+        ".top",
+    ):
+        (tmp_path / f).touch()
+    (tmp_path / "e" / "link").symlink_to("../a")
+    (tmp_path / "e" / "dangling").symlink_to("nowhere")
+    monkeypatch.chdir(tmp_path)
+    return tmp_path
+
+
+# Tests
+
+
+@mark.parametrize("pattern", PATTERNS)
+def test_utils_listing_Listings_glob(pattern, tree):
+    expected = list(glob.iglob(pattern, recursive=True))
+    actual = list(listing.Listings().glob(pattern))
+    assert [path for path, _ in actual] == expected
+    assert all(isdir == Path(path).is_dir() for path, isdir in actual)
+    absolute = list(listing.Listings().glob(str(tree / pattern)))
+    assert [path for path, _ in absolute] == list(glob.iglob(str(tree / pattern), recursive=True))
+
+
+def test_utils_listing_Listings_glob__cached(tree):
+    listings = listing.Listings()
+    with patch.object(listing.os, "scandir", wraps=os.scandir) as scandir:
+        for pattern in ("a/*.txt", "a/x*", "a/**/*.txt", "a/**/c/*"):
+            list(listings.glob(pattern))
+        assert list(listings.glob("a/b/y.txt")) == [("a/b/y.txt", False)]  # via cached listing
+    listed = [call.args[0] for call in scandir.call_args_list]
+    assert sorted(listed) == ["a", "a/b", "a/b/c"]
+    (tree / "a" / "b" / "c" / "z.txt").unlink()
+    assert list(listings.glob("a/b/c/*")) == [("a/b/c/z.txt", False)]  # listing is not refreshed
+
+
+def test_utils_listing_Listings_glob__unreadable(tree):
+    real = os.scandir
+
+    def scandir(path):
+        if path == str(tree / "a" / "b"):  # e.g. searchable but not readable
+            raise PermissionError
+        return real(path)
+
+    with patch.object(listing.os, "scandir", side_effect=scandir):
+        assert list(listing.Listings().glob(f"{tree}/a/b/*")) == []
+        assert list(listing.Listings().glob(f"{tree}/a/*/y.txt")) == [(f"{tree}/a/b/y.txt", False)]
+
+
+def test_utils_listing_Listings_listdir(tree):
+    listings = listing.Listings()
+    assert listings.listdir("a") == {"x.txt": False, "b": True, ".hidden": True, ".dot.txt": False}
+    assert listings.listdir("a/") is listings.listdir("a")
+    assert listings.listdir("") == {"a": True, "e": True, ".top": False}
+    assert listings.listdir("nope") is None
+    assert listings.listdir(str(tree / "e")) == {"f": True, "link": True, "dangling": False}
+
+
+def test_utils_listing_walk(tree):
+    os.mkfifo(tree / "a" / "fifo")
+    assert listing.walk("a") == [
+        ("a/.dot.txt", False),
+        ("a/.hidden/h.txt", False),
+        ("a/b/c/z.txt", False),
+        ("a/b/y.txt", False),
+        ("a/x.txt", False),
+    ]
+    assert listing.walk(str(tree / "e"), workers=1) == [
+        (str(tree / "e" / "dangling"), True),
+        (str(tree / "e" / "f" / "r"), False),
+        (str(tree / "e" / "link"), True),  # not followed
+    ]
+    assert listing.walk("a/x.txt") == []
+
+
+def test_utils_listing_walk__unreadable(logged, tree):
+    real = os.scandir
+
+    def scandir(path):
+        if path == str(tree / "a" / "b"):
+            msg = "denied"
+            raise PermissionError(msg)
+        return real(path)
+
+    with patch.object(listing.os, "scandir", side_effect=scandir):
+        paths = [path for path, _ in listing.walk(str(tree / "a"))]
+    assert paths == [str(tree / "a" / x) for x in (".dot.txt", ".hidden/h.txt", "x.txt")]
+    assert logged(f"Could not list {tree / 'a' / 'b'}: denied")
+
+
+def test_utils_listing__matcher():
+    assert listing._matcher("*.txt") is listing._matcher("*.txt")
+    assert listing._matcher("*.txt")("a.txt")
+    assert not listing._matcher("*.txt")("a.TXT")
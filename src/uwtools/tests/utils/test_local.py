@@ -0,0 +1,169 @@
+import os
+from hashlib import sha256
+from shutil import SameFileError
+from unittest.mock import Mock, patch
+
+from pytest import fixture, mark, raises
+
+from uwtools.utils import local
+
+# Fixtures
+
+
+@fixture(autouse=True)
+def config():
+    defaults = dict(local.CONFIG.__dict__)
+    local.COUNTS.clear()
+    yield local.CONFIG
+    local.configure(**defaults)
+
+
+@fixture
+def src(tmp_path):
+    path = tmp_path / "src"
+    path.write_bytes(bytes(range(256)) * 1000)
+    path.chmod(0o640)
+    os.utime(path, (1000, 1000))
+    return path
+
+
+# Tests
+
+
+def test_utils_local_configure(config):
+    local.configure(buffer_size=1, chunk_size=2)
+    assert config.buffer_size == 1
+    assert config.chunk_size == 2
+
+
+def test_utils_local_configure__bad():
+    with raises(TypeError, match="Unknown local-copy setting: foo"):
+        local.configure(foo=1)
+
+
+@mark.parametrize(
+    ("reflink", "copy_file_range", "method"),
+    [
+        (True, False, local.REFLINK),
+        (False, True, local.COPY_FILE_RANGE),
+        (False, False, local.BUFFERED),
+    ],
+)
+def test_utils_local_copy(copy_file_range, logged, method, reflink, src, tmp_path):
+    dst = tmp_path / "dst"
+    cfr = local._copy_file_range if copy_file_range else Mock(return_value=False)
+    with (
+        patch.object(local, "_reflink", return_value=reflink),
+        patch.object(local, "_copy_file_range", cfr),
+    ):
+        assert local.copy(src, dst) == method
+    if method != local.REFLINK:
+        assert dst.read_bytes() == src.read_bytes()
+    assert dst.stat().st_mode == src.stat().st_mode
+    assert dst.stat().st_mtime != 1000
+    assert dict(local.COUNTS) == {method: 1}
+    assert logged(f"Copied {src} -> {dst} via {method}")
+
+
+def test_utils_local_copy__buffered(src, tmp_path):
+    dst = tmp_path / "dst"
+    local.configure(buffer_size=100)
+    with (
+        patch.object(local, "_reflink", return_value=False),
+        patch.object(local, "_copy_file_range", return_value=False),
+    ):
+        local.copy(src, dst)
+    assert dst.read_bytes() == src.read_bytes()
+
+
+def test_utils_local_copy__hasher(src, tmp_path):
+    dst = tmp_path / "dst"
+    h = sha256()
+    with patch.object(local, "_reflink") as _reflink:
+        assert local.copy(src, dst, hasher=h) == local.BUFFERED
+    _reflink.assert_not_called()
+    assert dst.read_bytes() == src.read_bytes()
+    assert h.hexdigest() == sha256(src.read_bytes()).hexdigest()
+
+
+def test_utils_local_copy__preserve(src, tmp_path):
+    dst = tmp_path / "dst"
+    local.copy(src, dst, preserve=True)
+    assert dst.read_bytes() == src.read_bytes()
+    assert dst.stat().st_mtime == 1000
+
+
+def test_utils_local_copy__same_file(src, tmp_path):
+    link = tmp_path / "link"
+    link.symlink_to(src)
+    with raises(SameFileError, match="are the same file"):
+        local.copy(src, link)
+    assert src.stat().st_size == 256000
+
+
+def test_utils_local__copy_file_range(src, tmp_path):
+    dst = tmp_path / "dst"
+    local.configure(chunk_size=1000)
+    with (
+        src.open("rb") as fsrc,
+        dst.open("wb") as fdst,
+        patch.object(local.os, "copy_file_range", wraps=os.copy_file_range) as cfr,
+    ):
+        assert local._copy_file_range(fsrc, fdst)
+    assert dst.read_bytes() == src.read_bytes()
+    assert cfr.call_count == 257
+
+
+def test_utils_local__copy_file_range__empty(tmp_path):
+    src, dst = tmp_path / "src", tmp_path / "dst"
+    src.touch()
+    with src.open("rb") as fsrc, dst.open("wb") as fdst:
+        assert local._copy_file_range(fsrc, fdst)
+
+
+def test_utils_local__copy_file_range__error_first(src, tmp_path):
+    with (
+        src.open("rb") as fsrc,
+        (tmp_path / "dst").open("wb") as fdst,
+        patch.object(local.os, "copy_file_range", side_effect=OSError("unsupported")),
+    ):
+        assert not local._copy_file_range(fsrc, fdst)
+
+
+def test_utils_local__copy_file_range__error_later(src, tmp_path):
+    with (
+        src.open("rb") as fsrc,
+        (tmp_path / "dst").open("wb") as fdst,
+        patch.object(local.os, "copy_file_range", side_effect=[1000, OSError("failed")]),
+        raises(OSError, match="failed"),
+    ):
+        local._copy_file_range(fsrc, fdst)
+
+
+def test_utils_local__copy_file_range__nothing_copied(src, tmp_path):
+    with (
+        src.open("rb") as fsrc,
+        (tmp_path / "dst").open("wb") as fdst,
+        patch.object(local.os, "copy_file_range", return_value=0),
+    ):
+        assert not local._copy_file_range(fsrc, fdst)
+
+
+def test_utils_local__copy_file_range__unavailable(src, tmp_path):
+    with (
+        src.open("rb") as fsrc,
+        (tmp_path / "dst").open("wb") as fdst,
+        patch.object(local, "os", Mock(spec=[])),
+    ):
+        assert not local._copy_file_range(fsrc, fdst)
+
+
+@mark.parametrize(("side_effect", "expected"), [(None, True), (OSError("unsupported"), False)])
+def test_utils_local__reflink(expected, side_effect, src, tmp_path):
+    with (
+        src.open("rb") as fsrc,
+        (tmp_path / "dst").open("wb") as fdst,
+        patch.object(local.fcntl, "ioctl", side_effect=side_effect) as ioctl,
+    ):
+        assert local._reflink(fsrc, fdst) is expected
+        ioctl.assert_called_once_with(fdst.fileno(), local._FICLONE, fsrc.fileno())
@@ -0,0 +1,80 @@
+from threading import Lock
+from unittest.mock import patch
+
+from pytest import fixture, raises
+
+from uwtools.utils import remove
+
+# Fixtures
+
+
+@fixture(autouse=True)
+def _reset():
+    yield
+    remove.configure(workers=16)
+
+
+@fixture
+def tree(tmp_path):
+    root = tmp_path / "root"
+    for name, text in [("a", "1"), ("d1/b", "22"), ("d1/d2/c", "333"), ("d3/d4/d5/e", "4444")]:
+        path = root / name
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text(text)
+    (root / "empty").mkdir()
+    (root / "d1" / "link").symlink_to(tmp_path)  # never followed
+    return root
+
+
+# Tests
+
+
+def test_utils_remove_configure():
+    remove.configure(workers=2)
+    assert remove.CONFIG.workers == 2
+    with raises(TypeError, match="Unknown removal setting: foo"):
+        remove.configure(foo=1)
+
+
+def test_utils_remove_remove(tmp_path, tree):
+    link = tree / "d1" / "link"
+    expected = (5, 10 + link.lstat().st_size)
+    assert remove.remove(tree) == expected
+    assert not tree.exists()
+    assert tmp_path.is_dir()
+
+
+def test_utils_remove_remove__file(tmp_path):
+    path = tmp_path / "a"
+    path.write_text("foo")
+    assert remove.remove(path) == (1, 3)
+    assert not path.exists()
+
+
+def test_utils_remove_remove__levels(tree):
+    # Directories are removed only after all files and symlinks have been unlinked.
+    calls: list[str] = []
+    lock = Lock()
+
+    def record(func):
+        def wrapper(path):
+            with lock:
+                calls.append(func.__name__)
+            return func(path)
+
+        return wrapper
+
+    with (
+        patch.object(remove.os, "unlink", record(remove.os.unlink)),
+        patch.object(remove.os, "rmdir", record(remove.os.rmdir)),
+    ):
+        remove.remove(tree)
+    assert calls == ["unlink"] * 5 + ["rmdir"] * 7
+
+
+def test_utils_remove_usage(tmp_path, tree):
+    link = tree / "d1" / "link"
+    assert remove.usage(tree) == (5, 10 + link.lstat().st_size)
+    assert remove.usage(tree / "a") == (1, 1)
+    assert tree.is_dir()
+    assert tmp_path.is_dir()
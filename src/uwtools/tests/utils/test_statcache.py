@@ -0,0 +1,90 @@
+from unittest.mock import patch
+
+from uwtools.utils import statcache
+
+# Tests
+
+
+def test_utils_statcache_caching(logged, tmp_path):
+    path = tmp_path / "foo"
+    path.touch()
+    before = statcache.COUNTS.copy()
+    with statcache.caching():
+        with statcache.caching():  # nested: no-op
+            assert statcache.is_file(path)
+        assert statcache.is_file(path)
+        assert statcache.exists(path)
+        assert not statcache.is_dir(path)
+    assert statcache._STATE.modes is None
+    counts = statcache.COUNTS - before
+    assert counts == {statcache.STAT: 1, statcache.CACHED: 3}
+    assert logged("Status checks: 1 stat, 0 lstat, 3 cached")
+
+
+def test_utils_statcache_caching__negative(tmp_path):
+    path = tmp_path / "foo"
+    with statcache.caching():
+        assert not statcache.is_file(path)
+        path.touch()
+        assert statcache.is_file(path)  # not-found status was not cached
+
+
+def test_utils_statcache_caching__off(tmp_path):
+    path = tmp_path / "foo"
+    path.touch()
+    assert statcache.is_file(path)
+    path.unlink()
+    assert not statcache.is_file(path)
+
+
+def test_utils_statcache_exists(tmp_path):
+    assert statcache.exists(tmp_path)
+    assert not statcache.exists(tmp_path / "foo")
+    assert not statcache.exists(tmp_path / "\0")  # invalid path
+
+
+def test_utils_statcache_invalidate(tmp_path):
+    path = tmp_path / "foo"
+    path.touch()
+    statcache.invalidate(path)  # not caching: no-op
+    with statcache.caching():
+        assert statcache.is_file(path)
+        assert statcache.is_symlink(path) is False
+        path.unlink()
+        assert statcache.is_file(path)  # stale
+        statcache.invalidate(path)
+        assert not statcache.is_file(path)
+        assert not statcache._STATE.modes
+
+
+def test_utils_statcache_is_dir(tmp_path):
+    assert statcache.is_dir(tmp_path)
+    (tmp_path / "foo").touch()
+    assert not statcache.is_dir(tmp_path / "foo")
+
+
+def test_utils_statcache_is_file(tmp_path):
+    (tmp_path / "foo").touch()
+    assert statcache.is_file(tmp_path / "foo")
+    assert not statcache.is_file(tmp_path)
+
+
+def test_utils_statcache_is_symlink(tmp_path):
+    link = tmp_path / "link"
+    link.symlink_to(tmp_path / "nowhere")
+    before = statcache.COUNTS.copy()
+    with statcache.caching():
+        assert statcache.is_symlink(link)
+        assert statcache.is_symlink(link)
+        assert not statcache.exists(link)  # dangling
+    assert statcache.COUNTS - before == {
+        statcache.CACHED: 1,
+        statcache.LSTAT: 1,
+        statcache.STAT: 1,
+    }
+    assert not statcache.is_symlink(tmp_path)
+
+
+def test_utils_statcache__mode(tmp_path):
+    with patch.object(statcache.os, "stat", side_effect=PermissionError):
+        assert statcache._mode(tmp_path) is None
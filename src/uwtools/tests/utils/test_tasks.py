@@ -1,15 +1,23 @@
 from __future__ import annotations
 
 import os
+from concurrent.futures import ThreadPoolExecutor
+from hashlib import sha256
 from pathlib import Path
-from unittest.mock import ANY, Mock, patch
+from threading import Barrier, Lock
+from time import sleep
+from typing import cast
+from unittest.mock import ANY, patch
 
 from iotaa import Asset, external
 from pytest import mark, raises
 
 from uwtools.exceptions import UWConfigError
 from uwtools.strings import STR
-from uwtools.utils import tasks
+from uwtools.utils import cache, checksum, hpss, statcache, tasks, telemetry
+
+BAR = sha256(b"bar").hexdigest()
+FOO = sha256(b"foo").hexdigest()
 
 # Helpers
 
@@ -23,6 +31,30 @@ def exists(x):
 # Tests
 
 
+@mark.parametrize(
+    ("dst_data", "dst_mtime", "sync", "expected"),
+    [
+        (None, None, STR.mtime, False),
+        (b"foo", 1000, STR.mtime, True),
+        (b"foo", 1000.5, STR.mtime, True),
+        (b"foo", 2000, STR.mtime, False),
+        (b"foobar", 1000, STR.mtime, False),
+        (b"bar", 1000, STR.mtime, True),
+        (b"foo", 2000, STR.hash, True),
+        (b"bar", 1000, STR.hash, False),
+        (b"foobar", 1000, STR.hash, False),
+    ],
+)
+def test_utils_tasks_current(dst_data, dst_mtime, expected, sync, tmp_path):
+    src, dst = tmp_path / "src", tmp_path / "dst"
+    src.write_bytes(b"foo")
+    os.utime(src, (1000, 1000))
+    if dst_data is not None:
+        dst.write_bytes(dst_data)
+        os.utime(dst, (dst_mtime, dst_mtime))
+    assert tasks.current(src, dst, sync) is expected
+
+
 def test_utils_tasks_directory(tmp_path):
     p = tmp_path / "foo" / "bar"
     assert not p.is_dir()
@@ -59,22 +91,33 @@ def test_utils_tasks_existing_hpss(available, wrapper):
     path = wrapper("/path/to/file")
     with (
         patch.object(tasks, "executable", exists),
-        patch.object(tasks, "run_shell_cmd", return_value=(available, None)) as run_shell_cmd,
+        patch.object(hpss, "run_shell_cmd", return_value=(available, None)) as run_shell_cmd,
     ):
         val = tasks.existing_hpss(path=path)
     assert val.ref == path
+    assert val.ready is available
     taskname = f"HPSS file {path}"
     run_shell_cmd.assert_called_once_with(f"{STR.hsi} -q ls -1 '{path}'", taskname=taskname)
 
 
+def test_utils_tasks_existing_hpss__listed():
+    with (
+        patch.object(tasks, "executable", exists),
+        patch.object(hpss, "run_shell_cmd", return_value=(True, "/a:\n/a/b\n")) as run_shell_cmd,
+    ):
+        hpss.hsi_ls("/a/*")
+        assert tasks.existing_hpss(path="/a/b").ready
+    run_shell_cmd.assert_called_once_with("hsi -q ls -1 '/a/*'", taskname=None)
+
+
 @mark.parametrize("scheme", ["http", "https"])
 @mark.parametrize(("code", "expected"), [(200, True), (404, False)])
 def test_utils_tasks_existing_http(code, expected, logged, scheme):
     url = f"{scheme}://foo.com/obj"
-    with patch.object(tasks.requests, "head", return_value=Mock(status_code=code)) as head:
+    with patch.object(tasks.http, "exists", return_value=code == 200) as exists:
         state = tasks.existing_http(url=url).ready
         assert state is expected
-    head.assert_called_with(url, allow_redirects=True, timeout=3)
+    exists.assert_called_with(url)
     msg = "Remote HTTP resource %s: %s" % (url, "Ready" if state else "Not ready [external asset]")
     assert logged(msg)
 
@@ -94,6 +137,16 @@ def test_utils_tasks_file__present(prefix, tmp_path):
     assert tasks.file(path=path).ready
 
 
+def test_utils_tasks_file__statcache(tmp_path):
+    path = tmp_path / "file"
+    path.touch()
+    before = statcache.COUNTS.copy()
+    with statcache.caching():
+        for _ in range(3):
+            assert tasks.file(path=path).ready
+    assert (statcache.COUNTS - before)[statcache.STAT] == 1
+
+
 def test_utils_tasks_filecopy__directory_hierarchy(tmp_path):
     src = tmp_path / "src"
     dst = tmp_path / "foo" / "bar" / "dst"
@@ -109,12 +162,10 @@ def test_utils_tasks_filecopy__source_http(code, expected, src, tmp_path):
     dst = tmp_path / "a-file"
     assert not dst.is_file()
     with patch.object(tasks, "existing_http", exists):
-        with patch.object(tasks, "requests") as requests:
-            response = requests.get()
-            response.status_code = code
-            response.iter_content.return_value = iter([b"f", b"o", b"o"])
+        with patch.object(tasks.http, "download") as download:
+            download.side_effect = lambda _, dst, _h: code == 200 and dst.write_bytes(b"foo")
             tasks.filecopy(src=src, dst=dst)
-        requests.get.assert_called_with(src, allow_redirects=True, stream=True, timeout=3)
+        download.assert_called_with(src, dst, None)
     assert dst.is_file() is expected
 
 
@@ -126,10 +177,10 @@ def test_utils_tasks_filecopy__source_local(src, ok):
     dst = "/dst/file"
     with patch.object(tasks.Path, "mkdir") as mkdir:
         if ok:
-            with patch.object(tasks, "file", exists), patch.object(tasks, "copy") as copy:
+            with patch.object(tasks, "file", exists), patch.object(tasks.local, "copy") as copy:
                 tasks.filecopy(src=src, dst=dst)
             mkdir.assert_called_once_with(parents=True, exist_ok=True)
-            copy.assert_called_once_with(Path("/src/file"), Path(dst))
+            copy.assert_called_once_with(Path("/src/file"), Path(dst), preserve=False, hasher=None)
         else:
             with raises(UWConfigError) as e:
                 tasks.filecopy(src=src, dst=dst)
@@ -181,7 +232,7 @@ def test_utils_tasks_filecopy__mocked_http(scheme, dst_in, dst_out):
 def test_utils_tasks_filecopy__mocked_local(src_in, src_out, dst_in, dst_out):
     with patch.object(tasks, "filecopy_local") as filecopy_local:
         tasks.filecopy(src=src_in, dst=dst_in)
-    filecopy_local.assert_called_once_with(Path(src_out), Path(dst_out), True)
+    filecopy_local.assert_called_once_with(Path(src_out), Path(dst_out), True, None)
 
 
 def test_utils_tasks_filecopy__simple(tmp_path):
@@ -199,9 +250,11 @@ def test_utils_tasks_filecopy_hsi(logged, ready_task, tmp_path):
     with (
         patch.object(tasks, "run_shell_cmd") as run_shell_cmd,
         patch.object(tasks, "existing_hpss", wraps=ready_task) as existing_hpss,
+        telemetry.recording() as transfers,
     ):
         run_shell_cmd.side_effect = lambda *_a, **_kw: (dst.touch(), (True, "msg1\nmsg2\n"))[1]
         tasks.filecopy_hsi(src=src, dst=Path(dst))
+    assert [(t.path, t.kind) for t in transfers] == [(str(dst), STR.hsi)]
     existing_hpss.assert_called_once_with(src)
     taskname = f"HSI {src} -> {dst}"
     run_shell_cmd.assert_called_once_with(f"hsi -q get '{dst}' : '{src}'", taskname=taskname)
@@ -210,6 +263,95 @@ def test_utils_tasks_filecopy_hsi(logged, ready_task, tmp_path):
     assert dst.exists()
 
 
+def test_utils_tasks_filecopy_hsi__checksum(ready_task, tmp_path):
+    dst = tmp_path / "dst"
+    with (
+        patch.object(tasks, "run_shell_cmd") as run_shell_cmd,
+        patch.object(tasks, "existing_hpss", wraps=ready_task),
+        checksum.verifying() as digests,
+    ):
+        run_shell_cmd.side_effect = lambda *_a, **_kw: (dst.write_bytes(b"foo"), (True, ""))[1]
+        tasks.filecopy_hsi(src="/path/to/src", dst=dst)
+    assert digests == {str(dst): FOO}
+
+
+def test_utils_tasks_filecopy_hsi_batch(logged, ready_task, tmp_path):
+    pairs = [(f"/src/{x}", tmp_path / "dst" / x) for x in ("c", "a", "b")]
+    pairs[2][1].parent.mkdir()
+    pairs[2][1].touch()  # already exists, so not copied
+
+    def hsi(cmd, **_):
+        cmds = Path(cmd.split("'")[1]).read_text()
+        assert cmds == f"get '{pairs[1][1]}' : '/src/a'\nget '{pairs[0][1]}' : '/src/c'\n"
+        pairs[1][1].touch()  # c fails
+        return True, "msg1\nmsg2\n"
+
+    with (
+        patch.object(tasks, "executable", wraps=ready_task) as executable,
+        patch.object(tasks, "run_shell_cmd", side_effect=hsi) as run_shell_cmd,
+        telemetry.recording() as transfers,
+    ):
+        node = tasks.filecopy_hsi_batch(pairs=pairs)
+    executable.assert_called_once_with(STR.hsi)
+    assert [(t.path, t.kind) for t in transfers] == [(str(pairs[1][1]), STR.hsi)]  # c failed
+    taskname = f"HSI /src/c -> {pairs[0][1]} (batch of 3)"
+    run_shell_cmd.assert_called_once_with(ANY, taskname=taskname)
+    assert run_shell_cmd.call_args[0][0].startswith("hsi -q in ")
+    assert logged(f"{taskname}: => msg1")
+    assert logged(f"{taskname}: => msg2")
+    assert logged(f"{taskname}: Could not copy /src/c -> {pairs[0][1]}")
+    assert not node.ready
+    assert [a.ready() for a in cast(list[Asset], node.asset)] == [False, True, True]
+
+
+def test_utils_tasks_filecopy_hsi_batch__cache(ready_task, tmp_path):
+    cache.configure(cache_dir=tmp_path / "cache", link=True)
+    pairs = [(f"/src/{x}", tmp_path / "run1" / x) for x in ("a", "b")]
+    gets = []
+
+    def hsi(cmd, **_):
+        for line in Path(cmd.split("'")[1]).read_text().strip().split("\n"):
+            tmp, src = line.split("'")[1::2]
+            gets.append(src)
+            Path(tmp).write_text(src)
+        return True, ""
+
+    with (
+        patch.object(tasks, "executable", wraps=ready_task),
+        patch.object(tasks, "run_shell_cmd", side_effect=hsi) as run_shell_cmd,
+    ):
+        tasks.filecopy_hsi_batch(pairs=pairs)
+        pairs = [(src, tmp_path / "run2" / dst.name) for src, dst in pairs]
+        pairs.append(("/src/c", tmp_path / "run2" / "c"))
+        node = tasks.filecopy_hsi_batch(pairs=pairs)
+        assert node.ready
+        tasks.filecopy_hsi_batch(pairs=[("/src/c", tmp_path / "run3" / "c")])
+    assert run_shell_cmd.call_count == 2  # nothing fetched by the third batch
+    assert gets == ["/src/a", "/src/b", "/src/c"]  # a and b fetched once
+    assert (tmp_path / "run2" / "a").samefile(tmp_path / "run1" / "a")
+    assert (tmp_path / "run2" / "c").read_text() == "/src/c"
+
+
+def test_utils_tasks_filecopy_hsi_batch__checksum(logged, ready_task, tmp_path):
+    pairs = [(f"/src/{x}", tmp_path / x) for x in ("a", "b", "c")]
+
+    def hsi(*_a, **_kw):
+        for _, dst in pairs[:2]:  # c fails
+            dst.write_bytes(b"foo")
+        return True, ""
+
+    expected = {str(pairs[1][1]): BAR}
+    with (
+        patch.object(tasks, "executable", wraps=ready_task),
+        patch.object(tasks, "run_shell_cmd", side_effect=hsi),
+        checksum.verifying(expected=expected) as digests,
+    ):
+        node = tasks.filecopy_hsi_batch(pairs=pairs)
+    assert digests == {str(pairs[0][1]): FOO, str(pairs[1][1]): FOO}
+    assert [a.ready() for a in cast(list[Asset], node.asset)] == [True, False, False]
+    assert logged(f"Checksum mismatch for {pairs[1][1]}: Expected {BAR}, got {FOO}")
+
+
 def test_utils_tasks_filecopy_htar(logged, ready_task, tmp_path):
     src_archive = "/path/to/archive.tar"
     src_file = "afile"
@@ -218,8 +360,10 @@ def test_utils_tasks_filecopy_htar(logged, ready_task, tmp_path):
         patch.object(tasks, "existing_hpss", wraps=ready_task) as existing_hpss,
         patch.object(tasks, "move", side_effect=lambda *_a, **_kw: dst.touch()) as move,
         patch.object(tasks, "run_shell_cmd", return_value=(True, "msg1\nmsg2\n")) as run_shell_cmd,
+        telemetry.recording() as transfers,
     ):
         tasks.filecopy_htar(src_archive=src_archive, src_file=src_file, dst=Path(dst))
+    assert [(t.path, t.kind) for t in transfers] == [(str(dst), STR.htar)]
     existing_hpss.assert_called_once_with(src_archive)
     cmd = f"htar -qxf '{src_archive}' '{src_file}'"
     taskname = f"HTAR {src_archive}:{src_file} -> {dst}"
@@ -230,30 +374,231 @@ def test_utils_tasks_filecopy_htar(logged, ready_task, tmp_path):
     assert dst.exists()
 
 
+def test_utils_tasks_filecopy_htar__checksum(ready_task, tmp_path):
+    dst = tmp_path / "dst"
+
+    def htar(_cmd, cwd, **_):
+        Path(cwd, "afile").write_bytes(b"foo")
+        return True, ""
+
+    with (
+        patch.object(tasks, "existing_hpss", wraps=ready_task),
+        patch.object(tasks, "run_shell_cmd", side_effect=htar),
+        checksum.verifying() as digests,
+    ):
+        tasks.filecopy_htar(src_archive="/archive.tar", src_file="afile", dst=dst)
+    assert dst.read_bytes() == b"foo"
+    assert digests == {str(dst): FOO}
+
+
+def test_utils_tasks_filecopy_htar_batch(logged, ready_task, tmp_path):
+    src_archive = "/path/to/archive.tar"
+    pairs = [("b", tmp_path / "b1"), ("a", tmp_path / "a"), ("b", tmp_path / "b2")]
+    pairs.append(("c", tmp_path / "c"))
+    pairs.append(("d", tmp_path / "d"))
+    pairs[4][1].touch()  # already exists, so not extracted
+
+    def htar(_cmd, cwd, **_):
+        for member in ("a", "b"):  # c fails
+            Path(cwd, member).write_text(member)
+        return True, "msg1\n"
+
+    with (
+        patch.object(tasks, "existing_hpss", wraps=ready_task) as existing_hpss,
+        patch.object(tasks, "run_shell_cmd", side_effect=htar) as run_shell_cmd,
+        telemetry.recording() as transfers,
+    ):
+        node = tasks.filecopy_htar_batch(src_archive=src_archive, pairs=pairs)
+    assert [Path(t.path).name for t in transfers] == ["b1", "a", "b2"]  # c failed
+    assert len({t.seconds for t in transfers}) == 1  # batch time shared equally
+    existing_hpss.assert_called_once_with(src_archive)
+    taskname = f"HTAR {src_archive}:b -> {pairs[0][1]} (batch of 5)"
+    cmd = f"htar -qxf '{src_archive}' 'a' 'b' 'c'"
+    run_shell_cmd.assert_called_once_with(cmd, cwd=ANY, taskname=taskname)
+    assert logged(f"{taskname}: => msg1")
+    assert logged(f"{taskname}: Could not extract c")
+    assert [path.read_text() for path in (tmp_path / "a", tmp_path / "b1", tmp_path / "b2")] == [
+        "a",
+        "b",
+        "b",
+    ]
+    assert not node.ready
+    assert [a.ready() for a in cast(list[Asset], node.asset)] == [True, True, True, False, True]
+
+
+def test_utils_tasks_filecopy_hsi_batch__cache_concurrent(ready_task, tmp_path):
+    cache.configure(cache_dir=tmp_path / "cache")
+    gets = []
+
+    def hsi(cmd, **_):
+        for line in Path(cmd.split("'")[1]).read_text().strip().split("\n"):
+            tmp, src = line.split("'")[1::2]
+            gets.append(src)
+            sleep(0.2)  # so that the other batch looks up the source meanwhile
+            Path(tmp).write_text(src)
+        return True, ""
+
+    def batch(run):
+        return tasks.filecopy_hsi_batch(pairs=[("/src/a", tmp_path / run / "a")]).ready
+
+    with (
+        patch.object(tasks, "executable", wraps=ready_task),
+        patch.object(tasks, "run_shell_cmd", side_effect=hsi),
+        ThreadPoolExecutor(max_workers=2) as executor,
+    ):
+        assert all(executor.map(batch, ["run1", "run2"]))
+    assert gets == ["/src/a"]  # fetched by one batch, found cached by the other
+
+
+def test_utils_tasks_filecopy_htar_batch__cache(ready_task, tmp_path):
+    cache.configure(cache_dir=tmp_path / "cache", link=True)
+    pairs = [("a", tmp_path / "a1"), ("a", tmp_path / "a2"), ("b", tmp_path / "b")]
+
+    def htar(_cmd, cwd, **_):
+        Path(cwd, "a").write_text("a")  # b fails
+        return True, ""
+
+    with (
+        patch.object(tasks, "existing_hpss", wraps=ready_task),
+        patch.object(tasks, "run_shell_cmd", side_effect=htar) as run_shell_cmd,
+    ):
+        tasks.filecopy_htar_batch(src_archive="/archive.tar", pairs=pairs)
+        assert (tmp_path / "a1").samefile(tmp_path / "a2")
+        assert not (tmp_path / "b").exists()
+        for dst in (tmp_path / "a1", tmp_path / "a2"):
+            dst.unlink()
+        node = tasks.filecopy_htar_batch(src_archive="/archive.tar", pairs=pairs[:2])
+    assert node.ready
+    run_shell_cmd.assert_called_once()  # a was cached by the first batch
+    assert (tmp_path / "a1").read_text() == "a"
+
+
+def test_utils_tasks_filecopy_htar_batch__checksum(ready_task, tmp_path):
+    pairs = [("a", tmp_path / "a1"), ("a", tmp_path / "a2"), ("b", tmp_path / "b")]
+
+    def htar(_cmd, cwd, **_):
+        Path(cwd, "a").write_bytes(b"foo")  # b fails
+        return True, ""
+
+    with (
+        patch.object(tasks, "existing_hpss", wraps=ready_task),
+        patch.object(tasks, "run_shell_cmd", side_effect=htar),
+        patch.object(tasks.checksum, "hexdigest", wraps=checksum.hexdigest) as hexdigest,
+        checksum.verifying() as digests,
+    ):
+        tasks.filecopy_htar_batch(src_archive="/archive.tar", pairs=pairs)
+    assert digests == {str(tmp_path / "a1"): FOO, str(tmp_path / "a2"): FOO}
+    hexdigest.assert_called_once()  # member a hashed once, for both destinations
+
+
 def test_utils_tasks_filecopy_http(ready_task, tmp_path):
     dst = tmp_path / "dst"
     url = "http://foo.com/obj"
     assert not dst.exists()
     with (
-        patch.object(tasks.requests, "get") as get,
+        patch.object(tasks.http, "download") as download,
         patch.object(tasks, "existing_http", wraps=ready_task) as existing_http,
+        telemetry.recording() as transfers,
     ):
-        response = Mock(status_code=200)
-        response.iter_content.return_value = iter([b"f", b"o", b"o"])
-        get.return_value = response
+        download.side_effect = lambda _, dst, _hasher: dst.write_bytes(b"foo")
         tasks.filecopy_http(url=url, dst=dst)
+    assert [(t.path, t.kind, t.size) for t in transfers] == [(str(dst), STR.http, 3)]
     existing_http.assert_called_once_with(url)
-    get.assert_called_once_with(url, allow_redirects=True, stream=True, timeout=3)
+    download.assert_called_once_with(url, dst, None)
     assert dst.read_bytes() == b"foo"
 
 
+def test_utils_tasks_filecopy_http__cache(tmp_path):
+    cache.configure(cache_dir=tmp_path / "cache", link=True)
+    url = "http://foo.com/obj"
+    download = lambda _, path: path.write_bytes(b"foo") or True
+    with (
+        patch.object(tasks.http, "download", side_effect=download) as download,
+        patch.object(tasks.http, "validator", return_value='"etag"'),
+        checksum.verifying() as digests,
+    ):
+        for dst in ("dst1", "dst2"):
+            tasks.filecopy_http(url=url, dst=tmp_path / dst, check=False)
+    download.assert_called_once()
+    assert (tmp_path / "dst1").samefile(tmp_path / "dst2")
+    assert digests == {str(tmp_path / "dst1"): FOO, str(tmp_path / "dst2"): FOO}
+
+
+def test_utils_tasks_filecopy_http__cache_no_validator(tmp_path):
+    cache.configure(cache_dir=tmp_path / "cache")
+    with (
+        patch.object(tasks.http, "download") as download,
+        patch.object(tasks.http, "validator", return_value=None),
+    ):
+        tasks.filecopy_http(url="http://foo.com/obj", dst=tmp_path / "dst", check=False)
+    download.assert_called_once_with("http://foo.com/obj", tmp_path / "dst", None)
+
+
+def test_utils_tasks_filecopy_http__checksum(tmp_path):
+    dst = tmp_path / "dst"
+
+    def download(_, dst, hasher):
+        dst.write_bytes(b"foo")
+        hasher.update(b"foo")
+        return True
+
+    with (
+        patch.object(tasks.http, "download", side_effect=download),
+        checksum.verifying() as digests,
+    ):
+        tasks.filecopy_http(url="http://foo.com/obj", dst=dst, check=False)
+    assert digests == {str(dst): FOO}
+
+
 def test_utils_tasks_filecopy_local(tmp_path):
     src = tmp_path / "src"
     src.touch()
     dst = tmp_path / "subdir" / "dst"
     assert not dst.exists()
-    tasks.filecopy_local(src=src, dst=dst)
+    with telemetry.recording() as transfers:
+        tasks.filecopy_local(src=src, dst=dst)
     assert dst.exists()
+    assert [(t.path, t.kind, t.size) for t in transfers] == [(str(dst), STR.local, 0)]
+
+
+def test_utils_tasks_filecopy_symlink(tmp_path):
+    src, dst = tmp_path / "src", tmp_path / "subdir" / "dst"
+    src.symlink_to("nowhere")
+    assert tasks.filecopy_symlink(src=src, dst=dst).ready
+    assert dst.readlink() == Path("nowhere")
+    dst.unlink()
+    dst.touch()
+    assert not tasks.filecopy_symlink(src=src, dst=dst).ready  # existing file is not replaced
+
+
+def test_utils_tasks_filecopy_local__checksum(logged, tmp_path):
+    src = tmp_path / "src"
+    src.write_bytes(b"foo")
+    dst1, dst2 = tmp_path / "dst1", tmp_path / "dst2"
+    expected = {str(dst2): BAR}
+    with checksum.verifying(expected=expected) as digests:
+        assert tasks.filecopy_local(src=src, dst=dst1).ready
+        assert not tasks.filecopy_local(src=src, dst=dst2).ready
+    assert digests == {str(dst1): FOO, str(dst2): FOO}
+    assert not dst2.exists()
+    assert logged(f"Checksum mismatch for {dst2}: Expected {BAR}, got {FOO}")
+
+
+@mark.parametrize("sync", [STR.hash, STR.mtime])
+def test_utils_tasks_filecopy_local__sync(sync, tmp_path):
+    src, dst = tmp_path / "src", tmp_path / "dst"
+    src.write_bytes(b"foo")
+    dst.write_bytes(b"old")
+    os.utime(dst, (1000, 1000))
+    node = tasks.filecopy_local(src=src, dst=dst, sync=sync)
+    assert node.ready
+    assert dst.read_bytes() == b"foo"
+    assert dst.stat().st_mtime == src.stat().st_mtime
+    with patch.object(tasks.local, "copy") as copy, patch.object(tasks, "current") as current:
+        current.return_value = True
+        assert tasks.filecopy_local(src=src, dst=dst, sync=sync).ready
+    copy.assert_not_called()
+    current.assert_called_once_with(src, dst, sync)
 
 
 @mark.parametrize("task", [tasks.hardlink, tasks.symlink])
@@ -298,6 +643,132 @@ def test_utils_tasks_hardlink__cannot_hardlink(logged, prefix, fallback, tmp_pat
         assert logged("Could not hardlink %s -> %s" % (link, target))
 
 
+def test_utils_tasks_htar_bundle(logged, tmp_path):
+    archive = "/hpss/run.000.tar"
+    index = "".join(
+        "HTAR: -rw-r--r--  u/g  3 2025-04-04 04:37  %s\n" % member for member in ("a", "/b/c")
+    )
+    members: list[str] = []
+
+    def htar(cmd, **_):
+        members.extend(Path(cmd.split("'")[3]).read_text().split())
+        return True, ""
+
+    with (
+        patch.object(tasks, "run_shell_cmd", side_effect=htar) as shell,
+        patch.object(hpss, "run_shell_cmd", side_effect=[(False, ""), (True, index)]),
+    ):
+        node = tasks.htar_bundle(archive=archive, members=["a", "/b/c"], cwd=tmp_path)
+    assert node.ready
+    assert members == ["a", "/b/c"]
+    shell.assert_called_once_with(ANY, cwd=tmp_path, taskname=f"HTAR {archive} (bundle of 2)")
+    assert shell.call_args.args[0].startswith(f"htar -P -cf '{archive}' -L ")
+    assert not logged("missing from archive index")
+
+
+def test_utils_tasks_htar_bundle__fail(logged, tmp_path):
+    archive = "/hpss/run.001.tar"
+    with (
+        patch.object(tasks, "run_shell_cmd", return_value=(False, "")),
+        patch.object(hpss, "run_shell_cmd", return_value=(False, "")) as run_shell_cmd,
+    ):
+        assert not tasks.htar_bundle(archive=archive, members=["a"], cwd=tmp_path).ready
+    run_shell_cmd.assert_called_once()  # not re-indexed after failure
+    index = "HTAR: -rw-r--r--  u/g  3 2025-04-04 04:37  a\n"
+    with (
+        patch.object(tasks, "run_shell_cmd", return_value=(True, "")),
+        patch.object(hpss, "run_shell_cmd", side_effect=[(False, ""), (True, index)]),
+    ):
+        assert not tasks.htar_bundle(archive=archive, members=["a", "b"]).ready
+    assert logged(f"HTAR {archive} (bundle of 2): Member b missing from archive index")
+
+
+@mark.parametrize("hard", [False, True])
+def test_utils_tasks_link_batch(hard, logged, tmp_path):
+    targets = [tmp_path / "targets" / x for x in ("a", "b", "c")]
+    targets[0].parent.mkdir()
+    for target in targets[:2]:  # c is missing
+        target.touch()
+    links = [tmp_path / "run" / sub / target.name for sub in ("x", "y") for target in targets]
+    links[0].parent.mkdir(parents=True)
+    links[0].symlink_to(targets[0])  # already exists, so not linked
+    pairs = [(target, link) for target, link in zip(targets * 2, links, strict=True)]
+    with patch.object(tasks.os, "scandir", wraps=os.scandir) as scandir:
+        node = tasks.link_batch(pairs=pairs, hard=hard)
+    scandir.assert_called_once_with(targets[0].parent)
+    taskname = "%s %s -> %s (batch of 6)" % (
+        "Hardlink" if hard else "Symlink",
+        links[0],
+        targets[0],
+    )
+    assert logged(f"{taskname}: Target {targets[2]} does not exist")
+    assert [a.ready() for a in cast(list[Asset], node.asset)] == [True, True, False] * 2
+    assert links[4].stat().st_nlink == 3 if hard else links[4].is_symlink()
+
+
+def test_utils_tasks_link_batch__fail(logged, tmp_path):
+    target, link = tmp_path / "target", tmp_path / "link"
+    target.touch()
+    with patch.object(tasks.os, "link", side_effect=OSError("trouble")):
+        node = tasks.link_batch(pairs=[(target, link)], hard=True)
+    assert not node.ready
+    assert logged(
+        f"Hardlink {link} -> {target} (batch of 1): Could not hardlink {link} -> {target}"
+    )
+
+
+@mark.parametrize("fallback", ["copy", "symlink"])
+def test_utils_tasks_link_batch__fallback(fallback, tmp_path):
+    target, link = tmp_path / "target", tmp_path / "link"
+    target.touch()
+    with (
+        patch.object(tasks.os, "link", side_effect=OSError("trouble")),
+        telemetry.recording() as transfers,
+    ):
+        assert tasks.link_batch(pairs=[(target, link)], hard=True, fallback=fallback).ready
+    assert link.is_symlink() is (fallback == "symlink")
+    assert len(transfers) == (fallback == "copy")
+
+
+@mark.parametrize("prefix", ["", "file://"])
+def test_utils_tasks_link_batch__no_check(prefix, tmp_path):
+    target, link = tmp_path / "target", tmp_path / "link"
+    with patch.object(tasks.os, "scandir") as scandir:
+        tasks.link_batch(pairs=[(f"{prefix}{target}", f"{prefix}{link}")], check=False)
+    scandir.assert_not_called()
+    assert link.is_symlink()
+    assert not link.exists()  # dangling
+
+
+def test_utils_tasks_link_batch__relative(monkeypatch, tmp_path):
+    monkeypatch.chdir(tmp_path)
+    Path("target").touch()
+    tasks.link_batch(pairs=[("target", "sub/link")])
+    assert Path("sub/link").readlink() == Path("../target")
+
+
+def test_utils_tasks_limits():
+    assert tasks._SEMAPHORES == {}
+    with tasks.limits({STR.hpss: 2, STR.local: 4}):
+        assert set(tasks._SEMAPHORES) == {STR.hpss, STR.local}
+        with tasks.limits({STR.hpss: 1}):
+            assert set(tasks._SEMAPHORES) == {STR.hpss, STR.local}
+        assert set(tasks._SEMAPHORES) == {STR.hpss, STR.local}
+    assert tasks._SEMAPHORES == {}
+    with tasks.limits(None):
+        assert tasks._SEMAPHORES == {}
+
+
+def test_utils_tasks_limits__bad_kind():
+    with raises(UWConfigError, match=r"Unknown transfer kind 'foo' \(choices: hpss, http, local\)"):
+        tasks.limits({"foo": 1}).__enter__()
+
+
+def test_utils_tasks_limits__bad_maximum():
+    with raises(UWConfigError, match="Maximum concurrent http transfers must be positive, not 0"):
+        tasks.limits({STR.http: 0}).__enter__()
+
+
 @mark.parametrize("wrapper", [Path, str])
 def test_utils_tasks_link_target(tmp_path, wrapper):
     d, f, s = (tmp_path / x for x in ("d", "f", "s"))
@@ -309,6 +780,80 @@ def test_utils_tasks_link_target(tmp_path, wrapper):
     assert not tasks.link_target(path=tmp_path / "foo").ready
 
 
+def test_utils_tasks_purged(logged, tmp_path):
+    p = tmp_path / "run"
+    (p / "sub").mkdir(parents=True)
+    (p / "sub" / "a").write_text("foo")
+    reclaimed: dict[str, int] = {}
+    assert tasks.purged(path=p, reclaimed=reclaimed).ready
+    assert not p.exists()
+    assert reclaimed == {str(p): 3}
+    assert logged(f"Purged {p}: 1 files, 3 bytes")
+    p.touch()
+    assert tasks.purged(path=p).ready
+    assert not p.exists()
+
+
+def test_utils_tasks_purged__fail(logged, tmp_path):
+    p = tmp_path / "run"
+    p.mkdir()
+    with patch.object(tasks.remove, "remove", side_effect=OSError("failed")):
+        assert not tasks.purged(path=p).ready
+    assert p.is_dir()
+    assert logged(f"Could not purge {p}: failed")
+
+
+def test_utils_tasks__existing(tmp_path):
+    (tmp_path / "file").touch()
+    (tmp_path / "dir").mkdir()
+    (tmp_path / "link").symlink_to(tmp_path / "file")
+    (tmp_path / "dangling").symlink_to(tmp_path / "missing")
+    paths = [tmp_path / x for x in ("file", "dir", "link", "dangling", "missing")]
+    paths += [
+        tmp_path / "nodir" / "file",
+        Path("/"),
+        tmp_path / "dir" / "..",
+        tmp_path / "nodir" / "..",
+    ]
+    expected = {tmp_path / x for x in ("file", "dir", "link")} | {
+        Path("/"),
+        tmp_path / "dir" / "..",
+    }
+    assert tasks._existing(paths) == expected
+
+
+@mark.parametrize(("maxima", "expected"), [({STR.local: 2}, 2), (None, 6)])
+def test_utils_tasks__limited(expected, maxima):
+    active, peak = [0], [0]
+    lock, barrier = Lock(), Barrier(expected)
+
+    def transfer():
+        with tasks._limited(STR.local):
+            with lock:
+                active[0] += 1
+                peak[0] = max(peak[0], active[0])
+            barrier.wait(timeout=5)  # all permitted transfers must be active at once
+            with lock:
+                active[0] -= 1
+
+    with tasks.limits(maxima), ThreadPoolExecutor(max_workers=6) as executor:
+        for future in [executor.submit(transfer) for _ in range(6)]:
+            future.result()
+    assert peak[0] == expected
+
+
+def test_utils_tasks__sha256(tmp_path):
+    path = tmp_path / "f"
+    path.write_bytes(b"foo")
+    digest = "2c26b46b68ffc68ff99b453c1d30413413422d706483bfa0f98a5e886266e7ae"
+    tasks._sha256.cache_clear()
+    assert tasks._sha256(path, 3, 1) == digest
+    path.write_bytes(b"bar")
+    assert tasks._sha256(path, 3, 1) == digest  # cached
+    assert tasks._sha256(path, 3, 2) != digest
+    assert tasks._sha256.cache_info().hits == 1
+
+
 def test_utils_tasks__local__path_fail():
     path = "foo://bucket/a/b"
     with patch.object(tasks, "_bad_scheme") as _bad_scheme:
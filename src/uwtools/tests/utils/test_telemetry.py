@@ -0,0 +1,120 @@
+import json
+from unittest.mock import patch
+
+from pytest import approx
+
+from uwtools.utils import telemetry
+from uwtools.utils.telemetry import Transfer
+
+# Helpers
+
+
+def transfers():
+    return [
+        Transfer("/a", "hsi", 100, 0.0, 4.0, 2.0),
+        Transfer("/b", "hsi", 300, 0.0, 4.0, 2.0),
+        Transfer("/c", "local", 50, 1.0, 2.0, 1.0),
+        Transfer("/d", "local", 50, 2.0, 2.5, 0.5),
+    ]
+
+
+# Tests
+
+
+def test_utils_telemetry_record(tmp_path):
+    paths = [tmp_path / "a", tmp_path / "b", tmp_path / "c"]
+    paths[0].write_bytes(b"foo")
+    paths[1].write_bytes(b"foobar")
+    telemetry.record("hsi", paths, 0)  # not recording: no-op
+    with (
+        patch.object(telemetry, "monotonic", return_value=3.0),
+        telemetry.recording() as recorded,
+    ):
+        telemetry.record("hsi", paths, 1.5)  # c not staged
+        telemetry.record("hsi", [], 1.5)
+    assert recorded == [
+        Transfer(str(paths[0]), "hsi", 3, 1.5, 3.0, 0.5),
+        Transfer(str(paths[1]), "hsi", 6, 1.5, 3.0, 0.5),
+    ]
+
+
+def test_utils_telemetry_recording(logged, tmp_path):
+    path = tmp_path / "a"
+    path.write_bytes(b"foo")
+    assert not telemetry.active()
+    with telemetry.recording() as outer:
+        assert telemetry.active()
+        with telemetry.recording() as inner:  # nested: same transfers
+            telemetry.record("local", [path], 0)
+        assert inner is outer
+    assert not telemetry.active()
+    assert len(outer) == 1
+    assert logged("Staged 1 files, 3 bytes, in ")
+
+
+def test_utils_telemetry_recording__none(logged):
+    with telemetry.recording() as recorded:
+        pass
+    assert recorded == []
+    assert not logged("Staged")
+
+
+def test_utils_telemetry_summary():
+    with patch.object(telemetry, "SLOWEST", 3):
+        summary = telemetry.summary(transfers())
+    assert summary == {
+        "bytes": 500,
+        "bytes_per_second": 125.0,
+        "files": 4,
+        "kinds": {
+            "hsi": {
+                "bytes": 400,
+                "bytes_per_second": 100.0,
+                "files": 2,
+                "p50": 2.0,
+                "p95": 2.0,
+                "seconds": 4.0,
+            },
+            "local": {
+                "bytes": 100,
+                "bytes_per_second": approx(66.667),
+                "files": 2,
+                "p50": 0.5,
+                "p95": 1.0,
+                "seconds": 1.5,
+            },
+        },
+        "seconds": 4.0,
+        "slowest": [
+            {"path": "/a", "kind": "hsi", "bytes": 100, "seconds": 2.0},
+            {"path": "/b", "kind": "hsi", "bytes": 300, "seconds": 2.0},
+            {"path": "/c", "kind": "local", "bytes": 50, "seconds": 1.0},
+        ],
+    }
+
+
+def test_utils_telemetry_summary__empty():
+    assert telemetry.summary([]) == {
+        "bytes": 0,
+        "bytes_per_second": 0,
+        "files": 0,
+        "kinds": {},
+        "seconds": 0,
+        "slowest": [],
+    }
+
+
+def test_utils_telemetry_write(logged, tmp_path):
+    path = tmp_path / "subdir" / "telemetry.json"
+    summary = telemetry.summary(transfers())
+    telemetry.write(str(path), summary)
+    assert json.loads(path.read_text()) == summary
+    assert logged(f"Wrote telemetry for 4 staged files to {path}")
+
+
+def test_utils_telemetry__percentile():
+    values = [float(x) for x in range(1, 21)]
+    assert telemetry._percentile(values, 50) == 10.0
+    assert telemetry._percentile(values, 95) == 19.0
+    assert telemetry._percentile([3.0], 95) == 3.0
+    assert telemetry._percentile([3.0], 0) == 3.0
@@ -11,6 +11,8 @@ from typing import TYPE_CHECKING, TypeVar
 
 from uwtools.exceptions import UWError
 from uwtools.utils.file import str2path
+from uwtools.utils.statcache import caching
+from uwtools.utils.telemetry import recording
 
 if TYPE_CHECKING:
     import datetime as dt
@@ -197,7 +199,8 @@ def _execute(
     function_scope_locals = locals()
     kwargs.update({arg: function_scope_locals.get(arg) for arg in accepted_args})
     obj = driver_class(**kwargs)
-    node: Node = getattr(obj, task)(dry_run=dry_run)
+    with caching(), recording():
+        node: Node = getattr(obj, task)(dry_run=dry_run)
     if graph_file:
         Path(graph_file).write_text(f"{node.graph}\n")
     return node
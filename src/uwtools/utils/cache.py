@@ -0,0 +1,340 @@
+"""
+A shared, content-addressed cache of remote staging sources.
+"""
+
+from __future__ import annotations
+
+import fcntl
+import os
+from contextlib import ExitStack, contextmanager, suppress
+from hashlib import sha256
+from pathlib import Path
+from threading import local as threadlocal
+from time import time
+from types import SimpleNamespace as ns
+from typing import TYPE_CHECKING
+from uuid import uuid4
+
+from uwtools.logging import log
+from uwtools.utils import local
+from uwtools.utils.remove import remove
+
+if TYPE_CHECKING:
+    from collections.abc import Callable, Iterator
+
+# Remote sources (e.g. from HTTP servers or HPSS) may be cached in a local directory shared by many
+# processes, e.g. by the ensemble members and consecutive cycles that stage the same static inputs.
+# Each source is cached as a read-only file named by the sha256 digest of its URL and, if available,
+# a validator (e.g. HTTP ETag) identifying its version. Cached files are materialized at destination
+# paths via copy or, if so configured, via hardlink, which saves space but leaves destinations
+# read-only, since they share the cached file's permissions. Each cached file is looked up, fetched,
+# and published, via atomic rename, under a lock, so that concurrent processes fetch it only once.
+# Batched fetches (e.g. via hsi) hold the locks on all their files, acquired in path order, from
+# lookup through publication. Lock files are removed with their cached files, or as soon as a
+# lookup misses and nothing is published. When the cache exceeds its maximum size, the least
+# recently used files are evicted. Temporary files left by interrupted fetches are removed once they
+# are older than TEMP_MAX_AGE seconds.
+
+CONFIG = ns(dir=None, link=False, max_size=None)
+
+TEMP_MAX_AGE = 24 * 3600
+
+_HELD = threadlocal()  # entries whose locks the current thread holds
+
+
+def configure(
+    cache_dir: Path | str | None = None, max_size: int | None = None, link: bool = False
+) -> None:
+    """
+    Configure the cache.
+
+    :param cache_dir: Directory in which to cache sources (None => no caching).
+    :param max_size: Maximum total size of cached files, in bytes (None => unlimited).
+    :param link: Hardlink cached files to destinations, which are then read-only, where possible?
+    """
+    CONFIG.dir = Path(cache_dir) if cache_dir else None
+    CONFIG.link = link
+    CONFIG.max_size = max_size
+
+
+def enabled() -> bool:
+    """
+    Is caching enabled?
+    """
+    return CONFIG.dir is not None
+
+
+def evict() -> None:
+    """
+    Remove least recently used files until the cache is within its maximum size.
+
+    Files locked by other processes, e.g. while being materialized, are not removed. Stale temporary
+    files are removed regardless of the cache's size.
+    """
+    _clean()
+    if not CONFIG.max_size:
+        return
+    with _lock(_root() / ".lock"):
+        entries = []
+        for path in filter(_key, _root().glob("??/*")):
+            stat = path.stat()
+            entries.append((stat.st_mtime, stat.st_size, path))
+        entries.sort()
+        total = sum(size for _, size, _ in entries)
+        for _, size, path in entries:
+            if total <= CONFIG.max_size:
+                break
+            with _lock(_lockfile(path), blocking=False) as locked:
+                if locked:
+                    path.unlink()
+                    _lockfile(path).unlink()
+                    total -= size
+                    log.debug("Evicted %s from cache", path)
+
+
+def get(src: str, dst: Path, fetch: Callable[[Path], bool], validator: str = "") -> bool:
+    """
+    Materialize a cached source at a destination path, first fetching it into the cache if needed.
+
+    :param src: The source URL.
+    :param dst: Path to the destination file to create.
+    :param fetch: Function to fetch the source to a given path, returning success.
+    :param validator: An identifier of the source's version.
+    :return: Was the destination file created?
+    """
+    entry = _entry(src, validator)
+    with _entry_lock(entry):
+        if not (hit := _materialize(entry, dst, src)):
+            tmp = temp_path(entry)
+            if not fetch(tmp):
+                tmp.unlink(missing_ok=True)
+                return False
+            _publish(tmp, entry, dst, src)
+    if not hit:
+        evict()
+    return True
+
+
+def lookup(src: str, dst: Path, validator: str = "") -> bool:
+    """
+    Materialize a cached source at a destination path, if it is cached.
+
+    :param src: The source URL.
+    :param dst: Path to the destination file to create.
+    :param validator: An identifier of the source's version.
+    :return: Was the source cached?
+    """
+    entry = _entry(src, validator)
+    with _entry_lock(entry):
+        return _materialize(entry, dst, src)
+
+
+@contextmanager
+def locked(srcs: list[str], validator: str = "") -> Iterator[None]:
+    """
+    Hold the locks on the cached files for sources while in the context, if caching is enabled.
+
+    Lookups and stores of the sources in the context, by the current thread, use the held locks, so
+    that a batch of sources can be looked up, fetched, and stored by only one process at a time.
+
+    :param srcs: The source URLs.
+    :param validator: An identifier of the sources' versions.
+    """
+    if not enabled():
+        yield
+        return
+    with ExitStack() as stack:
+        # Acquire the locks in order, avoiding deadlock:
+        for entry in sorted({_entry(src, validator) for src in srcs}):
+            stack.enter_context(_entry_lock(entry))
+        yield
+
+
+def store(src: str, path: Path, dsts: list[Path], validator: str = "") -> None:
+    """
+    Cache a fetched source, and materialize it at destination paths.
+
+    :param src: The source URL.
+    :param path: Path to the fetched file, in the cache directory, to move into the cache.
+    :param dsts: Paths to the destination files to create.
+    :param validator: An identifier of the source's version.
+    """
+    entry = _entry(src, validator)
+    with _entry_lock(entry):
+        _publish(path, entry, dsts[0], src)
+        for dst in dsts[1:]:
+            _materialize(entry, dst, src)
+    evict()
+
+
+def temp_path(entry: Path | None = None) -> Path:
+    """
+    Return a unique path in the cache directory to fetch a source to.
+
+    :param entry: The cached file that will be populated from the path.
+    """
+    path = _root() / "tmp" / ("%s.%s" % (entry.name if entry else "fetch", uuid4().hex))
+    path.parent.mkdir(parents=True, exist_ok=True)
+    return path
+
+
+# Private helpers
+
+
+def _clean() -> None:
+    """
+    Remove temporary files, and directories, older than TEMP_MAX_AGE seconds.
+    """
+    cutoff = time() - TEMP_MAX_AGE
+    tmpdir = _root() / "tmp"
+    if not tmpdir.is_dir():
+        return
+    for path in tmpdir.iterdir():
+        with suppress(OSError):  # e.g. already removed by another process
+            if path.lstat().st_mtime < cutoff:
+                remove(path)
+                log.debug("Removed stale temporary file %s", path)
+
+
+def _entry(src: str, validator: str) -> Path:
+    """
+    Return the path to the cached file for a source.
+
+    :param src: The source URL.
+    :param validator: An identifier of the source's version.
+    """
+    key = sha256(("%s\n%s" % (src, validator)).encode()).hexdigest()
+    entry = _root() / key[:2] / key
+    entry.parent.mkdir(parents=True, exist_ok=True)
+    return entry
+
+
+@contextmanager
+def _entry_lock(entry: Path) -> Iterator[None]:
+    """
+    Hold the lock on a cached file while in the context, unless the current thread already does.
+
+    :param entry: Path to the cached file.
+    """
+    held: set[Path] = _HELD.__dict__.setdefault("entries", set())
+    if entry in held:
+        yield
+        return
+    lockfile = _lockfile(entry)
+    with _lock(lockfile):
+        held.add(entry)
+        try:
+            yield
+        finally:
+            held.discard(entry)
+            if not entry.is_file():
+                lockfile.unlink(missing_ok=True)  # nothing cached: remove while still locked
+
+
+def _key(path: Path) -> bool:
+    """
+    Is the given path a cached file, as opposed to e.g. a lock file?
+
+    :param path: A path in the cache.
+    """
+    return len(path.name) == 64 and path.suffix == ""
+
+
+@contextmanager
+def _lock(path: Path, blocking: bool = True) -> Iterator[bool]:
+    """
+    Hold an exclusive lock on a lock file while in the context.
+
+    :param path: Path to the lock file.
+    :param blocking: Wait for the lock, if necessary?
+    :yields: Was the lock acquired?
+    """
+    while True:
+        with path.open("a") as f:
+            try:
+                fcntl.flock(f, fcntl.LOCK_EX | (0 if blocking else fcntl.LOCK_NB))
+            except BlockingIOError:
+                yield False
+                return
+            try:
+                # The lock file may have been removed, by its previous holder, while this process
+                # waited for the lock: If so, lock the file now at the path instead.
+                if _same(f.fileno(), path):
+                    yield True
+                    return
+            finally:
+                fcntl.flock(f, fcntl.LOCK_UN)
+
+
+def _lockfile(entry: Path) -> Path:
+    """
+    Return the path to the lock file for a cached file.
+
+    :param entry: Path to the cached file.
+    """
+    return entry.with_name("%s.lock" % entry.name)
+
+
+def _materialize(entry: Path, dst: Path, src: str) -> bool:
+    """
+    Create a destination file from a cached file, if it is cached, via copy or, if configured, link.
+
+    :param entry: Path to the cached file.
+    :param dst: Path to the destination file to create.
+    :param src: The source URL, for logging.
+    :return: Was the source cached?
+    """
+    if not entry.is_file():
+        return False
+    with suppress(PermissionError):  # e.g. cached by another user
+        os.utime(entry)  # mark as recently used
+    dst.parent.mkdir(parents=True, exist_ok=True)
+    dst.unlink(missing_ok=True)
+    linked = False
+    if CONFIG.link:
+        with suppress(OSError):  # e.g. across filesystems
+            os.link(entry, dst)
+            linked = True
+    if not linked:
+        local.copy(entry, dst)
+        dst.chmod(0o644)
+    log.info("Using cached %s for %s", src, dst)
+    return True
+
+
+def _publish(path: Path, entry: Path, dst: Path, src: str) -> None:
+    """
+    Move a fetched file into the cache, and materialize it at a destination path.
+
+    :param path: Path to the fetched file.
+    :param entry: Path to the cached file.
+    :param dst: Path to the destination file to create.
+    :param src: The source URL, for logging.
+    """
+    # Make the cached file read-only, so that it cannot be modified via hardlinked destinations:
+    path.chmod(0o444)
+    path.replace(entry)
+    log.info("Cached %s", src)
+    _materialize(entry, dst, src)
+
+
+def _same(fd: int, path: Path) -> bool:
+    """
+    Is the open file the one at the given path?
+
+    :param fd: Descriptor of the open file.
+    :param path: A path.
+    """
+    try:
+        return path.stat().st_ino == os.fstat(fd).st_ino
+    except FileNotFoundError:
+        return False
+
+
+def _root() -> Path:
+    """
+    Return the cache directory.
+    """
+    root: Path = CONFIG.dir
+    root.mkdir(parents=True, exist_ok=True)
+    return root
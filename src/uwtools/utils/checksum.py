@@ -0,0 +1,133 @@
+"""
+Checksums of staged files.
+"""
+
+from __future__ import annotations
+
+import re
+from contextlib import contextmanager
+from hashlib import sha256
+from pathlib import Path
+from threading import Lock
+from types import SimpleNamespace as ns
+from typing import TYPE_CHECKING
+
+from uwtools.exceptions import UWConfigError
+from uwtools.logging import log
+from uwtools.utils import statcache
+from uwtools.utils.file import atomic
+
+if TYPE_CHECKING:
+    from _hashlib import HASH
+    from collections.abc import Iterator
+
+# While in the verifying() context, the tasks that stage files compute the sha256 digest of each
+# file they stage, from its bytes as they are streamed where possible, and record it. A staged file
+# whose digest differs from its expected digest is removed, so that it is reported as not ready.
+# Manifests of digests use the format of the sha256sum utility: one "<digest>  <path>" per line.
+
+CHUNK_SIZE = 1024 * 1024
+
+_LOCK = Lock()
+_STATE = ns(expected=None, recorded=None)
+
+
+def active() -> bool:
+    """
+    Are digests of staged files being recorded?
+    """
+    return _STATE.recorded is not None
+
+
+def check(path: Path, digest: str) -> bool:
+    """
+    Record the digest of a staged file, verifying it against its expected digest, if any.
+
+    A file that fails verification is removed.
+
+    :param path: Path to the staged file.
+    :param digest: The file's hex digest.
+    :return: Did the file pass verification?
+    """
+    key = str(path.absolute())
+    with _LOCK:
+        expected = (_STATE.expected or {}).get(key)
+        if _STATE.recorded is not None:
+            _STATE.recorded[key] = digest
+    if expected and expected != digest:
+        log.error("Checksum mismatch for %s: Expected %s, got %s", path, expected, digest)
+        path.unlink()
+        statcache.invalidate(path)
+        return False
+    return True
+
+
+def hexdigest(path: Path, hasher: HASH | None = None) -> str:
+    """
+    Return the sha256 hex digest of a file's content.
+
+    :param path: Path to the file.
+    :param hasher: A hash object to update with the content (default: a new sha256 object).
+    """
+    h = hasher or sha256()
+    with path.open("rb") as f:
+        while chunk := f.read(CHUNK_SIZE):
+            h.update(chunk)
+    return h.hexdigest()
+
+
+def read_manifest(path: Path | str, root: Path | None = None) -> dict[str, str]:
+    """
+    Return the expected digests in a manifest, keyed by absolute path.
+
+    :param path: Path to the manifest.
+    :param root: Directory that relative paths in the manifest are relative to (default: the
+        manifest's directory).
+    :raises: UWConfigError if the manifest is malformed.
+    """
+    path = Path(path)
+    root = root or path.parent
+    digests = {}
+    for n, line in enumerate(path.read_text().split("\n"), start=1):
+        if not line.strip() or line.startswith("#"):
+            continue
+        if not (m := re.fullmatch(r"([0-9a-fA-F]{64}) [ *](.+)", line)):
+            msg = "Malformed line %s in manifest %s: %s" % (n, path, line)
+            raise UWConfigError(msg)
+        digests[str((root / m[2]).absolute())] = m[1].lower()
+    return digests
+
+
+@contextmanager
+def verifying(expected: dict[str, str] | None = None) -> Iterator[dict[str, str]]:
+    """
+    Record, and optionally verify, the digests of files staged while in the context.
+
+    :param expected: Expected digests, keyed by absolute path.
+    :yields: The recorded digests, keyed by absolute path.
+    """
+    saved = (_STATE.expected, _STATE.recorded)
+    recorded: dict[str, str] = {}
+    _STATE.expected, _STATE.recorded = expected, recorded
+    try:
+        yield recorded
+    finally:
+        _STATE.expected, _STATE.recorded = saved
+
+
+def write_manifest(path: Path | str, digests: dict[str, str], root: Path | None = None) -> None:
+    """
+    Write a manifest of digests.
+
+    :param path: Path to the manifest to write.
+    :param digests: Digests, keyed by absolute path.
+    :param root: Directory to make paths in the manifest relative to, where possible.
+    """
+    root = root.absolute() if root else None
+    lines = []
+    for p, digest in sorted(digests.items()):
+        rel = Path(p).relative_to(root) if root and Path(p).is_relative_to(root) else Path(p)
+        lines.append("%s  %s\n" % (digest, rel))
+    with atomic(Path(path)) as tmp:
+        tmp.write_text("".join(lines))
+    log.info("Wrote manifest of %s staged files to %s", len(lines), path)
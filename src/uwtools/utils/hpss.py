@@ -0,0 +1,177 @@
+"""
+Cached HPSS listings.
+"""
+
+from __future__ import annotations
+
+import json
+import re
+from hashlib import sha256
+from pathlib import Path
+from threading import Lock
+from time import time
+from types import SimpleNamespace as ns
+
+from uwtools.logging import log
+from uwtools.strings import STR
+from uwtools.utils.file import atomic
+from uwtools.utils.processing import run_shell_cmd
+
+# Listings of HPSS directories and htar archive indexes are cached, keyed by the listing command, so
+# that each is made once per process (e.g. per staging run) however many glob expansions and
+# existence checks need it. Successful listings may also be cached on disk, for reuse by subsequent
+# processes, by calling configure_cache() with a cache directory. Cached listings, in memory and on
+# disk, expire after the configured time-to-live.
+
+CACHE = ns(dir=None, ttl=3600.0)
+
+# A line of htar index output, e.g.:
+# HTAR: -rw-r--r--  Paul.Madden/rtruc         64 2025-04-04 04:37  a1.c
+HTAR_MEMBER = re.compile(
+    r"^HTAR:\s+[^ ]{10}\s+[^ ]+\s+(?P<size>\d+)\s+[^ ]{10}\s+[^ ]{5}\s+(?P<path>.*)$"
+)
+
+_LISTINGS: dict[str, tuple[float, tuple[bool, str]]] = {}
+_LOCK = Lock()
+_LOCKS: dict[str, Lock] = {}
+
+
+def clear_cache() -> None:
+    """
+    Clear the in-memory listing cache.
+    """
+    with _LOCK:
+        _LISTINGS.clear()
+
+
+def configure_cache(cache_dir: Path | str | None = None, ttl: float = 3600.0) -> None:
+    """
+    Configure the listing cache.
+
+    :param cache_dir: Directory in which to cache listings on disk (None => cache only in memory).
+    :param ttl: Seconds after which cached listings expire.
+    """
+    CACHE.dir = Path(cache_dir) if cache_dir else None
+    CACHE.ttl = ttl
+
+
+def hsi_ls(path: str, taskname: str | None = None) -> tuple[bool, str]:
+    """
+    Return the result of listing an HPSS path, or glob pattern, via hsi.
+
+    :param path: HPSS path or glob pattern to list.
+    :param taskname: Name of task requesting the listing, for logging.
+    :return: Success indication and listing output.
+    """
+    return _listing(f"{STR.hsi} -q ls -1 '{path}'", taskname)
+
+
+def htar_index(
+    archive: str, taskname: str | None = None, refresh: bool = False
+) -> tuple[bool, str]:
+    """
+    Return the result of listing an HPSS-based archive's members via htar.
+
+    :param archive: HPSS path to the archive.
+    :param taskname: Name of task requesting the listing, for logging.
+    :param refresh: Ignore any cached listing, e.g. of an archive just created.
+    :return: Success indication and listing output.
+    """
+    return _listing(_htar_index_cmd(archive), taskname, refresh)
+
+
+def htar_sizes(archive: str) -> dict[str, int]:
+    """
+    Return the sizes of an HPSS-based archive's members, if its index is cached in memory.
+
+    :param archive: HPSS path to the archive.
+    :return: Sizes, in bytes, keyed by member path (empty if the index is not cached).
+    """
+    with _LOCK:
+        cached = _LISTINGS.get(_htar_index_cmd(archive))
+    if not cached or not _fresh(cached[0]) or not cached[1][0]:
+        return {}
+    return {
+        m["path"]: int(m["size"])
+        for line in cached[1][1].split("\n")
+        if (m := HTAR_MEMBER.match(line))
+    }
+
+
+def listed(path: str) -> bool:
+    """
+    Is the given HPSS path an entry in a cached, successful hsi listing?
+
+    :param path: HPSS path to a file.
+    """
+    prefix = f"{STR.hsi} "
+    with _LOCK:
+        listings = [
+            output
+            for cmd, (t, (success, output)) in _LISTINGS.items()
+            if cmd.startswith(prefix) and success and _fresh(t)
+        ]
+    return any(path in _entries(output) for output in listings)
+
+
+# Private helpers
+
+
+def _entries(output: str) -> list[str]:
+    """
+    Return the paths listed in hsi ls output.
+
+    :param output: Output of an hsi ls command.
+    """
+    return [line for line in output.strip().split("\n") if not line.startswith("***")][1:]
+
+
+def _fresh(t: float) -> bool:
+    """
+    Is a listing made at the given time still fresh?
+
+    :param t: Time, in seconds since the epoch, of the listing.
+    """
+    ttl: float = CACHE.ttl
+    return time() - t < ttl
+
+
+def _htar_index_cmd(archive: str) -> str:
+    """
+    Return the command to list an HPSS-based archive's members.
+
+    :param archive: HPSS path to the archive.
+    """
+    return f"{STR.htar} -qtf '{archive}'"
+
+
+def _listing(cmd: str, taskname: str | None, refresh: bool = False) -> tuple[bool, str]:
+    """
+    Return the cached result of a listing command, running the command if necessary.
+
+    :param cmd: The listing command.
+    :param taskname: Name of task requesting the listing, for logging.
+    :param refresh: Run the command, replacing any cached result.
+    :return: Success indication and listing output.
+    """
+    with _LOCK:
+        lock = _LOCKS.setdefault(cmd, Lock())
+    with lock:  # one listing at a time per command, so that concurrent requests share a listing
+        with _LOCK:
+            cached = _LISTINGS.get(cmd)
+        if cached and _fresh(cached[0]) and not refresh:
+            log.debug("Using cached listing: %s", cmd)
+            return cached[1]
+        path = CACHE.dir / ("%s.json" % sha256(cmd.encode()).hexdigest()) if CACHE.dir else None
+        if path and path.is_file() and _fresh(t := path.stat().st_mtime) and not refresh:
+            log.debug("Using listing cached in %s: %s", path, cmd)
+            result = (True, str(json.loads(path.read_text())))
+        else:
+            t = time()
+            result = run_shell_cmd(cmd, taskname=taskname)
+            if path and result[0]:
+                with atomic(path) as tmp:
+                    tmp.write_text(json.dumps(result[1]))
+        with _LOCK:
+            _LISTINGS[cmd] = (t, result)
+        return result
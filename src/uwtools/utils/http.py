@@ -0,0 +1,259 @@
+"""
+Pooled HTTP transfers.
+"""
+
+from __future__ import annotations
+
+from concurrent.futures import ThreadPoolExecutor
+from http import HTTPStatus
+from threading import Lock
+from types import SimpleNamespace as ns
+from typing import TYPE_CHECKING
+from urllib.parse import urlparse
+
+import requests
+from requests.adapters import HTTPAdapter
+
+from uwtools.logging import log
+from uwtools.utils import checksum
+
+if TYPE_CHECKING:
+    from _hashlib import HASH
+    from pathlib import Path
+
+    from requests.structures import CaseInsensitiveDict
+
+# Requests are made via one requests.Session per host, so that connections are pooled and reused
+# across transfers. The headers of a successful HEAD request made to check a resource's existence
+# are kept, so that the subsequent download can use them to decide whether to fetch the resource in
+# parallel segments without another round trip. Downloads are written to a .part file that is
+# renamed on completion, so that an interrupted download can later be resumed via a Range request.
+# Downloads may be hashed as their bytes are streamed, except for segmented downloads, which arrive
+# out of order and are hashed on completion.
+
+CONFIG = ns(
+    buffer_size=1024 * 1024,  # bytes per streamed chunk
+    pool_size=10,  # connections per host
+    segment_min=64 * 1024 * 1024,  # smallest resource, in bytes, to download in segments
+    segments=1,  # parallel segments per download (1 => no segmentation)
+    timeout=30.0,  # seconds
+)
+
+_HEADERS: dict[str, CaseInsensitiveDict] = {}
+_LOCK = Lock()
+_SESSIONS: dict[str, requests.Session] = {}
+
+
+def configure(**kwargs) -> None:
+    """
+    Configure HTTP transfers.
+
+    :param kwargs: Values for any of the CONFIG settings buffer_size, pool_size, segment_min,
+        segments, and timeout.
+    :raises: TypeError on an unknown setting.
+    """
+    for key, val in kwargs.items():
+        if not hasattr(CONFIG, key):
+            msg = "Unknown HTTP setting: %s" % key
+            raise TypeError(msg)
+        setattr(CONFIG, key, val)
+    with _LOCK:
+        _SESSIONS.clear()  # so that new sessions reflect the new pool size
+
+
+def download(url: str, dst: Path, hasher: HASH | None = None) -> bool:
+    """
+    Download a remote resource, resuming a previous partial download of it, if any.
+
+    :param url: URL of the resource.
+    :param dst: Path to the destination file to create.
+    :param hasher: A hash object to update with the resource's content.
+    :return: Did the download succeed?
+    """
+    part = dst.with_name("%s.part" % dst.name)
+    with _LOCK:
+        headers = _HEADERS.pop(url, None)
+    size = int(headers.get("Content-Length", 0)) if headers else 0
+    segmented = (
+        headers is not None
+        and headers.get("Accept-Ranges") == "bytes"
+        and CONFIG.segments > 1
+        and size >= CONFIG.segment_min
+        and not part.exists()
+    )
+    try:
+        ok = _get_segments(url, part, size) if segmented else _get(url, part, hasher)
+    except requests.RequestException as e:
+        log.error("Could not get '%s': %s", url, e)
+        return False
+    if ok:
+        if segmented and hasher:
+            checksum.hexdigest(part, hasher)
+        part.replace(dst)
+    return ok
+
+
+def exists(url: str) -> bool:
+    """
+    Does the given remote resource exist?
+
+    :param url: URL of the resource.
+    """
+    response = session(url).head(url, allow_redirects=True, timeout=CONFIG.timeout)
+    if response.status_code != HTTPStatus.OK:
+        return False
+    with _LOCK:
+        _HEADERS[url] = response.headers
+    return True
+
+
+def session(url: str) -> requests.Session:
+    """
+    Return the shared session for the given URL's host.
+
+    :param url: A URL.
+    """
+    parts = urlparse(url)
+    host = "%s://%s" % (parts.scheme, parts.netloc)
+    with _LOCK:
+        if host not in _SESSIONS:
+            s = requests.Session()
+            s.mount(host, HTTPAdapter(pool_connections=1, pool_maxsize=CONFIG.pool_size))
+            _SESSIONS[host] = s
+        return _SESSIONS[host]
+
+
+def size(url: str) -> int | None:
+    """
+    Return the size of a remote resource, if its server provides it.
+
+    :param url: URL of the resource.
+    :return: The resource's Content-Length, if known.
+    """
+    if (headers := _headers(url)) is None:
+        return None
+    length = headers.get("Content-Length", "")
+    return int(length) if length.isdigit() else None
+
+
+def validator(url: str) -> str | None:
+    """
+    Return an identifier of a remote resource's version, if its server provides one.
+
+    :param url: URL of the resource.
+    :return: The resource's ETag or, failing that, its size and modification time, if known.
+    """
+    if (headers := _headers(url)) is None:
+        return None
+    if etag := headers.get("ETag"):
+        return str(etag)
+    if (size := headers.get("Content-Length")) and (mtime := headers.get("Last-Modified")):
+        return "%s %s" % (size, mtime)
+    return None
+
+
+# Private helpers
+
+
+def _get(url: str, part: Path, hasher: HASH | None = None) -> bool:
+    """
+    Download a resource, in one request, to a .part file, resuming from the end of existing data.
+
+    :param url: URL of the resource.
+    :param part: Path to the .part file.
+    :param hasher: A hash object to update with the resource's content.
+    :return: Did the download succeed?
+    """
+    offset = part.stat().st_size if part.is_file() else 0
+    headers = {"Range": "bytes=%s-" % offset} if offset else {}
+    with session(url).get(
+        url, allow_redirects=True, headers=headers, stream=True, timeout=CONFIG.timeout
+    ) as response:
+        code = response.status_code
+        if code == HTTPStatus.REQUESTED_RANGE_NOT_SATISFIABLE and offset:
+            log.info("Restarting download of %s", url)
+            part.unlink()
+            return _get(url, part, hasher)
+        if code not in (HTTPStatus.OK, HTTPStatus.PARTIAL_CONTENT):
+            log.error("Could not get '%s', HTTP status was: %s", url, code)
+            return False
+        if code == HTTPStatus.PARTIAL_CONTENT:
+            log.info("Resuming download of %s at byte %s", url, offset)
+            if hasher:
+                checksum.hexdigest(part, hasher)  # the data already downloaded
+        with part.open(mode="ab" if code == HTTPStatus.PARTIAL_CONTENT else "wb") as f:
+            for chunk in response.iter_content(chunk_size=CONFIG.buffer_size):
+                f.write(chunk)
+                if hasher:
+                    hasher.update(chunk)
+    return True
+
+
+def _get_segment(url: str, part: Path, start: int, end: int) -> bool:
+    """
+    Download a byte range of a resource into its place in a .part file.
+
+    :param url: URL of the resource.
+    :param part: Path to the .part file.
+    :param start: Offset of the first byte in the range.
+    :param end: Offset of the last byte in the range.
+    :return: Did the download succeed?
+    """
+    headers = {"Range": "bytes=%s-%s" % (start, end)}
+    with session(url).get(
+        url, allow_redirects=True, headers=headers, stream=True, timeout=CONFIG.timeout
+    ) as response:
+        if (code := response.status_code) != HTTPStatus.PARTIAL_CONTENT:
+            log.error("Could not get '%s' bytes %s-%s, HTTP status was: %s", url, start, end, code)
+            return False
+        with part.open(mode="r+b") as f:
+            f.seek(start)
+            for chunk in response.iter_content(chunk_size=CONFIG.buffer_size):
+                f.write(chunk)
+    return True
+
+
+def _get_segments(url: str, part: Path, size: int) -> bool:
+    """
+    Download a resource to a .part file in parallel segments.
+
+    A failed segmented download cannot be resumed, so its .part file is removed.
+
+    :param url: URL of the resource.
+    :param part: Path to the .part file.
+    :param size: Size of the resource in bytes.
+    :return: Did the download succeed?
+    """
+    n = CONFIG.segments
+    log.info("Downloading %s in %s segments", url, n)
+    with part.open(mode="wb") as f:
+        f.truncate(size)
+    starts = [i * size // n for i in range(n)]
+    ends = [start - 1 for start in starts[1:]] + [size - 1]
+    try:
+        with ThreadPoolExecutor(max_workers=n) as executor:
+            segments = zip(starts, ends, strict=True)
+            ok = all(executor.map(lambda se: _get_segment(url, part, *se), segments))
+    except requests.RequestException:
+        part.unlink()
+        raise
+    if not ok:
+        part.unlink()
+    return ok
+
+
+def _headers(url: str) -> CaseInsensitiveDict | None:
+    """
+    Return the headers of a remote resource, from a HEAD request made once per URL.
+
+    :param url: URL of the resource.
+    :return: The headers, or None if the resource does not exist.
+    """
+    with _LOCK:
+        headers = _HEADERS.get(url)
+    if headers is None:
+        if not exists(url):
+            return None
+        with _LOCK:
+            headers = _HEADERS[url]
+    return headers
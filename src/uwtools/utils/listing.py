@@ -0,0 +1,228 @@
+"""
+Glob expansion over cached directory listings.
+"""
+
+from __future__ import annotations
+
+import os
+import re
+from concurrent.futures import ThreadPoolExecutor
+from fnmatch import translate
+from functools import lru_cache
+from pathlib import Path
+from typing import TYPE_CHECKING
+
+from uwtools.logging import log
+
+if TYPE_CHECKING:
+    from collections.abc import Callable, Iterator
+
+# Listings.glob() expands patterns like glob.iglob(pattern, recursive=True), yielding the same paths
+# in the same order, but lists each directory via os.scandir() at most once, however many patterns
+# are expanded, and takes the type of each path from its directory entry, rather than from a stat.
+
+# walk() lists a directory tree breadth first, listing the directories at each depth concurrently,
+# since on a parallel filesystem each listing is a round trip to a metadata server. Symlinks, to
+# files or directories, are reported as such, and not followed.
+
+WALKERS = 8  # maximum concurrent directory listings
+
+_MAGIC = re.compile(r"[*?[]")
+
+
+class Listings:
+    """
+    A cache of directory listings.
+    """
+
+    def __init__(self) -> None:
+        self._listings: dict[str, dict[str, bool] | None] = {}
+
+    def glob(self, pattern: str) -> Iterator[tuple[str, bool]]:
+        """
+        Yield the paths matching a glob pattern, each with whether it is a directory.
+
+        :param pattern: The pattern, in which ** matches any files and zero or more directories.
+        """
+        for path, isdir in self._iglob(pattern, dironly=False):
+            if path:
+                yield path, isdir
+
+    def listdir(self, path: str) -> dict[str, bool] | None:
+        """
+        Return a directory's entries, each with whether it is a directory, listing it if necessary.
+
+        :param path: Path to the directory.
+        :return: The entries, or None if the directory could not be listed.
+        """
+        key = _key(path)
+        if key not in self._listings:
+            try:
+                with os.scandir(path or os.curdir) as entries:
+                    self._listings[key] = {entry.name: entry.is_dir() for entry in entries}
+            except OSError:
+                self._listings[key] = None
+        return self._listings[key]
+
+    # Private helper methods
+
+    def _entry(self, dirname: str, name: str) -> bool | None:
+        """
+        Return whether a directory entry is itself a directory, or None if it does not exist.
+
+        An entry is looked up in its directory's listing, if the directory has been listed, but
+        does not cause the directory to be listed: Listing a large directory to find one entry would
+        be slower than a stat.
+
+        :param dirname: Path to the directory.
+        :param name: The entry's name.
+        """
+        listing = self._listings.get(_key(dirname))
+        if listing is None or name in (os.curdir, os.pardir):
+            path = Path(dirname, name)
+            return path.is_dir() if path.is_symlink() or path.exists() else None
+        return listing.get(name)
+
+    def _glob0(self, dirname: str, name: str) -> Iterator[tuple[str, bool]]:
+        """
+        Yield a literal name, if it exists in a directory.
+        """
+        if not name:  # a pattern ending with a separator, in a directory found via glob
+            yield name, True
+        elif (isdir := self._entry(dirname, name)) is not None:
+            yield name, isdir
+
+    def _glob1(self, dirname: str, pattern: str, dironly: bool) -> Iterator[tuple[str, bool]]:
+        """
+        Yield the names in a directory matching a pattern.
+        """
+        match = _matcher(pattern)
+        hidden = pattern.startswith(".")
+        for name, isdir in (self.listdir(dirname) or {}).items():
+            if (hidden or not name.startswith(".")) and (isdir or not dironly) and match(name):
+                yield name, isdir
+
+    def _glob2(self, dirname: str, dironly: bool) -> Iterator[tuple[str, bool]]:
+        """
+        Yield the directory itself and, recursively, the names below it.
+        """
+        yield "", True
+        yield from self._rlistdir(dirname, dironly)
+
+    def _iglob(self, pathname: str, dironly: bool) -> Iterator[tuple[str, bool]]:
+        """
+        Yield the paths matching a pattern, following glob._iglob().
+        """
+        dirname, basename = os.path.split(pathname)
+        if not _MAGIC.search(pathname):
+            if basename:
+                if (isdir := self._entry(dirname, basename)) is not None:
+                    yield pathname, isdir
+            elif Path(dirname).is_dir():
+                yield pathname, True
+            return
+        if not dirname:
+            yield from self._names(dirname, basename, dironly)
+            return
+        if dirname != pathname and _MAGIC.search(dirname):
+            dirs = [path for path, _ in self._iglob(dirname, dironly=True)]
+        else:
+            dirs = [dirname]
+        for d in dirs:
+            for name, isdir in self._names(d, basename, dironly):
+                yield _join(d, name), isdir
+
+    def _names(self, dirname: str, pattern: str, dironly: bool) -> Iterator[tuple[str, bool]]:
+        """
+        Yield the names in a directory matching a pattern's final component.
+        """
+        if pattern == "**":
+            yield from self._glob2(dirname, dironly)
+        elif _MAGIC.search(pattern):
+            yield from self._glob1(dirname, pattern, dironly)
+        else:
+            yield from self._glob0(dirname, pattern)
+
+    def _rlistdir(self, dirname: str, dironly: bool) -> Iterator[tuple[str, bool]]:
+        """
+        Yield the non-hidden names below a directory, recursively.
+        """
+        for name, isdir in (self.listdir(dirname) or {}).items():
+            if not name.startswith(".") and (isdir or not dironly):
+                yield name, isdir
+                if isdir:
+                    for y, ydir in self._rlistdir(_join(dirname, name), dironly):
+                        yield _join(name, y), ydir
+
+
+def walk(root: str, workers: int = WALKERS) -> list[tuple[str, bool]]:
+    """
+    Return the regular files and symlinks below a directory, recursively, in sorted order.
+
+    :param root: Path to the directory.
+    :param workers: Maximum number of directories to list concurrently.
+    :return: The paths, each with whether it is a symlink.
+    """
+    paths: list[tuple[str, bool]] = []
+    dirs = [root]
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        while dirs:
+            subdirs = []
+            for entries in executor.map(_scan, dirs):
+                for path, isdir, islink in entries:
+                    if isdir:
+                        subdirs.append(path)
+                    else:
+                        paths.append((path, islink))
+            dirs = subdirs
+    return sorted(paths)
+
+
+def _join(dirname: str, name: str) -> str:
+    """
+    Join a directory path and a name, as os.path.join() does on POSIX systems.
+
+    :param dirname: Path to the directory.
+    :param name: The name.
+    """
+    if not dirname or dirname.endswith(os.sep):
+        return dirname + name
+    return dirname + os.sep + name
+
+
+def _key(path: str) -> str:
+    """
+    Return the key for a directory's listing, the same with or without a trailing separator.
+
+    :param path: Path to the directory.
+    """
+    return path.rstrip(os.sep) or path
+
+
+def _scan(dirname: str) -> list[tuple[str, bool, bool]]:
+    """
+    Return the directories, regular files, and symlinks in a directory, without following symlinks.
+
+    :param dirname: Path to the directory.
+    :return: The paths, each with whether it is a directory, and whether it is a symlink.
+    """
+    found = []
+    try:
+        with os.scandir(dirname) as entries:
+            for entry in entries:
+                isdir, islink = entry.is_dir(follow_symlinks=False), entry.is_symlink()
+                if isdir or islink or entry.is_file(follow_symlinks=False):  # not e.g. a FIFO
+                    found.append((_join(dirname, entry.name), isdir, islink))
+    except OSError as e:
+        log.warning("Could not list %s: %s", dirname, e)
+    return found
+
+
+@lru_cache(maxsize=256)
+def _matcher(pattern: str) -> Callable[[str], re.Match | None]:
+    """
+    Return a function matching names against a glob pattern, compiled once.
+
+    :param pattern: The glob pattern.
+    """
+    return re.compile(translate(pattern)).match
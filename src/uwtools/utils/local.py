@@ -0,0 +1,138 @@
+"""
+Local-filesystem copies.
+"""
+
+from __future__ import annotations
+
+import fcntl
+import os
+from collections import Counter
+from shutil import SameFileError, copymode, copystat
+from threading import Lock
+from types import SimpleNamespace as ns
+from typing import IO, TYPE_CHECKING
+
+from uwtools.logging import log
+
+if TYPE_CHECKING:
+    from _hashlib import HASH
+    from pathlib import Path
+
+# Files are copied by the fastest available method: First, by reflink (FICLONE), sharing the
+# source's data blocks on copy-on-write filesystems like XFS and Btrfs; then, by copy_file_range(),
+# copying in the kernel, and on some filesystems (e.g. NFS, Lustre) on the server, in large chunks;
+# and finally, by buffered reads and writes. The number of copies made by each method is counted.
+# A copy whose content must be hashed is always buffered, so that the bytes read are hashed as they
+# are copied, without reading the source again.
+
+BUFFERED, COPY_FILE_RANGE, REFLINK = "buffered", "copy_file_range", "reflink"
+
+CONFIG = ns(
+    buffer_size=8 * 1024 * 1024,  # bytes per buffered read/write
+    chunk_size=1024 * 1024 * 1024,  # bytes per copy_file_range() call
+)
+
+COUNTS: Counter[str] = Counter()
+
+_FICLONE = 0x40049409  # from linux/fs.h
+_LOCK = Lock()
+
+
+def configure(**kwargs) -> None:
+    """
+    Configure local copies.
+
+    :param kwargs: Values for any of the CONFIG settings buffer_size and chunk_size.
+    :raises: TypeError on an unknown setting.
+    """
+    for key, val in kwargs.items():
+        if not hasattr(CONFIG, key):
+            msg = "Unknown local-copy setting: %s" % key
+            raise TypeError(msg)
+        setattr(CONFIG, key, val)
+
+
+def copy(src: Path, dst: Path, preserve: bool = False, hasher: HASH | None = None) -> str:
+    """
+    Copy a file's content and permissions, like shutil.copy(), or all metadata, like shutil.copy2().
+
+    :param src: Path to the source file.
+    :param dst: Path to the destination file to create.
+    :param preserve: Preserve all metadata, including modification time?
+    :param hasher: A hash object to update with the content copied.
+    :return: The copy method used.
+    :raises: SameFileError if the source and destination are the same file.
+    """
+    if dst.exists() and src.samefile(dst):
+        msg = "%s and %s are the same file" % (src, dst)
+        raise SameFileError(msg)
+    with src.open("rb") as fsrc, dst.open("wb") as fdst:
+        if hasher is None and _reflink(fsrc, fdst):
+            method = REFLINK
+        elif hasher is None and _copy_file_range(fsrc, fdst):
+            method = COPY_FILE_RANGE
+        else:
+            _buffered(fsrc, fdst, hasher)
+            method = BUFFERED
+    (copystat if preserve else copymode)(src, dst)
+    log.debug("Copied %s -> %s via %s", src, dst, method)
+    with _LOCK:
+        COUNTS[method] += 1
+    return method
+
+
+# Private helpers
+
+
+def _buffered(fsrc: IO[bytes], fdst: IO[bytes], hasher: HASH | None) -> None:
+    """
+    Copy a file's content via buffered reads and writes.
+
+    :param fsrc: The open source file.
+    :param fdst: The open destination file.
+    :param hasher: A hash object to update with the content copied.
+    """
+    while chunk := fsrc.read(CONFIG.buffer_size):
+        fdst.write(chunk)
+        if hasher:
+            hasher.update(chunk)
+
+
+def _copy_file_range(fsrc: IO[bytes], fdst: IO[bytes]) -> bool:
+    """
+    Copy a file's content in the kernel, if possible.
+
+    :param fsrc: The open source file.
+    :param fdst: The open destination file.
+    :return: Was the content copied?
+    :raises: OSError if the copy fails after copying some content.
+    """
+    if not hasattr(os, "copy_file_range"):
+        return False
+    size, copied = os.fstat(fsrc.fileno()).st_size, 0
+    while True:
+        try:
+            n = os.copy_file_range(fsrc.fileno(), fdst.fileno(), CONFIG.chunk_size)
+        except OSError:
+            if copied:
+                raise
+            return False  # e.g. unsupported by the kernel or across these filesystems
+        if n == 0:
+            break
+        copied += n
+    return copied > 0 or size == 0  # some special files report a size but copy nothing
+
+
+def _reflink(fsrc: IO[bytes], fdst: IO[bytes]) -> bool:
+    """
+    Make the destination file share the source file's data blocks, if possible.
+
+    :param fsrc: The open source file.
+    :param fdst: The open destination file.
+    :return: Was the reflink made?
+    """
+    try:
+        fcntl.ioctl(fdst.fileno(), _FICLONE, fsrc.fileno())
+    except OSError:
+        return False  # e.g. unsupported by the OS or filesystem, or across filesystems
+    return True
@@ -0,0 +1,112 @@
+"""
+Parallel removal of local files and directory trees.
+"""
+
+from __future__ import annotations
+
+import os
+import stat
+from concurrent.futures import ThreadPoolExecutor
+from types import SimpleNamespace as ns
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
+# A directory tree is removed breadth first: The directories at each depth are listed concurrently,
+# via os.scandir(), then the files and symlinks found in them are unlinked concurrently, and, once
+# all depths have been emptied, the directories are removed, deepest first. On a parallel
+# filesystem, where each listing and unlink is a round trip to a metadata server, a tree of many
+# small files is removed many times faster than by a serial walk. Symlinks are never followed.
+
+CONFIG = ns(
+    workers=16,  # concurrent listings / unlinks
+)
+
+
+def configure(**kwargs) -> None:
+    """
+    Configure removals.
+
+    :param kwargs: Values for the CONFIG setting workers.
+    :raises: TypeError on an unknown setting.
+    """
+    for key, val in kwargs.items():
+        if not hasattr(CONFIG, key):
+            msg = "Unknown removal setting: %s" % key
+            raise TypeError(msg)
+        setattr(CONFIG, key, val)
+
+
+def remove(path: Path) -> tuple[int, int]:
+    """
+    Remove a file, symlink, or directory tree.
+
+    :param path: The path to remove.
+    :return: The number of files and symlinks removed, and their total size in bytes.
+    :raises: OSError if the path, or anything below it, cannot be removed.
+    """
+    return _walk(path, unlink=True)
+
+
+def usage(path: Path) -> tuple[int, int]:
+    """
+    Return what removing a file, symlink, or directory tree would reclaim.
+
+    :param path: The path.
+    :return: The number of files and symlinks, and their total size in bytes.
+    :raises: OSError if the path, or anything below it, cannot be examined.
+    """
+    return _walk(path, unlink=False)
+
+
+# Private helpers
+
+
+def _scan(dirname: str) -> tuple[list[str], list[tuple[str, int]]]:
+    """
+    Return the subdirectories, and the other entries with their sizes, of a directory.
+
+    :param dirname: Path to the directory.
+    """
+    subdirs, others = [], []
+    with os.scandir(dirname) as entries:
+        for entry in entries:
+            if entry.is_dir(follow_symlinks=False):
+                subdirs.append(entry.path)
+            else:
+                others.append((entry.path, entry.stat(follow_symlinks=False).st_size))
+    return subdirs, others
+
+
+def _walk(path: Path, unlink: bool) -> tuple[int, int]:
+    """
+    Walk a path, totaling, and optionally removing, the files and symlinks at and below it.
+
+    :param path: The path.
+    :param unlink: Remove what is found?
+    """
+    info = path.lstat()
+    if not stat.S_ISDIR(info.st_mode):
+        if unlink:
+            path.unlink()
+        return 1, info.st_size
+    count = size = 0
+    levels, dirs = [], [str(path)]
+    with ThreadPoolExecutor(max_workers=CONFIG.workers) as executor:
+        while dirs:
+            levels.append(dirs)
+            subdirs: list[str] = []
+            others: list[tuple[str, int]] = []
+            for s, o in executor.map(_scan, dirs):
+                subdirs.extend(s)
+                others.extend(o)
+            if unlink:
+                list(executor.map(os.unlink, [p for p, _ in others]))
+            count += len(others)
+            size += sum(n for _, n in others)
+            dirs = subdirs
+        if unlink:
+            for level in reversed(levels):
+                list(executor.map(os.rmdir, level))
+    return count, size
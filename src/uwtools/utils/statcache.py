@@ -0,0 +1,130 @@
+"""
+A run-scoped cache of file-status checks.
+"""
+
+from __future__ import annotations
+
+import os
+import stat
+from collections import Counter
+from contextlib import contextmanager
+from threading import Lock
+from types import SimpleNamespace as ns
+from typing import TYPE_CHECKING
+
+from uwtools.logging import log
+
+if TYPE_CHECKING:
+    from collections.abc import Iterator
+    from pathlib import Path
+
+# The readiness of a task's asset is checked before the task executes, after it executes, and again
+# when the asset is reported, and a path may be the asset of, or required by, several tasks. On a
+# parallel filesystem, each check is a metadata call to a server. While in the caching() context,
+# the status of each path found to exist is cached, so that it is checked only once. The status of
+# a path found not to exist is never cached, since a task may create its asset, but a task that
+# removes or replaces its asset must invalidate() its status.
+
+CACHED, LSTAT, STAT = "cached", "lstat", "stat"
+COUNTS: Counter = Counter()  # status checks, by kind
+
+_LOCK = Lock()
+_STATE = ns(modes=None)  # dict[tuple[str, bool], int] while caching
+
+
+@contextmanager
+def caching() -> Iterator[None]:
+    """
+    Cache the status of paths found to exist while in the context.
+    """
+    if _STATE.modes is not None:  # already caching, e.g. via a nested API call
+        yield
+        return
+    before = COUNTS.copy()
+    _STATE.modes = {}
+    try:
+        yield
+    finally:
+        _STATE.modes = None
+        counts = COUNTS - before
+        log.debug(
+            "Status checks: %s stat, %s lstat, %s cached",
+            counts[STAT],
+            counts[LSTAT],
+            counts[CACHED],
+        )
+
+
+def exists(path: Path) -> bool:
+    """
+    Does the path exist, following symlinks?
+
+    :param path: The path.
+    """
+    return _mode(path) is not None
+
+
+def invalidate(path: Path) -> None:
+    """
+    Discard any cached status of a path.
+
+    :param path: The path.
+    """
+    with _LOCK:
+        if _STATE.modes is not None:
+            for follow in (True, False):
+                _STATE.modes.pop((str(path), follow), None)
+
+
+def is_dir(path: Path) -> bool:
+    """
+    Is the path a directory, following symlinks?
+
+    :param path: The path.
+    """
+    return stat.S_ISDIR(_mode(path) or 0)
+
+
+def is_file(path: Path) -> bool:
+    """
+    Is the path a regular file, following symlinks?
+
+    :param path: The path.
+    """
+    return stat.S_ISREG(_mode(path) or 0)
+
+
+def is_symlink(path: Path) -> bool:
+    """
+    Is the path a symlink?
+
+    :param path: The path.
+    """
+    return stat.S_ISLNK(_mode(path, follow=False) or 0)
+
+
+# Private helpers
+
+
+def _mode(path: Path, follow: bool = True) -> int | None:
+    """
+    Return the mode of a path, or None if it does not exist.
+
+    :param path: The path.
+    :param follow: Follow symlinks?
+    """
+    key = (str(path), follow)
+    with _LOCK:
+        if _STATE.modes is not None and key in _STATE.modes:
+            COUNTS[CACHED] += 1
+            cached: int = _STATE.modes[key]
+            return cached
+        COUNTS[STAT if follow else LSTAT] += 1
+    try:
+        mode = (os.stat if follow else os.lstat)(path).st_mode
+    except (OSError, ValueError):
+        return None
+    with _LOCK:
+        if _STATE.modes is not None:
+            _STATE.modes[key] = mode
+    return mode
@@ -5,22 +5,30 @@ Common iotaa tasks.
 from __future__ import annotations
 
 import os
-from http import HTTPStatus
+from contextlib import contextmanager, suppress
+from functools import lru_cache, partial
+from hashlib import sha256
 from pathlib import Path
-from shutil import copy, move, which
+from shutil import move, which
 from tempfile import TemporaryDirectory
+from threading import BoundedSemaphore
+from time import monotonic
 from types import SimpleNamespace as ns
-from typing import NoReturn
-from urllib.parse import unquote, urlparse
+from typing import TYPE_CHECKING, NoReturn
+from urllib.parse import quote, unquote, urlparse
 
-import requests
 from iotaa import Asset, Node, external, task
 
 from uwtools.exceptions import UWConfigError, UWError
 from uwtools.logging import log
 from uwtools.strings import STR
+from uwtools.utils import cache, checksum, http, local, remove, statcache, telemetry
+from uwtools.utils.hpss import HTAR_MEMBER, hsi_ls, htar_index, listed
 from uwtools.utils.processing import run_shell_cmd
 
+if TYPE_CHECKING:
+    from collections.abc import Iterator
+
 SCHEMES = ns(
     hsi=(STR.url_scheme_hsi,),
     htar=(STR.url_scheme_htar,),
@@ -28,6 +36,64 @@ SCHEMES = ns(
     local=("", STR.url_scheme_file),
 )
 
+# Transfers of each kind (from HPSS, via hsi or htar; from HTTP servers; and within the local
+# filesystem) may be limited to a maximum number of concurrent transfers, so that a staging run
+# using many threads can saturate each backend without overloading any of them.
+
+LIMITS = (STR.hpss, STR.http, STR.local)
+
+_SEMAPHORES: dict[str, BoundedSemaphore] = {}
+
+# When syncing, a destination file is current if it has the same size as its source and either the
+# same modification time (to the second) or the same sha256 content hash. Synced copies preserve the
+# source's modification time, so that later syncs by modification time find them current.
+
+SYNC = (STR.hash, STR.mtime)
+
+
+@contextmanager
+def limits(maxima: dict[str, int] | None) -> Iterator[None]:
+    """
+    Limit concurrent transfers, per kind, while in the context.
+
+    :param maxima: Maximum concurrent transfers, keyed by kind: 'hpss', 'http', or 'local'.
+    :raises: UWConfigError on an unknown kind or a non-positive maximum.
+    """
+    for kind, n in (maxima or {}).items():
+        if kind not in LIMITS:
+            msg = "Unknown transfer kind '%s' (choices: %s)" % (kind, ", ".join(LIMITS))
+            raise UWConfigError(msg)
+        if n < 1:
+            msg = "Maximum concurrent %s transfers must be positive, not %s" % (kind, n)
+            raise UWConfigError(msg)
+    saved = dict(_SEMAPHORES)
+    _SEMAPHORES.update({kind: BoundedSemaphore(n) for kind, n in (maxima or {}).items()})
+    try:
+        yield
+    finally:
+        _SEMAPHORES.clear()
+        _SEMAPHORES.update(saved)
+
+
+def current(src: Path, dst: Path, sync: str) -> bool:
+    """
+    Is the destination file a current copy of the source file?
+
+    :param src: Path to the source file.
+    :param dst: Path to the destination file.
+    :param sync: How to compare the files: 'mtime' (size and modification time) or 'hash' (size and
+        content hash).
+    """
+    try:
+        s, d = src.stat(), dst.stat()
+    except FileNotFoundError:
+        return False
+    if s.st_size != d.st_size:
+        return False
+    if sync == STR.hash:
+        return _sha256(src, s.st_size, s.st_mtime_ns) == _sha256(dst, d.st_size, d.st_mtime_ns)
+    return int(s.st_mtime) == int(d.st_mtime)
+
 
 @task
 def directory(path: Path):
@@ -37,7 +103,7 @@ def directory(path: Path):
     :param path: Path to the directory.
     """
     yield "Directory %s" % path
-    yield Asset(path, path.is_dir)
+    yield Asset(path, partial(statcache.is_dir, path))
     yield None
     try:
         path.mkdir(parents=True, exist_ok=True)
@@ -68,8 +134,8 @@ def existing_hpss(path: Path | str):
     val = [False]
     yield Asset(path, lambda: val[0])
     yield executable(STR.hsi)
-    available, _ = run_shell_cmd(f"{STR.hsi} -q ls -1 '{path!s}'", taskname=taskname)
-    val[0] = available
+    with _limited(STR.hpss):
+        val[0] = listed(str(path)) or hsi_ls(str(path), taskname=taskname)[0]
 
 
 @external
@@ -79,11 +145,13 @@ def existing_http(url: str):
 
     :param url: URL of the HTTP resource.
     """
+
+    def exists() -> bool:
+        with _limited(STR.http):
+            return http.exists(url)
+
     yield "Remote HTTP resource %s" % url
-    yield Asset(
-        url,
-        lambda: requests.head(url, allow_redirects=True, timeout=3).status_code == HTTPStatus.OK,
-    )
+    yield Asset(url, exists)
 
 
 @external
@@ -97,16 +165,17 @@ def file(path: Path | str, context: str = ""):
     path = _local_path(path)
     suffix = f" ({context})" if context else ""
     yield "File %s%s" % (path, suffix)
-    yield Asset(path, path.is_file)
+    yield Asset(path, partial(statcache.is_file, path))
 
 
-def filecopy(src: Path | str, dst: Path | str, check: bool = True) -> Node:
+def filecopy(src: Path | str, dst: Path | str, check: bool = True, sync: str | None = None) -> Node:
     """
     A copy of an existing file.
 
     :param src: Path to the source file.
     :param dst: Path to the destination file to create.
     :param check: Check existence of source before trying to copy.
+    :param sync: Recopy a local source if destination is not current (choices: 'mtime', 'hash').
     :return: An iotaa task-graph node.
     :raises: UWConfigError for unsupported URL schemes.
     """
@@ -120,7 +189,7 @@ def filecopy(src: Path | str, dst: Path | str, check: bool = True) -> Node:
     if src_scheme in SCHEMES.http:
         return filecopy_http(str(src), dst, check)
     if src_scheme in SCHEMES.local:
-        return filecopy_local(_local_path(src), dst, check)
+        return filecopy_local(_local_path(src), dst, check, sync)
     return _bad_scheme(src, src_scheme)
 
 
@@ -135,13 +204,63 @@ def filecopy_hsi(src: str, dst: Path, check: bool = True):
     """
     taskname = "HSI %s -> %s" % (src, dst)
     yield taskname
-    yield Asset(Path(dst), Path(dst).is_file)
+    yield Asset(Path(dst), partial(statcache.is_file, Path(dst)))
     yield existing_hpss(src) if check else None
     dst.parent.mkdir(parents=True, exist_ok=True)
     cmd = f"{STR.hsi} -q get '{dst}' : '{src}'"
-    _, output = run_shell_cmd(cmd, taskname=taskname)
+    with _limited(STR.hpss):
+        start = monotonic()
+        _, output = run_shell_cmd(cmd, taskname=taskname)
     for line in output.strip().split("\n"):
         log.info("%s: => %s", taskname, line)
+    telemetry.record(STR.hsi, [dst], start)
+    _verify(dst)
+
+
+@task
+def filecopy_hsi_batch(pairs: list[tuple[str, Path]]):
+    """
+    Copy HPSS files to the local filesystem via a single hsi session.
+
+    The get commands are passed to hsi in a command file, ordered by HPSS path so that files
+    archived together are retrieved together. Files that already exist are not copied again.
+
+    :param pairs: HPSS paths to source files, paired with paths to destination files to create.
+    """
+    src, dst = pairs[0]
+    taskname = "HSI %s -> %s (batch of %s)" % (src, dst, len(pairs))
+    yield taskname
+    yield [Asset(dst, partial(statcache.is_file, dst)) for _, dst in pairs]
+    yield executable(STR.hsi)
+    todo = sorted((src, dst) for src, dst in pairs if not statcache.is_file(dst))
+    # The cache locks on the sources are held from lookup through store, so that another process
+    # staging the same sources waits, then finds them cached, instead of fetching them again.
+    with cache.locked([_url(STR.hsi, src) for src, _ in todo]):
+        if cache.enabled():
+            todo = [(src, dst) for src, dst in todo if not cache.lookup(_url(STR.hsi, src), dst)]
+        # When caching, files are fetched into the cache directory, then cached and materialized.
+        fetched = {dst: cache.temp_path() if cache.enabled() else dst for _, dst in todo}
+        for _, dst in todo:
+            dst.parent.mkdir(parents=True, exist_ok=True)
+        if todo:
+            with TemporaryDirectory() as tmpdir:
+                cmdfile = Path(tmpdir, "hsi.in")
+                cmdfile.write_text(
+                    "".join("get '%s' : '%s'\n" % (fetched[dst], src) for src, dst in todo)
+                )
+                with _limited(STR.hpss):
+                    start = monotonic()
+                    _, output = run_shell_cmd(f"{STR.hsi} -q in '{cmdfile}'", taskname=taskname)
+            for line in output.strip().split("\n"):
+                log.info("%s: => %s", taskname, line)
+        for src, dst in todo:
+            if fetched[dst] != dst and fetched[dst].is_file():
+                cache.store(_url(STR.hsi, src), fetched[dst], [dst])
+            if not statcache.is_file(dst):
+                log.error("%s: Could not copy %s -> %s", taskname, src, dst)
+            _verify(dst)
+        if todo:
+            telemetry.record(STR.hsi, [dst for _, dst in todo], start)
 
 
 @task
@@ -156,17 +275,81 @@ def filecopy_htar(src_archive: str, src_file: str, dst: Path, check: bool = True
     """
     taskname = "HTAR %s:%s -> %s" % (src_archive, src_file, dst)
     yield taskname
-    yield Asset(Path(dst), Path(dst).is_file)
+    yield Asset(Path(dst), partial(statcache.is_file, Path(dst)))
     yield existing_hpss(src_archive) if check else None
     dst.parent.mkdir(parents=True, exist_ok=True)
     cmd = f"{STR.htar} -qxf '{src_archive}' '{src_file}'"
     with TemporaryDirectory(prefix=".tmpdir", dir=dst.parent) as tmpdir:
-        _, output = run_shell_cmd(cmd, cwd=tmpdir, taskname=taskname)
+        with _limited(STR.hpss):
+            start = monotonic()
+            _, output = run_shell_cmd(cmd, cwd=tmpdir, taskname=taskname)
         for line in output.strip().split("\n"):
             log.info("%s: => %s", taskname, line)
         tmp = Path(tmpdir, src_file)
+        digest = checksum.hexdigest(tmp) if checksum.active() and tmp.is_file() else None
         log.info("%s: Moving %s -> %s", taskname, tmp, dst)
         move(tmp, dst)
+    telemetry.record(STR.htar, [dst], start)
+    _verify(dst, digest)
+
+
+@task
+def filecopy_htar_batch(src_archive: str, pairs: list[tuple[str, Path]], check: bool = True):
+    """
+    Copy files from an HPSS-based archive to the local filesystem via a single htar extraction.
+
+    :param src_archive: HPSS path to the source archive.
+    :param pairs: Paths within the archive to files, paired with paths to destination files to
+        create.
+    :param check: Check existence of source archive before trying to copy.
+    """
+    src_file, dst = pairs[0]
+    taskname = "HTAR %s:%s -> %s (batch of %s)" % (src_archive, src_file, dst, len(pairs))
+    yield taskname
+    yield [Asset(dst, partial(statcache.is_file, dst)) for _, dst in pairs]
+    yield existing_hpss(src_archive) if check else None
+    todo = [(src_file, dst) for src_file, dst in pairs if not statcache.is_file(dst)]
+    url = lambda src_file: _url(STR.htar, "%s?%s" % (src_archive, quote(src_file)))
+    with cache.locked([url(src_file) for src_file, _ in todo]):  # see filecopy_hsi_batch()
+        if cache.enabled():
+            todo = [(m, dst) for m, dst in todo if not cache.lookup(url(m), dst)]
+        if not todo:
+            return
+        for _, dst in todo:
+            dst.parent.mkdir(parents=True, exist_ok=True)
+        members = " ".join("'%s'" % src_file for src_file in sorted({m for m, _ in todo}))
+        cmd = f"{STR.htar} -qxf '{src_archive}' {members}"
+        last = dict(todo)  # the last destination for each member, which it can be moved to
+        digests: dict[str, str] = {}  # of extracted members, each hashed once however many copies
+        # When caching, members are extracted into the cache directory, then cached and materialized
+        # at their destinations.
+        parent = cache.temp_path().parent if cache.enabled() else todo[0][1].parent
+        with TemporaryDirectory(prefix=".tmpdir", dir=parent) as tmpdir:
+            with _limited(STR.hpss):
+                start = monotonic()
+                _, output = run_shell_cmd(cmd, cwd=tmpdir, taskname=taskname)
+            for line in output.strip().split("\n"):
+                log.info("%s: => %s", taskname, line)
+            for src_file, dst in todo:
+                tmp = Path(tmpdir, src_file)
+                if cache.enabled() and src_file in digests:
+                    cache.lookup(url(src_file), dst)
+                elif not tmp.is_file():
+                    log.error("%s: Could not extract %s", taskname, src_file)
+                    continue
+                else:
+                    if src_file not in digests:
+                        digests[src_file] = checksum.hexdigest(tmp) if checksum.active() else ""
+                    if cache.enabled():
+                        cache.store(url(src_file), tmp, [dst])
+                    elif last[src_file] == dst:
+                        log.info("%s: Moving %s -> %s", taskname, tmp, dst)
+                        move(tmp, dst)
+                    else:
+                        log.info("%s: Copying %s -> %s", taskname, tmp, dst)
+                        local.copy(tmp, dst)
+                _verify(dst, digests[src_file] or None)
+        telemetry.record(STR.htar, [dst for _, dst in todo], start)
 
 
 @task
@@ -179,32 +362,68 @@ def filecopy_http(url: str, dst: Path, check: bool = True):
     :param check: Check existence of source before trying to copy.
     """
     yield "HTTP %s -> %s" % (url, dst)
-    yield Asset(dst, dst.is_file)
+    yield Asset(dst, partial(statcache.is_file, dst))
     yield existing_http(url) if check else None
     dst.parent.mkdir(parents=True, exist_ok=True)
-    response = requests.get(url, allow_redirects=True, stream=True, timeout=3)
-    if (code := response.status_code) == HTTPStatus.OK:
-        with dst.open(mode="wb") as f:
-            for chunk in response.iter_content(chunk_size=8192):
-                f.write(chunk)
-    else:
-        log.error("Could not get '%s', HTTP status was: %s", url, code)
+    with _limited(STR.http):
+        start = monotonic()
+        if cache.enabled() and (version := http.validator(url)):
+            hasher = None  # a cached file is hashed by reading it
+            ok = cache.get(url, dst, lambda path: http.download(url, path), version)
+        else:
+            hasher = sha256() if checksum.active() else None
+            ok = http.download(url, dst, hasher)
+    if ok:
+        telemetry.record(STR.http, [dst], start)
+        _verify(dst, hasher.hexdigest() if hasher else None)
 
 
 @task
-def filecopy_local(src: Path, dst: Path, check: bool = True):
+def filecopy_local(src: Path, dst: Path, check: bool = True, sync: str | None = None):
     """
     Copy a file in the local filesystem.
 
     :param src: Path to the source file.
     :param dst: Path to the destination file to create.
     :param check: Check existence of source before trying to copy.
+    :param sync: Recopy if destination is not current (choices: 'mtime', 'hash').
     """
     yield "Local %s -> %s" % (src, dst)
-    yield Asset(Path(dst), Path(dst).is_file)
+    synced = ns(ok=False)
+
+    def ready() -> bool:
+        # Once found current, a synced destination need not be compared with its source again.
+        if sync and not synced.ok:
+            synced.ok = ok = current(src, dst, sync)
+            return ok
+        return statcache.is_file(dst)
+
+    yield Asset(Path(dst), ready)
     yield file(src) if check else None
     dst.parent.mkdir(parents=True, exist_ok=True)
-    copy(src, dst)
+    hasher = sha256() if checksum.active() else None
+    with _limited(STR.local):
+        start = monotonic()
+        local.copy(src, dst, preserve=bool(sync), hasher=hasher)
+    telemetry.record(STR.local, [dst], start)
+    synced.ok = bool(sync)
+    if hasher:
+        _verify(dst, hasher.hexdigest())
+
+
+@task
+def filecopy_symlink(src: Path, dst: Path):
+    """
+    Copy a symlink in the local filesystem, as a symlink to the same target.
+
+    :param src: Path to the source symlink.
+    :param dst: Path to the destination symlink to create.
+    """
+    yield "Symlink %s -> %s" % (src, dst)
+    yield Asset(Path(dst), partial(statcache.is_symlink, dst))
+    yield None
+    dst.parent.mkdir(parents=True, exist_ok=True)
+    dst.symlink_to(src.readlink())
 
 
 @task
@@ -221,24 +440,99 @@ def hardlink(
     """
     target, linkname = map(_local_path, [target, linkname])
     yield "Hardlink %s -> %s" % (linkname, target)
-    yield Asset(linkname, linkname.exists)
+    yield Asset(linkname, partial(statcache.exists, linkname))
     yield link_target(target) if check else None
     linkname.parent.mkdir(parents=True, exist_ok=True)
-    src = target if target.is_absolute() else os.path.relpath(target, linkname.parent)
-    dst = linkname
+    _link(target, linkname, hard=True, fallback=fallback)
+
+
+@task
+def htar_bundle(archive: str, members: list[str], cwd: Path | None = None):
+    """
+    An HPSS-based archive of local files, created via htar and verified against its index.
+
+    :param archive: HPSS path to the archive to create.
+    :param members: Paths to the files to archive, as they are to be stored in the archive.
+    :param cwd: Directory relative to which member paths are resolved.
+    """
+    taskname = "HTAR %s (bundle of %s)" % (archive, len(members))
+    yield taskname
+    yield Asset(archive, partial(_archived, archive, members))
+    yield None
+    with TemporaryDirectory(prefix=".tmpdir") as tmpdir:
+        listfile = Path(tmpdir, "members")
+        listfile.write_text("".join("%s\n" % member for member in members))
+        cmd = f"{STR.htar} -P -cf '{archive}' -L '{listfile}'"
+        with _limited(STR.hpss):
+            success, _ = run_shell_cmd(cmd, cwd=cwd, taskname=taskname)
+    if not success:
+        return
+    _, output = htar_index(archive, taskname=taskname, refresh=True)
+    indexed = _indexed(output)
+    for member in members:
+        if member.lstrip("/") not in indexed:
+            log.error("%s: Member %s missing from archive index", taskname, member)
+
+
+@task
+def link_batch(
+    pairs: list[tuple[Path | str, Path | str]],
+    check: bool = True,
+    hard: bool = False,
+    fallback: str | None = None,
+):
+    """
+    A batch of links, created together.
+
+    Each link directory is created, and each target directory is listed to check for targets, once
+    per batch, rather than once per link.
+
+    :param pairs: Pairs of (target, linkname).
+    :param check: Check existence of targets before trying to link.
+    :param hard: Create hardlinks instead of symlinks?
+    :param fallback: Alternative if a hardlink fails (choices: 'copy', 'symlink').
+    """
+    links = [(_local_path(target), _local_path(linkname)) for target, linkname in pairs]
+    kind = "Hardlink" if hard else "Symlink"
+    taskname = "%s %s -> %s (batch of %s)" % (kind, links[0][1], links[0][0], len(links))
+    yield taskname
+    yield [Asset(linkname, partial(statcache.exists, linkname)) for _, linkname in links]
+    yield None
+    todo = [(target, linkname) for target, linkname in links if not statcache.exists(linkname)]
+    if check:
+        found = _existing([target for target, _ in todo])
+        for target, _ in todo:
+            if target not in found:
+                log.warning("%s: Target %s does not exist", taskname, target)
+        todo = [(target, linkname) for target, linkname in todo if target in found]
+    for parent in {linkname.parent for _, linkname in todo}:
+        parent.mkdir(parents=True, exist_ok=True)
+    for target, linkname in todo:
+        try:
+            _link(target, linkname, hard=hard, fallback=fallback)
+        except Exception as e:  # noqa: BLE001
+            log.error("%s: %s", taskname, e)
+
+
+@task
+def purged(path: Path, reclaimed: dict[str, int] | None = None):
+    """
+    A purged file, symlink, or directory tree.
+
+    :param path: The path to purge.
+    :param reclaimed: Record the number of bytes reclaimed, keyed by path, here.
+    """
+    yield "Purged %s" % path
+    yield Asset(path, lambda: not os.path.lexists(path))
+    yield None
     try:
-        os.link(src, dst)
-    except Exception as e:
-        if fallback == STR.symlink:
-            Path(dst).symlink_to(src)
-            log.info("Could not hardlink %s -> %s, symlinked instead" % (dst, src))
-        elif fallback == STR.copy:
-            copy(src, dst)
-            log.info("Could not hardlink %s -> %s, copied instead" % (dst, src))
-        else:
-            for line in str(e).split("\n"):
-                log.error(line)
-            raise UWError("Could not hardlink %s -> %s" % (dst, src)) from e
+        files, nbytes = remove.remove(path)
+    except OSError as e:
+        log.error("Could not purge %s: %s", path, e)
+        return
+    log.info("Purged %s: %s files, %s bytes", path, files, nbytes)
+    if reclaimed is not None:
+        reclaimed[str(path)] = nbytes
 
 
 @task
@@ -252,12 +546,10 @@ def symlink(target: Path | str, linkname: Path | str, check: bool = True):
     """
     target, linkname = map(_local_path, [target, linkname])
     yield "Symlink %s -> %s" % (linkname, target)
-    yield Asset(linkname, linkname.exists)
+    yield Asset(linkname, partial(statcache.exists, linkname))
     yield link_target(target) if check else None
     linkname.parent.mkdir(parents=True, exist_ok=True)
-    src = target if target.is_absolute() else os.path.relpath(target, linkname.parent)
-    dst = linkname
-    Path(dst).symlink_to(src)
+    _link(target, linkname)
 
 
 @external
@@ -270,7 +562,7 @@ def link_target(path: Path | str):
     """
     path = _local_path(path)
     yield "Target %s" % path
-    yield Asset(path, path.exists)
+    yield Asset(path, partial(statcache.exists, path))
 
 
 # Private helpers
@@ -299,3 +591,132 @@ def _local_path(path: Path | str) -> Path:
     if info.scheme and info.scheme not in SCHEMES.local:
         _bad_scheme(path, info.scheme)
     return Path(info.path)
+
+
+def _existing(paths: list[Path]) -> set[Path]:
+    """
+    Return those of the given paths that exist, listing each of their directories once.
+
+    :param paths: The paths to check.
+    """
+    names: dict[Path, set[str]] = {}
+    existing = set()
+    for path in paths:
+        if path.name in ("", ".."):  # e.g. "/", which no directory listing contains
+            if path.exists():
+                existing.add(path)
+            continue
+        if path.parent not in names:
+            names[path.parent] = set()
+            with suppress(OSError), os.scandir(path.parent) as entries:
+                for entry in entries:
+                    # A symlink exists only if its target does.
+                    if not entry.is_symlink() or Path(entry.path).exists():
+                        names[path.parent].add(entry.name)
+        if path.name in names[path.parent]:
+            existing.add(path)
+    return existing
+
+
+def _archived(archive: str, members: list[str]) -> bool:
+    """
+    Does an HPSS-based archive's index list all the given members?
+
+    :param archive: HPSS path to the archive.
+    :param members: Paths to the members.
+    """
+    success, output = htar_index(archive)
+    indexed = _indexed(output) if success else set()
+    return success and all(member.lstrip("/") in indexed for member in members)
+
+
+def _indexed(output: str) -> set[str]:
+    """
+    Return the member paths, without leading slashes, in htar index output.
+
+    :param output: Output of an htar index command.
+    """
+    return {m["path"].lstrip("/") for line in output.split("\n") if (m := HTAR_MEMBER.match(line))}
+
+
+@contextmanager
+def _limited(kind: str) -> Iterator[None]:
+    """
+    Wait, if necessary, to start a transfer of the given kind within its concurrency limit.
+
+    :param kind: The kind of transfer: 'hpss', 'http', or 'local'.
+    """
+    if semaphore := _SEMAPHORES.get(kind):
+        with semaphore:
+            yield
+    else:
+        yield
+
+
+def _link(target: Path, linkname: Path, hard: bool = False, fallback: str | None = None) -> None:
+    """
+    Create a link, in an existing directory.
+
+    :param target: The existing file or directory.
+    :param linkname: The link to create.
+    :param hard: Create a hardlink instead of a symlink?
+    :param fallback: Alternative if a hardlink fails (choices: 'copy', 'symlink').
+    :raises: UWError if a hardlink cannot be created and there is no fallback.
+    """
+    src = target if target.is_absolute() else os.path.relpath(target, linkname.parent)
+    dst = linkname
+    if not hard:
+        Path(dst).symlink_to(src)
+        return
+    try:
+        os.link(src, dst)
+    except Exception as e:
+        if fallback == STR.symlink:
+            Path(dst).symlink_to(src)
+            log.info("Could not hardlink %s -> %s, symlinked instead" % (dst, src))
+        elif fallback == STR.copy:
+            with _limited(STR.local):
+                start = monotonic()
+                local.copy(Path(src), dst)
+            telemetry.record(STR.local, [Path(dst)], start)
+            log.info("Could not hardlink %s -> %s, copied instead" % (dst, src))
+        else:
+            for line in str(e).split("\n"):
+                log.error(line)
+            raise UWError("Could not hardlink %s -> %s" % (dst, src)) from e
+
+
+@lru_cache(maxsize=4096)
+def _sha256(path: Path, size: int, mtime_ns: int) -> str:  # noqa: ARG001
+    """
+    Return the sha256 hash of a file's content.
+
+    The file's size and modification time are part of the cache key, so that a modified file is
+    hashed again.
+
+    :param path: Path to the file.
+    :param size: Size of the file, in bytes.
+    :param mtime_ns: Modification time of the file, in nanoseconds since the epoch.
+    """
+    return checksum.hexdigest(path)
+
+
+def _url(scheme: str, path: str) -> str:
+    """
+    Return a URL for a remote source, e.g. to identify it in the cache.
+
+    :param scheme: The URL scheme.
+    :param path: The source's path, with any query string.
+    """
+    return "%s://%s" % (scheme, path)
+
+
+def _verify(path: Path, digest: str | None = None) -> None:
+    """
+    Record, and verify, the digest of a staged file, if digests are being recorded.
+
+    :param path: Path to the staged file.
+    :param digest: The file's hex digest (default: computed by reading the file).
+    """
+    if checksum.active() and path.is_file():
+        checksum.check(path, digest or checksum.hexdigest(path))
@@ -0,0 +1,173 @@
+"""
+Throughput telemetry for staged files.
+"""
+
+from __future__ import annotations
+
+import json
+from collections import defaultdict
+from contextlib import contextmanager
+from dataclasses import dataclass
+from math import ceil
+from pathlib import Path
+from threading import Lock
+from time import monotonic
+from types import SimpleNamespace as ns
+from typing import TYPE_CHECKING
+
+from uwtools.logging import log
+from uwtools.utils.file import atomic
+
+if TYPE_CHECKING:
+    from collections.abc import Iterator
+
+# While in the recording() context, the tasks that stage files record, for each file staged, its
+# size, the kind of transfer that staged it (e.g. 'hsi', 'http', 'local'), and the time the transfer
+# took, excluding any wait for a concurrency limit. Files staged together, e.g. in one hsi session,
+# share the time their batch took equally. Files that could not be staged are not recorded.
+
+SLOWEST = 10  # number of slowest files to summarize
+
+_LOCK = Lock()
+_STATE = ns(transfers=None)
+
+
+@dataclass(frozen=True)
+class Transfer:
+    """
+    A staged file.
+    """
+
+    path: str
+    kind: str
+    size: int
+    start: float
+    end: float
+    seconds: float
+
+
+def active() -> bool:
+    """
+    Are transfers being recorded?
+    """
+    return _STATE.transfers is not None
+
+
+def record(kind: str, paths: list[Path], start: float) -> None:
+    """
+    Record files staged together since a start time, if transfers are being recorded.
+
+    :param kind: The kind of transfer.
+    :param paths: Paths to the staged files.
+    :param start: The monotonic time at which the transfer started.
+    """
+    if (recorded := _STATE.transfers) is None or not paths:
+        return
+    end = monotonic()
+    seconds = (end - start) / len(paths)
+    transfers = []
+    for path in paths:
+        try:
+            size = path.stat().st_size
+        except OSError:  # not staged
+            continue
+        transfers.append(Transfer(str(path), kind, size, start, end, seconds))
+    with _LOCK:
+        recorded.extend(transfers)
+
+
+@contextmanager
+def recording() -> Iterator[list[Transfer]]:
+    """
+    Record transfers while in the context.
+
+    :yields: The recorded transfers.
+    """
+    if _STATE.transfers is not None:  # already recording, e.g. via a nested API call
+        yield _STATE.transfers
+        return
+    transfers: list[Transfer] = []
+    _STATE.transfers = transfers
+    try:
+        yield transfers
+    finally:
+        _STATE.transfers = None
+        if transfers:
+            total = summary(transfers)
+            log.debug(
+                "Staged %s files, %s bytes, in %.3f s (%.0f bytes/s)",
+                total["files"],
+                total["bytes"],
+                total["seconds"],
+                total["bytes_per_second"],
+            )
+
+
+def summary(transfers: list[Transfer]) -> dict:
+    """
+    Summarize transfers: aggregate throughput, and latency, per kind, and the slowest files.
+
+    :param transfers: The recorded transfers.
+    """
+    kinds = defaultdict(list)
+    for transfer in transfers:
+        kinds[transfer.kind].append(transfer)
+    slowest = sorted(transfers, key=lambda t: t.seconds, reverse=True)[:SLOWEST]
+    return {
+        **_throughput(transfers),
+        "kinds": {
+            kind: {
+                **_throughput(ts),
+                "p50": _percentile([t.seconds for t in ts], 50),
+                "p95": _percentile([t.seconds for t in ts], 95),
+            }
+            for kind, ts in sorted(kinds.items())
+        },
+        "slowest": [
+            {"path": t.path, "kind": t.kind, "bytes": t.size, "seconds": round(t.seconds, 6)}
+            for t in slowest
+        ],
+    }
+
+
+def write(path: Path | str, report: dict) -> None:
+    """
+    Write a summary of transfers as JSON.
+
+    :param path: Path to the file to write.
+    :param report: The summary.
+    """
+    with atomic(Path(path)) as tmp:
+        tmp.write_text("%s\n" % json.dumps(report, indent=2, sort_keys=True))
+    log.info("Wrote telemetry for %s staged files to %s", report["files"], path)
+
+
+# Private helpers
+
+
+def _percentile(values: list[float], p: int) -> float:
+    """
+    Return a percentile of values, by the nearest-rank method.
+
+    :param values: The values.
+    :param p: The percentile.
+    """
+    return round(sorted(values)[max(ceil(p / 100 * len(values)) - 1, 0)], 6)
+
+
+def _throughput(transfers: list[Transfer]) -> dict:
+    """
+    Return the number of files and bytes transferred, and the rate, over the wall-clock time taken.
+
+    :param transfers: The transfers.
+    """
+    nbytes = sum(t.size for t in transfers)
+    seconds = max((t.end for t in transfers), default=0) - min(
+        (t.start for t in transfers), default=0
+    )
+    return {
+        "bytes": nbytes,
+        "bytes_per_second": round(nbytes / seconds, 3) if seconds else 0,
+        "files": len(transfers),
+        "seconds": round(seconds, 6),
+    }